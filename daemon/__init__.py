@@ -10,8 +10,9 @@ The daemon is a background service that:
 """
 from __future__ import annotations
 
+from daemon import changes
 from daemon._internal import DaemonError, generate_id, now_iso
-from daemon.db import get_connection
+from daemon.db import get_connection, get_read_connection
 from daemon.server import create_app
 
 __version__ = "0.1.0"
@@ -37,8 +38,8 @@ def version() -> str:
 class Daemon:
     """wicked-garden background daemon.
 
-    Coordinates the event consumer, hook dispatcher, projector, and HTTP server
-    into a single runnable unit.
+    Coordinates the event consumer, hook dispatcher, projector, retention
+    worker, and HTTP server into a single runnable unit.
 
     Usage::
 
@@ -55,17 +56,26 @@ class Daemon:
         host: str = "127.0.0.1",
         port: int = 7700,
         poll_interval_ms: int = 5000,
+        http_threads: int = 8,
+        http_max_queue: int = 32,
+        retention: dict | None = None,
+        tasks_dir: str | None = None,
     ) -> None:
+        import os
         import threading
         from pathlib import Path
 
         from daemon.consumer import EventConsumer
         from daemon.hook_dispatch import HookDispatcher
         from daemon.projector import Projector
+        from daemon.retention import RetentionWorker
         from daemon.server import create_app
 
         self._host = host
         self._port = port
+        self._http_threads = http_threads
+        self._http_max_queue = http_max_queue
+        self._server = None
         self._stop_event = threading.Event()
 
         # DB
@@ -73,41 +83,88 @@ class Daemon:
 
         # Components
         hooks_path = Path(hooks_dir) if hooks_dir else Path.cwd() / "hooks"
+        # Native task files, backfilled into the tasks projection on start.
+        config_dir = os.environ.get("CLAUDE_CONFIG_DIR")
+        self._tasks_dir = (
+            Path(tasks_dir) if tasks_dir
+            else (Path(config_dir) if config_dir else Path.home() / ".claude") / "tasks"
+        )
         self._projector = Projector(self._conn)
         self._dispatcher = HookDispatcher(self._conn, hooks_path)
         self._consumer = EventConsumer(
             self._conn,
             poll_interval_ms=poll_interval_ms,
             on_event=self._on_event,
+            on_batch=self._on_batch,
+        )
+        # Per-table overrides, e.g. {"garden_events": {"max_age_days": 7}}.
+        self._retention = RetentionWorker(self._conn, policy=retention)
+        self._app = create_app(
+            self._conn,
+            self._projector,
+            reader=get_read_connection,
+            dispatcher=self._dispatcher,
         )
-        self._app = create_app(self._conn, self._projector)
 
     def _on_event(self, event_type: str, payload: dict) -> None:
         """Internal callback wired from consumer to projector + dispatcher."""
         self._projector.update(event_type, payload)
-        self._dispatcher.dispatch(event_type, payload)
+        self._dispatcher.submit(event_type, payload)
+
+    def _on_batch(self, events: list, cursor: tuple) -> None:
+        """Page callback: one projector transaction (cursor included), then hooks.
+
+        Hooks are queued on the dispatcher's pool, not awaited, so the next
+        page is not held up by a slow hook.
+        """
+        self._projector.apply_batch(events, cursor=cursor)
+        for event_type, payload in events:
+            self._dispatcher.submit(event_type, payload)
 
     def start(self, block: bool = True) -> None:
         """Start all daemon components.
 
         Args:
-            block: When True (default), runs the Flask dev server in the
-                   foreground (blocks until Ctrl-C or stop()). When False,
-                   starts the consumer thread and returns immediately — the
+            block: When True (default), serves HTTP in the foreground on a
+                   worker pool (``http_threads`` workers, at most
+                   ``http_max_queue`` waiting connections before 503s) until
+                   Ctrl-C or stop(). When False,
+                   starts the consumer and retention threads and returns immediately — the
                    HTTP server is NOT started in non-blocking mode, which
                    is primarily useful for tests.
         """
+        from daemon.projector import backfill_tasks
+
+        backfill_tasks(self._conn, self._tasks_dir)
+        # A previous stop() closed the change feed; let /stream serve again.
+        changes.reopen()
         self._consumer.start()
+        self._retention.start()
         if block:
+            from daemon.server import make_server
+
+            self._server = make_server(
+                self._app,
+                self._host,
+                self._port,
+                threads=self._http_threads,
+                max_queue=self._http_max_queue,
+            )
             try:
-                self._app.run(host=self._host, port=self._port)
+                self._server.serve_forever()
             finally:
                 self.stop()
+                self._server.server_close()
 
     def stop(self) -> None:
         """Signal all components to stop."""
         self._consumer.stop()
+        self._retention.stop()
+        self._dispatcher.close()
+        changes.close()
         self._stop_event.set()
+        if self._server is not None:
+            self._server.shutdown()
 
 
 def start(
@@ -0,0 +1,162 @@
+"""
+changes.py — Change feed for the wicked-garden daemon's ``GET /stream``.
+
+Every daemon writer that changes client-visible state (projector batches,
+council progress, HITL responses) appends a row to ``change_log`` inside its
+own transaction and calls :func:`notify` after committing. ``/stream`` turns
+the log into Server-Sent Events: the row's ``seq`` is the SSE ``id``, so a
+reconnecting client resumes with ``Last-Event-ID`` and misses nothing that is
+still retained. Waiting streams are woken in-process — no client polls SQLite.
+
+Event kinds:
+    state    — a projector batch committed (changed keys, task transitions,
+               and the consumer's bus cursor)
+    council  — a council session started, received a vote, or finished
+    hitl     — a HITL prompt was answered
+
+Usage::
+
+    from daemon import changes
+
+    with get_write_lock():
+        conn.execute(...)
+        changes.record(conn, "hitl", {"prompt_id": pid, "status": "responded"})
+        conn.commit()
+    changes.notify()
+
+    for chunk in changes.stream(get_read_connection, last_event_id=41):
+        ...  # "id: 42\nevent: council\ndata: {...}\n\n"
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Iterator, Optional
+
+from daemon._internal import now_iso
+
+logger = logging.getLogger("wicked-garden.daemon.changes")
+
+# Rows kept in change_log; older ones are pruned as new ones arrive. A client
+# resuming from before the retained window gets a ``reset`` event.
+_RETAIN_ROWS = 10_000
+_PRUNE_EVERY = 100
+
+HEARTBEAT_S = 15.0
+_PAGE_SIZE = 200
+
+_cond = threading.Condition()
+_version = 0
+_closed = False
+
+
+def record(conn: sqlite3.Connection, kind: str, data: dict[str, Any]) -> int:
+    """Append one change in the caller's transaction; return its ``seq``.
+
+    The caller holds ``get_write_lock()``, commits, then calls :func:`notify`.
+    """
+    cur = conn.execute(
+        "INSERT INTO change_log (kind, data, created_at) VALUES (?, ?, ?)",
+        (kind, json.dumps(data, default=str), now_iso()),
+    )
+    seq = cur.lastrowid
+    if seq % _PRUNE_EVERY == 0:
+        conn.execute("DELETE FROM change_log WHERE seq <= ?", (seq - _RETAIN_ROWS,))
+    return seq
+
+
+def notify() -> None:
+    """Wake every waiting stream (call after the recording transaction commits)."""
+    global _version
+    with _cond:
+        _version += 1
+        _cond.notify_all()
+
+
+def close() -> None:
+    """End all open streams (daemon shutdown)."""
+    global _closed
+    with _cond:
+        _closed = True
+        _cond.notify_all()
+
+
+def reopen() -> None:
+    """Allow streams again after :func:`close` (tests / in-process restart)."""
+    global _closed
+    with _cond:
+        _closed = False
+
+
+def latest_seq(conn: sqlite3.Connection) -> int:
+    row = conn.execute("SELECT MAX(seq) FROM change_log").fetchone()
+    return row[0] or 0
+
+
+def _format(seq: Optional[int], kind: str, data: Any) -> str:
+    head = f"id: {seq}\n" if seq is not None else ""
+    return f"{head}event: {kind}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+def stream(
+    reader: Callable[[], sqlite3.Connection],
+    last_event_id: Optional[int] = None,
+    heartbeat_s: float = HEARTBEAT_S,
+    max_idle_s: Optional[float] = None,
+) -> Iterator[str]:
+    """Yield SSE chunks for changes after ``last_event_id``.
+
+    Without ``last_event_id`` the stream starts at the current head. A
+    ``: heartbeat`` comment is sent after ``heartbeat_s`` of silence. The
+    generator ends on :func:`close`, or after ``max_idle_s`` without changes
+    when given.
+
+    Args:
+        reader: Returns the calling thread's read connection.
+        last_event_id: Resume point from the client's ``Last-Event-ID``.
+        heartbeat_s: Seconds of silence before a heartbeat comment.
+        max_idle_s: Optional idle cut-off (mainly for tests).
+    """
+    conn = reader()
+    if last_event_id is None:
+        cursor = latest_seq(conn)
+    else:
+        cursor = last_event_id
+        oldest = conn.execute("SELECT MIN(seq) FROM change_log").fetchone()[0]
+        if oldest is not None and cursor < oldest - 1:
+            # Resume point pruned — the client must refetch /state.
+            yield _format(None, "reset", {"oldest": oldest})
+    yield "retry: 2000\n\n"
+
+    idle_since = time.monotonic()
+    while True:
+        with _cond:
+            seen = _version
+            if _closed:
+                return
+        rows = conn.execute(
+            "SELECT seq, kind, data FROM change_log WHERE seq > ? ORDER BY seq LIMIT ?",
+            (cursor, _PAGE_SIZE),
+        ).fetchall()
+        for seq, kind, data in rows:
+            cursor = seq
+            try:
+                payload = json.loads(data)
+            except (json.JSONDecodeError, TypeError):
+                payload = data
+            yield _format(seq, kind, payload)
+        if rows:
+            idle_since = time.monotonic()
+            if len(rows) == _PAGE_SIZE:
+                continue
+
+        if max_idle_s is not None and time.monotonic() - idle_since >= max_idle_s:
+            return
+        wait_s = heartbeat_s if max_idle_s is None else min(heartbeat_s, max_idle_s)
+        with _cond:
+            woke = _cond.wait_for(lambda: _version != seen or _closed, timeout=wait_s)
+        if not woke:
+            yield ": heartbeat\n\n"
@@ -1,9 +1,17 @@
 """
 consumer.py — Bus event consumer for the wicked-garden daemon.
 
-Polls wicked-bus for new events matching ``wicked.garden.*`` (and related
-garden-relevant event prefixes) on a configurable interval, stores them in the
-``garden_events`` table, and dispatches them to a caller-supplied callback.
+Reads new events matching ``wicked.garden.*`` (and related garden-relevant
+event prefixes) from wicked-bus, stores them in the ``garden_events`` table,
+and dispatches them to a caller-supplied callback.
+
+When the bus SQLite store is readable (``$WICKED_BUS_DATA_DIR/bus.db`` or
+``~/.something-wicked/wicked-bus/bus.db``) the consumer reads it directly:
+one keyset query on ``event_id`` covers every watched prefix, ``PRAGMA
+data_version`` tells it whether anything was committed since the last look,
+a full page is drained immediately and an idle consumer backs off from
+``_MIN_WAIT_S`` to ``_IDLE_MAX_WAIT_S``. Otherwise it falls back to one
+``npx wicked-bus query`` per prefix every ``poll_interval_ms``.
 
 Graceful degradation: if the bus is unavailable or a poll fails, the error is
 logged and the consumer continues — it never crashes the daemon.
@@ -24,6 +32,7 @@ from __future__ import annotations
 
 import json
 import logging
+import os
 import sqlite3
 import subprocess
 import threading
@@ -57,6 +66,34 @@ _PAGE_SIZE = 100
 # Timeout for each bus query subprocess call (seconds).
 _QUERY_TIMEOUT_S = 10
 
+# Direct-read wait bounds (seconds): after a non-empty page the consumer looks
+# again after _MIN_WAIT_S; each idle look doubles the wait up to
+# _IDLE_MAX_WAIT_S. An idle look is one PRAGMA — no query, no subprocess.
+_MIN_WAIT_S = 0.02
+_IDLE_MAX_WAIT_S = 0.25
+
+# Columns the direct path reads; any missing → CLI fallback.
+_BUS_REQUIRED_COLUMNS = frozenset({"event_id", "event_type", "payload"})
+
+# projector_state key for the direct path's keyset cursor (bus event_id).
+_KEY_BUS_EVENT_ID = "consumer.bus_event_id"
+
+# Emitted by the daemon itself — never re-consumed (council feedback loop).
+_SELF_EMITTED = "wicked.garden.council.voted"
+
+
+def bus_db_path() -> str:
+    """Resolve the bus DB the same way wicked-bus paths.js does (env → home)."""
+    override = os.environ.get("WICKED_BUS_DATA_DIR")
+    base = override or os.path.join(os.path.expanduser("~"), ".something-wicked", "wicked-bus")
+    return os.path.join(base, "bus.db")
+
+
+def _prefix_bounds(prefix: str) -> tuple[str, str]:
+    """Half-open ``[lo, hi)`` range matching every string starting with
+    ``prefix`` — usable by an index on ``event_type``, unlike ``LIKE``."""
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
 
 class EventConsumer:
     """Polls wicked-bus for garden-relevant events and dispatches them.
@@ -67,10 +104,19 @@ class EventConsumer:
 
     Args:
         db_conn: Open sqlite3 connection (check_same_thread=False).
-        poll_interval_ms: Milliseconds between bus polls. Default 5000.
+        poll_interval_ms: Milliseconds between CLI polls when the bus store
+                  cannot be read directly. Default 5000.
         on_event: Optional callback invoked for each new event after it is
                   stored. Signature: ``(event_type: str, payload: dict) -> None``.
                   Exceptions raised by the callback are caught and logged.
+        bus_db: Path to the wicked-bus SQLite store. Defaults to
+                  :func:`bus_db_path`.
+        on_batch: Optional page callback for the direct path, used instead of
+                  ``on_event`` there. Signature: ``(events, cursor) -> None``
+                  where ``events`` is a list of ``(event_type, payload)`` and
+                  ``cursor`` the ``(key, value)`` projector_state entry to
+                  commit with the page (see ``Projector.apply_batch``). If it
+                  raises, the cursor is not advanced and the page is re-read.
     """
 
     def __init__(
@@ -78,13 +124,20 @@ class EventConsumer:
         db_conn: sqlite3.Connection,
         poll_interval_ms: int = 5000,
         on_event: Optional[Callable[[str, dict[str, Any]], None]] = None,
+        bus_db: Optional[str] = None,
+        on_batch: Optional[Callable[[list[tuple[str, dict[str, Any]]], tuple[str, Any]], None]] = None,
     ) -> None:
         self._conn = db_conn
         self._interval_s = poll_interval_ms / 1000.0
         self._on_event = on_event
+        self._on_batch = on_batch
         self._stop_flag = threading.Event()
         self._thread: Optional[threading.Thread] = None
         self._cursor: Optional[str] = self._load_cursor()
+        self._bus_db = bus_db or bus_db_path()
+        self._bus_conn: Optional[sqlite3.Connection] = None
+        self._bus_data_version: Optional[int] = None
+        self._bus_event_id: Optional[int] = None
 
     # ------------------------------------------------------------------
     # Public API
@@ -117,14 +170,185 @@ class EventConsumer:
 
     def _poll_loop(self) -> None:
         """Main polling loop — runs in the background thread."""
+        wait = _MIN_WAIT_S
         while not self._stop_flag.is_set():
             try:
-                self._poll_once()
+                fetched = self._poll_once()
             except Exception as exc:  # noqa: BLE001
                 logger.error("EventConsumer poll error (continuing): %s", exc, exc_info=True)
-            self._stop_flag.wait(timeout=self._interval_s)
+                fetched = None
+            if fetched is None:
+                wait = self._interval_s  # CLI path — fixed interval
+            elif fetched >= _PAGE_SIZE:
+                continue  # full page — more are waiting, drain now
+            elif fetched > 0:
+                wait = _MIN_WAIT_S
+            else:
+                wait = min(max(wait, _MIN_WAIT_S) * 2, _IDLE_MAX_WAIT_S)
+            self._stop_flag.wait(timeout=wait)
+        self._close_bus()
+
+    def _poll_once(self) -> Optional[int]:
+        """Fetch new events once.
+
+        Returns the number of events read from the bus store, or None when
+        the CLI fallback ran (its count is not tracked).
+        """
+        fetched = self._poll_direct()
+        if fetched is not None:
+            return fetched
+        self._poll_cli()
+        return None
+
+    # ------------------------------------------------------------------
+    # Direct bus-store path
+    # ------------------------------------------------------------------
+
+    def _open_bus(self) -> Optional[sqlite3.Connection]:
+        """Open (once) a read-only connection to the bus store, or None."""
+        if self._bus_conn is not None:
+            return self._bus_conn
+        if not os.path.isfile(self._bus_db):
+            return None
+        try:
+            conn = sqlite3.connect(f"file:{self._bus_db}?mode=ro", uri=True, timeout=2.0)
+            conn.row_factory = sqlite3.Row
+            cols = {r[1] for r in conn.execute("PRAGMA table_info(events)")}
+        except sqlite3.Error as exc:
+            logger.debug("bus store unreadable (%s); using CLI poll", exc)
+            return None
+        if not _BUS_REQUIRED_COLUMNS <= cols:
+            logger.warning(
+                "bus store events table lacks %s; using CLI poll",
+                sorted(_BUS_REQUIRED_COLUMNS - cols),
+            )
+            conn.close()
+            return None
+        self._bus_conn = conn
+        self._bus_data_version = None
+        return conn
+
+    def _close_bus(self) -> None:
+        if self._bus_conn is not None:
+            try:
+                self._bus_conn.close()
+            except Exception:  # noqa: BLE001
+                pass
+            self._bus_conn = None
+
+    def _poll_direct(self) -> Optional[int]:
+        """Read one page of watched events past the keyset cursor.
+
+        Returns the page size (0 when nothing was committed since the last
+        look), or None when the store cannot be read.
+        """
+        conn = self._open_bus()
+        if conn is None:
+            return None
+        try:
+            data_version = conn.execute("PRAGMA data_version").fetchone()[0]
+            if data_version == self._bus_data_version:
+                return 0
+            if self._bus_event_id is None:
+                self._bus_event_id = self._load_bus_event_id()
+            clauses = " OR ".join(
+                "(event_type >= ? AND event_type < ?)" for _ in _WATCH_PREFIXES
+            )
+            params: list[Any] = [self._bus_event_id]
+            for prefix in _WATCH_PREFIXES:
+                params.extend(_prefix_bounds(prefix))
+            params.append(_PAGE_SIZE)
+            rows = conn.execute(
+                f"SELECT event_id, event_type, payload FROM events "
+                f"WHERE event_id > ? AND ({clauses}) "
+                f"ORDER BY event_id LIMIT ?",
+                params,
+            ).fetchall()
+        except sqlite3.Error as exc:
+            logger.warning("bus store read failed (%s); reopening", exc)
+            self._close_bus()
+            return None
+
+        page: list[tuple[str, str, dict[str, Any]]] = []
+        for row in rows:
+            if row["event_type"] == _SELF_EMITTED:
+                continue
+            try:
+                payload = json.loads(row["payload"]) if row["payload"] else {}
+            except (json.JSONDecodeError, TypeError):
+                payload = {}
+            page.append((str(row["event_id"]), row["event_type"], payload))
+
+        if rows and not self._apply_page(page, int(rows[-1]["event_id"])):
+            return 0  # cursor not advanced — the page is re-read next look
+        if len(rows) < _PAGE_SIZE:
+            # Caught up with this snapshot; skip the query until the next commit.
+            self._bus_data_version = data_version
+        return len(rows)
+
+    def _apply_page(self, page: list[tuple[str, str, dict[str, Any]]], last_event_id: int) -> bool:
+        """Store a direct-path page and hand it on; True once the keyset
+        cursor has advanced to ``last_event_id``.
+
+        The ``garden_events`` rows go in one transaction. With ``on_batch``
+        the callback receives the page plus the cursor entry to commit with
+        its own writes; otherwise ``on_event`` runs per event and the cursor
+        is saved here.
+        """
+        received_at = now_iso()
+        try:
+            with get_write_lock():
+                self._conn.executemany(
+                    """
+                    INSERT OR IGNORE INTO garden_events
+                        (id, event_type, payload, received_at, processed)
+                    VALUES (?, ?, ?, ?, 0)
+                    """,
+                    [(eid, et, json.dumps(p), received_at) for eid, et, p in page],
+                )
+                self._conn.commit()
+        except Exception as exc:  # noqa: BLE001
+            logger.error("Failed to store event page ending at %s: %s", last_event_id, exc)
+            return False
+
+        events = [(et, p) for _, et, p in page]
+        if self._on_batch:
+            try:
+                self._on_batch(events, (_KEY_BUS_EVENT_ID, last_event_id))
+            except Exception as exc:  # noqa: BLE001
+                logger.error("on_batch callback raised for page ending at %s: %s",
+                             last_event_id, exc, exc_info=True)
+                # The callback may have committed the cursor before raising
+                # (e.g. a hook submit after the projector transaction); trust
+                # the persisted value so a committed page is not re-applied.
+                self._bus_event_id = max(self._bus_event_id, self._load_bus_event_id())
+                return self._bus_event_id >= last_event_id
+        else:
+            for event_type, payload in events:
+                self._notify(event_type, payload)
+            self._save_state(_KEY_BUS_EVENT_ID, last_event_id)
+        self._bus_event_id = last_event_id
+        return True
+
+    def _load_bus_event_id(self) -> int:
+        """Keyset cursor for the direct path.
+
+        Seeded from the CLI-era cursor when that was a numeric event id, so
+        switching paths neither replays nor skips history.
+        """
+        value = self._load_state(_KEY_BUS_EVENT_ID)
+        if value is None:
+            value = self._cursor
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            return 0
+
+    # ------------------------------------------------------------------
+    # CLI fallback path
+    # ------------------------------------------------------------------
 
-    def _poll_once(self) -> None:
+    def _poll_cli(self) -> None:
         """Poll wicked-bus for new events since the last cursor.
 
         Calls::
@@ -183,14 +407,18 @@ class EventConsumer:
         for raw_event in events:
             self._store_event(raw_event)
 
-    def _store_event(self, raw_event: dict[str, Any]) -> None:
-        """Persist a raw bus event and dispatch it to the callback."""
+    def _store_event(self, raw_event: dict[str, Any], advance_cursor: bool = True) -> None:
+        """Persist a raw bus event and dispatch it to the callback.
+
+        ``advance_cursor=False`` leaves cursor persistence to the caller (the
+        direct path saves its keyset cursor once per page).
+        """
         event_type = raw_event.get("type", "")
 
         # Self-consumption prevention: skip events emitted by this daemon to
         # avoid feedback loops (e.g. wicked.garden.council.voted re-triggering
         # council sessions).
-        if event_type == "wicked.garden.council.voted":
+        if event_type == _SELF_EMITTED:
             logger.debug("Skipping self-emitted event: %s", event_type)
             return
 
@@ -215,9 +443,13 @@ class EventConsumer:
             return
 
         # Advance cursor to this event's ID so we don't re-fetch it.
-        self._cursor = event_id
-        self._save_cursor(event_id)
+        if advance_cursor:
+            self._cursor = event_id
+            self._save_cursor(event_id)
+
+        self._notify(event_type, payload)
 
+    def _notify(self, event_type: str, payload: dict[str, Any]) -> None:
         if self._on_event:
             try:
                 self._on_event(event_type, payload)
@@ -230,9 +462,16 @@ class EventConsumer:
 
     def _load_cursor(self) -> Optional[str]:
         """Load the last-seen event cursor from projector_state."""
+        return self._load_state("consumer.cursor")
+
+    def _save_cursor(self, cursor: str) -> None:
+        """Persist the cursor to projector_state."""
+        self._save_state("consumer.cursor", cursor)
+
+    def _load_state(self, key: str) -> Any:
         try:
             row = self._conn.execute(
-                "SELECT value FROM projector_state WHERE key = 'consumer.cursor'"
+                "SELECT value FROM projector_state WHERE key = ?", (key,)
             ).fetchone()
             if row:
                 return json.loads(row["value"])
@@ -240,17 +479,16 @@ class EventConsumer:
             pass
         return None
 
-    def _save_cursor(self, cursor: str) -> None:
-        """Persist the cursor to projector_state."""
+    def _save_state(self, key: str, value: Any) -> None:
         try:
             with get_write_lock():
                 self._conn.execute(
                     """
                     INSERT OR REPLACE INTO projector_state (key, value, updated_at)
-                    VALUES ('consumer.cursor', ?, ?)
+                    VALUES (?, ?, ?)
                     """,
-                    (json.dumps(cursor), now_iso()),
+                    (key, json.dumps(value), now_iso()),
                 )
                 self._conn.commit()
         except Exception as exc:  # noqa: BLE001
-            logger.debug("Failed to save consumer cursor: %s", exc)
+            logger.debug("Failed to save consumer state %s: %s", key, exc)
@@ -1,22 +1,35 @@
 """
 council.py — Council orchestrator for the wicked-garden daemon.
 
-Council is *synchronous* — the caller POSTs a question, gets back votes +
-synthesis. For v0.1 the council runs a single synthesis call via the Anthropic
-API (requires ANTHROPIC_API_KEY in the environment) and records the session in
-the ``council_sessions`` table.
+Council runs are *jobs*: :func:`submit_council` records a ``council_sessions``
+row and returns its id at once, while the members run concurrently on a
+background pool under one overall deadline. Each member's vote is appended to
+the row as it arrives (``members_done`` / ``members_total`` report progress),
+so ``GET /council/<id>`` can be polled while the council deliberates. When
+every member has answered — or the deadline passes — the votes are reduced to
+a verdict and the row moves to ``completed`` (``partial`` if some members
+missed the deadline, ``failed`` if none answered).
+
+Members are CLI names (``claude``, ``gemini``, ``codex``, ...). With no
+members given, the council is a single synthesis call via the Anthropic SDK
+(requires ANTHROPIC_API_KEY) or the ``claude`` CLI — the v0.1 behaviour.
+:func:`run_council` is the synchronous wrapper that waits for the verdict.
 
 Usage::
 
-    from daemon.council import run_council
+    from daemon.council import get_session, run_council, submit_council
 
-    result = run_council(
+    session_id = submit_council(
         conn,
         topic="architecture",
         question="Should we use SQLite or Postgres for the garden DB?",
         criteria=["simplicity", "reliability", "zero-ops"],
-        timeout_s=30,
+        cli_list=["claude", "gemini"],
+        timeout_s=60,
     )
+    get_session(conn, session_id)["status"]   # "running" → "completed"
+
+    result = run_council(conn, topic="...", question="...", criteria=[])
     print(result.verdict, result.confidence)
 """
 from __future__ import annotations
@@ -28,9 +41,13 @@ import os
 import sqlite3
 import subprocess
 import sys
-from collections import namedtuple
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from datetime import datetime, timedelta, timezone
 from typing import Any, Optional
 
+from daemon import changes
 from daemon._internal import DaemonError, emit_bus_event, generate_id, now_iso
 from daemon.db import get_write_lock
 
@@ -55,79 +72,209 @@ _COUNCIL_EVENT_TYPE = "wicked.garden.council.voted"
 _COUNCIL_DOMAIN = "wicked-garden"
 _COUNCIL_SUBDOMAIN = "garden.council"
 
+# Member name for the single SDK/CLI synthesis call used when no members are given.
+_SYNTHESIS_MEMBER = "synthesis"
+
+# The member CLIs a council may run, with their argv prefixes; the prompt is
+# appended. Any other member name is rejected before a session is created.
+_MEMBER_COMMANDS: dict[str, list[str]] = {
+    "claude": ["claude", "--output-format", "text", "-p"],
+    "gemini": ["gemini", "-p"],
+    "codex": ["codex", "exec"],
+}
+
+# Concurrent council jobs, and concurrent member calls across all jobs.
+_MAX_CONCURRENT_COUNCILS = 4
+_MAX_CONCURRENT_MEMBERS = 16
+
+_job_pool = ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_COUNCILS, thread_name_prefix="council-job")
+_member_pool = ThreadPoolExecutor(max_workers=_MAX_CONCURRENT_MEMBERS, thread_name_prefix="council-member")
+
 
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
 
 
-def run_council(
+def validate_members(cli_list: Optional[list[str]]) -> None:
+    """Reject member names that are not a known council CLI.
+
+    Members come from the ``POST /council`` body and become subprocess argv,
+    so only the entries of ``_MEMBER_COMMANDS`` (and the SDK synthesis
+    member) are accepted.
+
+    Raises:
+        ValueError: Naming the unknown members.
+    """
+    unknown = sorted({
+        m for m in (cli_list or [])
+        if m and m != _SYNTHESIS_MEMBER and m not in _MEMBER_COMMANDS
+    })
+    if unknown:
+        allowed = ", ".join(sorted(_MEMBER_COMMANDS))
+        raise ValueError(f"unknown council members {unknown}; expected any of: {allowed}")
+
+
+def submit_council(
     conn: sqlite3.Connection,
     topic: str,
     question: str,
     criteria: list[str],
     cli_list: Optional[list[str]] = None,
     timeout_s: int = _DEFAULT_TIMEOUT_S,
-) -> CouncilResult:
-    """Run a council session synchronously.
-
-    Creates a council_sessions row, calls the Anthropic API for a synthesis
-    verdict, updates the row, emits a ``wicked.garden.council.voted`` bus event, and
-    returns a CouncilResult.
+) -> str:
+    """Start a council session in the background and return its id.
 
     Args:
-        conn: Open sqlite3 connection.
+        conn: Open sqlite3 connection (the daemon's writer).
         topic: Council topic identifier (e.g. ``"architecture"``).
         question: The question put to council.
-        criteria: Evaluation criteria list (e.g. ``["simplicity", "reliability"]``).
-        cli_list: Specific CLI names to use as voters. Not used in v0.1 (single
-                  synthesis path); reserved for future multi-model expansion.
-        timeout_s: Maximum seconds to wait for the API call.
+        criteria: Evaluation criteria list.
+        cli_list: Member CLI names, run concurrently. Empty/None runs the
+                  single synthesis member.
+        timeout_s: Overall deadline for the whole council, in seconds.
+
+    Returns:
+        The new session id; poll :func:`get_session` for progress.
+
+    Raises:
+        ValueError: If ``cli_list`` names an unknown member CLI.
+    """
+    session_id, members = _start_session(conn, topic, question, cli_list, timeout_s)
+    _job_pool.submit(
+        _run_job_logged, conn, session_id, topic, question, criteria, members, timeout_s,
+    )
+    return session_id
+
+
+def run_council(
+    conn: sqlite3.Connection,
+    topic: str,
+    question: str,
+    criteria: list[str],
+    cli_list: Optional[list[str]] = None,
+    timeout_s: int = _DEFAULT_TIMEOUT_S,
+) -> CouncilResult:
+    """Run a council session and wait for its verdict.
+
+    Same job as :func:`submit_council`, executed on the calling thread: the
+    row is created, members run concurrently under ``timeout_s``, votes are
+    recorded as they arrive, and a ``wicked.garden.council.voted`` bus event
+    is emitted on completion.
 
     Returns:
         CouncilResult namedtuple with fields:
         ``session_id``, ``verdict``, ``confidence``, ``votes``, ``rationale``.
 
     Raises:
-        DaemonError: If the API call fails and no fallback is available.
+        ValueError: If ``cli_list`` names an unknown member CLI.
+        DaemonError: If no member produced a result.
     """
-    session_id = generate_id()
-    created_at = now_iso()
+    session_id, members = _start_session(conn, topic, question, cli_list, timeout_s)
+    return _run_job(conn, session_id, topic, question, criteria, members, timeout_s)
+
+
+# ---------------------------------------------------------------------------
+# Job execution
+# ---------------------------------------------------------------------------
 
-    # Persist the session as 'pending'
+
+def _start_session(
+    conn: sqlite3.Connection,
+    topic: str,
+    question: str,
+    cli_list: Optional[list[str]],
+    timeout_s: int,
+) -> tuple[str, list[str]]:
+    """Insert the ``running`` session row; return ``(session_id, members)``."""
+    validate_members(cli_list)
+    session_id = generate_id()
+    members = list(dict.fromkeys(m for m in (cli_list or []) if m)) or [_SYNTHESIS_MEMBER]
+    # Same format as now_iso(), which stamps created_at/completed_at.
+    deadline_at = (datetime.now(tz=timezone.utc) + timedelta(seconds=timeout_s)).isoformat()
     with get_write_lock():
         conn.execute(
             """
             INSERT INTO council_sessions
-                (id, topic, question, status, created_at)
-            VALUES (?, ?, ?, 'pending', ?)
+                (id, topic, question, status, votes, created_at,
+                 members_total, members_done, deadline_at)
+            VALUES (?, ?, ?, 'running', '[]', ?, ?, 0, ?)
             """,
-            (session_id, topic, question, created_at),
+            (session_id, topic, question, now_iso(), len(members), deadline_at),
         )
+        _record_change(conn, session_id)
         conn.commit()
-    logger.info("Council session %s started: topic=%r", session_id, topic)
+    changes.notify()
+    logger.info("Council session %s started: topic=%r members=%s", session_id, topic, members)
+    return session_id, members
 
+
+def _run_job_logged(*args: Any) -> None:
+    """Pool entry point — failures are already recorded on the row."""
     try:
-        result = _synthesise(
-            session_id=session_id,
-            topic=topic,
-            question=question,
-            criteria=criteria,
-            timeout_s=timeout_s,
-        )
+        _run_job(*args)
+    except DaemonError:
+        pass
     except Exception as exc:  # noqa: BLE001
-        logger.error("Council session %s failed: %s", session_id, exc, exc_info=True)
-        _update_session(conn, session_id, status="failed", verdict="error", votes=[], rationale=str(exc))
-        raise DaemonError(f"Council session failed: {exc}") from exc
+        logger.error("Council job crashed: %s", exc, exc_info=True)
+
 
-    # Persist result
+def _run_job(
+    conn: sqlite3.Connection,
+    session_id: str,
+    topic: str,
+    question: str,
+    criteria: list[str],
+    members: list[str],
+    timeout_s: int,
+) -> CouncilResult:
+    """Run every member concurrently, record votes as they land, then finalise."""
+    prompt = _build_prompt(topic, question, criteria)
+    deadline = time.monotonic() + timeout_s
+    pending: dict[Future, str] = {
+        _member_pool.submit(_run_member, session_id, member, prompt, timeout_s): member
+        for member in members
+    }
+    results: list[tuple[str, CouncilResult]] = []
+    errors: list[str] = []
+
+    while pending:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        done, _ = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+        for future in done:
+            member = pending.pop(future)
+            try:
+                member_result = future.result()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("Council %s member %s failed: %s", session_id, member, exc)
+                errors.append(f"{member}: {exc}")
+                _record_member(conn, session_id, None)
+                continue
+            results.append((member, member_result))
+            _record_member(conn, session_id, _member_vote(member, member_result))
+
+    for future in pending:
+        future.cancel()
+    missed = [pending[f] for f in pending]
+
+    if not results:
+        reason = "; ".join(errors) or f"no member answered within {timeout_s}s"
+        logger.error("Council session %s failed: %s", session_id, reason)
+        _update_session(conn, session_id, status="failed", verdict="error", votes=None,
+                        rationale=reason, confidence=None)
+        raise DaemonError(f"Council session failed: {reason}")
+
+    result = _reduce(session_id, results)
     _update_session(
         conn,
         session_id,
-        status="completed",
+        status="partial" if missed else "completed",
         verdict=result.verdict,
         votes=result.votes,
         rationale=result.rationale,
+        confidence=result.confidence,
     )
 
     # Emit bus event (fire-and-forget)
@@ -147,12 +294,95 @@ def run_council(
     )
 
     logger.info(
-        "Council session %s completed: verdict=%r confidence=%.2f",
-        session_id, result.verdict, result.confidence,
+        "Council session %s completed: verdict=%r confidence=%.2f missed=%s",
+        session_id, result.verdict, result.confidence, missed,
     )
     return result
 
 
+def _run_member(session_id: str, member: str, prompt: str, timeout_s: int) -> CouncilResult:
+    if member == _SYNTHESIS_MEMBER:
+        return _synthesise(session_id=session_id, prompt=prompt, timeout_s=timeout_s)
+    return _synthesise_via_cli(session_id, prompt, timeout_s, cli=member)
+
+
+def _member_vote(member: str, result: CouncilResult) -> dict[str, Any]:
+    return {
+        "voter": member,
+        "vote": result.verdict,
+        "confidence": result.confidence,
+        "rationale": result.rationale[:500],
+    }
+
+
+def _reduce(session_id: str, results: list[tuple[str, CouncilResult]]) -> CouncilResult:
+    """Combine member results into one verdict.
+
+    A lone synthesis member is returned as-is (its advisor votes included).
+    Otherwise the most common verdict wins; confidence is the winners' mean
+    confidence scaled by their share of the answering members.
+    """
+    if len(results) == 1 and results[0][0] == _SYNTHESIS_MEMBER:
+        return results[0][1]._replace(session_id=session_id)
+
+    tally = Counter(r.verdict.strip().lower() for _, r in results)
+    winner_key, count = tally.most_common(1)[0]
+    winners = [(m, r) for m, r in results if r.verdict.strip().lower() == winner_key]
+    confidence = sum(r.confidence for _, r in winners) / len(winners) * count / len(results)
+    return CouncilResult(
+        session_id=session_id,
+        verdict=winners[0][1].verdict,
+        confidence=round(confidence, 3),
+        votes=[_member_vote(m, r) for m, r in results],
+        rationale="\n\n".join(f"[{m}] {r.rationale}" for m, r in winners)[:2000],
+    )
+
+
+def _record_member(
+    conn: sqlite3.Connection,
+    session_id: str,
+    vote: Optional[dict[str, Any]],
+) -> None:
+    """Append one member's vote (None for a failed member) and bump progress."""
+    try:
+        with get_write_lock():
+            row = conn.execute(
+                "SELECT votes FROM council_sessions WHERE id = ? AND status = 'running'",
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                return
+            votes = json.loads(row["votes"] or "[]")
+            if vote is not None:
+                votes.append(vote)
+            conn.execute(
+                """
+                UPDATE council_sessions
+                SET votes = ?, members_done = members_done + 1
+                WHERE id = ?
+                """,
+                (json.dumps(votes), session_id),
+            )
+            _record_change(conn, session_id)
+            conn.commit()
+        changes.notify()
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Failed to record council vote for %s: %s", session_id, exc)
+
+
+def _record_change(conn: sqlite3.Connection, session_id: str) -> None:
+    """Append the session's progress to the /stream change feed (caller commits)."""
+    row = conn.execute(
+        """
+        SELECT status, members_done, members_total, verdict, confidence
+        FROM council_sessions WHERE id = ?
+        """,
+        (session_id,),
+    ).fetchone()
+    if row is not None:
+        changes.record(conn, "council", {"session_id": session_id, **dict(row)})
+
+
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
@@ -161,9 +391,7 @@ def run_council(
 def _synthesise(
     *,
     session_id: str,
-    topic: str,
-    question: str,
-    criteria: list[str],
+    prompt: str,
     timeout_s: int,
 ) -> CouncilResult:
     """Call the Anthropic API (via SDK or subprocess) and return a CouncilResult.
@@ -174,7 +402,6 @@ def _synthesise(
     3. If neither is available, raise DaemonError.
     """
     api_key = os.environ.get("ANTHROPIC_API_KEY", "")
-    prompt = _build_prompt(topic, question, criteria)
 
     # Try SDK first
     try:
@@ -228,10 +455,16 @@ def _synthesise_via_sdk(
     return _parse_council_response(session_id, raw)
 
 
-def _synthesise_via_cli(session_id: str, prompt: str, timeout_s: int) -> CouncilResult:
-    """Use the ``claude`` CLI subprocess to run the council synthesis."""
+def _synthesise_via_cli(
+    session_id: str,
+    prompt: str,
+    timeout_s: int,
+    cli: str = "claude",
+) -> CouncilResult:
+    """Run ``prompt`` through a member CLI subprocess (``claude`` by default)."""
+    argv = _MEMBER_COMMANDS[cli]
     result = subprocess.run(
-        ["claude", "-p", prompt, "--output-format", "text"],
+        [*argv, prompt],
         capture_output=True,
         text=True,
         timeout=timeout_s,
@@ -277,10 +510,14 @@ def _update_session(
     session_id: str,
     status: str,
     verdict: str,
-    votes: list[Any],
+    votes: Optional[list[Any]],
     rationale: str,
+    confidence: Optional[float],
 ) -> None:
-    """Update a council_sessions row after the session completes or fails."""
+    """Finalise a council_sessions row after the session completes or fails.
+
+    ``votes=None`` keeps the per-member votes already recorded.
+    """
     try:
         with get_write_lock():
             conn.execute(
@@ -288,19 +525,25 @@ def _update_session(
                 UPDATE council_sessions
                 SET status = ?,
                     verdict = ?,
-                    votes = ?,
+                    votes = COALESCE(?, votes),
+                    rationale = ?,
+                    confidence = ?,
                     completed_at = ?
                 WHERE id = ?
                 """,
                 (
                     status,
                     verdict,
-                    json.dumps(votes),
+                    json.dumps(votes) if votes is not None else None,
+                    rationale,
+                    confidence,
                     now_iso(),
                     session_id,
                 ),
             )
+            _record_change(conn, session_id)
             conn.commit()
+        changes.notify()
     except Exception as exc:  # noqa: BLE001
         logger.error("Failed to update council session %s: %s", session_id, exc)
 
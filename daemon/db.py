@@ -4,12 +4,18 @@ db.py — SQLite connection manager for the wicked-garden daemon.
 Auto-creates `.wicked-garden/garden.db` in the current working directory.
 Thread-safe via check_same_thread=False + a module-level threading.Lock.
 
+The shared connection from ``get_connection()`` is the daemon's single
+writer (serialised by ``get_write_lock()``). HTTP handlers read through
+``get_read_connection()`` instead: one query-only WAL connection per thread,
+so readers never queue behind the writer or each other.
+
 Usage::
 
-    from daemon.db import get_connection
+    from daemon.db import get_connection, get_read_connection
 
     conn = get_connection()           # uses default path
     conn = get_connection("/path/to/garden.db")  # explicit path
+    reader = get_read_connection()    # this thread's read connection
 """
 from __future__ import annotations
 
@@ -26,6 +32,16 @@ _write_lock = threading.Lock()
 _conn: Optional[sqlite3.Connection] = None
 _db_path: Optional[str] = None
 
+# Per-thread read connections, plus a registry so close_connection() can
+# close the ones opened by (possibly finished) server threads. Bumping the
+# generation invalidates every thread's cached reader at once.
+_local = threading.local()
+_read_conns: list[sqlite3.Connection] = []
+_read_generation = 0
+
+# How long a connection waits on a locked database before raising.
+_BUSY_TIMEOUT_MS = 5000
+
 # ---------------------------------------------------------------------------
 # Schema
 # ---------------------------------------------------------------------------
@@ -38,6 +54,7 @@ CREATE TABLE IF NOT EXISTS garden_events (
     received_at TEXT NOT NULL,
     processed INTEGER DEFAULT 0
 );
+CREATE INDEX IF NOT EXISTS idx_garden_events_received ON garden_events(received_at);
 
 CREATE TABLE IF NOT EXISTS council_sessions (
     id TEXT PRIMARY KEY,
@@ -47,8 +64,14 @@ CREATE TABLE IF NOT EXISTS council_sessions (
     verdict TEXT,
     votes TEXT,
     created_at TEXT NOT NULL,
-    completed_at TEXT
+    completed_at TEXT,
+    confidence REAL,
+    rationale TEXT,
+    members_total INTEGER NOT NULL DEFAULT 0,
+    members_done INTEGER NOT NULL DEFAULT 0,
+    deadline_at TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_council_sessions_created ON council_sessions(created_at);
 
 CREATE TABLE IF NOT EXISTS hitl_prompts (
     id TEXT PRIMARY KEY,
@@ -59,6 +82,7 @@ CREATE TABLE IF NOT EXISTS hitl_prompts (
     created_at TEXT NOT NULL,
     responded_at TEXT
 );
+CREATE INDEX IF NOT EXISTS idx_hitl_prompts_created ON hitl_prompts(created_at);
 
 CREATE TABLE IF NOT EXISTS projector_state (
     key TEXT PRIMARY KEY,
@@ -66,6 +90,33 @@ CREATE TABLE IF NOT EXISTS projector_state (
     updated_at TEXT NOT NULL
 );
 
+-- Native task projection (wicked.garden.task.* events). Native task ids are
+-- only unique within a session, hence the composite key.
+CREATE TABLE IF NOT EXISTS tasks (
+    session_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    subject TEXT,
+    status TEXT NOT NULL DEFAULT 'pending',
+    event_type TEXT,
+    chain_id TEXT,
+    metadata TEXT NOT NULL DEFAULT '{}',
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    PRIMARY KEY (session_id, id)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_id ON tasks(id);
+CREATE INDEX IF NOT EXISTS idx_tasks_session_status ON tasks(session_id, status, updated_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_status ON tasks(status, updated_at);
+CREATE INDEX IF NOT EXISTS idx_tasks_chain ON tasks(chain_id, updated_at);
+
+-- Client-visible change feed for GET /stream (see daemon/changes.py).
+CREATE TABLE IF NOT EXISTS change_log (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    data TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+
 CREATE TABLE IF NOT EXISTS hooks (
     id TEXT PRIMARY KEY,
     event_pattern TEXT NOT NULL,
@@ -76,6 +127,17 @@ CREATE TABLE IF NOT EXISTS hooks (
 """
 
 
+# Columns added after a table first shipped: CREATE TABLE IF NOT EXISTS leaves
+# existing databases alone, so _apply_schema adds any that are missing.
+_ADDED_COLUMNS: tuple[tuple[str, str, str], ...] = (
+    ("council_sessions", "confidence", "REAL"),
+    ("council_sessions", "rationale", "TEXT"),
+    ("council_sessions", "members_total", "INTEGER NOT NULL DEFAULT 0"),
+    ("council_sessions", "members_done", "INTEGER NOT NULL DEFAULT 0"),
+    ("council_sessions", "deadline_at", "TEXT"),
+)
+
+
 def _default_db_path() -> Path:
     """Return the default database path: .wicked-garden/garden.db in cwd."""
     db_dir = Path.cwd() / ".wicked-garden"
@@ -114,7 +176,12 @@ def get_connection(db_path: Optional[str] = None) -> sqlite3.Connection:
             check_same_thread=False,
         )
         conn.row_factory = sqlite3.Row
+        # Only takes effect on a new file, and only before WAL is enabled;
+        # daemon.retention converts older databases once enough pages are free.
+        conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
         conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={_BUSY_TIMEOUT_MS}")
         conn.execute("PRAGMA foreign_keys=ON")
         _apply_schema(conn)
 
@@ -131,6 +198,13 @@ def _apply_schema(conn: sqlite3.Connection) -> None:
     additional locking is needed here.
     """
     conn.executescript(SCHEMA)
+    existing: dict[str, set[str]] = {}
+    for table, column, decl in _ADDED_COLUMNS:
+        if table not in existing:
+            existing[table] = {row[1] for row in conn.execute(f"PRAGMA table_info({table})")}
+        if column not in existing[table]:
+            conn.execute(f"ALTER TABLE {table} ADD COLUMN {column} {decl}")
+            existing[table].add(column)
     conn.commit()
     logger.debug("Schema applied")
 
@@ -153,11 +227,50 @@ def get_write_lock() -> threading.Lock:
     return _write_lock
 
 
+def get_read_connection() -> sqlite3.Connection:
+    """Return the calling thread's read-only connection to the garden DB.
+
+    Opened lazily on the path chosen by ``get_connection()`` with
+    ``PRAGMA query_only`` set, so a stray write fails loudly instead of
+    bypassing the single writer. Under WAL each read sees a consistent
+    snapshot and never blocks on, or blocks, the writer.
+
+    Falls back to the shared connection when the garden DB is not a file
+    (``:memory:``) — there is nothing for a second connection to attach to.
+    """
+    if _db_path is None:
+        get_connection()
+    path = _db_path
+    if path is None or path == ":memory:":
+        return get_connection()
+
+    conn = getattr(_local, "conn", None)
+    if conn is not None and getattr(_local, "generation", None) == _read_generation:
+        return conn
+
+    conn = sqlite3.connect(path, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.execute(f"PRAGMA busy_timeout={_BUSY_TIMEOUT_MS}")
+    conn.execute("PRAGMA query_only=ON")
+    with _lock:
+        _read_conns.append(conn)
+        _local.generation = _read_generation
+    _local.conn = conn
+    return conn
+
+
 def close_connection() -> None:
-    """Close the cached connection. Primarily for tests / graceful shutdown."""
-    global _conn, _db_path
+    """Close the cached connections. Primarily for tests / graceful shutdown."""
+    global _conn, _db_path, _read_generation
 
     with _lock:
+        for reader in _read_conns:
+            try:
+                reader.close()
+            except Exception:
+                pass
+        _read_conns.clear()
+        _read_generation += 1
         if _conn is not None:
             try:
                 _conn.close()
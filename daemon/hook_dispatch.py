@@ -1,39 +1,65 @@
 """
 hook_dispatch.py — Hook dispatcher for the wicked-garden daemon.
 
-Routes wicked-bus events to registered garden hooks. Hooks are shell scripts or
-Python files in the garden's ``hooks/`` directory. Matched by filename prefix
-convention::
+Routes wicked-bus events to registered garden hooks. Hooks come from two
+places:
 
-    on-{event_type_with_dots_replaced_by_dashes}.*
+- Shell scripts or Python files in the garden's ``hooks/`` directory, matched
+  by filename prefix convention::
 
-Examples:
-    - ``on-wicked-garden-skill-installed.sh``
-    - ``on-wicked-garden-council-voted.py``
+      on-{event_type_with_dots_replaced_by_dashes}.*
+
+  Examples:
+      - ``on-wicked-garden-skill-installed.sh``
+      - ``on-wicked-garden-council-voted.py``
+
+- Commands registered through ``POST /hooks`` (the ``hooks`` table), matched
+  by ``event_pattern`` as a shell-style glob (``wicked.garden.*``). These
+  run only when enabled (``run_registered=True`` or
+  ``WG_DAEMON_RUN_REGISTERED_HOOKS=1``; off by default, since ``/hooks`` is
+  unauthenticated), and only when the command's program resolves to a file
+  inside the hooks directory — otherwise they are inert metadata.
+
+Lookup:
+    Both sources are folded into an in-memory index keyed by event type. The
+    index is rebuilt when the hooks directory's mtime changes or when
+    :meth:`HookDispatcher.invalidate` is called (the ``/hooks`` POST/DELETE
+    handlers do), so a dispatch costs one ``stat`` instead of a directory scan.
 
 Execution:
     - ``.py`` hooks are invoked with the active Python interpreter.
     - All other hooks (shell scripts, executables) are invoked directly.
     - The event payload is passed as a JSON string via the ``WICKED_EVENT_PAYLOAD``
-      environment variable, and also as the first positional argument.
+      environment variable, and also as the last positional argument.
+    - Hooks run on a bounded worker pool, each under its own timeout, so one
+      slow hook never delays the others or the next event.
     - Hook stdout/stderr is captured and logged at DEBUG level.
     - Hook failures are logged but never propagate — graceful degradation.
+    - Per-hook run/failure/timeout counts and latencies are kept in memory and
+      exposed by :meth:`HookDispatcher.stats` (``GET /hooks``).
 
 Usage::
 
     from daemon.hook_dispatch import HookDispatcher
 
     dispatcher = HookDispatcher(db_conn, hooks_dir=Path("hooks"))
-    dispatcher.dispatch("wicked.garden.skill.installed", {"skill": "foo"})
+    dispatcher.dispatch("wicked.garden.skill.installed", {"skill": "foo"})  # waits
+    dispatcher.submit("wicked.garden.skill.installed", {"skill": "foo"})    # returns at once
 """
 from __future__ import annotations
 
+import fnmatch
 import json
 import logging
 import os
+import shlex
 import sqlite3
 import subprocess
 import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Optional
 
@@ -43,6 +69,12 @@ from daemon.db import get_write_lock
 logger = logging.getLogger("wicked-garden.daemon.hook_dispatch")
 
 _HOOK_TIMEOUT_S = 30
+# Hook worker pool size, and how many hook runs may wait for a worker before
+# submit() blocks (backpressure instead of an unbounded queue).
+_DEFAULT_WORKERS = 4
+_MAX_PENDING = 64
+# Opt-in for running commands registered through POST /hooks.
+_ENV_RUN_REGISTERED = "WG_DAEMON_RUN_REGISTERED_HOOKS"
 
 
 def _event_type_to_prefix(event_type: str) -> str:
@@ -50,6 +82,18 @@ def _event_type_to_prefix(event_type: str) -> str:
     return "on-" + event_type.replace(".", "-")
 
 
+@dataclass(frozen=True)
+class _Hook:
+    """One runnable hook: display name plus argv (payload JSON is appended)."""
+
+    name: str
+    argv: tuple[str, ...]
+
+
+def _argv_for(path: str) -> tuple[str, ...]:
+    return (sys.executable, path) if path.endswith(".py") else (path,)
+
+
 class HookDispatcher:
     """Finds and executes garden hooks for incoming events.
 
@@ -57,111 +101,296 @@ class HookDispatcher:
         db_conn: Open sqlite3 connection (check_same_thread=False).
         hooks_dir: Path to the garden's hooks directory. May not exist yet;
                    that is not an error.
+        workers: Size of the hook worker pool.
+        timeout_s: Per-hook execution timeout in seconds.
+        run_registered: Run commands registered through ``POST /hooks``.
+                        None (default) reads ``WG_DAEMON_RUN_REGISTERED_HOOKS``;
+                        off unless that is ``1``/``true``/``yes``.
     """
 
-    def __init__(self, db_conn: sqlite3.Connection, hooks_dir: Path) -> None:
+    def __init__(
+        self,
+        db_conn: sqlite3.Connection,
+        hooks_dir: Path,
+        workers: int = _DEFAULT_WORKERS,
+        timeout_s: float = _HOOK_TIMEOUT_S,
+        run_registered: Optional[bool] = None,
+    ) -> None:
+        if run_registered is None:
+            run_registered = os.environ.get(_ENV_RUN_REGISTERED, "").strip().lower() in ("1", "true", "yes")
         self._conn = db_conn
         self._hooks_dir = Path(hooks_dir)
+        self._run_registered = run_registered
+        self._timeout_s = timeout_s
+        self._pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="garden-hook")
+        self._slots = threading.BoundedSemaphore(max(1, workers) + _MAX_PENDING)
+
+        # Index state (guarded by _index_lock).
+        self._index_lock = threading.Lock()
+        self._index_mtime: Optional[int] = None
+        self._index_stale = True
+        self._file_hooks: dict[str, list[_Hook]] = {}
+        self._pattern_hooks: list[tuple[str, _Hook]] = []
+        self._resolved: dict[str, list[_Hook]] = {}
+
+        # Per-hook counters (guarded by _stats_lock).
+        self._stats_lock = threading.Lock()
+        self._stats: dict[str, dict[str, Any]] = {}
 
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
 
     def dispatch(self, event_type: str, payload: dict[str, Any]) -> list[str]:
-        """Find and execute matching hooks for an event.
+        """Execute matching hooks for an event concurrently and wait for them.
 
         Args:
             event_type: The event type string (e.g. ``wicked.garden.skill.installed``).
             payload: The event payload dict.
 
         Returns:
-            List of hook file names that were dispatched (empty if none found).
+            List of hook names that succeeded (empty if none found).
         """
         hooks = self._find_hooks(event_type)
         if not hooks:
             logger.debug("No hooks found for event %s", event_type)
             return []
 
-        dispatched: list[str] = []
-        for hook_path in hooks:
-            success = self._execute_hook(hook_path, event_type, payload)
-            self._record_execution(hook_path, event_type, payload, success)
-            if success:
-                dispatched.append(hook_path.name)
+        futures = [(hook, self._submit(hook, event_type, payload)) for hook in hooks]
+        return [hook.name for hook, future in futures if future.result()]
 
-        return dispatched
+    def submit(self, event_type: str, payload: dict[str, Any]) -> int:
+        """Queue matching hooks for an event without waiting for them.
+
+        Blocks only when the pool's pending queue is full.
+
+        Returns:
+            Number of hooks queued.
+        """
+        hooks = self._find_hooks(event_type)
+        for hook in hooks:
+            self._submit(hook, event_type, payload)
+        return len(hooks)
+
+    def invalidate(self) -> None:
+        """Force an index rebuild on the next lookup (hook registry changed)."""
+        with self._index_lock:
+            self._index_stale = True
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Return per-hook counters keyed by hook name.
+
+        Each entry: ``runs``, ``failures``, ``timeouts``, ``avg_ms``,
+        ``max_ms``, ``last_ms``, ``last_status`` and ``last_run_at``.
+        """
+        with self._stats_lock:
+            out = {}
+            for name, entry in self._stats.items():
+                runs = entry["runs"]
+                out[name] = {
+                    "runs": runs,
+                    "failures": entry["failures"],
+                    "timeouts": entry["timeouts"],
+                    "avg_ms": round(entry["total_ms"] / runs, 1) if runs else 0.0,
+                    "max_ms": round(entry["max_ms"], 1),
+                    "last_ms": round(entry["last_ms"], 1),
+                    "last_status": entry["last_status"],
+                    "last_run_at": entry["last_run_at"],
+                }
+            return out
+
+    def file_hooks(self) -> list[tuple[str, str]]:
+        """Return ``(name, path)`` for each indexed ``hooks/`` directory hook."""
+        self._refresh_index()
+        with self._index_lock:
+            return sorted(
+                (hook.name, str(self._hooks_dir / hook.name))
+                for hooks in self._file_hooks.values()
+                for hook in hooks
+            )
+
+    def resolve_command(self, command: str) -> tuple[str, ...]:
+        """Return the argv a registered ``command`` runs as.
+
+        The program (first word) is resolved against the hooks directory and
+        must name a file inside it; ``.py`` programs run under the active
+        interpreter.
+
+        Raises:
+            ValueError: If the command is empty, unparsable, or its program
+                is not a file inside the hooks directory.
+        """
+        try:
+            argv = shlex.split(command)
+        except ValueError as exc:
+            raise ValueError(f"unparsable hook command: {exc}") from None
+        if not argv:
+            raise ValueError("empty hook command")
+        root = self._hooks_dir.resolve()
+        program = (root / argv[0]).resolve()
+        if not program.is_relative_to(root) or not program.is_file():
+            raise ValueError(f"hook command must run a file inside {root}")
+        return (*_argv_for(str(program)), *argv[1:])
+
+    def close(self) -> None:
+        """Stop accepting hook runs; queued runs that have not started are dropped."""
+        self._pool.shutdown(wait=False, cancel_futures=True)
 
     # ------------------------------------------------------------------
-    # Internal helpers
+    # Index
     # ------------------------------------------------------------------
 
-    def _find_hooks(self, event_type: str) -> list[Path]:
-        """Return all hook files that match the event type prefix convention."""
-        if not self._hooks_dir.is_dir():
-            return []
+    def _find_hooks(self, event_type: str) -> list[_Hook]:
+        """Return all hooks matching the event type, from the index."""
+        self._refresh_index()
+        with self._index_lock:
+            hooks = self._resolved.get(event_type)
+            if hooks is None:
+                hooks = list(self._file_hooks.get(_event_type_to_prefix(event_type), []))
+                hooks.extend(
+                    hook for pattern, hook in self._pattern_hooks
+                    if fnmatch.fnmatchcase(event_type, pattern)
+                )
+                self._resolved[event_type] = hooks
+            return hooks
 
-        prefix = _event_type_to_prefix(event_type)
-        matches: list[Path] = []
+    def _refresh_index(self) -> None:
+        try:
+            mtime: Optional[int] = self._hooks_dir.stat().st_mtime_ns
+        except OSError:
+            mtime = None
+        with self._index_lock:
+            if not self._index_stale and mtime == self._index_mtime:
+                return
+            self._file_hooks = self._scan_hooks_dir() if mtime is not None else {}
+            self._pattern_hooks = self._load_registered_hooks()
+            self._resolved = {}
+            self._index_mtime = mtime
+            self._index_stale = False
+
+    def _scan_hooks_dir(self) -> dict[str, list[_Hook]]:
+        """Group hook files by the ``on-…`` prefix before the first dot."""
+        index: dict[str, list[_Hook]] = {}
+        try:
+            candidates = sorted(self._hooks_dir.iterdir())
+        except OSError:
+            return index
+        for candidate in candidates:
+            if not candidate.name.startswith("on-") or not candidate.is_file():
+                continue
+            key = candidate.name.partition(".")[0]
+            index.setdefault(key, []).append(_Hook(candidate.name, _argv_for(str(candidate))))
+        return index
+
+    def _load_registered_hooks(self) -> list[tuple[str, _Hook]]:
+        if not self._run_registered:
+            return []
+        try:
+            rows = self._conn.execute(
+                "SELECT id, event_pattern, command FROM hooks ORDER BY created_at"
+            ).fetchall()
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Failed to load registered hooks: %s", exc)
+            return []
+        hooks = []
+        for row in rows:
+            try:
+                argv = self.resolve_command(row["command"])
+            except ValueError as exc:
+                logger.warning("Hook %s skipped: %s", row["id"], exc)
+                continue
+            hooks.append((row["event_pattern"], _Hook(row["id"], argv)))
+        return hooks
 
-        for candidate in sorted(self._hooks_dir.iterdir()):
-            if candidate.is_file() and candidate.stem == prefix:
-                matches.append(candidate)
-            elif candidate.is_file() and candidate.name.startswith(prefix + "."):
-                # e.g. on-wicked-garden-skill-installed.sh
-                matches.append(candidate)
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
 
-        return matches
+    def _submit(self, hook: _Hook, event_type: str, payload: dict[str, Any]) -> Future:
+        self._slots.acquire()
+        try:
+            future = self._pool.submit(self._run, hook, event_type, payload)
+        except RuntimeError:  # pool shut down
+            self._slots.release()
+            future = Future()
+            future.set_result(False)
+            return future
+        future.add_done_callback(lambda _f: self._slots.release())
+        return future
+
+    def _run(self, hook: _Hook, event_type: str, payload: dict[str, Any]) -> bool:
+        started = time.monotonic()
+        status = self._execute_hook(hook, event_type, payload)
+        elapsed_ms = (time.monotonic() - started) * 1000
+        self._record_stats(hook.name, status, elapsed_ms)
+        success = status == "ok"
+        self._record_execution(hook, event_type, payload, success)
+        return success
 
     def _execute_hook(
         self,
-        hook_path: Path,
+        hook: _Hook,
         event_type: str,
         payload: dict[str, Any],
-    ) -> bool:
-        """Execute a single hook file. Returns True on success, False on failure."""
+    ) -> str:
+        """Execute a single hook. Returns ``"ok"``, ``"failed"`` or ``"timeout"``."""
         payload_str = json.dumps(payload, default=str)
         env = {**os.environ, "WICKED_EVENT_PAYLOAD": payload_str, "WICKED_EVENT_TYPE": event_type}
+        cmd = [*hook.argv, payload_str]
 
-        if hook_path.suffix == ".py":
-            cmd = [sys.executable, str(hook_path), payload_str]
-        else:
-            cmd = [str(hook_path), payload_str]
-
-        logger.debug("Dispatching hook %s for event %s", hook_path.name, event_type)
+        logger.debug("Dispatching hook %s for event %s", hook.name, event_type)
         try:
             result = subprocess.run(
                 cmd,
-                timeout=_HOOK_TIMEOUT_S,
+                timeout=self._timeout_s,
                 capture_output=True,
                 text=True,
                 env=env,
                 check=False,
             )
             if result.stdout:
-                logger.debug("Hook %s stdout: %s", hook_path.name, result.stdout.strip())
+                logger.debug("Hook %s stdout: %s", hook.name, result.stdout.strip())
             if result.stderr:
-                logger.debug("Hook %s stderr: %s", hook_path.name, result.stderr.strip())
+                logger.debug("Hook %s stderr: %s", hook.name, result.stderr.strip())
 
             if result.returncode != 0:
                 logger.warning(
                     "Hook %s exited %d for event %s",
-                    hook_path.name, result.returncode, event_type,
+                    hook.name, result.returncode, event_type,
                 )
-                return False
-            return True
+                return "failed"
+            return "ok"
         except PermissionError as exc:
-            logger.warning("Hook %s not executable: %s", hook_path.name, exc)
-            return False
+            logger.warning("Hook %s not executable: %s", hook.name, exc)
+            return "failed"
         except subprocess.TimeoutExpired:
-            logger.warning("Hook %s timed out after %ds", hook_path.name, _HOOK_TIMEOUT_S)
-            return False
+            logger.warning("Hook %s timed out after %ss", hook.name, self._timeout_s)
+            return "timeout"
         except Exception as exc:  # noqa: BLE001
-            logger.error("Hook %s raised: %s", hook_path.name, exc, exc_info=True)
-            return False
+            logger.error("Hook %s raised: %s", hook.name, exc, exc_info=True)
+            return "failed"
+
+    def _record_stats(self, name: str, status: str, elapsed_ms: float) -> None:
+        with self._stats_lock:
+            entry = self._stats.setdefault(name, {
+                "runs": 0, "failures": 0, "timeouts": 0,
+                "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0,
+                "last_status": None, "last_run_at": None,
+            })
+            entry["runs"] += 1
+            if status != "ok":
+                entry["failures"] += 1
+            if status == "timeout":
+                entry["timeouts"] += 1
+            entry["total_ms"] += elapsed_ms
+            entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+            entry["last_ms"] = elapsed_ms
+            entry["last_status"] = status
+            entry["last_run_at"] = now_iso()
 
     def _record_execution(
         self,
-        hook_path: Path,
+        hook: _Hook,
         event_type: str,
         payload: dict[str, Any],
         success: bool,
@@ -170,7 +399,7 @@ class HookDispatcher:
         try:
             record_id = generate_id()
             status = "completed" if success else "failed"
-            prompt_text = f"hook:{hook_path.name} event:{event_type}"
+            prompt_text = f"hook:{hook.name} event:{event_type}"
             with get_write_lock():
                 self._conn.execute(
                     """
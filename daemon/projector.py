@@ -9,12 +9,24 @@ Event handlers are registered by event-type prefix. The projector is designed
 to be called from the EventConsumer callback on the consumer thread; all methods
 acquire a threading.Lock so they are safe to call from multiple threads.
 
+``apply_batch`` applies a whole consumer page in one transaction: handler
+writes land in an in-memory overlay (so repeated upserts of one key coalesce
+into a single row write), and the overlay plus an optional consumer cursor are
+committed together — a crash leaves either the whole page or none of it.
+
+Native task lifecycle events (``wicked.garden.task.*``) are projected into the
+``tasks`` table rather than the key-value store; :func:`query_tasks` and
+:func:`get_task` are the read side used by the ``/tasks`` endpoints.
+:func:`backfill_tasks` seeds the table from the native task files at daemon
+start, so tasks created before the daemon ran are served too.
+
 Usage::
 
     from daemon.projector import Projector
 
     projector = Projector(conn)
     projector.update("wicked.garden.skill.installed", {"skill": "my-skill"})
+    projector.apply_batch(page, cursor=("consumer.bus_event_id", 1234))
     state = projector.snapshot()
     val   = projector.get("daemon.health", default="unknown")
 """
@@ -24,9 +36,13 @@ import json
 import logging
 import sqlite3
 import threading
-from typing import Any, Optional
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional
 
+from daemon import changes
 from daemon._internal import now_iso
+from daemon.db import get_write_lock
 
 logger = logging.getLogger("wicked-garden.daemon.projector")
 
@@ -85,8 +101,20 @@ _HANDLERS: dict[str, str] = {
     "wicked.garden.consensus.evidence_recorded":          "_on_generic",
     "wicked.garden.consensus.gate_completed":             "_on_generic",
     "wicked.garden.consensus.gate_pending":               "_on_generic",
+    # Native task projection (tasks table)
+    "wicked.garden.task.created":                         "_on_task_changed",
+    "wicked.garden.task.updated":                         "_on_task_changed",
 }
 
+# Page-size bounds for query_tasks / GET /tasks.
+DEFAULT_TASK_LIMIT = 50
+MAX_TASK_LIMIT = 500
+
+_TASK_COLUMNS = (
+    "session_id", "id", "subject", "status", "event_type", "chain_id",
+    "metadata", "created_at", "updated_at",
+)
+
 
 class Projector:
     """Applies events to a persistent key-value state.
@@ -101,6 +129,10 @@ class Projector:
     def __init__(self, db_conn: sqlite3.Connection) -> None:
         self._conn = db_conn
         self._lock = threading.Lock()
+        # Write overlay while apply_batch runs (None = write through).
+        self._pending: Optional[dict[str, Any]] = None
+        # Task rows touched by the current batch, keyed by (session_id, id).
+        self._pending_tasks: dict[tuple[str, str], dict[str, Any]] = {}
         self._init_defaults()
 
     # ------------------------------------------------------------------
@@ -112,39 +144,96 @@ class Projector:
 
         Dispatches to a type-specific handler if one is registered, then
         always updates the generic ``daemon.event_count`` and ``daemon.last_event``
-        keys.
+        keys. A one-event :meth:`apply_batch` whose commit failure is logged
+        rather than raised.
 
         Args:
             event_type: The event type string.
             payload: The event payload dict.
         """
-        with self._lock:
-            self._dispatch(event_type, payload)
-            self._increment_event_count()
-            self._set(_KEY_LAST_EVENT, event_type)
-            self._set(_KEY_LAST_EVENT_AT, now_iso())
+        try:
+            self.apply_batch([(event_type, payload)])
+        except Exception as exc:  # noqa: BLE001
+            logger.error("projector update(%r) failed: %s", event_type, exc)
 
-    def snapshot(self) -> dict[str, Any]:
+    def apply_batch(
+        self,
+        events: Iterable[tuple[str, dict[str, Any]]],
+        cursor: Optional[tuple[str, Any]] = None,
+    ) -> int:
+        """Apply a page of events in a single transaction.
+
+        Each event goes through the same handlers as :meth:`update`, but every
+        key is written once per batch with its final value, and ``cursor``
+        (a ``(key, value)`` projector_state pair, e.g. the consumer's keyset
+        position) is committed in the same transaction. On a failed commit
+        nothing from the batch is persisted.
+
+        Args:
+            events: ``(event_type, payload)`` pairs, in bus order.
+            cursor: Optional projector_state entry to advance with the data.
+
+        Returns:
+            Number of events applied.
+        """
+        with self._lock:
+            self._pending = {}
+            try:
+                applied = 0
+                for event_type, payload in events:
+                    self._dispatch(event_type, payload)
+                    self._increment_event_count()
+                    self._set(_KEY_LAST_EVENT, event_type)
+                    applied += 1
+                if applied:
+                    self._set(_KEY_LAST_EVENT_AT, now_iso())
+                if cursor is not None:
+                    self._pending[cursor[0]] = cursor[1]
+                change = {
+                    "events": applied,
+                    "keys": sorted(self._pending),
+                    "tasks": [
+                        {"session_id": t["session_id"], "id": t["id"], "status": t["status"]}
+                        for t in self._pending_tasks.values()
+                    ],
+                    "cursor": cursor[1] if cursor is not None else None,
+                }
+                self._flush_pending(change)
+                return applied
+            finally:
+                self._pending = None
+                self._pending_tasks = {}
+
+    def snapshot(self, conn: Optional[sqlite3.Connection] = None) -> dict[str, Any]:
         """Return the current projected state as a plain dict.
 
         Deserialises JSON values. Returns an empty dict if the table is empty.
+
+        Args:
+            conn: Read from this connection (e.g. a per-thread reader from
+                  ``get_read_connection``) without taking the projector lock,
+                  so HTTP reads never wait on an in-flight batch. Defaults to
+                  the projector's own connection under its lock.
         """
+        if conn is not None:
+            return self._read_snapshot(conn)
         with self._lock:
-            try:
-                rows = self._conn.execute(
-                    "SELECT key, value FROM projector_state"
-                ).fetchall()
-            except Exception as exc:  # noqa: BLE001
-                logger.error("projector snapshot failed: %s", exc)
-                return {}
+            return self._read_snapshot(self._conn)
 
-            result: dict[str, Any] = {}
-            for row in rows:
-                try:
-                    result[row["key"]] = json.loads(row["value"])
-                except (json.JSONDecodeError, TypeError):
-                    result[row["key"]] = row["value"]
-            return result
+    def _read_snapshot(self, conn: Any) -> dict[str, Any]:
+        try:
+            rows = conn.execute("SELECT key, value FROM projector_state").fetchall()
+        except Exception as exc:  # noqa: BLE001
+            logger.error("projector snapshot failed: %s", exc)
+            return {}
+
+        result: dict[str, Any] = {}
+        for row in rows:
+            try:
+                result[row["key"]] = json.loads(row["value"])
+            except (json.JSONDecodeError, TypeError):
+                result[row["key"]] = row["value"]
+        return result
 
     def get(self, key: str, default: Any = None) -> Any:
         """Get a specific state value.
@@ -174,6 +263,8 @@ class Projector:
     # ------------------------------------------------------------------
 
     def _get(self, key: str, default: Any = None) -> Any:
+        if self._pending is not None and key in self._pending:
+            return self._pending[key]
         try:
             row = self._conn.execute(
                 "SELECT value FROM projector_state WHERE key = ?", (key,)
@@ -185,6 +276,9 @@ class Projector:
             return default
 
     def _set(self, key: str, value: Any) -> None:
+        if self._pending is not None:
+            self._pending[key] = value
+            return
         try:
             self._conn.execute(
                 """
@@ -197,6 +291,49 @@ class Projector:
         except Exception as exc:  # noqa: BLE001
             logger.error("projector _set(%r) failed: %s", key, exc)
 
+    def _flush_pending(self, change: Optional[dict[str, Any]] = None) -> None:
+        """Write the batch overlay in one transaction. Raises on failure
+        after rolling back, so the caller's cursor is not advanced.
+
+        ``change`` is appended to the ``/stream`` change feed in the same
+        transaction."""
+        if not self._pending and not self._pending_tasks:
+            return
+        ts = now_iso()
+        rows = [
+            (key, json.dumps(value, default=str), ts)
+            for key, value in (self._pending or {}).items()
+        ]
+        task_rows = [
+            tuple(
+                json.dumps(task[col], default=str) if col == "metadata" else task[col]
+                for col in _TASK_COLUMNS
+            )
+            for task in self._pending_tasks.values()
+        ]
+        with get_write_lock():
+            try:
+                self._conn.executemany(
+                    """
+                    INSERT OR REPLACE INTO projector_state (key, value, updated_at)
+                    VALUES (?, ?, ?)
+                    """,
+                    rows,
+                )
+                if task_rows:
+                    self._conn.executemany(
+                        f"INSERT OR REPLACE INTO tasks ({', '.join(_TASK_COLUMNS)}) "
+                        f"VALUES ({', '.join('?' * len(_TASK_COLUMNS))})",
+                        task_rows,
+                    )
+                if change is not None:
+                    changes.record(self._conn, "state", change)
+                self._conn.commit()
+            except Exception:
+                self._conn.rollback()
+                raise
+        changes.notify()
+
     def _increment_event_count(self) -> None:
         current = self._get(_KEY_EVENT_COUNT, 0)
         try:
@@ -273,3 +410,192 @@ class Projector:
 
     def _on_generic(self, payload: dict[str, Any]) -> None:  # noqa: ARG002
         """No-op handler — base update() already tracks event_count and last_event."""
+
+    def _on_task_changed(self, payload: dict[str, Any]) -> None:
+        """Upsert one task row into the batch's task overlay.
+
+        TaskUpdate payloads carry only the changed fields, so they are merged
+        onto the current row; metadata keys set to null are removed, matching
+        native TaskUpdate semantics.
+        """
+        task_id = payload.get("task_id")
+        if not task_id:
+            return
+        key = (str(payload.get("session_id") or ""), str(task_id))
+        ts = _task_ts(payload.get("ts")) or now_iso()
+
+        task = self._pending_tasks.get(key) or self._load_task(*key)
+        if task is None:
+            task = {
+                "session_id": key[0], "id": key[1], "subject": None,
+                "status": "pending", "metadata": {}, "created_at": ts,
+            }
+
+        for field in ("subject", "status"):
+            if payload.get(field):
+                task[field] = payload[field]
+        meta_update = payload.get("metadata")
+        if isinstance(meta_update, dict):
+            metadata = dict(task.get("metadata") or {})
+            for meta_key, value in meta_update.items():
+                if value is None:
+                    metadata.pop(meta_key, None)
+                else:
+                    metadata[meta_key] = value
+            task["metadata"] = metadata
+
+        task["event_type"] = task["metadata"].get("event_type")
+        task["chain_id"] = task["metadata"].get("chain_id")
+        task["updated_at"] = ts
+        self._pending_tasks[key] = task
+
+    def _load_task(self, session_id: str, task_id: str) -> Optional[dict[str, Any]]:
+        row = self._conn.execute(
+            f"SELECT {', '.join(_TASK_COLUMNS)} FROM tasks WHERE session_id = ? AND id = ?",
+            (session_id, task_id),
+        ).fetchone()
+        return _task_from_row(row) if row is not None else None
+
+
+# ---------------------------------------------------------------------------
+# Task read side — used by the /tasks endpoints in server.py
+# ---------------------------------------------------------------------------
+
+
+def _task_ts(value: Any) -> Optional[str]:
+    """Normalise a hook timestamp to the ``now_iso()`` form.
+
+    Hooks stamp task events with a ``Z`` suffix; the daemon writes
+    ``+00:00``. ``tasks`` is ordered by these strings, so only one form may
+    be stored.
+    """
+    if not value:
+        return None
+    value = str(value)
+    return value[:-1] + "+00:00" if value.endswith("Z") else value
+
+
+def _task_from_row(row: sqlite3.Row) -> dict[str, Any]:
+    task = dict(row)
+    try:
+        task["metadata"] = json.loads(task.get("metadata") or "{}")
+    except (json.JSONDecodeError, TypeError):
+        task["metadata"] = {}
+    return task
+
+
+def get_task(
+    conn: sqlite3.Connection,
+    task_id: str,
+    session_id: Optional[str] = None,
+) -> Optional[dict[str, Any]]:
+    """Return one projected task, or None.
+
+    Native task ids are only unique per session; without ``session_id`` the
+    most recently updated task with that id wins.
+    """
+    sql = f"SELECT {', '.join(_TASK_COLUMNS)} FROM tasks WHERE id = ?"
+    params: list[Any] = [task_id]
+    if session_id:
+        sql += " AND session_id = ?"
+        params.append(session_id)
+    row = conn.execute(sql + " ORDER BY updated_at DESC LIMIT 1", params).fetchone()
+    return _task_from_row(row) if row is not None else None
+
+
+def query_tasks(
+    conn: sqlite3.Connection,
+    *,
+    session_id: Optional[str] = None,
+    status: Optional[str] = None,
+    chain_id: Optional[str] = None,
+    limit: int = DEFAULT_TASK_LIMIT,
+    offset: int = 0,
+) -> list[dict[str, Any]]:
+    """Return projected tasks matching the filters, newest update first.
+
+    Every filter combination is served by one of the ``tasks`` indexes.
+    ``limit`` is clamped to ``[1, MAX_TASK_LIMIT]``.
+    """
+    clauses: list[str] = []
+    params: list[Any] = []
+    for column, value in (("session_id", session_id), ("status", status), ("chain_id", chain_id)):
+        if value:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    limit = max(1, min(int(limit), MAX_TASK_LIMIT))
+    rows = conn.execute(
+        f"SELECT {', '.join(_TASK_COLUMNS)} FROM tasks{where} "
+        "ORDER BY updated_at DESC LIMIT ? OFFSET ?",
+        (*params, limit, max(0, int(offset))),
+    ).fetchall()
+    return [_task_from_row(row) for row in rows]
+
+
+def tasks_projected(
+    conn: sqlite3.Connection,
+    *,
+    session_id: Optional[str] = None,
+    chain_id: Optional[str] = None,
+) -> bool:
+    """Return True when the projection holds any task for the session/chain.
+
+    ``/tasks`` uses this to tell "no matching tasks" apart from "not
+    projected yet" when a filtered query comes back empty.
+    """
+    clauses: list[str] = []
+    params: list[Any] = []
+    for column, value in (("session_id", session_id), ("chain_id", chain_id)):
+        if value:
+            clauses.append(f"{column} = ?")
+            params.append(value)
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return conn.execute(f"SELECT 1 FROM tasks{where} LIMIT 1", params).fetchone() is not None
+
+
+def backfill_tasks(conn: sqlite3.Connection, tasks_root: Path) -> int:
+    """Seed the ``tasks`` table from ``tasks_root/{session_id}/*.json``.
+
+    Rows already projected from bus events are left alone (``INSERT OR
+    IGNORE``); file mtimes stand in for created/updated timestamps.
+
+    Returns:
+        Number of rows inserted.
+    """
+    rows: list[tuple[Any, ...]] = []
+    try:
+        session_dirs = [d for d in tasks_root.iterdir() if d.is_dir()]
+    except OSError:
+        return 0
+    for session_dir in session_dirs:
+        for entry in session_dir.glob("*.json"):
+            if entry.name.startswith("."):
+                continue
+            try:
+                data = json.loads(entry.read_text(encoding="utf-8"))
+                mtime = entry.stat().st_mtime
+            except (OSError, json.JSONDecodeError):
+                continue
+            if not isinstance(data, dict):
+                continue
+            metadata = data.get("metadata")
+            if not isinstance(metadata, dict):
+                metadata = {}
+            ts = datetime.fromtimestamp(mtime, tz=timezone.utc).isoformat()
+            rows.append((
+                session_dir.name, str(data.get("id") or entry.stem), data.get("subject"),
+                data.get("status") or "pending", metadata.get("event_type"),
+                metadata.get("chain_id"), json.dumps(metadata, default=str), ts, ts,
+            ))
+    if not rows:
+        return 0
+    with get_write_lock():
+        before = conn.total_changes
+        conn.executemany(
+            f"INSERT OR IGNORE INTO tasks ({', '.join(_TASK_COLUMNS)}) "
+            f"VALUES ({', '.join('?' * len(_TASK_COLUMNS))})",
+            rows,
+        )
+        conn.commit()
+        return conn.total_changes - before
@@ -0,0 +1,261 @@
+"""
+retention.py — Retention and compaction for the wicked-garden daemon's garden.db.
+
+Bounds the tables that grow with use — the ``garden_events`` log, hook
+execution history (``hitl_prompts`` rows written by the hook dispatcher) and
+finished ``council_sessions`` — by age and by row count, then hands freed
+pages back to the filesystem.
+
+Deletion runs in small batches on an idle timer: each batch takes the write
+lock only if it is free, so retention never queues behind (or delays) the
+consumer or an HTTP write. Every ``vacuum_interval_s`` the worker runs
+``PRAGMA incremental_vacuum`` and ``PRAGMA wal_checkpoint(TRUNCATE)`` so the
+database and WAL files shrink back to steady state.
+
+Usage::
+
+    from daemon.retention import RetentionWorker, storage_stats
+
+    worker = RetentionWorker(conn, policy={"garden_events": {"max_age_days": 7}})
+    worker.start()
+    storage_stats(conn)   # {"db_bytes": ..., "wal_bytes": ..., "freelist_pages": ...}
+    worker.stop()
+"""
+from __future__ import annotations
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional
+
+from daemon.db import get_write_lock
+
+logger = logging.getLogger("wicked-garden.daemon.retention")
+
+# ---------------------------------------------------------------------------
+# Policy
+# ---------------------------------------------------------------------------
+
+# Per-table rules. ``where`` limits which rows are eligible at all (pending
+# HITL prompts and running councils are never pruned); ``ts`` is the column
+# ages are measured on. ``max_age_days`` / ``max_rows`` may be None (no cap).
+_TABLES: dict[str, dict[str, str]] = {
+    "garden_events": {"ts": "received_at", "where": "1"},
+    "hitl_prompts": {"ts": "created_at", "where": "prompt LIKE 'hook:%'"},
+    "council_sessions": {"ts": "created_at", "where": "status NOT IN ('pending', 'running')"},
+}
+
+DEFAULT_POLICY: dict[str, dict[str, Optional[int]]] = {
+    "garden_events": {"max_age_days": 14, "max_rows": 100_000},
+    "hitl_prompts": {"max_age_days": 14, "max_rows": 50_000},
+    "council_sessions": {"max_age_days": 90, "max_rows": 5_000},
+}
+
+_BATCH_ROWS = 500
+_TICK_BUDGET_S = 0.05
+_DEFAULT_INTERVAL_S = 60.0
+_DEFAULT_VACUUM_INTERVAL_S = 900.0
+# Pages returned to the OS per incremental_vacuum call.
+_VACUUM_PAGES = 2000
+
+
+def merge_policy(overrides: Optional[dict[str, dict[str, Optional[int]]]]) -> dict[str, dict[str, Optional[int]]]:
+    """Return DEFAULT_POLICY with per-table ``overrides`` applied.
+
+    Raises:
+        ValueError: For a table retention does not manage.
+    """
+    policy = {table: dict(rules) for table, rules in DEFAULT_POLICY.items()}
+    for table, rules in (overrides or {}).items():
+        if table not in policy:
+            raise ValueError(f"retention: unknown table {table!r}")
+        policy[table].update(rules)
+    return policy
+
+
+# ---------------------------------------------------------------------------
+# One-shot operations
+# ---------------------------------------------------------------------------
+
+
+def _cutoff(days: int) -> str:
+    """ISO timestamp ``days`` ago, in the same format as ``now_iso()``."""
+    return (datetime.now(tz=timezone.utc) - timedelta(days=days)).isoformat()
+
+
+def _delete_batch(conn: sqlite3.Connection, table: str, rules: dict[str, Optional[int]], limit: int) -> int:
+    """Delete up to ``limit`` expired or over-cap rows (oldest first). Caller holds the write lock."""
+    spec = _TABLES[table]
+    ts, where = spec["ts"], spec["where"]
+    deleted = 0
+
+    max_age = rules.get("max_age_days")
+    if max_age is not None:
+        cur = conn.execute(
+            f"DELETE FROM {table} WHERE rowid IN ("
+            f"SELECT rowid FROM {table} WHERE {where} AND {ts} < ? ORDER BY {ts} LIMIT ?)",
+            (_cutoff(max_age), limit),
+        )
+        deleted += cur.rowcount
+
+    max_rows = rules.get("max_rows")
+    if max_rows is not None and deleted < limit:
+        total = conn.execute(f"SELECT COUNT(*) FROM {table} WHERE {where}").fetchone()[0]
+        excess = min(total - max_rows, limit - deleted)
+        if excess > 0:
+            cur = conn.execute(
+                f"DELETE FROM {table} WHERE rowid IN ("
+                f"SELECT rowid FROM {table} WHERE {where} ORDER BY {ts} LIMIT ?)",
+                (excess,),
+            )
+            deleted += cur.rowcount
+    return deleted
+
+
+def prune_step(
+    conn: sqlite3.Connection,
+    policy: dict[str, dict[str, Optional[int]]],
+    batch_rows: int = _BATCH_ROWS,
+    budget_s: float = _TICK_BUDGET_S,
+    wait: bool = False,
+) -> Optional[int]:
+    """Run delete batches until nothing is eligible or ``budget_s`` is spent.
+
+    Each batch is its own short transaction. With ``wait=False`` a batch is
+    skipped when the write lock is taken.
+
+    Returns:
+        Rows deleted, or None when the lock was busy before any batch ran.
+    """
+    deadline = time.monotonic() + budget_s
+    total = 0
+    pending = [t for t in policy if t in _TABLES]
+    while pending and time.monotonic() < deadline:
+        lock = get_write_lock()
+        if not lock.acquire(blocking=wait):
+            return total or None
+        try:
+            for table in list(pending):
+                deleted = _delete_batch(conn, table, policy[table], batch_rows)
+                total += deleted
+                if deleted < batch_rows:
+                    pending.remove(table)
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            lock.release()
+    return total
+
+
+def compact(conn: sqlite3.Connection, pages: int = _VACUUM_PAGES) -> dict[str, Any]:
+    """Return freed pages to the filesystem and truncate the WAL.
+
+    A database created before ``auto_vacuum=INCREMENTAL`` was set is converted
+    with one full VACUUM, but only once a quarter of its pages are free —
+    otherwise ``incremental_vacuum`` is a no-op there.
+    """
+    out: dict[str, Any] = {"vacuumed": False}
+    with get_write_lock():
+        auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        if auto_vacuum == 2:
+            conn.execute(f"PRAGMA incremental_vacuum({int(pages)})").fetchall()
+        else:
+            page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+            freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            if page_count and freelist * 4 >= page_count:
+                conn.execute("PRAGMA auto_vacuum=INCREMENTAL")
+                conn.execute("VACUUM")
+                out["vacuumed"] = True
+        busy, wal_pages, _ = conn.execute("PRAGMA wal_checkpoint(TRUNCATE)").fetchone()
+    out["checkpoint_busy"] = bool(busy)
+    out["wal_pages"] = wal_pages
+    return out
+
+
+def storage_stats(conn: sqlite3.Connection) -> dict[str, Any]:
+    """Return database/WAL file sizes and free pages for ``/health``."""
+    page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+    page_count = conn.execute("PRAGMA page_count").fetchone()[0]
+    freelist = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    path = next((row[2] for row in conn.execute("PRAGMA database_list") if row[1] == "main"), "")
+    wal_bytes = 0
+    if path:
+        try:
+            wal_bytes = os.path.getsize(path + "-wal")
+        except OSError:
+            pass
+    return {
+        "db_bytes": page_size * page_count,
+        "wal_bytes": wal_bytes,
+        "freelist_pages": freelist,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Background worker
+# ---------------------------------------------------------------------------
+
+
+class RetentionWorker:
+    """Runs :func:`prune_step` on a timer and :func:`compact` periodically.
+
+    Thread-safety: ``start()`` spawns a single daemon thread; ``stop()`` sets a
+    threading.Event the thread waits on, so it exits promptly.
+
+    Args:
+        db_conn: The daemon's shared (writer) connection.
+        policy: Per-table overrides merged onto :data:`DEFAULT_POLICY`.
+        interval_s: Seconds between prune ticks.
+        vacuum_interval_s: Seconds between compaction passes.
+    """
+
+    def __init__(
+        self,
+        db_conn: sqlite3.Connection,
+        policy: Optional[dict[str, dict[str, Optional[int]]]] = None,
+        interval_s: float = _DEFAULT_INTERVAL_S,
+        vacuum_interval_s: float = _DEFAULT_VACUUM_INTERVAL_S,
+    ) -> None:
+        self._conn = db_conn
+        self._policy = merge_policy(policy)
+        self._interval_s = interval_s
+        self._vacuum_interval_s = vacuum_interval_s
+        self._stop_flag = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._last_vacuum = time.monotonic()
+
+    def start(self) -> None:
+        """Start the retention thread."""
+        if self._thread and self._thread.is_alive():
+            return
+        self._stop_flag.clear()
+        self._thread = threading.Thread(target=self._loop, name="garden-retention", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Signal the retention thread to stop and wait for it."""
+        self._stop_flag.set()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def tick(self) -> None:
+        """One prune pass, plus compaction when it is due."""
+        deleted = prune_step(self._conn, self._policy)
+        if deleted:
+            logger.debug("retention pruned %d rows", deleted)
+        if time.monotonic() - self._last_vacuum >= self._vacuum_interval_s:
+            self._last_vacuum = time.monotonic()
+            result = compact(self._conn)
+            logger.debug("retention compaction: %s", result)
+
+    def _loop(self) -> None:
+        while not self._stop_flag.wait(self._interval_s):
+            try:
+                self.tick()
+            except Exception as exc:  # noqa: BLE001
+                logger.warning("retention tick failed: %s", exc, exc_info=True)
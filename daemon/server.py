@@ -2,21 +2,28 @@
 server.py — HTTP server for the wicked-garden daemon.
 
 Provides a Flask application exposing garden state, council, and HITL endpoints
-for the garden dashboard and external tooling.
+for the garden dashboard and external tooling, and ``make_server`` — a stdlib
+WSGI server with a fixed worker pool and a bounded accept queue. Read
+endpoints use per-thread connections so a slow ``/council`` call or a projector
+write never stalls ``/health``, ``/state`` or ``/tasks``; when every worker is
+busy and the queue is full, new connections get an immediate 503.
 
 Endpoints:
-    GET  /health                 → daemon health + version
+    GET  /health                 → daemon health, version + DB/WAL size
     GET  /state                  → current projector snapshot
-    POST /council                → run a council session (synchronous)
-    GET  /council/<session_id>   → council session status
+    POST /council                → submit a council session (202 + session id)
+    GET  /council/<session_id>   → council session progress / verdict
+    GET  /tasks                  → projected native tasks (session/status/chain_id filters)
+    GET  /tasks/<task_id>        → one projected task
+    GET  /stream                 → Server-Sent Events for state/council/HITL changes
     POST /hitl/respond           → record a HITL response
 
 Usage::
 
     from daemon.server import create_app
 
-    app = create_app(conn, projector)
-    app.run(host="127.0.0.1", port=7700)
+    app = create_app(conn, projector, reader=get_read_connection)
+    make_server(app, "127.0.0.1", 7700).serve_forever()
 
 Or use the factory directly with Flask's WSGI runner, gunicorn, etc.
 """
@@ -24,33 +31,58 @@ from __future__ import annotations
 
 import json
 import logging
+import queue
+import socket
 import sqlite3
-from typing import Any
+import threading
+from typing import Any, Callable, Optional
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer
 
+from daemon import changes
 from daemon._internal import generate_id, now_iso
 from daemon.db import get_write_lock
-from daemon.projector import Projector
+from daemon.hook_dispatch import HookDispatcher
+from daemon.projector import DEFAULT_TASK_LIMIT, Projector, get_task, query_tasks, tasks_projected
+from daemon.retention import storage_stats
 
 logger = logging.getLogger("wicked-garden.daemon.server")
 
 VERSION = "0.1.0"
 
+# Worker pool / accept queue defaults for make_server.
+DEFAULT_THREADS = 8
+DEFAULT_MAX_QUEUE = 32
+# Each open /stream holds a worker thread; cap them so requests keep flowing.
+DEFAULT_MAX_STREAMS = DEFAULT_THREADS // 2
+
 
 def create_app(
     conn: sqlite3.Connection,
     projector: Projector,
+    reader: Optional[Callable[[], sqlite3.Connection]] = None,
+    dispatcher: Optional[HookDispatcher] = None,
+    max_streams: int = DEFAULT_MAX_STREAMS,
 ) -> Any:
     """Create and return the configured Flask application.
 
     Args:
         conn: Open sqlite3 connection shared with other daemon components.
+              All writes go through it under ``get_write_lock()``.
         projector: The daemon's Projector instance.
+        reader: Returns the connection read-only endpoints should query —
+                normally ``daemon.db.get_read_connection``. Defaults to
+                ``conn``.
+        dispatcher: The daemon's HookDispatcher. When given, ``GET /hooks``
+                    includes per-hook counters and directory hooks, and hook
+                    registration changes invalidate its index.
+        max_streams: Concurrent ``/stream`` clients allowed; further ones get
+                     a 503 so streams cannot occupy every server worker.
 
     Returns:
         A Flask application object.
     """
     try:
-        from flask import Flask, jsonify, request
+        from flask import Flask, Response, jsonify, request, stream_with_context
     except ImportError as exc:
         raise ImportError(
             "Flask is required for the garden daemon HTTP server. "
@@ -61,6 +93,11 @@ def create_app(
         """Return a nested error response: {"error": {"code": ..., "message": ...}}."""
         return jsonify({"error": {"code": code, "message": message}}), status
 
+    def _read() -> sqlite3.Connection:
+        return reader() if reader is not None else conn
+
+    stream_slots = threading.BoundedSemaphore(max(1, max_streams))
+
     app = Flask("wicked-garden-daemon")
     app.config["PROPAGATE_EXCEPTIONS"] = False
 
@@ -70,8 +107,14 @@ def create_app(
 
     @app.get("/health")
     def health():
-        """Return daemon health and version."""
-        return jsonify({"status": "ok", "version": VERSION})
+        """Return daemon health, version and database file sizes."""
+        body: dict[str, Any] = {"status": "ok", "version": VERSION}
+        try:
+            body["db"] = storage_stats(_read())
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("/health storage stats failed: %s", exc)
+            body["db"] = None
+        return jsonify(body)
 
     # ----------------------------------------------------------------
     # GET /state
@@ -81,7 +124,7 @@ def create_app(
     def state():
         """Return the current projector snapshot."""
         try:
-            snapshot = projector.snapshot()
+            snapshot = projector.snapshot(_read())
             return jsonify(snapshot)
         except Exception as exc:  # noqa: BLE001
             logger.error("/state failed: %s", exc, exc_info=True)
@@ -93,17 +136,21 @@ def create_app(
 
     @app.post("/council")
     def council_run():
-        """Run a council session.
+        """Submit a council session as a background job.
 
         Request body (JSON):
             {
                 "topic": "...",
                 "question": "...",
                 "criteria": ["...", "..."],
-                "timeout_s": 30        (optional)
+                "members": ["claude", "gemini"],   (optional; claude|gemini|codex)
+                "timeout_s": 30,                    (optional, overall deadline)
+                "wait": false                       (optional)
             }
 
-        Returns:
+        Returns 202 with ``{"session_id": "...", "status": "running"}``; poll
+        ``GET /council/<session_id>`` for progress and the verdict. With
+        ``"wait": true`` the request blocks and returns the verdict:
             {
                 "session_id": "...",
                 "verdict": "...",
@@ -112,23 +159,43 @@ def create_app(
                 "votes": [...]
             }
         """
-        from daemon.council import run_council
+        from daemon.council import run_council, submit_council, validate_members
 
         body = request.get_json(silent=True) or {}
         topic = body.get("topic", "")
         question = body.get("question", "")
         criteria = body.get("criteria", [])
+        members = body.get("members") or None
         timeout_s = int(body.get("timeout_s", 30))
 
         if not topic or not question:
             return _err("'topic' and 'question' are required", "INVALID_REQUEST", 400)
+        if members is not None and not (
+            isinstance(members, list) and all(isinstance(m, str) for m in members)
+        ):
+            return _err("'members' must be a list of CLI names", "INVALID_REQUEST", 400)
+        try:
+            validate_members(members)
+        except ValueError as exc:
+            return _err(str(exc), "INVALID_REQUEST", 400)
 
         try:
+            if not body.get("wait"):
+                session_id = submit_council(
+                    conn,
+                    topic=topic,
+                    question=question,
+                    criteria=criteria,
+                    cli_list=members,
+                    timeout_s=timeout_s,
+                )
+                return jsonify({"session_id": session_id, "status": "running"}), 202
             result = run_council(
                 conn,
                 topic=topic,
                 question=question,
                 criteria=criteria,
+                cli_list=members,
                 timeout_s=timeout_s,
             )
         except Exception as exc:  # noqa: BLE001
@@ -149,26 +216,147 @@ def create_app(
 
     @app.get("/council/<session_id>")
     def council_get(session_id: str):
-        """Return council session status by ID."""
+        """Return council session status by ID.
+
+        While running, ``members_done`` / ``members_total`` report progress
+        and ``votes`` holds the member votes received so far.
+        """
         from daemon.council import get_session
 
-        session = get_session(conn, session_id)
+        session = get_session(_read(), session_id)
         if session is None:
             return _err("Session not found", "NOT_FOUND", 404)
         return jsonify(session)
 
+    # ----------------------------------------------------------------
+    # GET /tasks
+    # ----------------------------------------------------------------
+
+    @app.get("/tasks")
+    def tasks_list():
+        """List projected tasks, most recently updated first.
+
+        Query params (all optional):
+            session, status, chain_id   — equality filters
+            limit  (default 50, max 500), offset  — pagination
+
+        Returns:
+            [{"id", "session_id", "subject", "status", "event_type",
+              "chain_id", "metadata", "created_at", "updated_at"}, ...]
+
+            404 ``NOT_PROJECTED`` when a ``session`` / ``chain_id`` filter
+            names something the projection holds no task for — callers
+            should read the task files directly rather than trust ``[]``.
+        """
+        try:
+            limit = int(request.args.get("limit", DEFAULT_TASK_LIMIT))
+            offset = int(request.args.get("offset", 0))
+        except ValueError:
+            return _err("'limit' and 'offset' must be integers", "INVALID_REQUEST", 400)
+        session_id = request.args.get("session")
+        chain_id = request.args.get("chain_id")
+        try:
+            read_conn = _read()
+            rows = query_tasks(
+                read_conn,
+                session_id=session_id,
+                status=request.args.get("status"),
+                chain_id=chain_id,
+                limit=limit,
+                offset=offset,
+            )
+            if (
+                not rows
+                and (session_id or chain_id)
+                and not tasks_projected(read_conn, session_id=session_id, chain_id=chain_id)
+            ):
+                return _err("No projected tasks for this session/chain", "NOT_PROJECTED", 404)
+            return jsonify(rows)
+        except Exception as exc:  # noqa: BLE001
+            logger.error("/tasks GET failed: %s", exc, exc_info=True)
+            return _err("Failed to list tasks", "INTERNAL_ERROR", 500)
+
+    # ----------------------------------------------------------------
+    # GET /tasks/<task_id>
+    # ----------------------------------------------------------------
+
+    @app.get("/tasks/<task_id>")
+    def tasks_get(task_id: str):
+        """Return one projected task; ``?session=`` disambiguates native ids."""
+        try:
+            task = get_task(_read(), task_id, session_id=request.args.get("session"))
+        except Exception as exc:  # noqa: BLE001
+            logger.error("/tasks/%s GET failed: %s", task_id, exc, exc_info=True)
+            return _err("Failed to read task", "INTERNAL_ERROR", 500)
+        if task is None:
+            return _err("Task not found", "NOT_FOUND", 404)
+        return jsonify(task)
+
+    # ----------------------------------------------------------------
+    # GET /stream
+    # ----------------------------------------------------------------
+
+    @app.get("/stream")
+    def stream():
+        """Server-Sent Events feed of daemon state changes.
+
+        Event types: ``state`` (projector batch: changed keys, task
+        transitions, bus cursor), ``council`` (session progress) and
+        ``hitl`` (prompt answered); ``reset`` when the resume point has been
+        pruned. Resume with the ``Last-Event-ID`` header (or
+        ``?last_event_id=``). A ``: heartbeat`` comment is sent every 15s.
+        """
+        raw_last = request.headers.get("Last-Event-ID") or request.args.get("last_event_id")
+        try:
+            last_event_id = int(raw_last) if raw_last else None
+        except ValueError:
+            return _err("'Last-Event-ID' must be an integer", "INVALID_REQUEST", 400)
+        if not stream_slots.acquire(blocking=False):
+            return _err("Too many open streams", "OVERLOADED", 503)
+
+        def _events():
+            try:
+                yield from changes.stream(_read, last_event_id)
+            finally:
+                stream_slots.release()
+
+        return Response(
+            stream_with_context(_events()),
+            mimetype="text/event-stream",
+            headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+        )
+
     # ----------------------------------------------------------------
     # GET /hooks
     # ----------------------------------------------------------------
 
     @app.get("/hooks")
     def hooks_list():
-        """List all registered hooks."""
+        """List all hooks with their execution counters.
+
+        Registered hooks (``source: "registered"``) come first, then
+        ``hooks/`` directory hooks (``source: "file"``). ``stats`` holds
+        runs/failures/timeouts and latency, or null if the hook has not run
+        since the daemon started.
+        """
         try:
-            rows = conn.execute(
+            rows = _read().execute(
                 "SELECT id, event_pattern, command, description, created_at FROM hooks ORDER BY created_at"
             ).fetchall()
-            return jsonify([dict(r) for r in rows])
+            stats = dispatcher.stats() if dispatcher is not None else {}
+            hooks = [{**dict(r), "source": "registered", "stats": stats.get(r["id"])} for r in rows]
+            if dispatcher is not None:
+                for name, path in dispatcher.file_hooks():
+                    hooks.append({
+                        "id": name,
+                        "event_pattern": None,
+                        "command": path,
+                        "description": None,
+                        "created_at": None,
+                        "source": "file",
+                        "stats": stats.get(name),
+                    })
+            return jsonify(hooks)
         except Exception as exc:  # noqa: BLE001
             logger.error("/hooks GET failed: %s", exc, exc_info=True)
             return _err("Failed to list hooks", "INTERNAL_ERROR", 500)
@@ -184,7 +372,7 @@ def create_app(
         Request body (JSON):
             {
                 "event_pattern": "wicked.garden.*",
-                "command": "/path/to/script.sh",
+                "command": "script.sh --flag",   (a file in hooks/)
                 "description": "optional description"
             }
 
@@ -199,6 +387,11 @@ def create_app(
 
         if not event_pattern or not command:
             return _err("'event_pattern' and 'command' are required", "INVALID_REQUEST", 400)
+        if dispatcher is not None:
+            try:
+                dispatcher.resolve_command(command)
+            except ValueError as exc:
+                return _err(str(exc), "INVALID_REQUEST", 400)
 
         hook_id = generate_id()
         created_at = now_iso()
@@ -215,6 +408,8 @@ def create_app(
         except Exception as exc:  # noqa: BLE001
             logger.error("/hooks POST failed: %s", exc, exc_info=True)
             return _err("Failed to register hook", "INTERNAL_ERROR", 500)
+        if dispatcher is not None:
+            dispatcher.invalidate()
 
         return jsonify({
             "id": hook_id,
@@ -244,6 +439,8 @@ def create_app(
         except Exception as exc:  # noqa: BLE001
             logger.error("/hooks DELETE failed: %s", exc, exc_info=True)
             return _err("Failed to deregister hook", "INTERNAL_ERROR", 500)
+        if dispatcher is not None:
+            dispatcher.invalidate()
 
         return jsonify({"ok": True, "id": hook_id})
 
@@ -300,7 +497,13 @@ def create_app(
                     "UPDATE council_sessions SET votes = ? WHERE id = ?",
                     (json.dumps(existing_votes), session_id),
                 )
+                changes.record(conn, "council", {
+                    "session_id": session_id,
+                    "status": row["status"],
+                    "voter_id": voter_id,
+                })
                 conn.commit()
+            changes.notify()
         except Exception as exc:  # noqa: BLE001
             logger.error("/council/vote failed: %s", exc, exc_info=True)
             return _err("Failed to record vote", "INTERNAL_ERROR", 500)
@@ -347,7 +550,9 @@ def create_app(
                     """,
                     (response_text, responded_at, prompt_id),
                 )
+                changes.record(conn, "hitl", {"prompt_id": prompt_id, "status": "responded"})
                 conn.commit()
+            changes.notify()
         except Exception as exc:  # noqa: BLE001
             logger.error("/hitl/respond failed: %s", exc, exc_info=True)
             return _err("Failed to record response", "INTERNAL_ERROR", 500)
@@ -372,3 +577,115 @@ def create_app(
         return _err("Internal server error", "INTERNAL_ERROR", 500)
 
     return app
+
+
+# ---------------------------------------------------------------------------
+# Serving — fixed worker pool with a bounded accept queue
+# ---------------------------------------------------------------------------
+
+_OVERLOADED_BODY = json.dumps({
+    "error": {"code": "OVERLOADED", "message": "Daemon is busy; retry shortly"},
+}).encode("utf-8")
+
+
+class _QuietHandler(WSGIRequestHandler):
+    """Route wsgiref's per-request access log to debug logging."""
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        logger.debug("%s - %s", self.address_string(), format % args)
+
+
+class DaemonHTTPServer(WSGIServer):
+    """WSGI server that hands accepted connections to a fixed worker pool.
+
+    Connections wait in a queue of at most ``max_queue`` entries; when the
+    queue is full the accept thread answers 503 with ``Retry-After: 1`` and
+    closes the socket, so callers with tight budgets fail fast and fall back
+    instead of timing out behind a slow request.
+    """
+
+    def __init__(
+        self,
+        address: tuple[str, int],
+        app: Any,
+        threads: int = DEFAULT_THREADS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+    ) -> None:
+        super().__init__(address, _QuietHandler)
+        self.set_app(app)
+        self.shed_count = 0
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, max_queue))
+        self._workers = [
+            threading.Thread(target=self._work, name=f"garden-http-{i}", daemon=True)
+            for i in range(max(1, threads))
+        ]
+        for worker in self._workers:
+            worker.start()
+
+    def process_request(self, request: Any, client_address: Any) -> None:
+        try:
+            self._queue.put_nowait((request, client_address))
+        except queue.Full:
+            self.shed_count += 1
+            self._shed(request)
+
+    def handle_error(self, request: Any, client_address: Any) -> None:
+        logger.error("HTTP request from %s failed", client_address, exc_info=True)
+
+    def server_close(self) -> None:
+        """Close the listening socket and stop the workers."""
+        super().server_close()
+        for _ in self._workers:
+            self._queue.put(None)
+        for worker in self._workers:
+            worker.join(timeout=5)
+
+    def _work(self) -> None:
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            request, client_address = item
+            try:
+                self.finish_request(request, client_address)
+            except Exception:  # noqa: BLE001
+                self.handle_error(request, client_address)
+            finally:
+                self.shutdown_request(request)
+
+    def _shed(self, request: socket.socket) -> None:
+        try:
+            # Drain what the client already sent so close() does not reset
+            # the connection before it reads the 503.
+            request.settimeout(0.01)
+            try:
+                request.recv(65536)
+            except OSError:
+                pass
+            request.sendall(
+                b"HTTP/1.0 503 Service Unavailable\r\n"
+                b"Content-Type: application/json\r\n"
+                b"Retry-After: 1\r\n"
+                + f"Content-Length: {len(_OVERLOADED_BODY)}\r\n\r\n".encode("ascii")
+                + _OVERLOADED_BODY
+            )
+        except OSError:
+            pass
+        finally:
+            self.shutdown_request(request)
+
+
+def make_server(
+    app: Any,
+    host: str = "127.0.0.1",
+    port: int = 7700,
+    threads: int = DEFAULT_THREADS,
+    max_queue: int = DEFAULT_MAX_QUEUE,
+) -> DaemonHTTPServer:
+    """Bind a :class:`DaemonHTTPServer` for ``app`` (any WSGI callable).
+
+    Call ``serve_forever()`` to run it; ``shutdown()`` (from another thread)
+    stops the accept loop and ``server_close()`` releases the socket and
+    workers.
+    """
+    return DaemonHTTPServer((host, port), app, threads=threads, max_queue=max_queue)
@@ -0,0 +1,128 @@
+"""
+test_changes.py — Tests for the /stream change feed (changes.py).
+
+Writers append change_log rows and notify; stream() turns them into SSE
+chunks, resumes from Last-Event-ID, and heartbeats while idle.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Ensure the daemon package is importable regardless of how pytest is invoked.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from daemon import changes
+from daemon.db import SCHEMA
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def db_conn():
+    """In-memory SQLite connection with garden schema applied."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    conn.commit()
+    changes.reopen()
+    yield conn
+    conn.close()
+
+
+def _append(conn, kind, data):
+    seq = changes.record(conn, kind, data)
+    conn.commit()
+    changes.notify()
+    return seq
+
+
+def _events(chunks):
+    """Parse (id, event, data) from SSE chunks, skipping comments/retry."""
+    out = []
+    for chunk in chunks:
+        fields = dict(
+            line.split(": ", 1) for line in chunk.strip().splitlines() if not line.startswith(":")
+        )
+        if "event" in fields:
+            out.append((fields.get("id"), fields["event"], json.loads(fields["data"])))
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_new_stream_starts_at_head_and_wakes_on_notify(db_conn):
+    _append(db_conn, "state", {"old": True})
+    gen = changes.stream(lambda: db_conn, heartbeat_s=5)
+    assert next(gen).startswith("retry:")
+
+    timer = threading.Timer(0.1, _append, args=(db_conn, "council", {"session_id": "c1"}))
+    timer.start()
+    started = time.monotonic()
+    chunk = next(gen)
+    assert time.monotonic() - started < 1.0
+    assert _events([chunk]) == [("2", "council", {"session_id": "c1"})]
+    gen.close()
+
+
+def test_resume_replays_missed_changes_in_order(db_conn):
+    for i in range(4):
+        _append(db_conn, "hitl", {"n": i})
+    chunks = list(changes.stream(lambda: db_conn, last_event_id=2, max_idle_s=0.05))
+    assert _events(chunks) == [("3", "hitl", {"n": 2}), ("4", "hitl", {"n": 3})]
+
+
+def test_pruned_resume_point_sends_reset(db_conn):
+    with patch.object(changes, "_RETAIN_ROWS", 2), patch.object(changes, "_PRUNE_EVERY", 1):
+        for i in range(5):
+            _append(db_conn, "state", {"n": i})
+    chunks = list(changes.stream(lambda: db_conn, last_event_id=1, max_idle_s=0.05))
+    events = _events(chunks)
+    assert events[0] == (None, "reset", {"oldest": 4})
+    assert [e[0] for e in events[1:]] == ["4", "5"]
+
+
+def test_idle_stream_heartbeats(db_conn):
+    gen = changes.stream(lambda: db_conn, heartbeat_s=0.05)
+    next(gen)  # retry
+    assert next(gen) == ": heartbeat\n\n"
+    gen.close()
+
+
+def test_close_ends_open_streams(db_conn):
+    gen = changes.stream(lambda: db_conn, heartbeat_s=5)
+    next(gen)
+    threading.Timer(0.1, changes.close).start()
+    assert list(gen) == []
+    changes.reopen()
+
+
+def test_daemon_restart_reopens_streams(tmp_path):
+    pytest.importorskip("flask")
+    from daemon import Daemon
+
+    d = Daemon(db_path=str(tmp_path / "garden.db"), tasks_dir=str(tmp_path / "tasks"))
+    d.start(block=False)
+    d.stop()
+    assert changes._closed
+    d.start(block=False)
+    try:
+        assert not changes._closed
+    finally:
+        d.stop()
+        changes.reopen()
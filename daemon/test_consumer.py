@@ -0,0 +1,213 @@
+"""
+test_consumer.py — Tests for consumer.py's direct bus-store path.
+
+The consumer reads the wicked-bus SQLite store with one keyset query across
+all watched prefixes, skips the query while nothing new was committed, and
+falls back to the CLI when the store is missing or unrecognised.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Ensure the daemon package is importable regardless of how pytest is invoked.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from daemon import consumer as consumer_mod
+from daemon.consumer import EventConsumer, _prefix_bounds
+from daemon.db import SCHEMA
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def db_conn():
+    """In-memory SQLite connection with garden schema applied."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture()
+def bus_db(tmp_path):
+    path = tmp_path / "bus.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute(
+        "CREATE TABLE events (event_id INTEGER PRIMARY KEY, event_type TEXT, payload TEXT)"
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _emit(bus_db, *event_types):
+    conn = sqlite3.connect(str(bus_db))
+    for et in event_types:
+        conn.execute(
+            "INSERT INTO events (event_type, payload) VALUES (?, ?)",
+            (et, json.dumps({"type": et})),
+        )
+    conn.commit()
+    conn.close()
+
+
+def _consumer(db_conn, bus_db, seen):
+    return EventConsumer(
+        db_conn,
+        on_event=lambda et, payload: seen.append(et),
+        bus_db=str(bus_db),
+    )
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_prefix_bounds_cover_only_the_prefix():
+    lo, hi = _prefix_bounds("wicked.garden.")
+    assert lo <= "wicked.garden.gate.decided" < hi
+    assert not (lo <= "wicked.gardenx" < hi)
+    assert not (lo <= "wicked.crew.phase.transitioned" < hi)
+
+
+def test_direct_poll_reads_all_prefixes_in_one_pass(db_conn, bus_db):
+    _emit(bus_db, "wicked.garden.project.created", "wicked.brain.fact.stored",
+          "wicked.crew.phase.transitioned")
+    seen = []
+    c = _consumer(db_conn, bus_db, seen)
+    with patch.object(consumer_mod.subprocess, "run") as run:
+        assert c._poll_once() == 2
+    run.assert_not_called()
+    assert seen == ["wicked.garden.project.created", "wicked.crew.phase.transitioned"]
+    ids = [r["id"] for r in db_conn.execute("SELECT id FROM garden_events ORDER BY id")]
+    assert ids == ["1", "3"]
+
+
+def test_idle_poll_skips_query_until_next_commit(db_conn, bus_db):
+    _emit(bus_db, "wicked.garden.project.created")
+    seen = []
+    c = _consumer(db_conn, bus_db, seen)
+    assert c._poll_once() == 1
+    with patch.object(c, "_store_event") as store:
+        assert c._poll_once() == 0
+    store.assert_not_called()
+    _emit(bus_db, "wicked.garden.project.completed")
+    assert c._poll_once() == 1
+    assert seen == ["wicked.garden.project.created", "wicked.garden.project.completed"]
+
+
+def test_full_page_is_drained_without_caching_version(db_conn, bus_db, monkeypatch):
+    monkeypatch.setattr(consumer_mod, "_PAGE_SIZE", 2)
+    _emit(bus_db, *["wicked.garden.project.created"] * 3)
+    seen = []
+    c = _consumer(db_conn, bus_db, seen)
+    assert c._poll_once() == 2
+    assert c._poll_once() == 1
+    assert len(seen) == 3
+
+
+def test_keyset_cursor_survives_restart(db_conn, bus_db):
+    _emit(bus_db, "wicked.garden.project.created", "wicked.garden.project.completed")
+    first = []
+    c = _consumer(db_conn, bus_db, first)
+    c._poll_once()
+    c._close_bus()
+    _emit(bus_db, "wicked.garden.gate.decided")
+    second = []
+    assert _consumer(db_conn, bus_db, second)._poll_once() == 1
+    assert second == ["wicked.garden.gate.decided"]
+
+
+def test_numeric_cli_cursor_seeds_keyset(db_conn, bus_db):
+    _emit(bus_db, "wicked.garden.project.created", "wicked.garden.project.completed")
+    db_conn.execute(
+        "INSERT INTO projector_state (key, value, updated_at) VALUES ('consumer.cursor', ?, 'x')",
+        (json.dumps("1"),),
+    )
+    seen = []
+    assert _consumer(db_conn, bus_db, seen)._poll_once() == 1
+    assert seen == ["wicked.garden.project.completed"]
+
+
+def test_missing_store_falls_back_to_cli(db_conn, tmp_path):
+    c = EventConsumer(db_conn, bus_db=str(tmp_path / "absent.db"))
+    with patch.object(consumer_mod.subprocess, "run") as run:
+        run.return_value.returncode = 1
+        assert c._poll_once() is None
+    assert run.call_count == len(consumer_mod._WATCH_PREFIXES)
+
+
+def test_unrecognised_schema_falls_back_to_cli(db_conn, tmp_path):
+    path = tmp_path / "bus.db"
+    conn = sqlite3.connect(str(path))
+    conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, kind TEXT)")
+    conn.commit()
+    conn.close()
+    c = EventConsumer(db_conn, bus_db=str(path))
+    with patch.object(consumer_mod.subprocess, "run") as run:
+        run.return_value.returncode = 1
+        assert c._poll_once() is None
+    assert run.called
+
+
+def test_on_batch_receives_page_and_cursor(db_conn, bus_db):
+    _emit(bus_db, "wicked.garden.project.created", "wicked.garden.council.voted",
+          "wicked.garden.gate.decided")
+    batches = []
+    c = EventConsumer(db_conn, bus_db=str(bus_db),
+                      on_batch=lambda events, cursor: batches.append((events, cursor)))
+    assert c._poll_once() == 3
+    assert len(batches) == 1
+    events, cursor = batches[0]
+    assert [et for et, _ in events] == ["wicked.garden.project.created",
+                                        "wicked.garden.gate.decided"]
+    assert cursor == ("consumer.bus_event_id", 3)
+
+
+def test_failed_on_batch_rereads_the_page(db_conn, bus_db):
+    _emit(bus_db, "wicked.garden.project.created")
+    calls = []
+
+    def on_batch(events, cursor):
+        calls.append(cursor)
+        if len(calls) == 1:
+            raise RuntimeError("projector down")
+
+    c = EventConsumer(db_conn, bus_db=str(bus_db), on_batch=on_batch)
+    assert c._poll_once() == 0
+    assert c._poll_once() == 1
+    assert calls == [("consumer.bus_event_id", 1)] * 2
+
+
+def test_on_batch_failure_after_cursor_commit_does_not_replay(db_conn, bus_db):
+    _emit(bus_db, "wicked.garden.project.created")
+    calls = []
+
+    def on_batch(events, cursor):
+        calls.append(cursor)
+        key, value = cursor
+        db_conn.execute(
+            "INSERT OR REPLACE INTO projector_state (key, value, updated_at) VALUES (?, ?, 'now')",
+            (key, json.dumps(value)),
+        )
+        db_conn.commit()
+        raise RuntimeError("hook submit failed after commit")
+
+    c = EventConsumer(db_conn, bus_db=str(bus_db), on_batch=on_batch)
+    assert c._poll_once() == 1
+    assert c._poll_once() == 0
+    assert len(calls) == 1
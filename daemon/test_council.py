@@ -0,0 +1,158 @@
+"""
+test_council.py — Tests for council.py job execution.
+
+submit_council returns a session id at once while members run concurrently
+under an overall deadline; each vote lands in council_sessions as it arrives.
+Member calls are patched, so no SDK or CLI is needed.
+"""
+from __future__ import annotations
+
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+# Ensure the daemon package is importable regardless of how pytest is invoked.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from daemon import council
+from daemon._internal import DaemonError
+from daemon.council import CouncilResult, get_session, run_council, submit_council
+from daemon.db import SCHEMA, _apply_schema
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def db_conn():
+    """In-memory SQLite connection with garden schema applied."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture(autouse=True)
+def _no_bus():
+    with patch.object(council, "emit_bus_event"):
+        yield
+
+
+def _result(verdict: str, confidence: float = 0.8) -> CouncilResult:
+    return CouncilResult("s", verdict, confidence, [], f"because {verdict}")
+
+
+def _wait_for(predicate, timeout: float = 3.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not reached"
+        time.sleep(0.01)
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_submit_returns_before_members_finish(db_conn):
+    release = threading.Event()
+    answers = {"claude": "sqlite", "gemini": "sqlite", "codex": "postgres"}
+
+    def member(session_id, name, prompt, timeout_s):
+        if name == "codex":
+            release.wait(3)
+        return _result(answers[name])
+
+    with patch.object(council, "_run_member", side_effect=member):
+        session_id = submit_council(db_conn, "arch", "db?", [], cli_list=list(answers))
+        _wait_for(lambda: get_session(db_conn, session_id)["members_done"] == 2)
+        running = get_session(db_conn, session_id)
+        assert running["status"] == "running"
+        assert running["members_total"] == 3
+        assert sorted(v["voter"] for v in running["votes"]) == ["claude", "gemini"]
+
+        release.set()
+        _wait_for(lambda: get_session(db_conn, session_id)["status"] != "running")
+
+    done = get_session(db_conn, session_id)
+    assert done["status"] == "completed"
+    assert done["verdict"] == "sqlite"
+    assert done["confidence"] == pytest.approx(0.8 * 2 / 3, abs=1e-3)
+    assert len(done["votes"]) == 3
+
+
+def test_deadline_finalises_with_partial_votes(db_conn):
+    release = threading.Event()
+
+    def member(session_id, name, prompt, timeout_s):
+        if name == "codex":
+            release.wait(3)
+        return _result("ship")
+
+    try:
+        with patch.object(council, "_run_member", side_effect=member):
+            started = time.monotonic()
+            result = run_council(db_conn, "t", "q", [], cli_list=["claude", "codex"], timeout_s=0.3)
+            assert time.monotonic() - started < 1.5
+    finally:
+        release.set()
+
+    session = get_session(db_conn, result.session_id)
+    assert session["status"] == "partial"
+    assert session["verdict"] == "ship"
+    assert [v["voter"] for v in session["votes"]] == ["claude"]
+
+
+def test_all_members_failing_marks_session_failed(db_conn):
+    with patch.object(council, "_run_member", side_effect=FileNotFoundError("gemini")):
+        with pytest.raises(DaemonError):
+            run_council(db_conn, "t", "q", [], cli_list=["gemini"])
+    row = db_conn.execute("SELECT status, rationale FROM council_sessions").fetchone()
+    assert row["status"] == "failed"
+    assert "gemini" in row["rationale"]
+
+
+def test_unknown_member_is_rejected_before_anything_runs(db_conn):
+    with patch.object(council.subprocess, "run") as run:
+        with pytest.raises(ValueError, match="rm"):
+            submit_council(db_conn, "t", "q", [], cli_list=["claude", "rm"])
+    run.assert_not_called()
+    assert db_conn.execute("SELECT COUNT(*) FROM council_sessions").fetchone()[0] == 0
+
+
+def test_single_synthesis_keeps_advisor_votes(db_conn):
+    advisor_votes = [{"voter": "advisor-1", "vote": "yes"}]
+    synthesis = CouncilResult("s", "yes", 0.9, advisor_votes, "r")
+    with patch.object(council, "_synthesise", return_value=synthesis):
+        result = run_council(db_conn, "t", "q", [])
+    assert (result.verdict, result.votes) == ("yes", advisor_votes)
+    session = get_session(db_conn, result.session_id)
+    assert session["deadline_at"].endswith("+00:00")
+    assert session["created_at"].endswith("+00:00")
+    assert (session["status"], session["members_total"], session["votes"]) == (
+        "completed", 1, advisor_votes,
+    )
+
+
+def test_schema_adds_progress_columns_to_existing_table():
+    conn = sqlite3.connect(":memory:")
+    conn.execute(
+        "CREATE TABLE council_sessions (id TEXT PRIMARY KEY, topic TEXT NOT NULL, "
+        "question TEXT NOT NULL, status TEXT NOT NULL DEFAULT 'pending', verdict TEXT, "
+        "votes TEXT, created_at TEXT NOT NULL, completed_at TEXT)"
+    )
+    _apply_schema(conn)
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(council_sessions)")}
+    assert {"members_total", "members_done", "deadline_at", "confidence", "rationale"} <= columns
+    conn.close()
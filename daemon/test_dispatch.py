@@ -2,7 +2,8 @@
 test_dispatch.py — Tests for hook_dispatch.py.
 
 Tests the HookDispatcher: event-to-hook matching, graceful handling of missing
-hooks, and execution record persistence.
+hooks, execution record persistence, the cached hook index, concurrent
+execution and per-hook counters.
 """
 from __future__ import annotations
 
@@ -12,7 +13,9 @@ import sqlite3
 import stat
 import sys
 import tempfile
+import time
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
@@ -223,3 +226,136 @@ def test_dispatch_executes_all_matching_hooks(db_conn, hooks_dir):
 
     assert hook_sh.name in result
     assert hook_py.name in result
+
+
+# ---------------------------------------------------------------------------
+# Tests: hook index
+# ---------------------------------------------------------------------------
+
+
+def _executable(path: Path, body: str) -> Path:
+    path.write_text(body)
+    path.chmod(path.stat().st_mode | stat.S_IEXEC | stat.S_IXGRP | stat.S_IXOTH)
+    return path
+
+
+def _touch_dir(path: Path) -> None:
+    """Force a visible directory mtime change regardless of fs granularity."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_index_scans_directory_once_until_mtime_changes(db_conn, hooks_dir):
+    _executable(hooks_dir / "on-wicked-garden-ready.sh", "#!/bin/sh\nexit 0\n")
+    dispatcher = HookDispatcher(db_conn, hooks_dir)
+
+    with patch.object(Path, "iterdir", autospec=True, side_effect=Path.iterdir) as scan:
+        for _ in range(5):
+            assert dispatcher.dispatch("wicked.garden.ready", {}) == ["on-wicked-garden-ready.sh"]
+        assert scan.call_count == 1
+
+        _executable(hooks_dir / "on-wicked-garden-ready.py", "import sys; sys.exit(0)\n")
+        _touch_dir(hooks_dir)
+        assert len(dispatcher.dispatch("wicked.garden.ready", {})) == 2
+        assert scan.call_count == 2
+
+
+def _register(db_conn, hook_id, command):
+    db_conn.execute(
+        "INSERT INTO hooks (id, event_pattern, command, description, created_at) "
+        "VALUES (?, 'wicked.garden.*', ?, '', 't')",
+        (hook_id, command),
+    )
+    db_conn.commit()
+
+
+def test_registered_hooks_match_by_glob_after_invalidate(db_conn, hooks_dir, tmp_path):
+    out_file = tmp_path / "registered.out"
+    _executable(hooks_dir / "record.sh", f'#!/bin/sh\necho "$WICKED_EVENT_TYPE" >> "{out_file}"\n')
+    dispatcher = HookDispatcher(db_conn, hooks_dir, run_registered=True)
+    assert dispatcher.dispatch("wicked.garden.ready", {}) == []
+
+    db_conn.execute(
+        "INSERT INTO hooks (id, event_pattern, command, description, created_at) "
+        "VALUES ('h1', 'wicked.garden.*', ?, '', 't')",
+        ("record.sh",),
+    )
+    db_conn.commit()
+    dispatcher.invalidate()
+
+    assert dispatcher.dispatch("wicked.garden.ready", {}) == ["h1"]
+    assert dispatcher.dispatch("wicked.crew.other", {}) == []
+    assert out_file.read_text().split() == ["wicked.garden.ready"]
+
+
+def test_registered_command_outside_hooks_dir_is_rejected(db_conn, hooks_dir, tmp_path):
+    out_file = tmp_path / "escaped.out"
+    outside = _executable(tmp_path / "evil.sh", f'#!/bin/sh\ntouch "{out_file}"\n')
+    dispatcher = HookDispatcher(db_conn, hooks_dir, run_registered=True)
+    for command in (str(outside), "../evil.sh", "sh -c 'touch x'"):
+        with pytest.raises(ValueError):
+            dispatcher.resolve_command(command)
+    _register(db_conn, "h1", str(outside))
+    _register(db_conn, "h2", "../evil.sh")
+    dispatcher.invalidate()
+    assert dispatcher.dispatch("wicked.garden.ready", {}) == []
+    assert not out_file.exists()
+
+
+def test_registered_hooks_are_inert_by_default(db_conn, hooks_dir, tmp_path, monkeypatch):
+    monkeypatch.delenv("WG_DAEMON_RUN_REGISTERED_HOOKS", raising=False)
+    out_file = tmp_path / "ran.out"
+    _executable(hooks_dir / "record.sh", f'#!/bin/sh\ntouch "{out_file}"\n')
+    _register(db_conn, "h1", "record.sh")
+    dispatcher = HookDispatcher(db_conn, hooks_dir)
+    assert dispatcher.dispatch("wicked.garden.ready", {}) == []
+    assert not out_file.exists()
+
+
+# ---------------------------------------------------------------------------
+# Tests: concurrent execution and counters
+# ---------------------------------------------------------------------------
+
+
+def test_hooks_for_one_event_run_concurrently(db_conn, hooks_dir):
+    for suffix in ("a.sh", "b.sh", "c.sh"):
+        _executable(hooks_dir / f"on-wicked-garden-ready.{suffix}", "#!/bin/sh\nsleep 0.4\n")
+    dispatcher = HookDispatcher(db_conn, hooks_dir, workers=3)
+
+    started = time.monotonic()
+    assert len(dispatcher.dispatch("wicked.garden.ready", {})) == 3
+    assert time.monotonic() - started < 1.0
+
+
+def test_submit_does_not_wait_for_slow_hooks(db_conn, hooks_dir, tmp_path):
+    done = tmp_path / "done"
+    _executable(hooks_dir / "on-wicked-garden-ready.sh", f'#!/bin/sh\nsleep 0.5\ntouch "{done}"\n')
+    dispatcher = HookDispatcher(db_conn, hooks_dir)
+
+    started = time.monotonic()
+    assert dispatcher.submit("wicked.garden.ready", {}) == 1
+    assert time.monotonic() - started < 0.3
+    dispatcher._pool.shutdown(wait=True)
+    assert done.exists()
+
+
+def test_stats_track_latency_failures_and_timeouts(db_conn, hooks_dir):
+    _executable(hooks_dir / "on-wicked-garden-ok.sh", "#!/bin/sh\nexit 0\n")
+    _executable(hooks_dir / "on-wicked-garden-bad.sh", "#!/bin/sh\nexit 3\n")
+    _executable(hooks_dir / "on-wicked-garden-slow.sh", "#!/bin/sh\nexec sleep 5\n")
+    dispatcher = HookDispatcher(db_conn, hooks_dir, timeout_s=0.3)
+
+    dispatcher.dispatch("wicked.garden.ok", {})
+    dispatcher.dispatch("wicked.garden.ok", {})
+    dispatcher.dispatch("wicked.garden.bad", {})
+    dispatcher.dispatch("wicked.garden.slow", {})
+
+    stats = dispatcher.stats()
+    assert stats["on-wicked-garden-ok.sh"]["runs"] == 2
+    assert stats["on-wicked-garden-ok.sh"]["failures"] == 0
+    assert stats["on-wicked-garden-bad.sh"]["last_status"] == "failed"
+    assert stats["on-wicked-garden-slow.sh"]["timeouts"] == 1
+    assert stats["on-wicked-garden-slow.sh"]["max_ms"] >= 300
+    assert [name for name, _ in dispatcher.file_hooks()] == [
+        "on-wicked-garden-bad.sh", "on-wicked-garden-ok.sh", "on-wicked-garden-slow.sh",
+    ]
@@ -0,0 +1,245 @@
+"""
+test_projector.py — Tests for projector.py batch application.
+
+apply_batch runs a consumer page through the normal handlers, writes each
+projector_state key once, and commits the consumer cursor with the data.
+Task lifecycle events project into the tasks table read by query_tasks.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Ensure the daemon package is importable regardless of how pytest is invoked.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from daemon.db import SCHEMA
+from daemon.projector import Projector, backfill_tasks, get_task, query_tasks, tasks_projected
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def db_conn():
+    """In-memory SQLite connection with garden schema applied."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+@pytest.fixture()
+def projector(db_conn):
+    return Projector(db_conn)
+
+
+class _CountingConn:
+    """Wraps a connection and counts write statements / commits."""
+
+    def __init__(self, conn):
+        self._conn = conn
+        self.writes = 0
+        self.commits = 0
+
+    def execute(self, sql, *args):
+        if sql.lstrip().upper().startswith("INSERT"):
+            self.writes += 1
+        return self._conn.execute(sql, *args)
+
+    def executemany(self, sql, rows):
+        rows = list(rows)
+        self.writes += len(rows)
+        return self._conn.executemany(sql, rows)
+
+    def commit(self):
+        self.commits += 1
+        return self._conn.commit()
+
+    def rollback(self):
+        return self._conn.rollback()
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_batch_matches_sequential_updates(db_conn, projector):
+    page = [
+        ("wicked.garden.skill.installed", {"skill": "a"}),
+        ("wicked.garden.skill.installed", {"skill": "b"}),
+        ("wicked.garden.session.started", {"session_id": "s1"}),
+        ("wicked.garden.skill.removed", {"skill": "a"}),
+    ]
+    assert projector.apply_batch(page) == 4
+    assert projector.get("garden.installed_skills") == ["b"]
+    assert projector.get("garden.active_sessions") == ["s1"]
+    assert projector.get("daemon.event_count") == 4
+    assert projector.get("daemon.last_event") == "wicked.garden.skill.removed"
+
+
+def test_batch_coalesces_writes_into_one_commit(db_conn, projector):
+    counting = _CountingConn(db_conn)
+    projector._conn = counting
+    page = [("wicked.garden.skill.installed", {"skill": f"s{i}"}) for i in range(50)]
+    projector.apply_batch(page, cursor=("consumer.bus_event_id", 50))
+    assert counting.commits == 1
+    # installed_skills, event_count, last_event, last_event_at, cursor, change_log
+    assert counting.writes == 6
+
+
+def test_cursor_commits_with_the_data(db_conn, projector):
+    projector.apply_batch(
+        [("wicked.garden.skill.installed", {"skill": "a"})],
+        cursor=("consumer.bus_event_id", 7),
+    )
+    assert projector.get("consumer.bus_event_id") == 7
+
+
+def test_failed_commit_persists_nothing(db_conn, projector):
+    before = projector.snapshot()
+
+    class _Failing(_CountingConn):
+        def commit(self):
+            raise sqlite3.OperationalError("disk I/O error")
+
+    projector._conn = _Failing(db_conn)
+    with pytest.raises(sqlite3.OperationalError):
+        projector.apply_batch(
+            [("wicked.garden.skill.installed", {"skill": "a"})],
+            cursor=("consumer.bus_event_id", 1),
+        )
+    projector._conn = db_conn
+    assert projector.snapshot() == before
+
+
+def test_update_logs_instead_of_raising(db_conn, projector):
+    class _Failing(_CountingConn):
+        def commit(self):
+            raise sqlite3.OperationalError("disk I/O error")
+
+    projector._conn = _Failing(db_conn)
+    projector.update("wicked.garden.skill.installed", {"skill": "a"})  # no raise
+
+
+def _task_event(kind, task_id, session="s1", **fields):
+    payload = {"task_id": task_id, "session_id": session, **fields}
+    return (f"wicked.garden.task.{kind}", payload)
+
+
+def test_task_events_project_and_merge(db_conn, projector):
+    projector.apply_batch([
+        _task_event("created", "1", subject="Build", status="pending", ts="t1",
+                    metadata={"chain_id": "p1.build", "event_type": "coding-task"}),
+        _task_event("updated", "1", status="in_progress", ts="t2",
+                    metadata={"source_agent": "builder"}),
+    ])
+    task = get_task(db_conn, "1", session_id="s1")
+    assert task["subject"] == "Build"
+    assert task["status"] == "in_progress"
+    assert task["chain_id"] == "p1.build"
+    assert task["event_type"] == "coding-task"
+    assert task["metadata"]["source_agent"] == "builder"
+    assert (task["created_at"], task["updated_at"]) == ("t1", "t2")
+
+    projector.update("wicked.garden.task.updated",
+                     {"task_id": "1", "session_id": "s1", "metadata": {"chain_id": None}})
+    task = get_task(db_conn, "1", session_id="s1")
+    assert task["chain_id"] is None
+    assert "chain_id" not in task["metadata"]
+
+
+def test_task_rows_commit_with_the_batch(db_conn, projector):
+    counting = _CountingConn(db_conn)
+    projector._conn = counting
+    page = [_task_event("created", "1", ts="t1")] + [
+        _task_event("updated", "1", status=s) for s in ("in_progress", "completed")
+    ]
+    projector.apply_batch(page)
+    assert counting.commits == 1
+    # event_count, last_event, last_event_at + one coalesced task row + change_log
+    assert counting.writes == 5
+    assert get_task(db_conn, "1")["status"] == "completed"
+
+
+def test_query_tasks_filters_and_paginates(db_conn, projector):
+    projector.apply_batch([
+        _task_event("created", "1", session="s1", status="in_progress", ts="t1",
+                    metadata={"chain_id": "c"}),
+        _task_event("created", "2", session="s1", status="completed", ts="t2",
+                    metadata={"chain_id": "c"}),
+        _task_event("created", "1", session="s2", status="in_progress", ts="t3"),
+    ])
+    assert [t["session_id"] for t in query_tasks(db_conn, status="in_progress")] == ["s2", "s1"]
+    assert [t["id"] for t in query_tasks(db_conn, chain_id="c")] == ["2", "1"]
+    assert [t["id"] for t in query_tasks(db_conn, session_id="s1", status="completed")] == ["2"]
+    page = query_tasks(db_conn, limit=2)
+    assert [t["updated_at"] for t in page] == ["t3", "t2"]
+    assert [t["updated_at"] for t in query_tasks(db_conn, limit=2, offset=2)] == ["t1"]
+    # Same native id in two sessions: newest wins unless the session is given.
+    assert get_task(db_conn, "1")["session_id"] == "s2"
+    assert get_task(db_conn, "1", session_id="s1")["status"] == "in_progress"
+    assert get_task(db_conn, "9") is None
+
+
+def test_task_timestamps_share_one_format(db_conn, projector):
+    projector.apply_batch([
+        _task_event("created", "1", ts="2026-10-16T12:00:00.000001Z"),
+        _task_event("created", "2"),
+    ])
+    stamps = [t["updated_at"] for t in query_tasks(db_conn)]
+    assert all(ts.endswith("+00:00") for ts in stamps), stamps
+    assert get_task(db_conn, "1")["created_at"] == "2026-10-16T12:00:00.000001+00:00"
+
+
+def test_backfill_seeds_unprojected_tasks_only(db_conn, projector, tmp_path):
+    projector.apply_batch([_task_event("created", "1", status="completed", ts="t1")])
+    session = tmp_path / "s1"
+    session.mkdir()
+    (session / "1.json").write_text(json.dumps({"id": "1", "status": "pending"}))
+    (session / "2.json").write_text(json.dumps({
+        "id": "2", "subject": "Review", "status": "in_progress",
+        "metadata": {"chain_id": "p1.review", "event_type": "review"},
+    }))
+    (session / ".lock").write_text("")
+
+    assert backfill_tasks(db_conn, tmp_path) == 1
+    assert get_task(db_conn, "1", session_id="s1")["status"] == "completed"
+    task = get_task(db_conn, "2", session_id="s1")
+    assert (task["status"], task["chain_id"], task["event_type"]) == ("in_progress", "p1.review", "review")
+    assert task["updated_at"].endswith("+00:00")
+    assert backfill_tasks(db_conn, tmp_path / "missing") == 0
+
+
+def test_tasks_projected_tells_empty_from_unknown(db_conn, projector):
+    projector.apply_batch([
+        _task_event("created", "1", status="completed", metadata={"chain_id": "c"}),
+    ])
+    assert query_tasks(db_conn, session_id="s1", status="in_progress") == []
+    assert tasks_projected(db_conn, session_id="s1")
+    assert tasks_projected(db_conn, chain_id="c")
+    assert not tasks_projected(db_conn, session_id="s2")
+
+
+def test_batch_appends_one_state_change(db_conn, projector):
+    projector.apply_batch(
+        [_task_event("created", "1", status="in_progress")],
+        cursor=("consumer.bus_event_id", 9),
+    )
+    rows = db_conn.execute("SELECT kind, data FROM change_log").fetchall()
+    assert [r["kind"] for r in rows] == ["state"]
+    change = json.loads(rows[0]["data"])
+    assert change["cursor"] == 9
+    assert change["tasks"] == [{"session_id": "s1", "id": "1", "status": "in_progress"}]
+    assert "consumer.bus_event_id" in change["keys"]
@@ -0,0 +1,145 @@
+"""
+test_retention.py — Tests for garden.db retention and compaction (retention.py).
+
+Expired and over-cap rows are deleted oldest-first in small batches, rows
+still in flight (pending HITL prompts, running councils) are kept, and
+compaction returns free pages and truncates the WAL.
+"""
+from __future__ import annotations
+
+import sqlite3
+import sys
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+# Ensure the daemon package is importable regardless of how pytest is invoked.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from daemon import retention
+from daemon.db import SCHEMA, get_write_lock
+from daemon.retention import compact, merge_policy, prune_step, storage_stats
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+@pytest.fixture()
+def db_conn():
+    """In-memory SQLite connection with garden schema applied."""
+    conn = sqlite3.connect(":memory:", check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    conn.executescript(SCHEMA)
+    conn.commit()
+    yield conn
+    conn.close()
+
+
+def _ago(days: float) -> str:
+    return (datetime.now(tz=timezone.utc) - timedelta(days=days)).isoformat()
+
+
+def _add_events(conn, ages_days):
+    for i, age in enumerate(ages_days):
+        conn.execute(
+            "INSERT INTO garden_events (id, event_type, payload, received_at) VALUES (?, 'e', '{}', ?)",
+            (f"ev-{i}", _ago(age)),
+        )
+    conn.commit()
+
+
+def _ids(conn, table):
+    return sorted(row[0] for row in conn.execute(f"SELECT id FROM {table}"))
+
+
+_ONLY_EVENTS = {
+    "garden_events": {"max_age_days": None, "max_rows": None},
+    "hitl_prompts": {"max_age_days": None, "max_rows": None},
+    "council_sessions": {"max_age_days": None, "max_rows": None},
+}
+
+
+def _policy(**tables):
+    return merge_policy({**_ONLY_EVENTS, **tables})
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_age_and_row_caps_delete_oldest_first(db_conn):
+    _add_events(db_conn, [30, 20, 5, 4, 3, 2, 1])
+    deleted = prune_step(db_conn, _policy(garden_events={"max_age_days": 14, "max_rows": 3}))
+    assert deleted == 4
+    assert _ids(db_conn, "garden_events") == ["ev-4", "ev-5", "ev-6"]
+
+
+def test_batches_stop_at_time_budget(db_conn):
+    _add_events(db_conn, [30] * 10)
+    policy = _policy(garden_events={"max_age_days": 1})
+    assert prune_step(db_conn, policy, batch_rows=3, budget_s=0) == 0
+    assert prune_step(db_conn, policy, batch_rows=3, budget_s=5) == 10
+
+
+def test_busy_write_lock_skips_tick(db_conn):
+    _add_events(db_conn, [30])
+    with get_write_lock():
+        assert prune_step(db_conn, _policy(garden_events={"max_age_days": 1})) is None
+    assert _ids(db_conn, "garden_events") == ["ev-0"]
+
+
+def test_in_flight_rows_are_kept(db_conn):
+    old = _ago(365)
+    db_conn.executemany(
+        "INSERT INTO hitl_prompts (id, prompt, status, created_at) VALUES (?, ?, ?, ?)",
+        [("h1", "hook:on-x event:e", "completed", old), ("p1", "approve?", "pending", old)],
+    )
+    db_conn.executemany(
+        "INSERT INTO council_sessions (id, topic, question, status, created_at) VALUES (?, 't', 'q', ?, ?)",
+        [("c1", "completed", old), ("c2", "running", old)],
+    )
+    db_conn.commit()
+    prune_step(db_conn, merge_policy(None))
+    assert _ids(db_conn, "hitl_prompts") == ["p1"]
+    assert _ids(db_conn, "council_sessions") == ["c2"]
+
+
+def test_unknown_table_in_policy_raises():
+    with pytest.raises(ValueError):
+        merge_policy({"tasks": {"max_rows": 1}})
+
+
+def test_compact_shrinks_file_and_truncates_wal(tmp_path):
+    conn = sqlite3.connect(str(tmp_path / "garden.db"), check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(SCHEMA)
+    conn.executemany(
+        "INSERT INTO garden_events (id, event_type, payload, received_at) VALUES (?, 'e', ?, ?)",
+        [(f"ev-{i}", "x" * 2000, _ago(30)) for i in range(300)],
+    )
+    conn.commit()
+    prune_step(conn, _policy(garden_events={"max_age_days": 1}), budget_s=5)
+    before = storage_stats(conn)
+    assert before["freelist_pages"] > 0 and before["wal_bytes"] > 0
+
+    # Legacy file without auto_vacuum: converted by one full VACUUM.
+    assert compact(conn)["vacuumed"] is True
+    after = storage_stats(conn)
+    assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 2
+    assert after["db_bytes"] < before["db_bytes"]
+    assert after["wal_bytes"] == 0
+    conn.close()
+
+
+def test_worker_tick_compacts_when_due(db_conn, monkeypatch):
+    calls = []
+    monkeypatch.setattr(retention, "compact", lambda conn: calls.append(conn) or {})
+    worker = retention.RetentionWorker(db_conn, vacuum_interval_s=0)
+    worker.tick()
+    assert calls == [db_conn]
@@ -0,0 +1,144 @@
+"""
+test_server.py — Tests for the daemon's concurrent serving path.
+
+make_server runs any WSGI app on a fixed worker pool with a bounded accept
+queue (503 when saturated); get_read_connection gives each thread its own
+query-only WAL connection. Plain WSGI callables stand in for the Flask app.
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+import sys
+import threading
+import time
+import urllib.error
+import urllib.request
+from pathlib import Path
+
+import pytest
+
+# Ensure the daemon package is importable regardless of how pytest is invoked.
+_REPO_ROOT = Path(__file__).resolve().parent.parent
+if str(_REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(_REPO_ROOT))
+
+from daemon import db
+from daemon.server import make_server
+
+
+# ---------------------------------------------------------------------------
+# Fixtures
+# ---------------------------------------------------------------------------
+
+
+class _App:
+    """WSGI app: /slow blocks until released, everything else answers at once."""
+
+    def __init__(self):
+        self.release = threading.Event()
+        self.entered = threading.Semaphore(0)
+
+    def __call__(self, environ, start_response):
+        if environ["PATH_INFO"] == "/slow":
+            self.entered.release()
+            self.release.wait(5)
+        start_response("200 OK", [("Content-Type", "application/json")])
+        return [b'{"ok": true}']
+
+
+@pytest.fixture()
+def serve():
+    started = []
+
+    def _serve(app, **kwargs):
+        server = make_server(app, "127.0.0.1", 0, **kwargs)
+        thread = threading.Thread(target=server.serve_forever, daemon=True)
+        thread.start()
+        started.append(server)
+        return f"http://127.0.0.1:{server.server_address[1]}", server
+
+    yield _serve
+    for server in started:
+        server.shutdown()
+        server.server_close()
+
+
+def _get(url: str, timeout: float = 2.0):
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            return resp.status, json.loads(resp.read())
+    except urllib.error.HTTPError as exc:
+        return exc.code, json.loads(exc.read())
+
+
+def _get_in_background(url: str) -> threading.Thread:
+    thread = threading.Thread(target=_get, args=(url, 5.0), daemon=True)
+    thread.start()
+    return thread
+
+
+# ---------------------------------------------------------------------------
+# Tests
+# ---------------------------------------------------------------------------
+
+
+def test_slow_request_does_not_block_fast_ones(serve):
+    app = _App()
+    base, _ = serve(app, threads=2)
+    slow = _get_in_background(base + "/slow")
+    assert app.entered.acquire(timeout=2)
+
+    started = time.monotonic()
+    assert _get(base + "/health") == (200, {"ok": True})
+    assert time.monotonic() - started < 0.5
+
+    app.release.set()
+    slow.join(5)
+
+
+def test_saturated_server_sheds_with_503(serve):
+    app = _App()
+    base, server = serve(app, threads=1, max_queue=1)
+    busy = _get_in_background(base + "/slow")
+    assert app.entered.acquire(timeout=2)
+    queued = _get_in_background(base + "/health")
+    deadline = time.monotonic() + 2
+    while server._queue.qsize() < 1 and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    status, body = _get(base + "/health")
+    assert status == 503
+    assert body["error"]["code"] == "OVERLOADED"
+    assert server.shed_count == 1
+
+    app.release.set()
+    busy.join(5)
+    queued.join(5)
+    assert _get(base + "/health") == (200, {"ok": True})
+
+
+def test_read_connections_are_per_thread_and_query_only(tmp_path):
+    db.close_connection()
+    try:
+        writer = db.get_connection(str(tmp_path / "garden.db"))
+        reader = db.get_read_connection()
+        assert reader is not writer
+        assert db.get_read_connection() is reader
+        with pytest.raises(sqlite3.OperationalError):
+            reader.execute("DELETE FROM hooks")
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(db.get_read_connection()))
+        thread.start()
+        thread.join()
+        assert other[0] is not reader
+
+        with db.get_write_lock():
+            writer.execute(
+                "INSERT INTO projector_state (key, value, updated_at) VALUES ('k', '1', 't')"
+            )
+            writer.commit()
+        assert reader.execute("SELECT value FROM projector_state WHERE key = 'k'").fetchone()[0] == "1"
+    finally:
+        db.close_connection()
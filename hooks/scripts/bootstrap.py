@@ -15,13 +15,20 @@ Flow:
 7. Assemble session briefing
 8. Return {"continue": true, "systemMessage": "<briefing>"}
 
+The independent peer / pack / plugin-readiness / skill / registry checks run
+concurrently on a bounded daemon-thread pool with per-check deadlines (see
+_ParallelChecks), and plugin readiness probes are cached across sessions.
+
 Always fails open — any unhandled exception returns {"continue": true}.
 """
 
 import json
 import os
+import queue
+import shutil
 import subprocess
 import sys
+import threading
 import time
 from datetime import datetime, timezone
 from pathlib import Path
@@ -137,6 +144,62 @@ def _check_prior_guard_findings():
         return None
 
 
+# ---------------------------------------------------------------------------
+# Cross-session plugin probe cache
+#
+# Each readiness probe forks the other plugin's hook binary (up to 2s). The
+# outcome only changes when the binary or the plugin changes, so "ready" and
+# "timeout" outcomes are remembered across sessions keyed by resolved binary
+# path + mtime + plugin version + probe argv. Auth failures are never cached
+# — they are the signal the user acts on, and must re-probe after a login.
+# ---------------------------------------------------------------------------
+
+_PROBE_CACHE_TTL_S = 7 * 86400
+
+
+def _probe_cache_path() -> Path:
+    return Path.home() / ".something-wicked" / "wicked-garden" / "cache" / "plugin-probes.json"
+
+
+def _load_probe_cache() -> dict:
+    """Return {key: {"outcome", "ts"}} with expired entries dropped."""
+    try:
+        data = json.loads(_probe_cache_path().read_text(encoding="utf-8"))
+        entries = data.get("entries", {})
+        cutoff = time.time() - _PROBE_CACHE_TTL_S
+        return {
+            k: v for k, v in entries.items()
+            if isinstance(v, dict) and v.get("ts", 0) >= cutoff
+        }
+    except (OSError, ValueError, AttributeError):
+        return {}
+
+
+def _save_probe_cache(entries: dict) -> None:
+    """Atomically persist the probe cache. Best-effort."""
+    try:
+        path = _probe_cache_path()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        tmp.write_text(json.dumps({"entries": entries}), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _probe_cache_key(probe_cmd: list, plugin_version: str) -> "str | None":
+    """Key a probe by resolved binary + mtime + plugin version, or None when
+    the binary does not resolve (the probe would raise FileNotFoundError)."""
+    resolved = shutil.which(probe_cmd[0])
+    if not resolved:
+        return None
+    try:
+        mtime_ns = os.stat(resolved).st_mtime_ns
+    except OSError:
+        return None
+    return json.dumps([resolved, mtime_ns, plugin_version, probe_cmd])
+
+
 def _probe_plugin_readiness():
     """Dynamically discover installed plugins and probe their hook readiness.
 
@@ -146,8 +209,11 @@ def _probe_plugin_readiness():
         [{"name": "semgrep", "hook": "PostToolUse", "error": "No SEMGREP_APP_TOKEN found"}]
 
     Runs with a tight timeout (2s per probe) and fails open — never blocks bootstrap.
+    Ready / timed-out outcomes are reused across sessions via the probe cache
+    until the binary, its mtime or the plugin version changes.
     """
     unready = []
+    probe_cache = _load_probe_cache()
     try:
         # Discover plugin cache directories
         cache_dirs = [
@@ -184,9 +250,12 @@ def _probe_plugin_readiness():
                         if not pj.exists():
                             pj = plugin_root / "plugin.json"
                         plugin_name = plugin_dir.name
+                        plugin_version = ""
                         if pj.exists():
                             try:
-                                plugin_name = json.loads(pj.read_text()).get("name", plugin_dir.name)
+                                pj_data = json.loads(pj.read_text())
+                                plugin_name = pj_data.get("name", plugin_dir.name)
+                                plugin_version = str(pj_data.get("version", ""))
                             except Exception:
                                 pass
 
@@ -218,9 +287,16 @@ def _probe_plugin_readiness():
                                         continue
                                     # Quick probe: just check if the binary is available and
                                     # runs without error when given empty input
+                                    probe_cmd = parts + ["--help"] if len(parts) == 1 else parts[:2] + ["--version"]
+                                    cache_key = _probe_cache_key(probe_cmd, plugin_version)
+                                    cached = probe_cache.get(cache_key, {}).get("outcome") if cache_key else None
+                                    if cached == "timeout":
+                                        continue
+                                    if cached == "ready":
+                                        break  # Only test first hook per event
                                     try:
                                         result = subprocess.run(
-                                            parts + ["--help"] if len(parts) == 1 else parts[:2] + ["--version"],
+                                            probe_cmd,
                                             capture_output=True, text=True, timeout=2,
                                             input="",
                                         )
@@ -229,7 +305,11 @@ def _probe_plugin_readiness():
                                     except FileNotFoundError:
                                         continue  # Binary not installed — not our problem
                                     except subprocess.TimeoutExpired:
-                                        continue  # Timed out — assume it works but is slow
+                                        # Timed out — assume it works but is slow
+                                        if cache_key:
+                                            probe_cache[cache_key] = {"outcome": "timeout", "ts": time.time()}
+                                            _save_probe_cache(probe_cache)
+                                        continue
                                     except Exception:
                                         continue
 
@@ -249,6 +329,9 @@ def _probe_plugin_readiness():
                                                 "error": short_err,
                                             })
                                             break  # One failure per plugin is enough
+                                    if cache_key:
+                                        probe_cache[cache_key] = {"outcome": "ready", "ts": time.time()}
+                                        _save_probe_cache(probe_cache)
                                     break  # Only test first hook per event
                             if any(u["name"] == plugin_name for u in unready):
                                 break  # Already flagged this plugin
@@ -520,8 +603,6 @@ def _check_vault_dependency():
     installs only. Always fails open — never blocks the session.
     """
     try:
-        import shutil
-
         # WICKED_VAULT_BIN explicitly set (even empty kill-switch) → operator
         # is driving resolution deliberately; don't nag.
         if "WICKED_VAULT_BIN" in os.environ:
@@ -672,6 +753,7 @@ def _check_bus_dependency():
          .claude/settings.json, and CLAUDE_CONFIG_DIR/settings.json.
       2. Loose skill installs at ``skills/wicked-bus-*`` under the home and
          CLAUDE_CONFIG_DIR skills directories.
+      3. A usable CLI in _bus's cross-process binary cache (no probe here).
 
     Fast + stdlib-only (no subprocess). Always fails open — never blocks the
     session.
@@ -724,6 +806,16 @@ def _check_bus_dependency():
                 if bus_installed:
                     break
 
+        # Check 3: the wicked-bus CLI resolution cached by _bus (shared with
+        # every emit-path process). Read-only — never probes.
+        if not bus_installed:
+            try:
+                from _bus import cached_binary_status
+                cached = cached_binary_status()
+                bus_installed = bool(cached and cached.get("binary"))
+            except Exception:
+                pass  # fail open
+
         if not bus_installed:
             return (
                 "[wicked-bus] optional layer not installed.\n"
@@ -1189,6 +1281,74 @@ def _scan_for_legacy_reeval_entries() -> str | None:
 # Main
 # ---------------------------------------------------------------------------
 
+# ---------------------------------------------------------------------------
+# Parallel independent checks
+#
+# The peer / pack / plugin / skill / registry checks share no state with each
+# other or with the rest of main(), so they start together on a small pool of
+# daemon threads as soon as setup is confirmed and are collected where their
+# notes land in the briefing (same order as before). Each check has a deadline
+# measured from pool start; a check that misses it contributes its fail-open
+# default and is abandoned — daemon threads never hold up interpreter exit.
+# ---------------------------------------------------------------------------
+
+_CHECK_WORKERS = 4
+_CHECK_DEADLINE_S = 3.0
+_CHECK_DEADLINES_S = {
+    "_probe_plugin_readiness": 8.0,  # forks other plugins' binaries (2s each)
+    "_run_registry_validation": 5.0,
+}
+_PARALLEL_CHECKS = (
+    "_probe_plugin_readiness",
+    "_run_registry_validation",
+    "_check_pack_floors",
+    "_check_vault_dependency",
+    "_check_bus_dependency",
+    "_check_loom_dependency",
+    "_check_critical_skills",
+)
+
+
+class _ParallelChecks:
+    """Run named module-level checks on a bounded pool of daemon threads."""
+
+    def __init__(self, names=_PARALLEL_CHECKS, workers=_CHECK_WORKERS):
+        self._t0 = time.monotonic()
+        self._results = {}
+        self._done = {name: threading.Event() for name in names}
+        self._queue = queue.SimpleQueue()
+        for name in names:
+            self._queue.put(name)
+        for _ in range(max(1, min(workers, len(names)))):
+            threading.Thread(target=self._work, name="wg-bootstrap-check",
+                             daemon=True).start()
+
+    def _work(self):
+        while True:
+            try:
+                name = self._queue.get_nowait()
+            except queue.Empty:
+                return
+            t0 = time.monotonic()
+            try:
+                # Resolved at call time so tests can patch the module function.
+                self._results[name] = globals()[name]()
+            except Exception:
+                pass  # fail open — the caller's default stands in
+            finally:
+                self._done[name].set()
+                _log("bootstrap", "debug", "check.end", ms=int((time.monotonic() - t0) * 1000),
+                     detail={"check": name})
+
+    def result(self, name, default=None):
+        """Return the check's result, or ``default`` if it misses its deadline."""
+        deadline = self._t0 + _CHECK_DEADLINES_S.get(name, _CHECK_DEADLINE_S)
+        if not self._done[name].wait(max(0.0, deadline - time.monotonic())):
+            _log("bootstrap", "normal", "check.deadline", ok=False, detail={"check": name})
+            return default
+        return self._results.get(name, default)
+
+
 def main():
     _t0 = time.monotonic()
     _log("bootstrap", "debug", "hook.start")
@@ -1244,6 +1404,10 @@ def main():
             }))
             return
 
+        # Independent checks run concurrently with the rest of bootstrap;
+        # results are collected below where their notes are appended.
+        checks = _ParallelChecks()
+
         # Clear one-time task suggestion flag from crew
         flag = Path.home() / ".something-wicked" / "wicked-crew" / ".task_suggest_shown"
         flag.unlink(missing_ok=True)
@@ -1309,19 +1473,19 @@ def main():
         if _legacy_reeval_notice:
             mode_notes.append(_legacy_reeval_notice)
         # Required-peer check: wicked-vault (the evidence backend for gates).
-        _vault_note = _check_vault_dependency()
+        _vault_note = checks.result("_check_vault_dependency")
         if _vault_note:
             mode_notes.append(_vault_note)
         # Required-peer check: wicked-bus (the event backbone for archetype events).
-        _bus_note = _check_bus_dependency()
+        _bus_note = checks.result("_check_bus_dependency")
         if _bus_note:
             mode_notes.append(_bus_note)
         # Required-peer check: wicked-loom (the orchestration runtime garden drives).
-        _loom_note = _check_loom_dependency()
+        _loom_note = checks.result("_check_loom_dependency")
         if _loom_note:
             mode_notes.append(_loom_note)
         # Third-party pack peer floors (extension contract, fail-open).
-        _pack_note = _check_pack_floors()
+        _pack_note = checks.result("_check_pack_floors")
         if _pack_note:
             mode_notes.append(_pack_note)
         if onedrive_path:
@@ -1357,7 +1521,7 @@ def main():
                 )
 
         # 7b. Probe installed plugin hooks for readiness
-        unready_plugins = _probe_plugin_readiness()
+        unready_plugins = checks.result("_probe_plugin_readiness", [])
         if unready_plugins and state is not None:
             state.update(unready_plugins=[p["name"] for p in unready_plugins])
         if unready_plugins:
@@ -1379,7 +1543,7 @@ def main():
             state.update(dangerous_mode=dangerous_mode)
 
         # 7c.1. Critical v6 skill smoke-test (issue #434)
-        skills_note = _check_critical_skills()
+        skills_note = checks.result("_check_critical_skills")
         if skills_note:
             mode_notes.append(skills_note)
 
@@ -1389,7 +1553,7 @@ def main():
         # swallowed inside _run_registry_validation, returning None so the
         # briefing simply omits the [Registry] line on failure.  Findings
         # are advisory at the session-start surface — they do NOT block.
-        registry_note = _run_registry_validation()
+        registry_note = checks.result("_run_registry_validation")
         if registry_note:
             mode_notes.append(registry_note)
 
@@ -0,0 +1,405 @@
+#!/usr/bin/env python3
+"""hook_worker.py — opt-in resident hook worker (one per session + cwd).
+
+Every hook in hooks.json launches ``invoke.py <name>``, which in turn runs the
+target script. On sessions with thousands of tool calls the interpreter
+start-up plus re-importing ``_session`` / ``_logger`` / ``_domain_store`` on
+every PreToolUse / PostToolUse dominates wall-clock. This module keeps ONE
+long-lived interpreter per session listening on a Unix socket; ``invoke.py``
+forwards argv / stdin / env to it and replays the captured stdout, stderr and
+exit code. The hook modules are imported once and their ``main()`` is called
+in-process for every event.
+
+Opt-in: ``WG_HOOK_WORKER=1``. Without it nothing here runs.
+
+Lifecycle:
+  * ``invoke.py`` calls :func:`request`. When no worker answers it calls
+    :func:`spawn` (detached, ``start_new_session``) and runs the current
+    event locally as usual — the NEXT event hits the worker.
+  * Single instance per socket via an ``flock`` on ``<socket>.lock``.
+  * session_end.py calls :func:`stop_worker`. Otherwise the worker exits
+    after ``WG_HOOK_WORKER_IDLE`` seconds without traffic (default 1800), or
+    when the current hook has been running longer than
+    ``WG_HOOK_WORKER_WEDGE`` seconds (default 120) — the next invocation
+    respawns a fresh one.
+
+Only hot-path hooks are resident (:data:`RESIDENT_SCRIPTS`). bootstrap, stop
+and session_end run once per turn/session with 15-30s budgets and spawn their
+own subprocesses; serialising them in the worker would only delay the hot
+path, so they always run locally in invoke.py.
+
+Wire format: 4-byte big-endian length + JSON, one request and one reply per
+connection. Replies are ``{"status": "ok", "code", "stdout", "stderr"}`` or
+``{"status": "busy"}`` when the run lock could not be taken within
+``WG_HOOK_WORKER_QUEUE_MS`` (default 500) — the hook was NOT executed, so the
+client can safely run it locally without running side effects twice.
+
+Contract: fail-open. :func:`request` returns ``None`` on any error and the
+caller runs the hook locally. Stdlib only.
+"""
+
+from __future__ import annotations
+
+import base64
+import hashlib
+import importlib.util
+import io
+import json
+import os
+import socket
+import struct
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+WORKER_ENV = "WG_HOOK_WORKER"
+
+# Hot-path hooks served in-process by the worker. Anything not listed here
+# always runs locally in invoke.py.
+RESIDENT_SCRIPTS = frozenset({
+    "pre_tool",
+    "post_tool",
+    "prompt_submit",
+    "task_completed",
+    "subagent_lifecycle",
+    "permission_request",
+    "notification",
+    "pre_compact",
+})
+
+_HOOKS_DIR = Path(__file__).resolve().parent
+
+_CONNECT_TIMEOUT_S = 0.1
+_DEFAULT_REPLY_TIMEOUT_S = 120.0
+_DEFAULT_QUEUE_MS = 500
+_DEFAULT_IDLE_S = 1800.0
+_DEFAULT_WEDGE_S = 120.0
+_MAX_FRAME = 64 * 1024 * 1024
+_SHUTDOWN = "__shutdown__"
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, "") or default)
+    except ValueError:
+        return default
+
+
+def enabled() -> bool:
+    """True when the resident worker is opted in and the platform supports it."""
+    return os.environ.get(WORKER_ENV, "") == "1" and hasattr(socket, "AF_UNIX")
+
+
+def socket_path() -> str:
+    """Return the socket path for the current session + working directory.
+
+    Keyed by cwd as well as session id because ``_paths`` resolves the
+    project storage root from the cwd at import time — a worker may only
+    serve the directory it was started in.
+    """
+    session_id = os.environ.get("CLAUDE_SESSION_ID", "default")
+    cwd = os.environ.get("CLAUDE_CWD") or os.getcwd()
+    key = hashlib.sha256(f"{session_id}\0{cwd}".encode("utf-8")).hexdigest()[:16]
+    # Unix socket paths are capped at ~104 bytes, so keep the name short.
+    return os.path.join(tempfile.gettempdir(), f"wg-hook-{key}.sock")
+
+
+# ---------------------------------------------------------------------------
+# Framing
+# ---------------------------------------------------------------------------
+
+def _send(conn: socket.socket, obj: dict) -> None:
+    data = json.dumps(obj).encode("utf-8")
+    conn.sendall(struct.pack(">I", len(data)) + data)
+
+
+def _recv_exact(conn: socket.socket, n: int) -> bytes:
+    chunks = []
+    while n:
+        chunk = conn.recv(min(n, 65536))
+        if not chunk:
+            raise ConnectionError("peer closed connection")
+        chunks.append(chunk)
+        n -= len(chunk)
+    return b"".join(chunks)
+
+
+def _recv(conn: socket.socket) -> dict:
+    (size,) = struct.unpack(">I", _recv_exact(conn, 4))
+    if size > _MAX_FRAME:
+        raise ValueError(f"frame too large: {size}")
+    return json.loads(_recv_exact(conn, size).decode("utf-8"))
+
+
+# ---------------------------------------------------------------------------
+# Client side (called from invoke.py)
+# ---------------------------------------------------------------------------
+
+def request(script: str, argv: list, stdin_data: bytes,
+            sock_path: "str | None" = None) -> "dict | None":
+    """Run ``script`` on the resident worker.
+
+    Returns ``{"code", "stdout", "stderr"}`` on success, or ``None`` when the
+    caller must run the hook locally (no worker, busy, wedged, or any
+    transport error). Starts a worker in the background when none is
+    listening.
+    """
+    sock_path = sock_path or socket_path()
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.settimeout(_CONNECT_TIMEOUT_S)
+        try:
+            conn.connect(sock_path)
+        except (FileNotFoundError, ConnectionRefusedError):
+            spawn(sock_path)
+            return None
+        conn.settimeout(_env_float("WG_HOOK_WORKER_TIMEOUT", _DEFAULT_REPLY_TIMEOUT_S))
+        _send(conn, {
+            "script": script,
+            "argv": list(argv),
+            "stdin": base64.b64encode(stdin_data).decode("ascii"),
+            "env": dict(os.environ),
+        })
+        reply = _recv(conn)
+    except Exception:
+        return None
+    finally:
+        conn.close()
+
+    if reply.get("status") != "ok":
+        return None
+    return {
+        "code": int(reply.get("code", 0) or 0),
+        "stdout": reply.get("stdout", ""),
+        "stderr": reply.get("stderr", ""),
+    }
+
+
+def spawn(sock_path: "str | None" = None) -> None:
+    """Start a detached worker for ``sock_path``. Never raises.
+
+    Concurrent spawns are harmless — the loser of the ``flock`` race exits.
+    """
+    sock_path = sock_path or socket_path()
+    try:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--serve", sock_path],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True,
+        )
+    except Exception:
+        pass
+
+
+def stop_worker(sock_path: "str | None" = None) -> bool:
+    """Ask the worker for ``sock_path`` to exit. Returns True if one answered."""
+    sock_path = sock_path or socket_path()
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.settimeout(_CONNECT_TIMEOUT_S)
+        conn.connect(sock_path)
+        _send(conn, {"script": _SHUTDOWN})
+        return _recv(conn).get("status") == "ok"
+    except Exception:
+        return False
+    finally:
+        conn.close()
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+class _Worker:
+    """Accept loop + serialised in-process hook execution."""
+
+    def __init__(self, sock_path: str, scripts_dir: Path = _HOOKS_DIR):
+        self.sock_path = sock_path
+        self.scripts_dir = Path(scripts_dir)
+        self.queue_s = _env_float("WG_HOOK_WORKER_QUEUE_MS", _DEFAULT_QUEUE_MS) / 1000.0
+        self.idle_s = _env_float("WG_HOOK_WORKER_IDLE", _DEFAULT_IDLE_S)
+        self.wedge_s = _env_float("WG_HOOK_WORKER_WEDGE", _DEFAULT_WEDGE_S)
+        self._run_lock = threading.Lock()
+        self._run_started = 0.0
+        self._last_activity = time.monotonic()
+        self._modules: dict = {}
+        self._stop = threading.Event()
+        self._server: "socket.socket | None" = None
+
+    # -- module loading -----------------------------------------------------
+
+    def _load(self, script: str):
+        module = self._modules.get(script)
+        if module is not None:
+            return module
+        path = self.scripts_dir / f"{script}.py"
+        spec = importlib.util.spec_from_file_location(script, path)
+        module = importlib.util.module_from_spec(spec)
+        # Register before exec so sibling imports (pre_tool -> worktree_guard)
+        # and `import <hook>` inside helpers resolve to this instance.
+        sys.modules[script] = module
+        spec.loader.exec_module(module)
+        self._modules[script] = module
+        return module
+
+    # -- execution ----------------------------------------------------------
+
+    def run_hook(self, script: str, argv: list, stdin_data: bytes, env: dict) -> dict:
+        """Run ``<script>.main()`` with replayed stdin/argv/env; capture output."""
+        saved_env = dict(os.environ)
+        saved_argv = sys.argv
+        saved_path: "list | None" = None
+        saved_stdio = (sys.stdin, sys.stdout, sys.stderr)
+
+        out, err = io.StringIO(), io.StringIO()
+        code = 0
+        try:
+            os.environ.clear()
+            os.environ.update(env)
+            sys.argv = [str(self.scripts_dir / f"{script}.py")] + list(argv)
+            sys.stdin = io.TextIOWrapper(io.BytesIO(stdin_data), encoding="utf-8")
+            sys.stdout, sys.stderr = out, err
+            module = self._load(script)
+            # Snapshot after loading: entries the hook module added at import
+            # (e.g. scripts/) must persist, because a cached module never
+            # re-runs its top level and its lazy imports rely on them.
+            saved_path = list(sys.path)
+            module.main()
+        except SystemExit as exc:
+            if exc.code is None:
+                code = 0
+            elif isinstance(exc.code, int):
+                code = exc.code
+            else:
+                print(exc.code, file=err)
+                code = 1
+        except BaseException as exc:  # noqa: BLE001 — mirror an uncaught crash
+            print(f"[wicked-garden] hook_worker: {script} crashed: {exc}", file=err)
+            code = 1
+        finally:
+            # Hooks buffer log entries, latency samples and outbox bus
+            # events until process exit; this process does not exit between
+            # events (and a wedged worker leaves via os._exit, skipping
+            # atexit), so flush per run.
+            for buffered in ("_logger", "_latency", "_bus"):
+                mod = sys.modules.get(buffered)
+                if mod is not None and hasattr(mod, "flush"):
+                    mod.flush()
+            sys.stdin, sys.stdout, sys.stderr = saved_stdio
+            sys.argv = saved_argv
+            if saved_path is not None:
+                sys.path[:] = saved_path
+            os.environ.clear()
+            os.environ.update(saved_env)
+        return {"status": "ok", "code": code,
+                "stdout": out.getvalue(), "stderr": err.getvalue()}
+
+    def _handle(self, conn: socket.socket) -> None:
+        try:
+            with conn:
+                req = _recv(conn)
+                self._last_activity = time.monotonic()
+                script = req.get("script", "")
+                if script == _SHUTDOWN:
+                    _send(conn, {"status": "ok"})
+                    self.shutdown()
+                    return
+                if script not in RESIDENT_SCRIPTS:
+                    _send(conn, {"status": "unsupported"})
+                    return
+                if not self._run_lock.acquire(timeout=self.queue_s):
+                    _send(conn, {"status": "busy"})
+                    # A hook stuck past the wedge limit poisons every later
+                    # event; exit so the next invocation respawns a worker.
+                    if self._run_started and time.monotonic() - self._run_started > self.wedge_s:
+                        self.shutdown()
+                        os._exit(0)
+                    return
+                try:
+                    self._run_started = time.monotonic()
+                    reply = self.run_hook(
+                        script,
+                        req.get("argv") or [],
+                        base64.b64decode(req.get("stdin") or ""),
+                        req.get("env") or {},
+                    )
+                finally:
+                    self._run_started = 0.0
+                    self._last_activity = time.monotonic()
+                    self._run_lock.release()
+                _send(conn, reply)
+        except Exception:
+            pass  # client falls back on a dropped connection
+
+    # -- serving ------------------------------------------------------------
+
+    def serve(self) -> None:
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            os.unlink(self.sock_path)
+        except FileNotFoundError:
+            pass
+        server.bind(self.sock_path)
+        os.chmod(self.sock_path, 0o600)
+        server.listen(64)
+        server.settimeout(1.0)
+        self._server = server
+        try:
+            while not self._stop.is_set():
+                try:
+                    conn, _ = server.accept()
+                except socket.timeout:
+                    idle = time.monotonic() - self._last_activity
+                    if not self._run_lock.locked() and idle > self.idle_s:
+                        break
+                    continue
+                except OSError:
+                    break
+                conn.settimeout(None)
+                threading.Thread(target=self._handle, args=(conn,), daemon=True).start()
+        finally:
+            self.shutdown()
+
+    def shutdown(self) -> None:
+        self._stop.set()
+        if self._server is not None:
+            try:
+                self._server.close()
+            except OSError:
+                pass
+            self._server = None
+            try:
+                os.unlink(self.sock_path)
+            except OSError:
+                pass
+
+
+def serve(sock_path: str) -> int:
+    """Worker entry point. Returns a process exit code."""
+    try:
+        import fcntl
+    except ImportError:
+        return 0  # no flock (Windows) — the worker is POSIX-only
+    lock = open(sock_path + ".lock", "a")
+    try:
+        fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        return 0  # another worker owns this socket
+    try:
+        _Worker(sock_path).serve()
+    finally:
+        lock.close()
+    return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 3 and sys.argv[1] == "--serve":
+        sys.exit(serve(sys.argv[2]))
+    print("usage: hook_worker.py --serve <socket-path>", file=sys.stderr)
+    sys.exit(2)
@@ -5,22 +5,94 @@ invoke.py — Cross-platform Python script dispatcher for wicked-garden hooks.
 On macOS/Linux, `python3` is the standard command. On Windows, Python often
 installs as `python` or `py` instead. This dispatcher is itself a Python
 script invoked via `python3 || python || py` in hooks.json, and then it
-reliably launches the target hook script using the same interpreter that
-successfully ran this file (sys.executable).
+runs the target hook script in the same interpreter that successfully ran
+this file — in-process via runpy, so each hook event costs one interpreter
+start-up instead of two.
 
 Usage (from hooks.json):
     "command": "python3 \"${CLAUDE_PLUGIN_ROOT}/hooks/scripts/invoke.py\" bootstrap || python \"${CLAUDE_PLUGIN_ROOT}/hooks/scripts/invoke.py\" bootstrap || py \"${CLAUDE_PLUGIN_ROOT}/hooks/scripts/invoke.py\" bootstrap"
 
 The target script name is the first argument (without .py extension).
-stdin is forwarded to the target script (hooks receive JSON on stdin).
+stdin is forwarded to the target script (hooks receive JSON on stdin):
+it is read once and replayed as the target's sys.stdin, sys.argv is rebuilt
+as if the target had been launched directly, and SystemExit codes propagate.
+
+Isolation escape hatch: ``WG_HOOK_ISOLATE=1`` restores the previous
+behaviour — the target runs in a child interpreter via subprocess. Use it when
+debugging a hook that misbehaves when sharing the dispatcher's process.
+
+Resident worker (opt-in, ``WG_HOOK_WORKER=1``): hot-path hooks are forwarded
+to a long-lived per-session interpreter (see hook_worker.py) instead of
+paying a fresh start-up per event. Any worker miss — absent, busy, wedged,
+transport error — falls back to running the hook locally.
 """
 
+import io
 import os
+import runpy
 import subprocess
 import sys
+import time
+
+
+def _record_total(script_name: str, t0: float) -> None:
+    """Record the whole-hook latency histogram sample (scripts/_latency.py)."""
+    try:
+        plugin_root = os.environ.get("CLAUDE_PLUGIN_ROOT") or os.path.dirname(
+            os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+        scripts = os.path.join(plugin_root, "scripts")
+        if scripts not in sys.path:
+            sys.path.append(scripts)
+        from _latency import record
+        record(script_name, (time.perf_counter() - t0) * 1000.0)
+    except Exception:
+        pass
+
+
+def _run_on_worker(script_name: str, argv: list, stdin_data: bytes):
+    """Forward to the resident hook worker; ``None`` means run the hook locally."""
+    try:
+        import hook_worker
+        if not hook_worker.enabled() or script_name not in hook_worker.RESIDENT_SCRIPTS:
+            return None
+        return hook_worker.request(script_name, argv, stdin_data)
+    except Exception:
+        return None
+
+
+def _run_in_process(target: str, argv: list, stdin_data: bytes) -> int:
+    """Execute ``target`` as ``__main__`` in this interpreter; return its exit code."""
+    sys.argv = [target] + list(argv)
+    sys.stdin = io.TextIOWrapper(io.BytesIO(stdin_data), encoding="utf-8")
+    # Match `python target.py`: the script's own directory leads sys.path.
+    sys.path[0] = os.path.dirname(target)
+    try:
+        runpy.run_path(target, run_name="__main__")
+    except SystemExit as exc:
+        if exc.code is None:
+            return 0
+        if isinstance(exc.code, int):
+            return exc.code
+        print(exc.code, file=sys.stderr)
+        return 1
+    return 0
+
+
+def _run_isolated(target: str, argv: list, stdin_data: bytes) -> int:
+    """Execute ``target`` in a child interpreter (WG_HOOK_ISOLATE=1)."""
+    # Use the same Python interpreter that is running this script.
+    # This guarantees we use the correct python on any platform.
+    result = subprocess.run(
+        [sys.executable, target] + list(argv),
+        input=stdin_data,
+        capture_output=False,
+        timeout=120,
+    )
+    return result.returncode
 
 
 def main() -> None:
+    t0 = time.perf_counter()
     if len(sys.argv) < 2:
         print(
             '{"ok": false, "reason": "invoke.py: missing script name argument"}',
@@ -42,20 +114,25 @@ def main() -> None:
         print('{"ok": true}')
         return
 
-    # Use the same Python interpreter that is running this script.
-    # This guarantees we use the correct python on any platform.
-    python = sys.executable
-
-    # Read stdin once and pass it to the subprocess (hooks receive JSON on stdin).
+    # Read stdin once — it is replayed to whichever path runs the hook.
     stdin_data = sys.stdin.buffer.read()
 
-    result = subprocess.run(
-        [python, target] + sys.argv[2:],
-        input=stdin_data,
-        capture_output=False,
-        timeout=120,
-    )
-    sys.exit(result.returncode)
+    if os.environ.get("WG_HOOK_WORKER", "") == "1":
+        reply = _run_on_worker(script_name, sys.argv[2:], stdin_data)
+        if reply is not None:
+            sys.stdout.write(reply["stdout"])
+            sys.stderr.write(reply["stderr"])
+            sys.stdout.flush()
+            sys.stderr.flush()
+            _record_total(script_name, t0)
+            sys.exit(reply["code"])
+
+    if os.environ.get("WG_HOOK_ISOLATE", "") == "1":
+        code = _run_isolated(target, sys.argv[2:], stdin_data)
+    else:
+        code = _run_in_process(target, sys.argv[2:], stdin_data)
+    _record_total(script_name, t0)
+    sys.exit(code)
 
 
 if __name__ == "__main__":
@@ -20,6 +20,7 @@ Traces are written to a session-scoped JSONL file in $TMPDIR (local only).
 Always fails open — any unhandled exception returns {"continue": true}.
 """
 
+import contextlib
 import json
 import os
 import re
@@ -270,8 +271,7 @@ def _handle_task_dispatch(tool_input: dict, tool_response=None) -> dict:
         # --- Permission failure detection (Issue #318) ---
         snippet = _check_permission_failure(tool_response)
         if snippet:
-            failures = (getattr(state, "subagent_permission_failures", None) or 0) + 1
-            state.update(subagent_permission_failures=failures)
+            failures = state.increment("subagent_permission_failures")
 
             _log(
                 "crew", "warn", "subagent.permission_failure",
@@ -375,7 +375,7 @@ def _handle_read(tool_input: dict, tool_response=None) -> dict:
                 char_count = len(response_text)
                 line_count = response_text.count("\n") + 1
 
-                cumulative = (state.read_bytes_total or 0) + char_count
+                cumulative = state.increment("read_bytes_total", char_count)
                 warn_count = state.read_large_warn_count or 0
 
                 if line_count >= _READ_LINE_THRESHOLD or char_count >= _READ_CHAR_THRESHOLD:
@@ -397,9 +397,9 @@ def _handle_read(tool_input: dict, tool_response=None) -> dict:
                             f"reading inline."
                         )
 
-                state.read_bytes_total = cumulative
-                state.read_large_warn_count = warn_count
-                state_dirty = True
+                if warn_count != (state.read_large_warn_count or 0):
+                    state.read_large_warn_count = warn_count
+                    state_dirty = True
 
             # Framework detection (merged into same state load)
             if detected_frameworks:
@@ -910,9 +910,7 @@ def _handle_bash(tool_input: dict, tool_response) -> dict:
     try:
         from _session import SessionState
         state = SessionState.load()
-        bash_count = (getattr(state, "bash_count", None) or 0) + 1
-        state.update(bash_count=bash_count)
-        state.save()
+        state.increment("bash_count")
     except Exception:
         pass
     return {"continue": True}
@@ -1063,6 +1061,43 @@ def _handle_task_update_mismatch(tool_input: dict) -> dict:
     return {"continue": True}
 
 
+def _emit_task_event(tool_name: str, tool_input: dict, tool_response) -> None:
+    """Emit wicked.garden.task.created / .updated for the daemon's task projection.
+
+    Carries only the fields the projection indexes (id, subject, status,
+    metadata) — never the description.  TaskUpdate sends just the fields the
+    call changed so the projector can merge them onto the existing row.
+
+    ``_bus.emit_event`` is non-raising — no try/except wrapper needed here.
+    """
+    response = tool_response if isinstance(tool_response, dict) else {}
+    nested = response.get("task") if isinstance(response.get("task"), dict) else {}
+    task_id = (
+        tool_input.get("taskId")
+        or tool_input.get("task_id")
+        or response.get("taskId")
+        or response.get("task_id")
+        or response.get("id")
+        or nested.get("id")
+    )
+    if not task_id:
+        return
+
+    payload = {"task_id": str(task_id), "session_id": _get_session_id(), "ts": _now_iso()}
+    for field in ("subject", "status"):
+        if tool_input.get(field):
+            payload[field] = tool_input[field]
+    if isinstance(tool_input.get("metadata"), dict):
+        payload["metadata"] = tool_input["metadata"]
+
+    from _bus import emit_event  # noqa: PLC0415 — lazy import per hook pattern
+    if tool_name == "TaskCreate":
+        payload.setdefault("status", "pending")
+        emit_event("wicked.garden.task.created", payload)
+    else:
+        emit_event("wicked.garden.task.updated", payload)
+
+
 # ---------------------------------------------------------------------------
 # Observability trace writer
 # ---------------------------------------------------------------------------
@@ -1121,8 +1156,7 @@ def _check_turn_progress(tool_name: str) -> str | None:
         state = SessionState.load()
 
         # Increment tool count
-        new_count = (state.turn_tool_count or 0) + 1
-        state.update(turn_tool_count=new_count)
+        new_count = state.increment("turn_tool_count")
 
         # Check elapsed time
         turn_start = state.turn_start_ts
@@ -1184,12 +1218,18 @@ def _record_latency(handler_label: str, handler_ms: int, total_ms: int) -> None:
     try:
         from _session import SessionState
         state = SessionState.load()
-        state.post_tool_total_ms = (state.post_tool_total_ms or 0) + total_ms
-        state.post_tool_call_count = (state.post_tool_call_count or 0) + 1
-        handler_breakdown = state.post_tool_handler_ms or {}
-        handler_breakdown[handler_label] = handler_breakdown.get(handler_label, 0) + handler_ms
-        state.post_tool_handler_ms = handler_breakdown
-        state.save()
+        state.increment("post_tool_total_ms", total_ms)
+        state.increment("post_tool_call_count")
+        state.increment("post_tool_handler_ms", handler_ms, key=handler_label)
+    except Exception:
+        pass
+
+
+def _record_histogram(handler_label: str, elapsed_ms: float) -> None:
+    """Per-handler latency histogram (scripts/_latency.py). Fail-silent."""
+    try:
+        from _latency import record
+        record("post_tool", elapsed_ms, handler=handler_label)
     except Exception:
         pass
 
@@ -1198,6 +1238,15 @@ def _record_latency(handler_label: str, handler_ms: int, total_ms: int) -> None:
 # Main dispatcher
 # ---------------------------------------------------------------------------
 
+def _session_transaction():
+    """SessionState transaction for one hook call; a no-op if unavailable."""
+    try:
+        from _session import SessionState
+        return SessionState.transaction()
+    except Exception:
+        return contextlib.nullcontext()
+
+
 def main():
     _t0 = time.monotonic()
 
@@ -1209,105 +1258,111 @@ def main():
         return
 
     try:
-        tool_name = payload.get("tool_name", "")
-        tool_input = payload.get("tool_input", {}) or {}
-        has_error = "tool_error" in payload or "tool_use_error" in payload
-
-        _log("posttool", "debug", "hook.start", detail={"tool": tool_name})
-
-        # Write observability trace (low-priority, always runs)
-        _t_trace = time.monotonic()
-        _write_trace(payload)
-        _trace_ms = int((time.monotonic() - _t_trace) * 1000)
-
-        # --- Route by event type and tool name ---
-        handler_label = tool_name or "unknown"
-        _t_handler = time.monotonic()
-
-        # PostToolUseFailure path
-        if has_error:
-            handler_label = "failure"
-            result = _handle_failure(payload)
-        # Task-management tools — native task store is the source of truth.
-        # PreToolUse validates metadata; PostToolUse only runs the mismatch
-        # detector for TaskUpdate (status/subject/metadata consistency).
-        # v10 Phase 3 (#813 successor): also append a cross-session audit
-        # entry so verify_chain_emission can find tasks created in earlier
-        # sessions. The writer fails-open — any I/O error swallowed.
-        elif tool_name in ("TaskCreate", "TaskUpdate", "TodoWrite"):
-            handler_label = "TaskCreate|TaskUpdate|TodoWrite"
-            if tool_name == "TaskUpdate":
-                _handle_task_update_mismatch(tool_input)
-            if tool_name in ("TaskCreate", "TaskUpdate"):
-                try:
-                    from crew._task_audit_writer import append_task_audit
-                    append_task_audit(
-                        tool_name=tool_name,
-                        tool_input=tool_input,
-                        tool_response=payload.get("tool_response"),
-                        session_id=_get_session_id(),
-                    )
-                except Exception:
-                    pass  # fail-open per Phase 3 contract
-            result = {"continue": True}
-        # Write / Edit tools (async — quick operations only)
-        elif tool_name in ("Write", "Edit"):
-            handler_label = "Write|Edit"
-            result = _handle_write_edit(tool_input)
-        # Task (subagent dispatch + permission failure detection)
-        elif tool_name == "Task":
-            tool_response = payload.get("tool_response", {})
-            result = _handle_task_dispatch(tool_input, tool_response)
-        # Read (large-file warning + framework detection)
-        elif tool_name == "Read":
-            tool_response = payload.get("tool_response", "")
-            result = _handle_read(tool_input, tool_response)
-        # Bash (activity tracking + discovery hints + async consensus gate)
-        elif tool_name == "Bash":
-            tool_response = payload.get("tool_response", {})
-            result = _handle_bash(tool_input, tool_response)
-            # Tier 2 consensus gate (Issue #368) — fast-exits unless phase_manager approve
-            _handle_bash_consensus(tool_input, tool_response)
-        # Skill (memory compliance counter reset + pull-model tracking)
-        elif tool_name == "Skill":
-            result = _handle_skill(tool_input)
-        # Grep / Glob (discovery hints for search commands)
-        elif tool_name in ("Grep", "Glob"):
-            handler_label = "Grep|Glob"
-            result = _handle_grep_glob(tool_name, tool_input)
-        # All other tools — pass through
-        else:
-            handler_label = "passthrough"
-            result = {"continue": True}
-
-        _handler_ms = int((time.monotonic() - _t_handler) * 1000)
-
-        # Turn progress visibility (Issue #323): append status note on long turns
-        _t_turn = time.monotonic()
-        turn_status = _check_turn_progress(tool_name)
-        _turn_ms = int((time.monotonic() - _t_turn) * 1000)
-        if turn_status:
-            existing_msg = result.get("systemMessage", "")
-            if existing_msg:
-                result["systemMessage"] = existing_msg + "\n" + turn_status
+        # One SessionState load + one merged commit for every handler below.
+        with _session_transaction():
+            tool_name = payload.get("tool_name", "")
+            tool_input = payload.get("tool_input", {}) or {}
+            has_error = "tool_error" in payload or "tool_use_error" in payload
+
+            _log("posttool", "debug", "hook.start", detail={"tool": tool_name})
+
+            # Write observability trace (low-priority, always runs)
+            _t_trace = time.monotonic()
+            _write_trace(payload)
+            _trace_ms = int((time.monotonic() - _t_trace) * 1000)
+
+            # --- Route by event type and tool name ---
+            handler_label = tool_name or "unknown"
+            _t_handler = time.monotonic()
+
+            # PostToolUseFailure path
+            if has_error:
+                handler_label = "failure"
+                result = _handle_failure(payload)
+            # Task-management tools — native task store is the source of truth.
+            # PreToolUse validates metadata; PostToolUse only runs the mismatch
+            # detector for TaskUpdate (status/subject/metadata consistency).
+            # v10 Phase 3 (#813 successor): also append a cross-session audit
+            # entry so verify_chain_emission can find tasks created in earlier
+            # sessions. The writer fails-open — any I/O error swallowed.
+            # wicked.garden.task.* events feed the daemon's /tasks projection.
+            elif tool_name in ("TaskCreate", "TaskUpdate", "TodoWrite"):
+                handler_label = "TaskCreate|TaskUpdate|TodoWrite"
+                if tool_name == "TaskUpdate":
+                    _handle_task_update_mismatch(tool_input)
+                if tool_name in ("TaskCreate", "TaskUpdate"):
+                    try:
+                        from crew._task_audit_writer import append_task_audit
+                        append_task_audit(
+                            tool_name=tool_name,
+                            tool_input=tool_input,
+                            tool_response=payload.get("tool_response"),
+                            session_id=_get_session_id(),
+                        )
+                    except Exception:
+                        pass  # fail-open per Phase 3 contract
+                    _emit_task_event(tool_name, tool_input, payload.get("tool_response"))
+                result = {"continue": True}
+            # Write / Edit tools (async — quick operations only)
+            elif tool_name in ("Write", "Edit"):
+                handler_label = "Write|Edit"
+                result = _handle_write_edit(tool_input)
+            # Task (subagent dispatch + permission failure detection)
+            elif tool_name == "Task":
+                tool_response = payload.get("tool_response", {})
+                result = _handle_task_dispatch(tool_input, tool_response)
+            # Read (large-file warning + framework detection)
+            elif tool_name == "Read":
+                tool_response = payload.get("tool_response", "")
+                result = _handle_read(tool_input, tool_response)
+            # Bash (activity tracking + discovery hints + async consensus gate)
+            elif tool_name == "Bash":
+                tool_response = payload.get("tool_response", {})
+                result = _handle_bash(tool_input, tool_response)
+                # Tier 2 consensus gate (Issue #368) — fast-exits unless phase_manager approve
+                _handle_bash_consensus(tool_input, tool_response)
+            # Skill (memory compliance counter reset + pull-model tracking)
+            elif tool_name == "Skill":
+                result = _handle_skill(tool_input)
+            # Grep / Glob (discovery hints for search commands)
+            elif tool_name in ("Grep", "Glob"):
+                handler_label = "Grep|Glob"
+                result = _handle_grep_glob(tool_name, tool_input)
+            # All other tools — pass through
             else:
-                result["systemMessage"] = turn_status
-
-        # --- Latency profiling (Issue #312) ---
-        _total_ms = int((time.monotonic() - _t0) * 1000)
-        _record_latency(handler_label, _handler_ms, _total_ms)
-
-        _log("posttool", "verbose", "hook.latency", ms=_total_ms, detail={
-            "tool": tool_name,
-            "handler": handler_label,
-            "handler_ms": _handler_ms,
-            "trace_ms": _trace_ms,
-            "turn_progress_ms": _turn_ms,
-            "total_ms": _total_ms,
-        })
-
-        _log("posttool", "debug", "hook.end", ms=_total_ms)
-        print(json.dumps(result))
+                handler_label = "passthrough"
+                result = {"continue": True}
+
+            _handler_elapsed = (time.monotonic() - _t_handler) * 1000
+            _handler_ms = int(_handler_elapsed)
+            _record_histogram(handler_label, _handler_elapsed)
+
+            # Turn progress visibility (Issue #323): append status note on long turns
+            _t_turn = time.monotonic()
+            turn_status = _check_turn_progress(tool_name)
+            _turn_ms = int((time.monotonic() - _t_turn) * 1000)
+            if turn_status:
+                existing_msg = result.get("systemMessage", "")
+                if existing_msg:
+                    result["systemMessage"] = existing_msg + "\n" + turn_status
+                else:
+                    result["systemMessage"] = turn_status
+
+            # --- Latency profiling (Issue #312) ---
+            _total_ms = int((time.monotonic() - _t0) * 1000)
+            _record_latency(handler_label, _handler_ms, _total_ms)
+
+            _log("posttool", "verbose", "hook.latency", ms=_total_ms, detail={
+                "tool": tool_name,
+                "handler": handler_label,
+                "handler_ms": _handler_ms,
+                "trace_ms": _trace_ms,
+                "turn_progress_ms": _turn_ms,
+                "total_ms": _total_ms,
+            })
+
+            _log("posttool", "debug", "hook.end", ms=_total_ms)
+            print(json.dumps(result))
 
     except Exception as e:
         print(f"[wicked-garden] post_tool error: {e}", file=sys.stderr)
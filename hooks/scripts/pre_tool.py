@@ -43,6 +43,17 @@ def _log(domain, level, event, ok=True, ms=None, detail=None):
         pass
 
 
+def _hook_end(t0: float, handler: str) -> None:
+    """Log hook.end and record the handler in the latency histograms."""
+    elapsed_ms = (time.monotonic() - t0) * 1000
+    _log("pretool", "debug", "hook.end", ms=int(elapsed_ms))
+    try:
+        from _latency import record
+        record("pre_tool", elapsed_ms, handler=handler)
+    except Exception:
+        pass
+
+
 # ---------------------------------------------------------------------------
 # Response helpers
 # ---------------------------------------------------------------------------
@@ -1244,36 +1255,36 @@ def main():
 
         if tool_name == "TaskCreate":
             result = _handle_task_create(tool_input)
-            _log("pretool", "debug", "hook.end", ms=int((time.monotonic() - _t0) * 1000))
+            _hook_end(_t0, "TaskCreate")
             print(result)
             return
 
         if tool_name == "TaskUpdate":
             result = _handle_task_update(tool_input)
-            _log("pretool", "debug", "hook.end", ms=int((time.monotonic() - _t0) * 1000))
+            _hook_end(_t0, "TaskUpdate")
             print(result)
             return
 
         if tool_name == "EnterPlanMode":
             result = _handle_enter_plan_mode(tool_input)
-            _log("pretool", "debug", "hook.end", ms=int((time.monotonic() - _t0) * 1000))
+            _hook_end(_t0, "EnterPlanMode")
             print(result)
             return
 
         if tool_name in ("Write", "Edit"):
             result = _handle_write_guard(tool_input)
-            _log("pretool", "debug", "hook.end", ms=int((time.monotonic() - _t0) * 1000))
+            _hook_end(_t0, "Write|Edit")
             print(result)
             return
 
         if tool_name == "Bash":
             result = _handle_bash(tool_input, input_data.get("cwd", "") or "")
-            _log("pretool", "debug", "hook.end", ms=int((time.monotonic() - _t0) * 1000))
+            _hook_end(_t0, "Bash")
             print(result)
             return
 
         # All other tools — allow
-        _log("pretool", "debug", "hook.end", ms=int((time.monotonic() - _t0) * 1000))
+        _hook_end(_t0, "passthrough")
         print(_allow())
 
     except Exception as e:
@@ -27,6 +27,7 @@ The hook is stdlib-only.
 Always fails open — any unhandled exception returns {"continue": true}.
 """
 
+import contextlib
 import json
 import os
 import re
@@ -89,14 +90,12 @@ def _increment_turn(state) -> int:
     if state is None:
         return 0
     try:
-        new_count = (state.turn_count or 0) + 1
+        new_count = state.increment("turn_count")
         # Reset turn progress visibility fields (Issue #323)
         state.update(
-            turn_count=new_count,
             turn_start_ts=datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
             turn_tool_count=0,
         )
-        state.save()
         return new_count
     except Exception:
         return 0
@@ -812,6 +811,24 @@ def _build_wip_recovery_block(session_id: str, project: str) -> str:
     return block
 
 
+def _take_stop_worker_results() -> list:
+    """Collect messages left by hooks/scripts/stop_worker.py. Fail-open."""
+    try:
+        from stop_worker import take_results
+        return take_results()
+    except Exception:
+        return []
+
+
+def _timed(stage: str):
+    """Latency histogram timer for one stage (scripts/_latency.py); no-op if unavailable."""
+    try:
+        from _latency import timed
+        return timed("prompt_submit", stage)
+    except Exception:
+        return contextlib.nullcontext()
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -837,18 +854,21 @@ def main():
 
     # Setup gate — hard-block (sys.exit(2)) if no config.
     # MUST run before HOT continuations so setup can never be bypassed.
-    _check_setup_gate(prompt)
+    with _timed("setup_gate"):
+        _check_setup_gate(prompt)
 
     # Context gate — soft directive if the context backend (wicked-estate)
     # is not reachable.
     # Runs after setup gate (context layer irrelevant before setup completes).
     # Does NOT hard-block — hooks fail open, retrieval degrades to empty.
-    _check_context_gate(prompt)
+    with _timed("context_gate"):
+        _check_context_gate(prompt)
 
     # Onboarding gate — inject directive if project hasn't been onboarded.
     # Checked after setup gate but before HOT path so continuations during
     # an active setup wizard ("yes", "ok") still pass through quickly.
-    onboarding_directive = _check_onboarding_gate(prompt)
+    with _timed("onboarding_gate"):
+        onboarding_directive = _check_onboarding_gate(prompt)
 
     # Issue #572: drain the wicked-bus cursor BEFORE the re-eval check so the
     # 41k+ lag clears and stale subscriptions don't accumulate further. The
@@ -856,7 +876,8 @@ def main():
     # signal still comes from task_completed.py's debounced flag, not the bus.
     # Wrapped in try/except so a bus failure can never break prompt submission.
     try:
-        _drain_bus_cursor()
+        with _timed("bus_drain"):
+            _drain_bus_cursor()
     except Exception:
         pass
 
@@ -901,6 +922,11 @@ def main():
             hot_parts.append(phase_start_gate_directive)
         if onboarding_directive:
             hot_parts.append(onboarding_directive)
+        # Background Stop results are delivered on every turn, not held
+        # until the next non-continuation prompt.
+        background_messages = _take_stop_worker_results()
+        if background_messages:
+            hot_parts.append("\n".join(background_messages))
         if hot_parts:
             print(json.dumps({
                 "hookSpecificOutput": {
@@ -1012,6 +1038,12 @@ def main():
         if jam_hint:
             all_parts.append(jam_hint)
 
+        # Messages from the detached stop worker (auto-memorize drain,
+        # heavy cadence) that finished after the previous Stop returned.
+        background_messages = _take_stop_worker_results()
+        if background_messages:
+            all_parts.append("\n".join(background_messages))
+
         # (Prompt-time discovery tips retired — ambient suggestions trained the
         # agent to ignore the channel; claim-time sentinel signals replaced them.)
 
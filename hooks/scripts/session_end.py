@@ -88,6 +88,24 @@ def main() -> None:
     except Exception:  # noqa: BLE001 — the sentinel never blocks session end
         pass
 
+    # Session state lock files outlive their state file; sweep those left by
+    # ended sessions so they do not pile up in TMPDIR.
+    try:
+        from _session import purge_stale_locks  # type: ignore
+        purge_stale_locks()
+    except Exception:
+        pass
+
+    # Resident hook worker (opt-in) — release the socket now rather than
+    # waiting out the idle timeout.
+    if os.environ.get("WG_HOOK_WORKER", "") == "1":
+        try:
+            sys.path.insert(0, str(Path(__file__).resolve().parent))
+            from hook_worker import stop_worker  # type: ignore
+            stop_worker()
+        except Exception:
+            pass
+
     elapsed_ms = int((time.monotonic() - _t0) * 1000)
     _log("session", "info", "session_end.done", ms=elapsed_ms,
          detail={"messages": len(messages)})
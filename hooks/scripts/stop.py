@@ -12,6 +12,10 @@ Flow:
 4. Event store retention purge
 5. Heavy cadence teardown (telemetry + guard pipeline, once per session)
 
+The auto-memorize drain (step 2), step 4 and step 5 are queued for the detached stop
+worker (stop_worker.py) and their messages surface on the next prompt;
+WG_STOP_INLINE=1 runs them inline as before.
+
 Always fails open — any unhandled exception returns {"systemMessage": ...}.
 Runs async so it does NOT block the user on exit.
 """
@@ -93,44 +97,18 @@ def _check_outgov_compliance(_input_data: dict) -> list:
 # done/passing/shipped claim with no verdict for HEAD produces a nudge.
 # ---------------------------------------------------------------------------
 
-def _extract_text(content) -> Optional[str]:
-    """Pull concatenated text from a transcript message's `content` — either a
-    raw string or a list of {type:'text', text:...} blocks."""
-    if isinstance(content, str):
-        return content or None
-    if isinstance(content, list):
-        parts = [b["text"] for b in content
-                 if isinstance(b, dict) and b.get("type") == "text" and b.get("text")]
-        return "\n".join(parts) if parts else None
-    return None
-
-
 def _read_final_assistant_text(transcript_path: str) -> Optional[str]:
     """Return the text of the LAST assistant message in the transcript JSONL,
-    or None. Fail-open — any read/parse error yields None (no claim => no fire)."""
+    or None. Fail-open — any read/parse error yields None (no claim => no fire).
+
+    Incremental: scripts/_transcript_tail.py keeps a byte cursor + the last
+    assistant text per transcript, so each Stop parses only the new lines."""
     try:
         p = Path(transcript_path)
         if not p.is_file():
             return None
-        last = None
-        for line in p.read_text(encoding="utf-8", errors="ignore").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                rec = json.loads(line)
-            except (json.JSONDecodeError, ValueError):
-                continue
-            if not isinstance(rec, dict):
-                continue
-            msg = rec.get("message") if isinstance(rec.get("message"), dict) else None
-            role = (msg or {}).get("role") or rec.get("role") or rec.get("type")
-            if role != "assistant":
-                continue
-            text = _extract_text((msg or {}).get("content", rec.get("content")))
-            if text:
-                last = text
-        return last
+        from _transcript_tail import final_assistant_text
+        return final_assistant_text(str(p))
     except Exception:
         return None
 
@@ -281,7 +259,8 @@ def _run_memory_promotion(session_id: str, transcript_path: Optional[str] = None
         )
         from _bus import emit_event
 
-        facts = extract_session_facts(session_id, limit=20, transcript_path=transcript_path)
+        facts = extract_session_facts(session_id, limit=20, transcript_path=transcript_path,
+                                      incremental=True)
         facts = filter_unemitted(facts, session_id)
         if not facts:
             if os.environ.get("WICKED_DEBUG"):
@@ -386,17 +365,23 @@ def _persist_session_state() -> None:
 
 
 # ---------------------------------------------------------------------------
-# Step 7: Event store retention purge
+# Step 7: Event store retention (archive rotation)
 # ---------------------------------------------------------------------------
 
 def _purge_old_events() -> None:
-    """Purge events older than retention period (default 90 days)."""
+    """Archive events older than the retention period (default 90 days).
+
+    Whole months move out of the hot events.db into compressed monthly
+    segments (still queryable with include_archive=True); segments older than
+    a year are dropped.
+    """
     try:
         from _event_store import EventStore
         EventStore.ensure_schema()
-        deleted = EventStore.purge_before(days=90)
-        if deleted > 0:
-            _log("stop", "debug", f"event_store.purged {deleted} events")
+        archived = EventStore.archive_before(days=90)
+        dropped = EventStore.drop_archive_before(days=365)
+        if archived > 0 or dropped > 0:
+            _log("stop", "debug", f"event_store.archived {archived} events, dropped {dropped} segments")
     except Exception:
         pass  # fire-and-forget
 
@@ -506,6 +491,54 @@ def _run_guard_pipeline() -> list:
         return []
 
 
+# ---------------------------------------------------------------------------
+# Background dispatch — heavy Stop work runs in the detached stop worker
+# ---------------------------------------------------------------------------
+
+def _run_stop_job(job: dict) -> list:
+    """Run one queued Stop job; returns its messages. Called inline by
+    _dispatch_stop_jobs or from hooks/scripts/stop_worker.py."""
+    kind = job.get("job")
+    if kind == "auto_memorize_drain":
+        return _run_auto_memorize_drain()
+    if kind == "purge_events":
+        _purge_old_events()
+        return []
+    if kind == "heavy_cadence":
+        sys.path.insert(0, str(_PLUGIN_ROOT / "scripts"))
+        from _heavy_cadence import run_heavy_cadence, already_ran_this_session  # type: ignore
+        session_id = job.get("session_id")
+        # A queued duplicate (two Stops before the worker ran) must not
+        # re-run the once-per-session teardown.
+        if already_ran_this_session(session_id):
+            return []
+        return run_heavy_cadence(
+            job.get("trigger"), session_id=session_id, plugin_root=_PLUGIN_ROOT,
+        )
+    return []
+
+
+def _dispatch_stop_jobs(jobs: list) -> list:
+    """Queue ``jobs`` for the detached stop worker, or run them inline when
+    the worker is unavailable (WG_STOP_INLINE=1, no flock, enqueue failure).
+    Returns the messages of jobs that ran inline."""
+    try:
+        from stop_worker import enqueue
+        if enqueue(jobs):
+            _log("stop", "debug", "stop_worker.enqueued",
+                 detail={"jobs": [j["job"] for j in jobs]})
+            return []
+    except Exception:
+        pass
+    messages: list = []
+    for job in jobs:
+        try:
+            messages.extend(_run_stop_job(job))
+        except Exception as e:
+            print(f"[wicked-garden] stop job {job.get('job')} error: {e}", file=sys.stderr)
+    return messages
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -540,15 +573,15 @@ def main():
         # (it replaced the retired wicked-brain server subscriber at S7).
         # Durable cursor: events
         # emitted here (or left over from earlier sessions) land in estate
-        # memory; failures redeliver next Stop.
-        drain_messages = _run_auto_memorize_drain()
-        promotion_messages = promotion_messages + drain_messages
+        # memory; failures redeliver next Stop. Queued for the detached stop
+        # worker (see _dispatch_stop_jobs) with the jobs below.
+        stop_jobs = [{"job": "auto_memorize_drain"}]
 
         # 4. Persist session state
         _persist_session_state()
 
-        # 5. Event store retention purge
-        _purge_old_events()
+        # 5. Event store retention purge — also a stop-worker job.
+        stop_jobs.append({"job": "purge_events"})
 
         # 6. Heavy cadence — Stop is a reliable co-primary carrier of the
         # teardown (v9.2.16, #842). SessionEnd fires on <40% of exits (~1% for
@@ -560,26 +593,29 @@ def main():
         # sessions SessionEnd would have dropped. Sidecar at <local store>/
         # wicked-garden/heavy-cadence/last_run.json makes the guard
         # deterministic and records which trigger actually ran the work.
-        consolidation_messages: list = []
         decay_messages: list = []
         telemetry_messages: list = []
         guard_messages: list = []
         try:
             sys.path.insert(0, str(_PLUGIN_ROOT / "scripts"))
             from _heavy_cadence import (  # type: ignore
-                run_heavy_cadence, should_run_fallback, TRIGGER_STOP_FALLBACK,
+                should_run_fallback, TRIGGER_STOP_FALLBACK,
             )
             if should_run_fallback(session_id=session_id, turn_count=turn_count):
-                fallback_messages = run_heavy_cadence(
-                    TRIGGER_STOP_FALLBACK, session_id=session_id, plugin_root=_PLUGIN_ROOT,
-                )
-                # Single combined list — semantics preserved for downstream
-                # joining; per-category split was only used by the deleted
-                # [Memory] reflection block.
-                consolidation_messages = fallback_messages
+                stop_jobs.append({
+                    "job": "heavy_cadence",
+                    "trigger": TRIGGER_STOP_FALLBACK,
+                    "session_id": session_id,
+                })
         except Exception as e:
             print(f"[wicked-garden] heavy cadence fallback error: {e}", file=sys.stderr)
 
+        # Single combined list — semantics preserved for downstream joining;
+        # per-category split was only used by the deleted [Memory] reflection
+        # block. Empty when the jobs went to the background worker — their
+        # messages surface on the next prompt (prompt_submit.py).
+        consolidation_messages = _dispatch_stop_jobs(stop_jobs)
+
         # Read session state for task completion count (fail open)
         tasks_completed_this_session = 0
         try:
@@ -0,0 +1,246 @@
+#!/usr/bin/env python3
+"""stop_worker.py — detached background worker for heavy Stop work.
+
+The Stop hook fires on every turn. Three of its steps are slow or spawn
+subprocesses, and their output is informational:
+
+  * ``auto_memorize_drain`` — auto_memorize.py subprocess, up to 25s
+  * ``purge_events``        — event-store retention DELETE
+  * ``heavy_cadence``       — telemetry + guard pipeline, once per session
+
+Instead of running them inline, stop.py appends them to a durable
+per-session queue (``$TMPDIR/wicked-stop-queue-{session}.jsonl``, one fsync'd
+JSON line per job) and starts this script detached (``start_new_session``,
+like hook_worker.py). Stop then returns at once. The worker drains the queue
+and appends any messages to ``wicked-stop-results-{session}.jsonl``.
+prompt_submit.py collects them on the next turn via :func:`take_results`.
+
+Single instance per session via an ``flock`` on ``<queue>.lock``. The worker
+claims the queue by renaming it to ``<queue>.{pid}.work``, so jobs appended
+while a batch runs land in a fresh queue file and are picked up by the next
+loop. Before exiting, the worker re-checks the queue after releasing the
+lock, so a job enqueued during shutdown is never stranded. Jobs of the same
+kind in one batch run once. ``heavy_cadence`` re-checks the sidecar, so a
+session never runs the teardown twice.
+
+A worker that dies mid-batch leaves its ``.work`` file. The next worker
+re-claims it: delivery is at-least-once, and every job is idempotent.
+
+Escape hatch: ``WG_STOP_INLINE=1`` keeps the old inline behaviour. So does
+any miss: no ``fcntl`` (Windows), a failed enqueue, or a failed spawn.
+
+Contract: fail-open. Nothing here raises into the hook. Stdlib only.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+from typing import List
+
+JOB_HEAVY_CADENCE = "heavy_cadence"
+JOB_MEMORIZE_DRAIN = "auto_memorize_drain"
+JOB_PURGE_EVENTS = "purge_events"
+
+# Batch execution order — mirrors the old inline order in stop.py.
+_JOB_ORDER = (JOB_MEMORIZE_DRAIN, JOB_PURGE_EVENTS, JOB_HEAVY_CADENCE)
+
+
+def enabled() -> bool:
+    if os.environ.get("WG_STOP_INLINE", "") == "1":
+        return False
+    try:
+        import fcntl  # noqa: F401
+    except ImportError:
+        return False  # no flock (Windows) — run inline
+    return True
+
+
+def _get_session_id() -> str:
+    raw = os.environ.get("CLAUDE_SESSION_ID", "unknown")
+    return re.sub(r"[^a-zA-Z0-9\-_]", "_", raw) or "unknown"
+
+
+def _tmpdir() -> Path:
+    return Path(os.environ.get("TMPDIR") or tempfile.gettempdir())
+
+
+def queue_path() -> Path:
+    return _tmpdir() / f"wicked-stop-queue-{_get_session_id()}.jsonl"
+
+
+def results_path() -> Path:
+    return _tmpdir() / f"wicked-stop-results-{_get_session_id()}.jsonl"
+
+
+def _append_lines(path: Path, rows: list) -> None:
+    data = "".join(json.dumps(r, separators=(",", ":")) + "\n" for r in rows)
+    fd = os.open(str(path), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+    try:
+        os.write(fd, data.encode("utf-8"))
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
+
+def _read_jobs(path: Path) -> list:
+    jobs = []
+    try:
+        with path.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    job = json.loads(line)
+                except ValueError:
+                    continue  # torn line from a crashed writer
+                if isinstance(job, dict) and job.get("job") in _JOB_ORDER:
+                    jobs.append(job)
+    except OSError:
+        pass
+    return jobs
+
+
+# ---------------------------------------------------------------------------
+# Producer side — stop.py / prompt_submit.py
+# ---------------------------------------------------------------------------
+
+
+def enqueue(jobs: list) -> bool:
+    """Durably queue ``jobs`` and make sure a worker is running.
+
+    Returns False when nothing was queued. The caller then runs the jobs
+    inline.
+    """
+    if not jobs or not enabled():
+        return False
+    try:
+        _append_lines(queue_path(), jobs)
+    except OSError:
+        return False
+    spawn()
+    return True
+
+
+def spawn() -> None:
+    """Start a detached worker. Concurrent spawns are harmless — the loser of
+    the ``flock`` race exits, and the winner drains every queued job."""
+    try:
+        subprocess.Popen(
+            [sys.executable, str(Path(__file__).resolve()), "--drain"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True,
+        )
+    except Exception:
+        pass  # jobs stay queued — the next Stop spawns again
+
+
+def take_results() -> List[str]:
+    """Claim and return messages the worker produced since the last call."""
+    path = results_path()
+    claimed = path.with_name(f"{path.name}.{os.getpid()}.take")
+    try:
+        os.replace(path, claimed)
+    except OSError:
+        return []
+    messages: List[str] = []
+    try:
+        with claimed.open(encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    messages.extend(json.loads(line).get("messages") or [])
+                except (ValueError, AttributeError):
+                    continue
+    except OSError:
+        pass
+    finally:
+        try:
+            claimed.unlink()
+        except OSError:
+            pass
+    return [m for m in messages if isinstance(m, str) and m]
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+
+def _claim_batch(qpath: Path) -> "tuple[list, list]":
+    """Claim orphaned work files plus the live queue. Returns (jobs, files)."""
+    files = sorted(qpath.parent.glob(f"{qpath.name}.*.work"))
+    mine = qpath.with_name(f"{qpath.name}.{os.getpid()}.work")
+    try:
+        os.replace(qpath, mine)
+        files.append(mine)
+    except OSError:
+        pass
+    jobs = []
+    for f in files:
+        jobs.extend(_read_jobs(f))
+    return jobs, files
+
+
+def _run_batch(jobs: list) -> List[str]:
+    """Run each job kind once, in the old inline order."""
+    import stop  # sibling hook module — owns the job implementations
+
+    latest = {}
+    for job in jobs:
+        latest[job["job"]] = job  # last enqueue of a kind wins
+    messages: List[str] = []
+    for kind in _JOB_ORDER:
+        if kind in latest:
+            try:
+                messages.extend(stop._run_stop_job(latest[kind]))
+            except Exception as exc:
+                print(f"[wicked-garden] stop worker {kind} error: {exc}", file=sys.stderr)
+    return messages
+
+
+def drain() -> int:
+    """Worker entry point: drain the queue until it stays empty."""
+    try:
+        import fcntl
+    except ImportError:
+        return 0
+    qpath = queue_path()
+    while True:
+        lock = open(str(qpath) + ".lock", "a")
+        try:
+            try:
+                fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except OSError:
+                return 0  # another worker owns this session's queue
+            while True:
+                jobs, files = _claim_batch(qpath)
+                if not files:
+                    break
+                messages = _run_batch(jobs)
+                if messages:
+                    try:
+                        _append_lines(results_path(), [{"messages": messages}])
+                    except OSError:
+                        pass
+                for f in files:
+                    try:
+                        f.unlink()
+                    except OSError:
+                        pass
+        finally:
+            lock.close()
+        # A job queued between the last claim and the unlock would otherwise
+        # wait for the next Stop — loop back and take the lock again.
+        if not qpath.exists():
+            return 0
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 2 and sys.argv[1] == "--drain":
+        sys.exit(drain())
@@ -5,6 +5,10 @@ _bus.py — wicked-bus integration shim for wicked-garden.
 Fire-and-forget event emission + poll-on-invoke consumption.
 Bus unavailable = no-op. Never blocks the caller. Never raises.
 
+Emits go through a durable local outbox (SQLite WAL, see the Outbox section)
+and are delivered by a detached flusher, so an event survives the short-lived
+hook process that produced it.
+
 Usage:
     from _bus import emit_event, poll_pending, BUS_EVENT_MAP
 
@@ -17,14 +21,18 @@ Usage:
     events = poll_pending(event_type_prefix="wicked.garden.gate.")
 """
 
+import atexit
 import json
 import logging
 import os
 import shutil
+import sqlite3
 import subprocess
+import sys
 import threading
 import time
-from typing import Any, Dict, List, Optional
+import uuid
+from typing import Any, Dict, List, Optional, Tuple
 
 logger = logging.getLogger("wicked-garden.bus")
 
@@ -207,6 +215,18 @@ BUS_EVENT_MAP: Dict[str, Dict[str, str]] = {
         "subdomain": "crew.subagent",
         "description": "Specialist subagent engagement recorded by subagent_lifecycle (Site W9b cutover)",
     },
+    # Native task lifecycle — post_tool.py TaskCreate/TaskUpdate branch.
+    # Projected into the daemon's tasks table for crew/_task_reader.py.
+    "wicked.garden.task.created": {
+        "domain": "wicked-garden",
+        "subdomain": "crew.task",
+        "description": "Native task created via TaskCreate (id, subject, status, metadata)",
+    },
+    "wicked.garden.task.updated": {
+        "domain": "wicked-garden",
+        "subdomain": "crew.task",
+        "description": "Native task updated via TaskUpdate (changed status/subject/metadata only)",
+    },
     # Jam domain — jam.py
     "wicked.garden.session.started": {
         "domain": "wicked-garden",
@@ -475,7 +495,10 @@ _PAYLOAD_ALLOW_OVERRIDES: Dict[str, frozenset] = {
 #
 # _EMIT_ATTEMPTED: incremented AFTER _check_available() + BUS_EVENT_MAP
 #   validation pass (bus-absent no-ops must NOT inflate the denominator).
-# _EMIT_SUCCEEDED: incremented inside _fire() on returncode == 0.
+# _EMIT_SUCCEEDED: incremented once the event is durably queued in the
+#   outbox (or, when the outbox is unwritable, inside _fire() on
+#   returncode == 0). Delivery outcomes live in the outbox's own
+#   flushed/failed counters — see bus_emit_stats().
 #
 # Public accessor: bus_emit_stats() — pure reader, no side effects.
 # Test-teardown helper: _bus_reset_stats() — resets both to 0 atomically.
@@ -500,8 +523,8 @@ _bus_binary: Optional[str] = None
 _CACHE_TTL_SECONDS = 60.0
 _EMIT_TIMEOUT_SECONDS = 5.0
 
-# Cursor ID for poll-on-invoke (set on first registration)
-_cursor_id: Optional[str] = None
+# Cursor IDs for poll-on-invoke, per consumer (set on first registration)
+_cursor_ids: Dict[str, str] = {}
 _CURSOR_FILE = os.path.join(
     os.path.expanduser("~"),
     ".something-wicked", "wicked-garden", "local",
@@ -583,32 +606,154 @@ def _bus_as_truth_enabled(site: str = "DISPATCH_LOG") -> bool:
     return site in _BUS_AS_TRUTH_DEFAULT_ON
 
 
-def _resolve_binary() -> Optional[str]:
-    """Resolve the wicked-bus binary path once, cache it."""
-    global _bus_binary
-    if _bus_binary is not None:
-        return _bus_binary
+# ---------------------------------------------------------------------------
+# Cross-process binary resolution cache
+#
+# Resolving the binary can cost an `npx wicked-bus status` probe (Node
+# start-up + npm resolution), and every hook is a fresh process. The outcome
+# is persisted in _BINARY_CACHE_FILE keyed by PATH plus the resolved paths +
+# mtimes of wicked-bus / npx / node, so an install, upgrade or PATH change
+# re-probes. A wicked-bus on PATH is a positive verdict without any probe.
+# Positive verdicts live _BINARY_CACHE_TTL_S; a definitive negative (the npx
+# probe ran and failed) holds for the rest of the Claude session, or
+# _BINARY_NEGATIVE_TTL_S outside one, so a machine without the bus stops
+# probing. A probe that timed out or errored is only trusted for
+# _BINARY_ERROR_TTL_S — it says nothing about the install. bootstrap.py reads
+# the same entry via cached_binary_status().
+# ---------------------------------------------------------------------------
 
-    # Try direct binary first (faster than npx)
+_BINARY_CACHE_FILE = os.path.join(
+    os.path.expanduser("~"),
+    ".something-wicked", "wicked-garden", "cache", "bus-binary.json",
+)
+_BINARY_CACHE_TTL_S = 86400.0
+_BINARY_NEGATIVE_TTL_S = 900.0
+_BINARY_ERROR_TTL_S = 60.0
+
+
+def _binary_cache_key() -> str:
+    """PATH + resolved path/mtime of every executable the resolution uses."""
+    parts: List[Any] = [os.environ.get("PATH", "")]
+    for name in ("wicked-bus", "npx", "node"):
+        resolved = shutil.which(name)
+        mtime_ns = None
+        if resolved:
+            try:
+                mtime_ns = os.stat(resolved).st_mtime_ns
+            except OSError:
+                pass
+        parts.append([name, resolved, mtime_ns])
+    return json.dumps(parts)
+
+
+def _load_binary_cache(key: str) -> Optional[Dict[str, Any]]:
+    """Return the cached resolution for ``key`` if still fresh, else None."""
+    try:
+        with open(_BINARY_CACHE_FILE, "r") as f:
+            entry = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+    if not isinstance(entry, dict) or entry.get("key") != key:
+        return None
+    age = time.time() - float(entry.get("ts") or 0)
+    if entry.get("binary"):
+        return entry if age < _BINARY_CACHE_TTL_S else None
+    if entry.get("error"):
+        return entry if age < _BINARY_ERROR_TTL_S else None
+    session = os.environ.get("CLAUDE_SESSION_ID", "")
+    if session and entry.get("session_id") == session:
+        return entry
+    return entry if age < _BINARY_NEGATIVE_TTL_S else None
+
+
+def _save_binary_cache(entry: Dict[str, Any]) -> None:
+    """Atomically persist the resolution. Best-effort."""
+    try:
+        os.makedirs(os.path.dirname(_BINARY_CACHE_FILE), exist_ok=True)
+        tmp = f"{_BINARY_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(entry, f)
+        os.replace(tmp, _BINARY_CACHE_FILE)
+    except OSError:
+        pass
+
+
+def _probe_binary() -> Dict[str, Any]:
+    """Find a usable wicked-bus command.
+
+    A binary on PATH is usable as-is and costs no subprocess (``version`` /
+    ``healthy`` / ``db_path`` stay unknown until something asks ``status``).
+    The npx fallback is usable only when ``npx wicked-bus status`` succeeds;
+    if that probe times out or errors the entry is marked ``error`` so it is
+    cached only briefly.
+    """
+    entry: Dict[str, Any] = {"binary": None, "version": None, "healthy": None, "db_path": None}
     path = shutil.which("wicked-bus")
     if path:
-        _bus_binary = path
-        return _bus_binary
-
-    # Fallback: verify npx can find it
+        entry["binary"] = path
+        return entry
     try:
         result = subprocess.run(
             ["npx", "wicked-bus", "status", "--json"],
-            capture_output=True, text=True,
-            timeout=_EMIT_TIMEOUT_SECONDS,
+            capture_output=True, text=True, timeout=_EMIT_TIMEOUT_SECONDS,
         )
-        if result.returncode == 0:
-            _bus_binary = "npx"
-            return _bus_binary
     except Exception:
-        pass  # fail open
+        entry["error"] = True  # timeout / npx missing mid-run — retry soon
+        return entry
+    entry["healthy"] = result.returncode == 0
+    if entry["healthy"]:
+        entry["binary"] = "npx"
+        _apply_status(entry, result.stdout)
+    return entry
 
-    return None
+
+def _apply_status(entry: Dict[str, Any], stdout: str) -> None:
+    """Copy ``version`` / ``db_path`` from ``status --json`` output into ``entry``."""
+    try:
+        data = json.loads(stdout)
+    except (json.JSONDecodeError, TypeError):
+        return
+    if not isinstance(data, dict):
+        return
+    version = data.get("version")
+    db_path = data.get("db_path")
+    entry["version"] = version if isinstance(version, str) else None
+    entry["db_path"] = db_path if isinstance(db_path, str) and db_path else None
+
+
+def cached_binary_status() -> Optional[Dict[str, Any]]:
+    """Return the persisted resolution without probing, or None when there
+    is no fresh entry for the current PATH/executables.
+
+    Keys: ``binary`` (path, "npx" or None), ``version``, ``healthy``,
+    ``db_path``, ``ts``.
+    """
+    return _load_binary_cache(_binary_cache_key())
+
+
+def _resolve_binary() -> Optional[str]:
+    """Resolve the wicked-bus binary path once, cache it.
+
+    In-process the answer lives in ``_bus_binary``; across processes in
+    _BINARY_CACHE_FILE (see above).
+    """
+    global _bus_binary
+    if _bus_binary is not None:
+        return _bus_binary
+
+    key = _binary_cache_key()
+    entry = _load_binary_cache(key)
+    if entry is None:
+        entry = _probe_binary()
+        entry.update({
+            "key": key,
+            "ts": time.time(),
+            "session_id": os.environ.get("CLAUDE_SESSION_ID", ""),
+        })
+        _save_binary_cache(entry)
+
+    _bus_binary = entry.get("binary") or None
+    return _bus_binary
 
 
 def _check_available() -> bool:
@@ -663,6 +808,350 @@ def _sanitize_payload(payload: Dict[str, Any], event_type: str = "") -> Dict[str
     return {k: v for k, v in payload.items() if k not in _PAYLOAD_DENY_LIST or k in allow}
 
 
+# ---------------------------------------------------------------------------
+# Outbox — durable local spool between emit_event() and wicked-bus.
+#
+# emit_event() appends one row to a SQLite WAL database and returns; the
+# append is a single local transaction (no Node start-up, no thread). When a
+# process that appended exits (or, for the resident hook worker, after each
+# hook run via flush()), a detached flusher is started
+# (`python _bus.py flush`, start_new_session) that drains the outbox oldest
+# first in batches of _OUTBOX_BATCH_SIZE. Only one flusher runs at a time
+# (flock on <db>.lock); a flusher that loses the race exits at once.
+#
+# Delivery is at-least-once: every row carries an idempotency key forwarded
+# as --idempotency-key, and rows are deleted only after their emit returned
+# 0, so a flusher killed mid-batch re-sends without duplicating bus events.
+# A row that fails _OUTBOX_MAX_ATTEMPTS times is dropped and counted as
+# failed. A transport error (timeout, binary gone) stops the run and leaves
+# the rest queued for the next flusher.
+#
+# WG_BUS_OUTBOX_DIRECT=1 restores the old thread-per-event direct emit.
+# ---------------------------------------------------------------------------
+
+_OUTBOX_FILE = os.path.join(
+    os.path.expanduser("~"),
+    ".something-wicked", "wicked-garden", "local",
+    "wicked-garden", "_bus_outbox.db",
+)
+_OUTBOX_BATCH_SIZE = 100
+_OUTBOX_MAX_ATTEMPTS = 5
+
+_outbox_conn: Optional[sqlite3.Connection] = None
+_outbox_conn_key: Optional[tuple] = None  # (pid, path) the connection belongs to
+_outbox_lock: threading.Lock = threading.Lock()
+_outbox_pending: bool = False  # this process appended — spawn a flusher at exit
+_outbox_atexit_registered: bool = False
+
+_OUTBOX_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS outbox ("
+    " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+    " idempotency_key TEXT NOT NULL UNIQUE,"
+    " event_type TEXT NOT NULL,"
+    " domain TEXT NOT NULL,"
+    " subdomain TEXT NOT NULL,"
+    " payload TEXT NOT NULL,"
+    " metadata TEXT,"
+    " enqueued_at REAL NOT NULL,"
+    " attempts INTEGER NOT NULL DEFAULT 0,"
+    " last_error TEXT)",
+    "CREATE TABLE IF NOT EXISTS outbox_counters ("
+    " name TEXT PRIMARY KEY,"
+    " value INTEGER NOT NULL)",
+)
+
+
+def _outbox_direct() -> bool:
+    """True when the outbox is bypassed via WG_BUS_OUTBOX_DIRECT."""
+    return os.environ.get("WG_BUS_OUTBOX_DIRECT", "").strip() in ("1", "true", "yes")
+
+
+def _outbox_connection() -> sqlite3.Connection:
+    """Return this process's outbox connection, opening it on first use.
+
+    Caller must hold _outbox_lock. Re-opened after fork or when _OUTBOX_FILE
+    changes (tests point it at a tmp dir).
+    """
+    global _outbox_conn, _outbox_conn_key
+    key = (os.getpid(), _OUTBOX_FILE)
+    if _outbox_conn is not None and _outbox_conn_key == key:
+        return _outbox_conn
+    os.makedirs(os.path.dirname(_OUTBOX_FILE), exist_ok=True)
+    conn = sqlite3.connect(
+        _OUTBOX_FILE, timeout=2.0, isolation_level=None, check_same_thread=False,
+    )
+    conn.execute("PRAGMA journal_mode=WAL")
+    # NORMAL under WAL: a committed append survives the process exiting,
+    # which is the failure mode the outbox exists for, without an fsync per
+    # emit.
+    conn.execute("PRAGMA synchronous=NORMAL")
+    for stmt in _OUTBOX_SCHEMA:
+        conn.execute(stmt)
+    conn.row_factory = sqlite3.Row
+    _outbox_conn, _outbox_conn_key = conn, key
+    return conn
+
+
+def _outbox_append(
+    event_type: str,
+    event_def: Dict[str, str],
+    payload_json: str,
+    meta_json: Optional[str],
+) -> bool:
+    """Queue one event in the outbox. Returns False when it was not queued
+    (outbox bypassed or unwritable) so the caller can emit directly.
+    """
+    global _outbox_pending, _outbox_atexit_registered
+    if _outbox_direct():
+        return False
+    try:
+        with _outbox_lock:
+            _outbox_connection().execute(
+                "INSERT INTO outbox (idempotency_key, event_type, domain, "
+                "subdomain, payload, metadata, enqueued_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    f"garden:outbox:{uuid.uuid4().hex}",
+                    event_type, event_def["domain"], event_def["subdomain"],
+                    payload_json, meta_json, time.time(),
+                ),
+            )
+            _outbox_pending = True
+            if not _outbox_atexit_registered:
+                atexit.register(_outbox_at_exit)
+                _outbox_atexit_registered = True
+    except Exception as exc:
+        logger.debug("bus outbox append failed: %s", exc)
+        return False
+    return True
+
+
+def _outbox_stats() -> Dict[str, int]:
+    """Return queued/flushed/failed outbox counts. Read-only; zeros when the
+    outbox does not exist or cannot be read.
+    """
+    stats = {"queued": 0, "flushed": 0, "failed": 0}
+    if not os.path.exists(_OUTBOX_FILE):
+        return stats
+    conn = None
+    try:
+        conn = sqlite3.connect(f"file:{_OUTBOX_FILE}?mode=ro", uri=True, timeout=2.0)
+        stats["queued"] = int(conn.execute("SELECT COUNT(*) FROM outbox").fetchone()[0])
+        for name, value in conn.execute("SELECT name, value FROM outbox_counters"):
+            if name in stats:
+                stats[name] = int(value)
+    except Exception:
+        pass  # fail open — partial stats are better than none
+    finally:
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:
+                pass
+    return stats
+
+
+def _outbox_try_lock() -> Any:
+    """Take the single-flusher lock without blocking.
+
+    Returns an open file object (the held lock), True when the platform has
+    no flock (idempotency keys make a concurrent flusher harmless), or None
+    when another flusher holds the lock.
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return True
+    try:
+        os.makedirs(os.path.dirname(_OUTBOX_FILE), exist_ok=True)
+        fh = open(_OUTBOX_FILE + ".lock", "a")
+    except OSError:
+        return None
+    try:
+        fcntl.flock(fh, fcntl.LOCK_EX | fcntl.LOCK_NB)
+    except OSError:
+        fh.close()
+        return None
+    return fh
+
+
+def _outbox_release(lock: Any) -> None:
+    if lock is True or lock is None:
+        return
+    try:
+        lock.close()  # closing the fd drops the flock
+    except Exception:
+        pass
+
+
+def _outbox_deliver(row: sqlite3.Row) -> Optional[bool]:
+    """Emit one outbox row. True = delivered, False = bus rejected it,
+    None = transport failure (stop the run, retry later).
+    """
+    cmd = _build_cmd(
+        "emit",
+        "--type", row["event_type"],
+        "--domain", row["domain"],
+        "--subdomain", row["subdomain"],
+        "--payload", row["payload"],
+        "--idempotency-key", row["idempotency_key"],
+        "--json",
+    )
+    if row["metadata"]:
+        cmd.extend(["--metadata", row["metadata"]])
+    try:
+        result = subprocess.run(cmd, timeout=_EMIT_TIMEOUT_SECONDS, capture_output=True)
+    except Exception:
+        _invalidate_cache()
+        return None
+    return result.returncode == 0
+
+
+def _outbox_drain_locked(max_rows: Optional[int]) -> Dict[str, Any]:
+    """Drain batches while holding the flusher lock. See flush_outbox."""
+    flushed = failed = 0
+    stalled = False
+    with _outbox_lock:
+        conn = _outbox_connection()
+    while max_rows is None or flushed + failed < max_rows:
+        limit = _OUTBOX_BATCH_SIZE
+        if max_rows is not None:
+            limit = min(limit, max_rows - flushed - failed)
+        with _outbox_lock:
+            rows = conn.execute(
+                "SELECT id, idempotency_key, event_type, domain, subdomain, "
+                "payload, metadata, attempts FROM outbox ORDER BY id LIMIT ?",
+                (limit,),
+            ).fetchall()
+        if not rows:
+            break
+
+        delivered: List[int] = []
+        dropped: List[int] = []
+        retry: List[int] = []
+        for row in rows:
+            ok = _outbox_deliver(row)
+            if ok is None:
+                stalled = True
+                break
+            if ok:
+                delivered.append(row["id"])
+            elif row["attempts"] + 1 >= _OUTBOX_MAX_ATTEMPTS:
+                dropped.append(row["id"])
+            else:
+                retry.append(row["id"])
+
+        # One transaction per batch: a flusher killed before this commit
+        # re-sends the batch under the same idempotency keys.
+        with _outbox_lock:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                conn.executemany("DELETE FROM outbox WHERE id = ?",
+                                 [(i,) for i in delivered + dropped])
+                conn.executemany(
+                    "UPDATE outbox SET attempts = attempts + 1, "
+                    "last_error = 'emit returned non-zero' WHERE id = ?",
+                    [(i,) for i in retry],
+                )
+                for name, n in (("flushed", len(delivered)), ("failed", len(dropped))):
+                    if n:
+                        conn.execute(
+                            "INSERT INTO outbox_counters (name, value) VALUES (?, ?) "
+                            "ON CONFLICT(name) DO UPDATE SET value = value + excluded.value",
+                            (name, n),
+                        )
+                conn.execute("COMMIT")
+            except Exception:
+                conn.execute("ROLLBACK")
+                raise
+        flushed += len(delivered)
+        failed += len(dropped)
+        if stalled or (retry and not delivered):
+            stalled = True  # bus is rejecting everything — back off
+            break
+    return {"flushed": flushed, "failed": failed, "stalled": stalled}
+
+
+def flush_outbox(max_rows: Optional[int] = None) -> Dict[str, Any]:
+    """Deliver queued outbox events to wicked-bus, oldest first.
+
+    Safe to call from any process: only one flusher drains at a time and a
+    caller that loses the race returns immediately with ``locked`` set.
+    Rows appended while the lock was held are picked up before returning.
+    Never raises.
+
+    Args:
+        max_rows: Stop after this many rows (delivered + dropped). None
+            drains until the outbox is empty or the bus stops accepting.
+
+    Returns:
+        {"flushed": int, "failed": int, "stalled": bool, "locked": bool}
+        for this call only — cumulative totals are in bus_emit_stats().
+    """
+    totals: Dict[str, Any] = {"flushed": 0, "failed": 0, "stalled": False, "locked": False}
+    if not os.path.exists(_OUTBOX_FILE) or not _check_available():
+        return totals
+    while True:
+        lock = _outbox_try_lock()
+        if lock is None:
+            totals["locked"] = True
+            return totals
+        try:
+            budget = None if max_rows is None else max_rows - totals["flushed"] - totals["failed"]
+            run = _outbox_drain_locked(budget)
+        except Exception as exc:
+            logger.debug("bus outbox flush failed: %s", exc)
+            return totals
+        finally:
+            _outbox_release(lock)
+        totals["flushed"] += run["flushed"]
+        totals["failed"] += run["failed"]
+        if run["stalled"]:
+            totals["stalled"] = True
+            return totals
+        if max_rows is not None and totals["flushed"] + totals["failed"] >= max_rows:
+            return totals
+        # Another emitter may have appended (and lost the flusher race) after
+        # our last SELECT but before we released the lock — re-check.
+        if _outbox_stats()["queued"] == 0:
+            return totals
+
+
+def _outbox_spawn_flusher() -> None:
+    """Start a detached ``_bus.py flush`` process. Fail-open."""
+    try:
+        subprocess.Popen(
+            [sys.executable, os.path.abspath(__file__), "flush"],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            close_fds=True,
+            start_new_session=True,
+        )
+    except Exception as exc:
+        logger.debug("bus outbox flusher spawn failed: %s", exc)
+
+
+def flush() -> None:
+    """Hand events this process queued since the last call to a detached flusher.
+
+    Runs at exit via atexit; long-lived processes that run many hooks (the
+    resident hook worker) call it after each run instead, since they may
+    never reach atexit. A no-op when nothing was appended. Never raises.
+    """
+    global _outbox_pending
+    with _outbox_lock:
+        if not _outbox_pending:
+            return
+        _outbox_pending = False
+    _outbox_spawn_flusher()
+
+
+def _outbox_at_exit() -> None:
+    """atexit hook: hand this process's queued events to a detached flusher."""
+    flush()
+
+
 # ---------------------------------------------------------------------------
 # Emit — fire-and-forget
 # ---------------------------------------------------------------------------
@@ -675,6 +1164,10 @@ def emit_event(
 ) -> None:
     """Emit an event to wicked-bus. Fire-and-forget — returns immediately.
 
+    The event is appended to the local outbox and delivered later by the
+    flusher (see flush_outbox). Falls back to a direct background emit only
+    when the outbox cannot be written.
+
     Args:
         event_type: Must be a key in BUS_EVENT_MAP.
         payload: Event data. Denied fields are stripped automatically.
@@ -695,23 +1188,29 @@ def emit_event(
         _EMIT_ATTEMPTED += 1
 
     safe_payload = _sanitize_payload(payload, event_type)
+    payload_json = json.dumps(safe_payload, default=str)
+
+    # Merge chain_id into metadata
+    meta = dict(metadata or {})
+    if chain_id:
+        meta["chain_id"] = chain_id
+    meta_json = json.dumps(meta, default=str) if meta else None
+
+    if _outbox_append(event_type, event_def, payload_json, meta_json):
+        with _emit_counter_lock:
+            _EMIT_SUCCEEDED += 1
+        return
 
     cmd = _build_cmd(
         "emit",
         "--type", event_type,
         "--domain", event_def["domain"],
         "--subdomain", event_def["subdomain"],
-        "--payload", json.dumps(safe_payload, default=str),
+        "--payload", payload_json,
         "--json",
     )
-
-    # Merge chain_id into metadata
-    meta = dict(metadata or {})
-    if chain_id:
-        meta["chain_id"] = chain_id
-
-    if meta:
-        cmd.extend(["--metadata", json.dumps(meta, default=str)])
+    if meta_json:
+        cmd.extend(["--metadata", meta_json])
 
     def _fire() -> None:
         global _EMIT_SUCCEEDED
@@ -738,18 +1237,27 @@ def bus_emit_stats() -> Dict[str, Any]:
     alerting when ratio falls below the threshold defined in gate-policy.json
     bus_health.emit_success_threshold.
 
+    The first three keys are this process's counters. The outbox keys are
+    shared by every process on the machine and read from the outbox DB
+    (zeros when it does not exist yet).
+
     Returns:
         {
             "attempted": int,   -- emits past availability + BUS_EVENT_MAP check
-            "succeeded": int,   -- returncode-0 subprocess completions
+            "succeeded": int,   -- emits durably queued (or emitted directly)
             "ratio": float,     -- succeeded / attempted; 0.0 when attempted == 0
+            "queued": int,      -- outbox rows awaiting delivery
+            "flushed": int,     -- outbox rows delivered to the bus (cumulative)
+            "failed": int,      -- outbox rows dropped undelivered (cumulative)
         }
     """
     with _emit_counter_lock:
         attempted = _EMIT_ATTEMPTED
         succeeded = _EMIT_SUCCEEDED
     ratio = succeeded / attempted if attempted > 0 else 0.0
-    return {"attempted": attempted, "succeeded": succeeded, "ratio": ratio}
+    stats: Dict[str, Any] = {"attempted": attempted, "succeeded": succeeded, "ratio": ratio}
+    stats.update(_outbox_stats())
+    return stats
 
 
 def _bus_reset_stats() -> None:
@@ -776,10 +1284,14 @@ def _resolve_bus_db_path() -> Optional[str]:
     Uses the same binary resolver as every other call in this module so the
     path stays correct regardless of how wicked-bus was installed. Returns
     None when the bus is unavailable or the status payload lacks ``db_path``.
-    Never raises.
+    The path recorded by the binary resolution probe is reused while that
+    file still exists. Never raises.
     """
     if not _check_available():
         return None
+    cached = cached_binary_status()
+    if cached and cached.get("db_path") and os.path.exists(cached["db_path"]):
+        return cached["db_path"]
     try:
         result = subprocess.run(
             _build_cmd("status", "--json"),
@@ -788,12 +1300,44 @@ def _resolve_bus_db_path() -> Optional[str]:
         )
         if result.returncode != 0:
             return None
-        data = json.loads(result.stdout)
     except Exception:
         _invalidate_cache()
         return None
-    db_path = data.get("db_path")
-    return db_path if isinstance(db_path, str) and db_path else None
+    status: Dict[str, Any] = {}
+    _apply_status(status, result.stdout)
+    if cached and status.get("db_path"):
+        # A PATH hit is cached without a status call; record what we learnt.
+        cached.update(status, healthy=True)
+        _save_binary_cache(cached)
+    return status.get("db_path")
+
+
+def _event_from_row(row: sqlite3.Row) -> Dict[str, Any]:
+    """Shape one ``events`` row the way consumers read bus events."""
+    try:
+        payload_raw = row["payload"]
+        payload = json.loads(payload_raw) if payload_raw else {}
+        if not isinstance(payload, dict):
+            payload = {"value": payload}
+    except (json.JSONDecodeError, TypeError):
+        payload = {}
+    try:
+        meta_raw = row["metadata"]
+        metadata = json.loads(meta_raw) if meta_raw else {}
+        if not isinstance(metadata, dict):
+            metadata = {}
+    except (json.JSONDecodeError, TypeError):
+        metadata = {}
+    return {
+        "event_id": row["event_id"],
+        "event_type": row["event_type"],
+        "domain": row["domain"],
+        "subdomain": row["subdomain"],
+        "payload": payload,
+        "data": payload,  # alias — consumers read event.get("data", {})
+        "metadata": metadata,
+        "emitted_at": row["emitted_at"],
+    }
 
 
 def tail_events(limit: int = 10) -> List[Dict[str, Any]]:
@@ -823,9 +1367,6 @@ def tail_events(limit: int = 10) -> List[Dict[str, Any]]:
     if not db_path or not os.path.exists(db_path):
         return []
 
-    import sqlite3  # stdlib; imported lazily so the module loads without it
-
-    events: List[Dict[str, Any]] = []
     conn = None
     try:
         # Read-only URI connection — never creates or writes the DB.
@@ -846,67 +1387,226 @@ def tail_events(limit: int = 10) -> List[Dict[str, Any]]:
             except Exception:
                 pass
 
-    for row in rows:
-        try:
-            payload_raw = row["payload"]
-            payload = json.loads(payload_raw) if payload_raw else {}
-            if not isinstance(payload, dict):
-                payload = {"value": payload}
-        except (json.JSONDecodeError, TypeError):
-            payload = {}
-        try:
-            meta_raw = row["metadata"]
-            metadata = json.loads(meta_raw) if meta_raw else {}
-            if not isinstance(metadata, dict):
-                metadata = {}
-        except (json.JSONDecodeError, TypeError):
-            metadata = {}
-        events.append({
-            "event_id": row["event_id"],
-            "event_type": row["event_type"],
-            "domain": row["domain"],
-            "subdomain": row["subdomain"],
-            "payload": payload,
-            "data": payload,  # alias — consumers read event.get("data", {})
-            "metadata": metadata,
-            "emitted_at": row["emitted_at"],
-        })
-    return events
+    return [_event_from_row(row) for row in rows]
 
 
 # ---------------------------------------------------------------------------
 # Poll — on-invoke consumption
+#
+# poll_pending() / ack_events() read and advance the subscriber cursor
+# straight from the wicked-bus SQLite store when its layout is one we know
+# (_DIRECT_REQUIRED_COLUMNS), skipping a Node start-up per call. Any miss —
+# DB file absent, a column missing, cursor not in the DB, sqlite error —
+# falls back to the CLI path unchanged. WG_BUS_DIRECT_DB=0 forces the CLI.
+#
+# Cursor IDs are cached per consumer name in _CURSOR_FILE:
+#   {"consumers": {"<name>": {"cursor_id": "...", "updated_at": <ts>}}}
+# The pre-consumer layout ({"cursor_id": ...}) is read as the default
+# consumer's entry.
 # ---------------------------------------------------------------------------
 
-def _load_cursor() -> Optional[str]:
-    """Load cursor ID from persistent storage."""
-    global _cursor_id
-    if _cursor_id:
-        return _cursor_id
+_DEFAULT_CONSUMER = "wicked-garden"
+
+# Columns the direct path reads or writes. A wicked-bus release that renames
+# or drops any of them sends every call back to the CLI.
+_DIRECT_REQUIRED_COLUMNS: Dict[str, frozenset] = {
+    "events": frozenset({
+        "event_id", "event_type", "domain", "subdomain",
+        "payload", "metadata", "emitted_at",
+    }),
+    "cursors": frozenset({"cursor_id", "last_event_id", "deregistered_at"}),
+}
+
+# db path -> (mtime_ns, schema_ok); re-checked when the file is replaced.
+_direct_schema_cache: Dict[str, tuple] = {}
+
+
+def _direct_enabled() -> bool:
+    return os.environ.get("WG_BUS_DIRECT_DB", "").strip().lower() not in ("0", "off", "false", "no")
+
+
+def _direct_db_path() -> Optional[str]:
+    """Bus DB path resolved the way wicked-bus paths.js does (env → home),
+    without a CLI call. None when the file does not exist.
+    """
+    override = os.environ.get("WICKED_BUS_DATA_DIR")
+    base = override or os.path.join(os.path.expanduser("~"), ".something-wicked", "wicked-bus")
+    path = os.path.join(base, "bus.db")
+    return path if os.path.isfile(path) else None
+
+
+def _direct_schema_ok(conn: sqlite3.Connection, db_path: str) -> bool:
+    """True when every _DIRECT_REQUIRED_COLUMNS column exists. Cached per
+    DB file identity so the PRAGMAs run once per process.
+    """
     try:
-        with open(_CURSOR_FILE, "r") as f:
-            data = json.load(f)
-            _cursor_id = data.get("cursor_id")
-            return _cursor_id
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        mtime = os.stat(db_path).st_mtime_ns
+    except OSError:
+        return False
+    cached = _direct_schema_cache.get(db_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    ok = True
+    try:
+        for table, required in _DIRECT_REQUIRED_COLUMNS.items():
+            cols = {r[1] for r in conn.execute(f"PRAGMA table_info({table})")}
+            if not required <= cols:
+                logger.debug("bus direct path: %s lacks %s", table, sorted(required - cols))
+                ok = False
+                break
+    except sqlite3.Error:
+        ok = False
+    _direct_schema_cache[db_path] = (mtime, ok)
+    return ok
+
+
+def _direct_connect(readonly: bool) -> Optional[sqlite3.Connection]:
+    """Open the bus DB for the direct path, or None to use the CLI."""
+    if not _direct_enabled():
+        return None
+    db_path = _direct_db_path()
+    if db_path is None:
         return None
+    try:
+        if readonly:
+            conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True, timeout=2.0)
+        else:
+            conn = sqlite3.connect(db_path, timeout=2.0)
+        conn.row_factory = sqlite3.Row
+    except sqlite3.Error:
+        return None
+    if not _direct_schema_ok(conn, db_path):
+        conn.close()
+        return None
+    return conn
+
+
+def _direct_cursor_position(conn: sqlite3.Connection, cursor_id: str) -> Optional[int]:
+    """last_event_id of a live cursor, or None when the DB does not know it."""
+    row = conn.execute(
+        "SELECT last_event_id FROM cursors WHERE cursor_id = ? AND deregistered_at IS NULL",
+        (cursor_id,),
+    ).fetchone()
+    if row is None:
+        return None
+    return int(row["last_event_id"] or 0)
+
+
+def _direct_poll(
+    cursor: str,
+    event_type_prefix: Optional[str],
+    limit: int,
+) -> Optional[List[Dict[str, Any]]]:
+    """Read pending events for ``cursor`` from SQLite. None = use the CLI."""
+    conn = _direct_connect(readonly=True)
+    if conn is None:
+        return None
+    try:
+        last_event_id = _direct_cursor_position(conn, cursor)
+        if last_event_id is None:
+            return None
+        sql = (
+            "SELECT event_id, event_type, domain, subdomain, payload, "
+            "metadata, emitted_at FROM events WHERE event_id > ?"
+        )
+        params: List[Any] = [last_event_id]
+        if event_type_prefix:
+            escaped = (event_type_prefix.replace("\\", "\\\\")
+                       .replace("%", "\\%").replace("_", "\\_"))
+            sql += " AND event_type LIKE ? ESCAPE '\\'"
+            params.append(escaped + "%")
+        sql += " ORDER BY event_id LIMIT ?"
+        params.append(int(limit))
+        rows = conn.execute(sql, params).fetchall()
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
+    return [_event_from_row(row) for row in rows]
+
+
+def _direct_ack(cursor: str, last_event_id: int) -> Optional[bool]:
+    """Advance ``cursor`` to ``last_event_id`` in SQLite (never backwards).
+    None = use the CLI.
+    """
+    conn = _direct_connect(readonly=False)
+    if conn is None:
+        return None
+    try:
+        with conn:
+            if _direct_cursor_position(conn, cursor) is None:
+                return None
+            conn.execute(
+                "UPDATE cursors SET last_event_id = ? "
+                "WHERE cursor_id = ? AND last_event_id < ?",
+                (int(last_event_id), cursor, int(last_event_id)),
+            )
+        return True
+    except sqlite3.Error:
+        return None
+    finally:
+        conn.close()
 
 
-def _save_cursor(cursor_id: str) -> None:
-    """Persist cursor ID for cross-session continuity."""
-    global _cursor_id
-    _cursor_id = cursor_id
+def _read_cursor_file() -> Dict[str, Dict[str, Any]]:
+    """Return the per-consumer cursor cache, upgrading the legacy layout."""
+    try:
+        with open(_CURSOR_FILE, "r") as f:
+            data = json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    consumers = data.get("consumers")
+    if isinstance(consumers, dict):
+        return {k: v for k, v in consumers.items() if isinstance(v, dict)}
+    if data.get("cursor_id"):
+        return {_DEFAULT_CONSUMER: {"cursor_id": data["cursor_id"],
+                                    "updated_at": data.get("updated_at")}}
+    return {}
+
+
+def _load_cursor(consumer: str = _DEFAULT_CONSUMER) -> Optional[str]:
+    """Load ``consumer``'s cursor ID from persistent storage."""
+    cached = _cursor_ids.get(consumer)
+    if cached:
+        return cached
+    cursor_id = _read_cursor_file().get(consumer, {}).get("cursor_id")
+    if cursor_id:
+        _cursor_ids[consumer] = cursor_id
+    return cursor_id
+
+
+def _save_cursor(cursor_id: Optional[str], consumer: str = _DEFAULT_CONSUMER) -> None:
+    """Persist ``consumer``'s cursor ID (None forgets it) for cross-session
+    continuity.
+    """
+    if cursor_id:
+        _cursor_ids[consumer] = cursor_id
+    else:
+        _cursor_ids.pop(consumer, None)
+    consumers = _read_cursor_file()
+    if cursor_id:
+        consumers[consumer] = {"cursor_id": cursor_id, "updated_at": time.time()}
+    else:
+        consumers.pop(consumer, None)
     try:
         os.makedirs(os.path.dirname(_CURSOR_FILE), exist_ok=True)
-        with open(_CURSOR_FILE, "w") as f:
-            json.dump({"cursor_id": cursor_id, "updated_at": time.time()}, f)
+        tmp = f"{_CURSOR_FILE}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump({"consumers": consumers}, f)
+        os.replace(tmp, _CURSOR_FILE)
     except OSError:
         pass  # fail open
 
 
-def _ensure_registered() -> Optional[str]:
-    """Register wicked-garden as a bus subscriber if not already registered."""
-    cursor = _load_cursor()
+def _ensure_registered(consumer: str = _DEFAULT_CONSUMER) -> Optional[str]:
+    """Register ``consumer`` as a bus subscriber if not already registered.
+
+    The consumer name is the ``--plugin`` the subscription is registered
+    under, so each consumer acks its own cursor.
+    """
+    cursor = _load_cursor(consumer)
     if cursor:
         return cursor
 
@@ -917,7 +1617,7 @@ def _ensure_registered() -> Optional[str]:
         result = subprocess.run(
             _build_cmd(
                 "register",
-                "--plugin", "wicked-garden",
+                "--plugin", consumer,
                 "--role", "subscriber",
                 "--filter", "wicked.*",
                 "--json",
@@ -929,7 +1629,7 @@ def _ensure_registered() -> Optional[str]:
             data = json.loads(result.stdout)
             cursor_id = data.get("cursor_id")
             if cursor_id:
-                _save_cursor(cursor_id)
+                _save_cursor(cursor_id, consumer)
                 return cursor_id
     except Exception:
         _invalidate_cache()
@@ -940,6 +1640,7 @@ def _ensure_registered() -> Optional[str]:
 def poll_pending(
     event_type_prefix: Optional[str] = None,
     limit: int = 50,
+    consumer: str = _DEFAULT_CONSUMER,
 ) -> List[Dict[str, Any]]:
     """Poll for pending events since last ack. Returns list of event dicts.
 
@@ -949,14 +1650,19 @@ def poll_pending(
     Args:
         event_type_prefix: Filter events by type prefix (e.g., "wicked.garden.gate.").
         limit: Max events to return per poll.
+        consumer: Subscriber name whose cursor is read (see _ensure_registered).
     """
     if not _check_available():
         return []
 
-    cursor = _ensure_registered()
+    cursor = _ensure_registered(consumer)
     if not cursor:
         return []
 
+    events = _direct_poll(cursor, event_type_prefix, limit)
+    if events is not None:
+        return events
+
     try:
         # Read cursor's last_event_id from registration
         result = subprocess.run(
@@ -1003,15 +1709,19 @@ def poll_pending(
         return []
 
 
-def ack_events(last_event_id: int) -> bool:
+def ack_events(last_event_id: int, consumer: str = _DEFAULT_CONSUMER) -> bool:
     """Acknowledge events up to last_event_id. Advances the cursor.
 
     Call after successfully processing events from poll_pending().
     """
-    cursor = _load_cursor()
+    cursor = _load_cursor(consumer)
     if not cursor or not _check_available():
         return False
 
+    acked = _direct_ack(cursor, last_event_id)
+    if acked is not None:
+        return acked
+
     try:
         result = subprocess.run(
             _build_cmd(
@@ -1030,53 +1740,141 @@ def ack_events(last_event_id: int) -> bool:
 
 
 # ---------------------------------------------------------------------------
-# Idempotency ledger — keyed on (event_type, chain_id)
+# Idempotency ledger — keyed on (consumer, event_type:chain_id)
+#
+# One row per processed event in an indexed SQLite table, so a check or a
+# mark is a primary-key lookup instead of a full JSON load + rewrite, and
+# concurrent hooks no longer overwrite each other's marks. Rows older than
+# _LEDGER_RETENTION_SECONDS are pruned (via the processed_at index) once per
+# process, when the ledger is first opened. A legacy _bus_processed.json is
+# imported on that first open and renamed to *.migrated.
 # ---------------------------------------------------------------------------
 
-_LEDGER_FILE = os.path.join(
+_LEDGER_DB = os.path.join(
     os.path.expanduser("~"),
     ".something-wicked", "wicked-garden", "local",
-    "wicked-garden", "_bus_processed.json",
+    "wicked-garden", "_bus_processed.db",
 )
+_LEDGER_FILE = os.path.join(
+    os.path.dirname(_LEDGER_DB), "_bus_processed.json",
+)  # pre-SQLite ledger, imported once
+_LEDGER_RETENTION_SECONDS = 7 * 86400
+
+_ledger_conn: Optional[sqlite3.Connection] = None
+_ledger_conn_key: Optional[tuple] = None  # (pid, path) the connection belongs to
+_ledger_lock: threading.Lock = threading.Lock()
+
 
+def _ledger_key(event_type: str, chain_id: str) -> str:
+    return f"{event_type}:{chain_id}"
 
-def _load_ledger() -> Dict[str, float]:
-    """Load processed events ledger. Returns {key: timestamp}."""
+
+def _ledger_import_json(conn: sqlite3.Connection) -> None:
+    """Import the legacy JSON ledger ({key: timestamp}) and retire the file."""
     try:
         with open(_LEDGER_FILE, "r") as f:
-            return json.load(f)
+            legacy = json.load(f)
     except (FileNotFoundError, json.JSONDecodeError, OSError):
-        return {}
-
-
-def _save_ledger(ledger: Dict[str, float]) -> None:
-    """Persist processed events ledger."""
+        return
+    if isinstance(legacy, dict):
+        rows = [
+            (_DEFAULT_CONSUMER, k, float(v)) for k, v in legacy.items()
+            if isinstance(v, (int, float))
+        ]
+        with conn:
+            conn.executemany(
+                "INSERT OR IGNORE INTO processed (consumer, event_key, processed_at) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
     try:
-        os.makedirs(os.path.dirname(_LEDGER_FILE), exist_ok=True)
-        with open(_LEDGER_FILE, "w") as f:
-            json.dump(ledger, f)
+        os.replace(_LEDGER_FILE, _LEDGER_FILE + ".migrated")
     except OSError:
-        pass  # fail open
+        pass
 
 
-def is_processed(event_type: str, chain_id: str) -> bool:
-    """Check if an event has already been processed."""
-    key = f"{event_type}:{chain_id}"
-    ledger = _load_ledger()
-    return key in ledger
+def _ledger_connection() -> sqlite3.Connection:
+    """Return this process's ledger connection, opening (and pruning) it on
+    first use. Caller must hold _ledger_lock.
+    """
+    global _ledger_conn, _ledger_conn_key
+    key = (os.getpid(), _LEDGER_DB)
+    if _ledger_conn is not None and _ledger_conn_key == key:
+        return _ledger_conn
+    os.makedirs(os.path.dirname(_LEDGER_DB), exist_ok=True)
+    conn = sqlite3.connect(_LEDGER_DB, timeout=2.0, check_same_thread=False)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS processed ("
+        " consumer TEXT NOT NULL,"
+        " event_key TEXT NOT NULL,"
+        " processed_at REAL NOT NULL,"
+        " PRIMARY KEY (consumer, event_key)) WITHOUT ROWID"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_processed_at ON processed (processed_at)"
+    )
+    _ledger_import_json(conn)
+    with conn:
+        conn.execute(
+            "DELETE FROM processed WHERE processed_at < ?",
+            (time.time() - _LEDGER_RETENTION_SECONDS,),
+        )
+    _ledger_conn, _ledger_conn_key = conn, key
+    return conn
 
 
-def mark_processed(event_type: str, chain_id: str) -> None:
-    """Mark an event as processed in the idempotency ledger."""
-    key = f"{event_type}:{chain_id}"
-    ledger = _load_ledger()
-    ledger[key] = time.time()
+def is_processed(
+    event_type: str,
+    chain_id: str,
+    consumer: str = _DEFAULT_CONSUMER,
+) -> bool:
+    """Check if an event has already been processed by ``consumer``."""
+    try:
+        with _ledger_lock:
+            row = _ledger_connection().execute(
+                "SELECT 1 FROM processed WHERE consumer = ? AND event_key = ? "
+                "AND processed_at >= ?",
+                (consumer, _ledger_key(event_type, chain_id),
+                 time.time() - _LEDGER_RETENTION_SECONDS),
+            ).fetchone()
+    except Exception:
+        return False  # fail open — worst case is a re-processed event
+    return row is not None
 
-    # Prune entries older than 7 days to prevent unbounded growth
-    cutoff = time.time() - (7 * 86400)
-    ledger = {k: v for k, v in ledger.items() if v > cutoff}
 
-    _save_ledger(ledger)
+def mark_processed_many(
+    events: List[Tuple[str, str]],
+    consumer: str = _DEFAULT_CONSUMER,
+) -> None:
+    """Mark several ``(event_type, chain_id)`` pairs processed in one
+    transaction.
+    """
+    if not events:
+        return
+    now = time.time()
+    rows = [(consumer, _ledger_key(et, cid), now) for et, cid in events]
+    try:
+        with _ledger_lock:
+            conn = _ledger_connection()
+            with conn:
+                conn.executemany(
+                    "INSERT OR REPLACE INTO processed (consumer, event_key, processed_at) "
+                    "VALUES (?, ?, ?)",
+                    rows,
+                )
+    except Exception as exc:
+        logger.debug("bus ledger mark failed: %s", exc)  # fail open
+
+
+def mark_processed(
+    event_type: str,
+    chain_id: str,
+    consumer: str = _DEFAULT_CONSUMER,
+) -> None:
+    """Mark an event as processed in the idempotency ledger."""
+    mark_processed_many([(event_type, chain_id)], consumer)
 
 
 # ---------------------------------------------------------------------------
@@ -1162,3 +1960,9 @@ def load_consumer_registry(
         )
 
     return result
+
+
+if __name__ == "__main__":
+    # Detached outbox flusher entry point — see _outbox_spawn_flusher().
+    if sys.argv[1:] == ["flush"]:
+        flush_outbox()
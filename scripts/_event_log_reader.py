@@ -12,6 +12,10 @@ Design constraints
   so the caller controls the DB lifetime (mirrors the pattern in
   ``scripts/crew/reconcile_v2.py::_get_projector_last_applied_seq``).
 - **Lightweight**: stdlib only — no third-party deps.
+- **Indexable**: chain_id prefixes are matched as a half-open range that an
+  ``event_log(event_type, chain_id)`` index can serve. No such index exists
+  yet — the projections DB belongs to the wicked-garden daemon and nothing
+  here opens it writable — so lookups still scan event_log.
 
 Usage
 -----
@@ -29,16 +33,22 @@ from __future__ import annotations
 
 import json
 import sqlite3
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
 
-def _escape_like(value: str) -> str:
-    """Escape LIKE special chars for SQLite (mirrors reconcile_v2 pattern)."""
-    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+def _prefix_range(prefix: str) -> Tuple[str, str]:
+    """Return ``(lo, hi)`` such that ``lo <= chain_id < hi`` ⇔ chain_id starts with prefix.
+
+    Unlike ``LIKE 'prefix%'`` (which SQLite cannot serve from an index once
+    an ESCAPE clause is present, and which ignores ASCII case), a half-open
+    BINARY range is an index seek. ``hi`` bumps the last code point, which
+    sorts after every extension of ``prefix`` in UTF-8 byte order.
+    """
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
 
 
 # ---------------------------------------------------------------------------
@@ -56,7 +66,10 @@ def read_latest_event_data(
 
     Filters ``event_log`` by::
 
-        chain_id LIKE '{project_id}.{phase}%'  AND  event_type = ?
+        chain_id starts with '{project_id}.{phase}'  AND  event_type = ?
+
+    The prefix is matched as a ``chain_id`` range (see the module notes on
+    indexing).
 
     Returns the highest-``event_id`` match's ``payload['data']``.  Returns
     ``None`` when:
@@ -69,19 +82,18 @@ def read_latest_event_data(
     Used by readers that previously loaded from disk — bus is the source
     of truth post-cutover so reads come from event_log.
     """
-    escaped = _escape_like(project_id)
-    prefix = f"{escaped}.{_escape_like(phase)}"
+    lo, hi = _prefix_range(f"{project_id}.{phase}")
     try:
         row = conn.execute(
             """
             SELECT payload_json
             FROM   event_log
-            WHERE  chain_id LIKE ? ESCAPE '\\'
-              AND  event_type = ?
+            WHERE  event_type = ?
+              AND  chain_id >= ? AND chain_id < ?
             ORDER  BY event_id DESC
             LIMIT  1
             """,
-            (f"{prefix}%", event_type),
+            (event_type, lo, hi),
         ).fetchone()
     except sqlite3.Error:
         return None
@@ -123,18 +135,17 @@ def read_event_appends(
     Rows whose ``payload_json`` does not contain a string ``raw_payload``
     field are silently skipped — the caller sees only well-formed entries.
     """
-    escaped = _escape_like(project_id)
-    prefix = f"{escaped}.{_escape_like(phase)}"
+    lo, hi = _prefix_range(f"{project_id}.{phase}")
     try:
         rows = conn.execute(
             """
             SELECT payload_json
             FROM   event_log
-            WHERE  chain_id LIKE ? ESCAPE '\\'
-              AND  event_type = ?
+            WHERE  event_type = ?
+              AND  chain_id >= ? AND chain_id < ?
             ORDER  BY event_id ASC
             """,
-            (f"{prefix}%", event_type),
+            (event_type, lo, hi),
         ).fetchall()
     except sqlite3.Error:
         return []
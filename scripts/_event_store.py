@@ -9,6 +9,10 @@ emit events directly for richer tracking.
 Events.db is a SEPARATE file from domain JSON storage.
 Corruption of events.db never breaks core domain operations.
 
+events.db is the hot segment. Older months are rotated out into one SQLite
+file per month under ``archive/`` (gzipped once complete), attached only for
+queries that ask for them.
+
 DB location:
     ~/.something-wicked/wicked-garden/local/wicked-garden/events.db
 
@@ -26,25 +30,53 @@ Usage:
         tags=["phase-change"],
     )
 
+    # Append a burst in one transaction
+    EventStore.append_many([
+        {"domain": "crew", "action": "tasks.completed", "record_id": t}
+        for t in task_ids
+    ])
+
+    # Or buffer every append() in a block and commit once
+    with EventStore.batch():
+        for t in task_ids:
+            EventStore.append(domain="crew", action="tasks.completed", record_id=t)
+
     # Query events
     results = EventStore.query(domain="crew", since="7d", limit=50)
     results = EventStore.query(project_id="my-project", fts="auth migration")
+    results = EventStore.query(fts="auth migration", rank=True)   # best match first
 
-    # Purge old events
+    # Page through a chronological scan
+    page = EventStore.query(domain="crew", limit=50)
+    last = page[-1]
+    page = EventStore.query(domain="crew", limit=50, before_ts=last["ts"], before_id=last["event_id"])
+
+    # Move months older than 90 days into archive/events-YYYY-MM.db.gz
+    EventStore.archive_before(days=90)
+    EventStore.query(fts="auth migration", include_archive=True)
+    EventStore.drop_archive_before(days=365)   # retention = unlink old segments
+
+    # Purge old events (permanent, row by row)
     EventStore.purge_before(days=90)
 
 Stdlib-only. No external dependencies.
 """
 from __future__ import annotations
 
+import atexit
+import gzip
 import json
 import os
+import shutil
 import sqlite3
 import sys
+import tempfile
+import time
 import uuid
+from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterable, Iterator
 
 # ---------------------------------------------------------------------------
 # DB path resolution
@@ -87,7 +119,9 @@ CREATE TABLE IF NOT EXISTS events (
     schema_version INTEGER DEFAULT 1
 );
 
-CREATE INDEX IF NOT EXISTS idx_events_ts ON events(ts DESC);
+-- (ts, event_id) is the keyset for query() paging; it supersedes idx_events_ts.
+DROP INDEX IF EXISTS idx_events_ts;
+CREATE INDEX IF NOT EXISTS idx_events_ts_id ON events(ts DESC, event_id DESC);
 CREATE INDEX IF NOT EXISTS idx_events_domain_ts ON events(domain, ts DESC);
 CREATE INDEX IF NOT EXISTS idx_events_project_ts ON events(project_id, ts DESC);
 CREATE INDEX IF NOT EXISTS idx_events_session ON events(session_id);
@@ -108,6 +142,62 @@ END;
 """
 
 
+_INSERT_SQL = """INSERT INTO events (
+    event_id, ts, domain, action, source, record_id,
+    project_id, session_id, sprint_ref, actor,
+    payload, payload_ref, tags, schema_version
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)"""
+
+
+def _build_row(
+    domain: str,
+    action: str,
+    source: str | None = None,
+    record_id: str | None = None,
+    payload: dict | str | None = None,
+    project_id: str | None = None,
+    session_id: str | None = None,
+    sprint_ref: str | None = None,
+    actor: str = "claude",
+    tags: list[str] | None = None,
+    file_refs: list[str] | None = None,
+) -> tuple:
+    """Build the _INSERT_SQL parameter tuple for one event (event_id first)."""
+    event_id = str(uuid.uuid4())
+    ts = datetime.now(timezone.utc).isoformat()
+
+    # Auto-resolve session_id
+    if session_id is None:
+        session_id = os.environ.get("CLAUDE_SESSION_ID", "")
+
+    # Serialize payload
+    payload_str = None
+    payload_ref = None
+    if payload is not None:
+        if isinstance(payload, dict):
+            payload_str = json.dumps(payload, default=str)
+        else:
+            payload_str = str(payload)
+
+        # Truncate large payloads
+        if len(payload_str) > _MAX_PAYLOAD_BYTES:
+            payload_ref = f"{domain}/{source}/{record_id}" if source and record_id else None
+            payload_str = payload_str[:_MAX_PAYLOAD_BYTES]
+            tags = (tags or []) + ["truncated"]
+
+    # Add file_refs to tags
+    if file_refs:
+        tags = (tags or []) + [f"file:{f}" for f in file_refs]
+
+    tags_str = json.dumps(tags) if tags else None
+
+    return (
+        event_id, ts, domain, action, source, record_id,
+        project_id, session_id, sprint_ref, actor,
+        payload_str, payload_ref, tags_str,
+    )
+
+
 # ---------------------------------------------------------------------------
 # EventStore
 # ---------------------------------------------------------------------------
@@ -122,6 +212,16 @@ class EventStore:
     _conn: sqlite3.Connection | None = None
     _schema_ready: bool = False
 
+    # Buffered mode: rows queued by append() until flush(). 0 = unbuffered.
+    _buffer: list[tuple] = []
+    _buffer_max: int = 0
+    _buffer_max_age_s: float = 2.0
+    _buffer_since: float | None = None
+    _atexit_registered: bool = False
+
+    # Scratch dir holding gunzipped archive segments while they are queried.
+    _archive_tmp: tempfile.TemporaryDirectory | None = None
+
     @classmethod
     def _get_conn(cls) -> sqlite3.Connection:
         if cls._conn is None:
@@ -158,55 +258,127 @@ class EventStore:
         tags: list[str] | None = None,
         file_refs: list[str] | None = None,
     ) -> str | None:
-        """Append an event. Returns event_id or None on failure."""
+        """Append an event. Returns event_id or None on failure.
+
+        In buffered mode (see enable_buffering) the row is queued and written
+        with the next flush. Its event_id is provisional until then: a failed
+        flush keeps the row queued for a retry, but rows still queued at exit
+        are lost.
+        """
         try:
+            row = _build_row(
+                domain, action, source=source, record_id=record_id,
+                payload=payload, project_id=project_id, session_id=session_id,
+                sprint_ref=sprint_ref, actor=actor, tags=tags, file_refs=file_refs,
+            )
+            if cls._buffer_max:
+                cls._buffer.append(row)
+                if cls._buffer_since is None:
+                    cls._buffer_since = time.monotonic()
+                if (len(cls._buffer) >= cls._buffer_max
+                        or time.monotonic() - cls._buffer_since >= cls._buffer_max_age_s):
+                    cls.flush()
+                return row[0]
+
             conn = cls._get_conn()
+            conn.execute(_INSERT_SQL, row)
+            conn.commit()
+            return row[0]
 
-            event_id = str(uuid.uuid4())
-            ts = datetime.now(timezone.utc).isoformat()
+        except Exception:
+            return None
 
-            # Auto-resolve session_id
-            if session_id is None:
-                session_id = os.environ.get("CLAUDE_SESSION_ID", "")
+    @classmethod
+    def append_many(cls, events: Iterable[dict]) -> list[str | None]:
+        """Append several events in one transaction (one commit, one fsync).
 
-            # Serialize payload
-            payload_str = None
-            payload_ref = None
-            if payload is not None:
-                if isinstance(payload, dict):
-                    payload_str = json.dumps(payload, default=str)
-                else:
-                    payload_str = str(payload)
+        Each item takes the same keyword arguments as append(). Items that
+        cannot be serialised (e.g. missing domain/action) get None in the
+        returned list and are skipped; if the write itself fails every entry
+        is None.
+        """
+        ids: list[str | None] = []
+        rows: list[tuple] = []
+        for event in events:
+            try:
+                row = _build_row(**event)
+            except Exception:
+                ids.append(None)
+                continue
+            rows.append(row)
+            ids.append(row[0])
+        if not rows:
+            return ids
+        try:
+            conn = cls._get_conn()
+            with conn:
+                conn.executemany(_INSERT_SQL, rows)
+            return ids
+        except Exception:
+            return [None] * len(ids)
 
-                # Truncate large payloads
-                if len(payload_str) > _MAX_PAYLOAD_BYTES:
-                    payload_ref = f"{domain}/{source}/{record_id}" if source and record_id else None
-                    payload_str = payload_str[:_MAX_PAYLOAD_BYTES]
-                    tags = (tags or []) + ["truncated"]
+    # ------------------------------------------------------------------
+    # Buffered mode
+    # ------------------------------------------------------------------
 
-            # Add file_refs to tags
-            if file_refs:
-                tags = (tags or []) + [f"file:{f}" for f in file_refs]
+    @classmethod
+    def enable_buffering(cls, max_events: int = 100, max_age_s: float = 2.0) -> None:
+        """Queue append() calls in-process and write them with append_many().
+
+        The buffer is flushed when it holds ``max_events`` rows, when an
+        append finds the oldest queued row older than ``max_age_s``, before
+        any read (query/count/purge_before), and at interpreter exit. Events
+        still queued when the process is killed are lost — use for bursts
+        (imports, phase completions), not as the default.
+        """
+        cls._buffer_max = max(1, int(max_events))
+        cls._buffer_max_age_s = max_age_s
+        if not cls._atexit_registered:
+            atexit.register(cls.flush)
+            cls._atexit_registered = True
 
-            tags_str = json.dumps(tags) if tags else None
+    @classmethod
+    def disable_buffering(cls) -> None:
+        """Flush any queued events and return to one commit per append()."""
+        cls.flush()
+        cls._buffer_max = 0
 
-            conn.execute(
-                """INSERT INTO events (
-                    event_id, ts, domain, action, source, record_id,
-                    project_id, session_id, sprint_ref, actor,
-                    payload, payload_ref, tags, schema_version
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1)""",
-                (
-                    event_id, ts, domain, action, source, record_id,
-                    project_id, session_id, sprint_ref, actor,
-                    payload_str, payload_ref, tags_str,
-                ),
-            )
-            conn.commit()
-            return event_id
+    @classmethod
+    def flush(cls) -> int:
+        """Write queued events in one transaction. Returns the count written.
 
+        If the write fails the rows go back to the front of the queue (ahead
+        of anything appended meanwhile) and are retried on the next flush.
+        """
+        if not cls._buffer:
+            return 0
+        rows, since = cls._buffer, cls._buffer_since
+        cls._buffer, cls._buffer_since = [], None
+        try:
+            conn = cls._get_conn()
+            with conn:
+                conn.executemany(_INSERT_SQL, rows)
+            return len(rows)
         except Exception:
-            return None
+            cls._buffer = rows + cls._buffer
+            cls._buffer_since = since
+            return 0
+
+    @classmethod
+    @contextmanager
+    def batch(cls, max_events: int = 1000) -> Iterator[None]:
+        """Buffer every append() inside the block and commit once on exit.
+
+        Restores the previous buffering settings afterwards, so batches nest
+        inside a process that already called enable_buffering().
+        """
+        previous = (cls._buffer_max, cls._buffer_max_age_s)
+        cls.enable_buffering(max_events=max_events, max_age_s=float("inf"))
+        try:
+            yield
+        finally:
+            cls.flush()
+            cls._buffer_max, cls._buffer_max_age_s = previous
 
     @classmethod
     def query(
@@ -218,9 +390,25 @@ class EventStore:
         since: str | None = None,
         fts: str | None = None,
         limit: int = 50,
+        rank: bool = False,
+        before_ts: str | None = None,
+        before_id: str | None = None,
+        include_archive: bool = False,
     ) -> list[dict]:
         """Query events with filters.
 
+        Results are newest first. To page, pass the last row's ``ts`` and
+        ``event_id`` back as ``before_ts``/``before_id``; each page then costs
+        one index range scan of ``limit`` rows, however deep it is.
+
+        With ``fts`` and ``rank=True`` the FTS index is joined directly and
+        results come back best match first (``bm25``, lower ``score`` is
+        better), so only the top ``limit`` matches are read in full.
+
+        Only the hot events.db is searched unless ``include_archive`` is set;
+        archived monthly segments (see archive_before) are then attached one
+        at a time, newest first, until the page is full.
+
         Args:
             domain: filter by domain name
             action: filter by action (supports prefix match with *)
@@ -229,15 +417,19 @@ class EventStore:
             since: time window — "7d", "24h", "2026-03-01"
             fts: full-text search query
             limit: max results (default 50)
+            rank: order FTS matches by relevance instead of time
+            before_ts: keyset cursor — only events older than this ts
+            before_id: tie-breaker for events sharing ``before_ts``
+            include_archive: also search archived segments
         """
         try:
+            cls.flush()
             conn = cls._get_conn()
             conditions = []
             params: list[Any] = []
+            ranked = bool(fts and rank)
 
             if fts:
-                # FTS query joins events_fts
-                conditions.append("e.rowid IN (SELECT rowid FROM events_fts WHERE events_fts MATCH ?)")
                 params.append(fts)
 
             if domain:
@@ -260,29 +452,155 @@ class EventStore:
                 conditions.append("e.session_id = ?")
                 params.append(session_id)
 
-            if since:
-                ts_cutoff = _parse_since(since)
-                if ts_cutoff:
-                    conditions.append("e.ts >= ?")
-                    params.append(ts_cutoff)
+            ts_cutoff = _parse_since(since) if since else None
+            if ts_cutoff:
+                conditions.append("e.ts >= ?")
+                params.append(ts_cutoff)
 
-            where = " AND ".join(conditions) if conditions else "1=1"
-            params.append(limit)
+            if before_ts:
+                if before_id:
+                    conditions.append("(e.ts, e.event_id) < (?, ?)")
+                    params.extend([before_ts, before_id])
+                else:
+                    conditions.append("e.ts < ?")
+                    params.append(before_ts)
+
+            rows = [dict(r) for r in conn.execute(
+                _select_sql("main", conditions, fts=bool(fts), ranked=ranked), params + [limit],
+            )]
+            if not include_archive:
+                return rows
+
+            for month, path in cls._segments():
+                if not ranked and len(rows) >= limit:
+                    break  # segments are older than everything already found
+                if ts_cutoff and month < ts_cutoff[:7]:
+                    break
+                if before_ts and month > before_ts[:7]:
+                    continue
+                need = limit if ranked else limit - len(rows)
+                conn.execute("ATTACH DATABASE ? AS seg", (str(cls._readable_segment(path)),))
+                try:
+                    rows.extend(dict(r) for r in conn.execute(
+                        _select_sql("seg", conditions, fts=bool(fts), ranked=ranked), params + [need],
+                    ))
+                finally:
+                    conn.execute("DETACH DATABASE seg")
+
+            unique = {r["event_id"]: r for r in rows}.values()
+            if ranked:
+                return sorted(unique, key=lambda r: r["score"])[:limit]
+            return sorted(unique, key=lambda r: (r["ts"], r["event_id"]), reverse=True)[:limit]
 
-            rows = conn.execute(
-                f"SELECT * FROM events e WHERE {where} ORDER BY e.ts DESC LIMIT ?",
-                params,
-            ).fetchall()
+        except Exception:
+            return []
 
-            return [dict(r) for r in rows]
+    # ------------------------------------------------------------------
+    # Archive segments
+    # ------------------------------------------------------------------
 
+    @classmethod
+    def archive_before(cls, days: int = 90, compress: bool = True) -> int:
+        """Move whole months older than ``days`` into monthly segment files.
+
+        Each month before the one containing the cutoff is copied into
+        ``archive/events-YYYY-MM.db`` (FTS included) and removed from the hot
+        events.db in one pass. A month is only ever archived once it is
+        complete, so its segment is gzipped straight away when ``compress``
+        is set. Returns the number of events moved.
+        """
+        try:
+            cls.flush()
+            conn = cls._get_conn()
+            cutoff = _month_start(datetime.now(timezone.utc) - timedelta(days=days))
+            months = [r[0] for r in conn.execute(
+                "SELECT DISTINCT substr(ts, 1, 7) FROM events WHERE ts < ? ORDER BY 1", (cutoff,),
+            )]
+            return sum(cls._archive_month(conn, month, compress) for month in months)
         except Exception:
-            return []
+            return 0
+
+    @classmethod
+    def drop_archive_before(cls, days: int = 365) -> int:
+        """Delete archived segments whose month ended more than ``days`` ago.
+
+        Retention is a file unlink per month. Returns segments removed.
+        """
+        cutoff = _month_start(datetime.now(timezone.utc) - timedelta(days=days))[:7]
+        dropped = 0
+        for month, path in cls._segments():
+            if month < cutoff:
+                try:
+                    path.unlink()
+                    dropped += 1
+                except OSError:
+                    pass  # fail open
+        return dropped
+
+    @classmethod
+    def _archive_month(cls, conn: sqlite3.Connection, month: str, compress: bool) -> int:
+        lo, hi = f"{month}-01", _month_start(_next_month(month))
+        path = _archive_dir() / f"events-{month}.db"
+        gz = path.with_name(path.name + ".gz")
+        if gz.exists():  # reopen a segment left behind by an interrupted run
+            _gunzip(gz, path)
+            gz.unlink()
+
+        seg = sqlite3.connect(str(path))
+        seg.executescript(_SCHEMA_SQL)
+        seg.executescript(_FTS_SQL)
+        seg.close()
+
+        conn.execute("ATTACH DATABASE ? AS seg", (str(path),))
+        try:
+            with conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO seg.events SELECT * FROM main.events WHERE ts >= ? AND ts < ?",
+                    (lo, hi),
+                )
+                conn.execute(
+                    "DELETE FROM main.events_fts WHERE rowid IN "
+                    "(SELECT rowid FROM main.events WHERE ts >= ? AND ts < ?)",
+                    (lo, hi),
+                )
+                moved = conn.execute(
+                    "DELETE FROM main.events WHERE ts >= ? AND ts < ?", (lo, hi),
+                ).rowcount
+        finally:
+            conn.execute("DETACH DATABASE seg")
+
+        if compress:
+            _gzip(path, gz)
+            path.unlink()
+        return moved
+
+    @classmethod
+    def _segments(cls) -> list[tuple[str, Path]]:
+        """(month, path) for every archived segment, newest first."""
+        out = []
+        for path in _archive_dir().glob("events-*.db*"):
+            month = path.name[len("events-"):].split(".", 1)[0]
+            if path.suffix in (".db", ".gz"):
+                out.append((month, path))
+        return sorted(out, reverse=True)
+
+    @classmethod
+    def _readable_segment(cls, path: Path) -> Path:
+        """Return an attachable file for ``path``, gunzipping to a temp dir once per process."""
+        if path.suffix != ".gz":
+            return path
+        if cls._archive_tmp is None:
+            cls._archive_tmp = tempfile.TemporaryDirectory(prefix="wg-events-")
+        target = Path(cls._archive_tmp.name) / path.name[: -len(".gz")]
+        if not target.exists() or target.stat().st_mtime < path.stat().st_mtime:
+            _gunzip(path, target)
+        return target
 
     @classmethod
     def purge_before(cls, days: int = 90) -> int:
         """Delete events older than N days. Returns count deleted."""
         try:
+            cls.flush()
             conn = cls._get_conn()
             cutoff = (datetime.now(timezone.utc) - timedelta(days=days)).isoformat()
 
@@ -301,6 +619,7 @@ class EventStore:
     def count(cls) -> int:
         """Return total event count."""
         try:
+            cls.flush()
             conn = cls._get_conn()
             row = conn.execute("SELECT COUNT(*) FROM events").fetchone()
             return row[0] if row else 0
@@ -309,16 +628,68 @@ class EventStore:
 
     @classmethod
     def close(cls) -> None:
-        """Close the database connection."""
+        """Flush queued events and close the database connection."""
+        cls.flush()
         if cls._conn is not None:
             cls._conn.close()
             cls._conn = None
+        if cls._archive_tmp is not None:
+            cls._archive_tmp.cleanup()
+            cls._archive_tmp = None
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+def _select_sql(db: str, conditions: list[str], fts: bool, ranked: bool) -> str:
+    """Render query()'s SELECT against schema ``db`` ("main" or an attached segment).
+
+    When ``fts`` is set the MATCH parameter comes first, ahead of ``conditions``.
+    """
+    if ranked:
+        where = " AND ".join(["events_fts MATCH ?"] + conditions)
+        return (
+            f"SELECT e.*, events_fts.rank AS score FROM {db}.events_fts "
+            f"JOIN {db}.events e ON e.rowid = events_fts.rowid WHERE {where} "
+            "ORDER BY events_fts.rank LIMIT ?"
+        )
+    if fts:
+        conditions = [
+            f"e.rowid IN (SELECT rowid FROM {db}.events_fts WHERE events_fts MATCH ?)"
+        ] + conditions
+    where = " AND ".join(conditions) if conditions else "1=1"
+    return f"SELECT * FROM {db}.events e WHERE {where} ORDER BY e.ts DESC, e.event_id DESC LIMIT ?"
+
+
+def _archive_dir() -> Path:
+    p = _db_path().parent / "archive"
+    p.mkdir(parents=True, exist_ok=True)
+    return p
+
+
+def _month_start(value: datetime | str) -> str:
+    """ISO date of the first day of the month — "2026-03-01"."""
+    text = value.isoformat() if isinstance(value, datetime) else value
+    return f"{text[:7]}-01"
+
+
+def _next_month(month: str) -> str:
+    """"2026-12" -> "2027-01"."""
+    year, mon = int(month[:4]), int(month[5:7])
+    return f"{year + mon // 12:04d}-{mon % 12 + 1:02d}"
+
+
+def _gzip(src: Path, dest: Path) -> None:
+    with open(src, "rb") as fin, gzip.open(dest, "wb") as fout:
+        shutil.copyfileobj(fin, fout)
+
+
+def _gunzip(src: Path, dest: Path) -> None:
+    with gzip.open(src, "rb") as fin, open(dest, "wb") as fout:
+        shutil.copyfileobj(fin, fout)
+
+
 def _parse_since(since: str) -> str | None:
     """Parse a 'since' string into an ISO timestamp."""
     now = datetime.now(timezone.utc)
@@ -366,11 +737,20 @@ if __name__ == "__main__":
     q.add_argument("--since", help="Time window (7d, 24h, ISO date)")
     q.add_argument("--fts", help="Full-text search")
     q.add_argument("--limit", type=int, default=50)
+    q.add_argument("--rank", action="store_true", help="Order --fts matches by relevance (bm25)")
+    q.add_argument("--before-ts", help="Keyset cursor: ts of the last row of the previous page")
+    q.add_argument("--before-id", help="Keyset cursor: event_id of the last row of the previous page")
+    q.add_argument("--include-archive", action="store_true", help="Also search archived segments")
     q.add_argument("--json", action="store_true")
 
     p = sub.add_parser("purge", help="Purge old events")
     p.add_argument("--days", type=int, default=90)
 
+    a = sub.add_parser("archive", help="Move old months into archive segments")
+    a.add_argument("--days", type=int, default=90)
+    a.add_argument("--no-compress", action="store_true")
+    a.add_argument("--drop-after-days", type=int, help="Also delete segments older than this")
+
     args = parser.parse_args()
 
     EventStore.ensure_schema()
@@ -383,7 +763,9 @@ if __name__ == "__main__":
         results = EventStore.query(
             domain=args.domain, action=args.action,
             project_id=args.project, since=args.since,
-            fts=args.fts, limit=args.limit,
+            fts=args.fts, limit=args.limit, rank=args.rank,
+            before_ts=args.before_ts, before_id=args.before_id,
+            include_archive=args.include_archive,
         )
         if getattr(args, "json", False):
             print(json.dumps(results, indent=2))
@@ -393,5 +775,9 @@ if __name__ == "__main__":
     elif args.cmd == "purge":
         deleted = EventStore.purge_before(days=args.days)
         print(json.dumps({"deleted": deleted}))
+    elif args.cmd == "archive":
+        archived = EventStore.archive_before(days=args.days, compress=not args.no_compress)
+        dropped = EventStore.drop_archive_before(days=args.drop_after_days) if args.drop_after_days else 0
+        print(json.dumps({"archived": archived, "dropped_segments": dropped}))
     else:
         parser.print_help()
@@ -0,0 +1,185 @@
+#!/usr/bin/env python3
+"""
+_latency.py — Fixed-bucket latency histograms for wicked-garden hooks.
+
+Recording is an in-memory bucket increment (bisect over a 13-entry tuple);
+the process's histograms are appended to $TMPDIR/wicked-latency-{session_id}.jsonl
+as ONE write at exit — or on an explicit flush() from long-lived processes
+such as the resident hook worker. No JSON rewrite, no per-record I/O.
+
+Each line is one (hook, handler) histogram from one process:
+    {"hook": "post_tool", "handler": "Read", "counts": [...], "n": 3,
+     "sum_ms": 41.2, "max_ms": 22.9}
+Readers merge lines by summing counts (see load()).
+
+Usage:
+    from _latency import record, timed
+
+    record("pre_tool", 12.5, handler="Bash")
+    with timed("prompt_submit", "SLOW"):
+        ...
+
+Fail-silent: never raises, never crashes the caller.
+"""
+
+import atexit
+import json
+import os
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from pathlib import Path
+
+# Bucket upper bounds in ms (inclusive). A final overflow bucket catches
+# anything slower than the last bound.
+BOUNDS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000)
+
+# Handler label used for a whole-hook measurement.
+TOTAL = "(total)"
+
+
+class Histogram:
+    """Fixed-bucket latency histogram."""
+
+    __slots__ = ("counts", "n", "sum_ms", "max_ms")
+
+    def __init__(self):
+        self.counts = [0] * (len(BOUNDS_MS) + 1)
+        self.n = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def add(self, ms: float) -> None:
+        self.counts[bisect_left(BOUNDS_MS, ms)] += 1
+        self.n += 1
+        self.sum_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def merge(self, counts: list, n: int, sum_ms: float, max_ms: float) -> None:
+        if len(counts) != len(self.counts):
+            return  # written with different bounds — skip rather than skew
+        for i, c in enumerate(counts):
+            self.counts[i] += int(c)
+        self.n += int(n)
+        self.sum_ms += float(sum_ms)
+        self.max_ms = max(self.max_ms, float(max_ms))
+
+    def percentile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-th quantile (0 < q <= 1).
+
+        Capped at the observed max, so small samples report a real value
+        instead of a bucket edge.
+        """
+        if not self.n:
+            return 0.0
+        rank = q * self.n
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= rank:
+                bound = BOUNDS_MS[i] if i < len(BOUNDS_MS) else self.max_ms
+                return float(min(bound, self.max_ms))
+        return self.max_ms
+
+
+_pending: dict = {}
+_atexit_registered = False
+
+
+def _get_session_id() -> str:
+    """Read and sanitize CLAUDE_SESSION_ID for use in filenames."""
+    import re
+    raw = os.environ.get("CLAUDE_SESSION_ID", "unknown")
+    safe = re.sub(r"[^a-zA-Z0-9\-_]", "_", raw)
+    return safe or "unknown"
+
+
+def latency_file(session_id: "str | None" = None) -> Path:
+    """Return the per-session latency file path."""
+    tmpdir = os.environ.get("TMPDIR") or __import__("tempfile").gettempdir()
+    return Path(tmpdir) / f"wicked-latency-{session_id or _get_session_id()}.jsonl"
+
+
+# ---------------------------------------------------------------------------
+# Public API — recording
+# ---------------------------------------------------------------------------
+
+
+def record(hook: str, ms: float, handler: str = TOTAL) -> None:
+    """Add one sample to the (hook, handler) histogram. Never raises."""
+    global _atexit_registered
+    try:
+        key = (hook, handler)
+        hist = _pending.get(key)
+        if hist is None:
+            hist = _pending[key] = Histogram()
+        hist.add(ms)
+        if not _atexit_registered:
+            atexit.register(flush)
+            _atexit_registered = True
+    except Exception:
+        pass
+
+
+@contextmanager
+def timed(hook: str, handler: str = TOTAL):
+    """Record the wall-clock duration of the block."""
+    t0 = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(hook, (time.perf_counter() - t0) * 1000.0, handler)
+
+
+def flush() -> None:
+    """Append pending histograms to the session file in one write. Never raises."""
+    if not _pending:
+        return
+    try:
+        lines = []
+        for (hook, handler), hist in _pending.items():
+            lines.append(json.dumps({
+                "hook": hook,
+                "handler": handler,
+                "counts": hist.counts,
+                "n": hist.n,
+                "sum_ms": round(hist.sum_ms, 3),
+                "max_ms": round(hist.max_ms, 3),
+            }, separators=(",", ":")))
+        _pending.clear()
+        fd = os.open(latency_file(), os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600)
+        try:
+            os.write(fd, ("\n".join(lines) + "\n").encode("utf-8"))
+        finally:
+            os.close(fd)
+    except Exception:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Public API — reading
+# ---------------------------------------------------------------------------
+
+
+def load(path: Path) -> dict:
+    """Merge a latency file into {(hook, handler): Histogram}.
+
+    Corrupt or truncated lines are skipped.
+    """
+    merged: dict = {}
+    try:
+        with Path(path).open("r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    row = json.loads(line)
+                    key = (row["hook"], row["handler"])
+                    hist = merged.get(key)
+                    if hist is None:
+                        hist = merged[key] = Histogram()
+                    hist.merge(row["counts"], row["n"], row["sum_ms"], row["max_ms"])
+                except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+                    continue
+    except OSError:
+        pass
+    return merged
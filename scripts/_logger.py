@@ -5,6 +5,13 @@ _logger.py — Structured operational logging for wicked-garden hook scripts.
 Writes one JSONL line per call to $TMPDIR/wicked-ops-{session_id}.jsonl.
 Fail-silent: never raises, never crashes the caller.
 
+Hot-path cost: the effective level is resolved once per process and only
+re-read when the session state file's mtime changes; filtered events return
+before any timestamp or serialization work. Accepted entries are buffered in
+memory and appended in one write at exit (atexit), when the buffer reaches
+_FLUSH_ENTRIES / _FLUSH_BYTES, or on an explicit flush() — long-lived
+processes (the resident hook worker) call flush() after each hook.
+
 Usage:
     from _logger import log
 
@@ -16,8 +23,11 @@ Level hierarchy: normal (0) < verbose (1) < debug (2)
 Effective level is resolved from: WICKED_LOG_LEVEL env var > SessionState.log_level > "normal"
 """
 
+import atexit
 import json
 import os
+import re
+import threading
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -27,6 +37,25 @@ from pathlib import Path
 
 _LEVELS = {"normal": 0, "verbose": 1, "debug": 2}
 
+# Buffer thresholds — whichever is reached first triggers a flush.
+_FLUSH_ENTRIES = 64
+_FLUSH_BYTES = 64 * 1024
+
+_UNSAFE_ID_RE = re.compile(r"[^a-zA-Z0-9\-_]")
+
+# Per-process caches.
+_session_id_cache: tuple = ("", "")   # (raw env value, sanitized id)
+_level_cache: tuple = (None, None, "normal")  # (state path, mtime_ns, level)
+
+# Pending lines keyed by log path (the session id can change in the worker).
+# Hooks may log from worker threads, so the buffer and its counters are only
+# touched under _buffer_lock.
+_buffer: dict = {}
+_buffer_entries = 0
+_buffer_bytes = 0
+_buffer_lock = threading.Lock()
+_atexit_registered = False
+
 
 # ---------------------------------------------------------------------------
 # Internal helpers
@@ -35,16 +64,22 @@ _LEVELS = {"normal": 0, "verbose": 1, "debug": 2}
 
 def _get_session_id() -> str:
     """Read and sanitize CLAUDE_SESSION_ID for use in filenames."""
-    import re
+    global _session_id_cache
     raw = os.environ.get("CLAUDE_SESSION_ID", "unknown")
-    safe = re.sub(r"[^a-zA-Z0-9\-_]", "_", raw)
-    return safe or "unknown"
+    if _session_id_cache[0] == raw and _session_id_cache[1]:
+        return _session_id_cache[1]
+    safe = _UNSAFE_ID_RE.sub("_", raw) or "unknown"
+    _session_id_cache = (raw, safe)
+    return safe
+
+
+def _tmpdir() -> str:
+    return os.environ.get("TMPDIR") or __import__("tempfile").gettempdir()
 
 
 def _log_file(session_id: str) -> Path:
     """Return path to the ops JSONL log file for the given session."""
-    tmpdir = os.environ.get("TMPDIR") or __import__("tempfile").gettempdir()
-    return Path(tmpdir) / f"wicked-ops-{session_id}.jsonl"
+    return Path(_tmpdir()) / f"wicked-ops-{session_id}.jsonl"
 
 
 def _resolve_level() -> str:
@@ -54,7 +89,12 @@ def _resolve_level() -> str:
     1. WICKED_LOG_LEVEL environment variable
     2. SessionState.log_level (read directly from raw JSON — no import)
     3. Default: "normal"
+
+    The session file is parsed only when its path or mtime differs from the
+    cached lookup — one stat() per call otherwise.
     """
+    global _level_cache
+
     # 1. Environment variable (highest priority)
     env = os.environ.get("WICKED_LOG_LEVEL", "").strip().lower()
     if env in _LEVELS:
@@ -62,22 +102,68 @@ def _resolve_level() -> str:
 
     # 2. SessionState JSON file (avoid circular import: read raw JSON directly)
     try:
-        import json as _json
-        _sid = _get_session_id()
-        _tmpdir = os.environ.get("TMPDIR") or __import__("tempfile").gettempdir()
-        _state_path = Path(_tmpdir) / f"wicked-garden-session-{_sid}.json"
-        if _state_path.exists():
-            _data = _json.loads(_state_path.read_text(encoding="utf-8"))
-            _level = _data.get("log_level", "").strip().lower()
-            if _level in _LEVELS:
-                return _level
+        state_path = os.path.join(_tmpdir(), f"wicked-garden-session-{_get_session_id()}.json")
+        try:
+            mtime = os.stat(state_path).st_mtime_ns
+        except OSError:
+            mtime = None
+        cached_path, cached_mtime, cached_level = _level_cache
+        if cached_path == state_path and cached_mtime == mtime:
+            return cached_level
+
+        level = "normal"
+        if mtime is not None:
+            try:
+                with open(state_path, encoding="utf-8") as fh:
+                    data = json.load(fh)
+                candidate = str(data.get("log_level", "") or "").strip().lower()
+                if candidate in _LEVELS:
+                    level = candidate
+            except Exception:
+                pass  # Fail open — use default
+        _level_cache = (state_path, mtime, level)
+        return level
     except Exception:
-        pass  # Fail open — use default
+        pass
 
     # 3. Default
     return "normal"
 
 
+def flush() -> None:
+    """Append all buffered entries to their log files. Never raises."""
+    global _buffer_entries, _buffer_bytes
+    # Held across the writes too, so two threads flushing at once cannot
+    # append their batches to a log file out of order.
+    with _buffer_lock:
+        if not _buffer:
+            return
+        pending = list(_buffer.items())
+        _buffer.clear()
+        _buffer_entries = 0
+        _buffer_bytes = 0
+        for log_path, lines in pending:
+            try:
+                with open(log_path, "a", encoding="utf-8") as fh:
+                    fh.write("".join(lines))
+            except OSError:
+                pass  # I/O errors are silently swallowed
+
+
+def _enqueue(log_path: str, line: str) -> None:
+    global _buffer_entries, _buffer_bytes, _atexit_registered
+    if not _atexit_registered:
+        atexit.register(flush)
+        _atexit_registered = True
+    with _buffer_lock:
+        _buffer.setdefault(log_path, []).append(line)
+        _buffer_entries += 1
+        _buffer_bytes += len(line)
+        full = _buffer_entries >= _FLUSH_ENTRIES or _buffer_bytes >= _FLUSH_BYTES
+    if full:
+        flush()
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -104,12 +190,9 @@ def log(
     This function never raises. All exceptions are silently swallowed.
     """
     try:
-        # Resolve effective level and filter
-        effective_level = _resolve_level()
+        # Resolve effective level and filter — before any serialization work
         event_rank = _LEVELS.get(level, 2)  # Unknown levels treated as debug (most permissive)
-        effective_rank = _LEVELS.get(effective_level, 0)
-
-        if event_rank > effective_rank:
+        if event_rank > _LEVELS.get(_resolve_level(), 0):
             return  # Silently discard — event is more verbose than the threshold
 
         # Build the log entry
@@ -117,17 +200,6 @@ def log(
         ts = datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
         ms_val = round(ms, 2) if ms is not None else None
 
-        # Serialize detail safely
-        detail_val: dict | None
-        if detail is None:
-            detail_val = None
-        else:
-            try:
-                json.dumps(detail)  # Probe serializability
-                detail_val = detail
-            except (TypeError, ValueError):
-                detail_val = {"_raw": str(detail)}
-
         entry = {
             "ts": ts,
             "session": session_id,
@@ -136,16 +208,18 @@ def log(
             "event": event,
             "ok": ok,
             "ms": ms_val,
-            "detail": detail_val,
+            "detail": detail,
         }
 
-        # Write one JSONL line — append mode, no fsync
-        log_path = _log_file(session_id)
+        # Serialize once; fall back to a string detail if it is not JSON-safe
         try:
-            with log_path.open("a", encoding="utf-8") as fh:
-                fh.write(json.dumps(entry) + "\n")
-        except OSError:
-            pass  # I/O errors are silently swallowed
+            line = json.dumps(entry)
+        except (TypeError, ValueError):
+            entry["detail"] = {"_raw": str(detail)}
+            line = json.dumps(entry)
+
+        # Buffered append — no fsync
+        _enqueue(str(_log_file(session_id)), line + "\n")
 
     except Exception:
         pass  # Outer catch — logger must never crash the caller
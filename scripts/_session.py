@@ -11,6 +11,22 @@ State file location:
 
 Atomic writes: write to .tmp, then os.replace — prevents partial reads.
 
+Lost-update-free writes: every save is a field-level merge performed under an
+exclusive lock on ``<state>.lock``. The writer re-reads the file, applies only
+the fields it changed (plus counter deltas from ``increment``) and replaces
+the file, so parallel hooks touching different fields — or bumping the same
+counter — never clobber each other. The file stays plain JSON, so readers that
+do not take the lock (statusline.py) keep working.
+
+Limit: list and dict fields (other than dict-of-int counters bumped through
+``increment(name, key=...)``) merge as whole values — the last writer's list
+wins. Two hooks appending to the same list concurrently can still lose one
+append; fields that need that should be counters or owned by a single hook.
+
+Lock files outlive their state file (see ``SessionState.delete``);
+``purge_stale_locks()`` removes those left by ended sessions and runs from
+the SessionEnd hook.
+
 Usage (hook scripts):
     from _session import SessionState
 
@@ -20,16 +36,37 @@ Usage (hook scripts):
 
     # Or update multiple fields at once:
     state.update(setup_complete=True)
+
+    # Counters — merged as deltas, safe under concurrent writers:
+    state.increment("bash_count")
+
+    # Per-hook transaction: load once, mutate many fields, commit once.
+    # SessionState.load() inside the block returns the same instance and
+    # update()/save()/increment() defer to the single commit on exit.
+    with SessionState.transaction() as state:
+        ...
 """
 
 import json
 import os
 import sys
 import tempfile
+import threading
+import time
+from contextlib import contextmanager
 from dataclasses import asdict, dataclass, field
 from pathlib import Path
 from typing import Any
 
+try:  # POSIX
+    import fcntl
+except ImportError:  # pragma: no cover — Windows
+    fcntl = None
+try:  # Windows
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
 # ---------------------------------------------------------------------------
 # Session ID resolution
 # ---------------------------------------------------------------------------
@@ -63,6 +100,55 @@ def _state_file_path() -> Path:
     return Path(tmpdir) / filename
 
 
+@contextmanager
+def _state_lock(path: Path):
+    """Hold an exclusive lock on ``<path>.lock`` for a read-merge-write cycle.
+
+    Degrades to unlocked (the pre-lock behaviour) when the lock file cannot be
+    opened or the platform offers no advisory locking.
+    """
+    try:
+        fh = open(path.with_suffix(".lock"), "a+b")
+    except OSError:
+        yield
+        return
+    locked = False
+    try:
+        try:
+            if fcntl is not None:
+                fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+                locked = True
+            elif msvcrt is not None:
+                msvcrt.locking(fh.fileno(), msvcrt.LK_LOCK, 1)
+                locked = True
+        except OSError:
+            pass
+        yield
+    finally:
+        if locked:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_UN)
+                else:
+                    msvcrt.locking(fh.fileno(), msvcrt.LK_UNLCK, 1)
+            except OSError:
+                pass
+        fh.close()
+
+
+def _read_state_dict(path: Path) -> "dict | None":
+    """Return the parsed state file, or None if missing / unreadable."""
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except (json.JSONDecodeError, OSError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+# The active per-thread transaction (see SessionState.transaction).
+_TXN = threading.local()
+
+
 # ---------------------------------------------------------------------------
 # SessionState dataclass
 # ---------------------------------------------------------------------------
@@ -395,50 +481,127 @@ class SessionState:
     # Persistence
     # ------------------------------------------------------------------
 
+    def __post_init__(self) -> None:
+        # Change tracking for field-level merges. Plain attributes (not
+        # dataclass fields) so asdict() never serialises them.
+        self._snapshot: dict = asdict(self)
+        self._dirty: set = set()
+        self._deltas: dict = {}
+        self._deleted = False
+
     @classmethod
     def load(cls) -> "SessionState":
         """Load state from the session file.
 
         Returns a fresh default-valued SessionState if the file does not exist
         or contains invalid JSON — ensures hooks never crash on missing state.
+        Inside :meth:`transaction` this returns the transaction's instance.
         """
-        path = _state_file_path()
+        active = getattr(_TXN, "state", None)
+        if active is not None:
+            return active
 
-        if not path.exists():
-            return cls()
-
-        try:
-            raw = path.read_text(encoding="utf-8")
-            data = json.loads(raw)
-        except (json.JSONDecodeError, OSError):
-            # Corrupted or unreadable state — return clean defaults
+        data = _read_state_dict(_state_file_path())
+        if data is None:
+            # Missing, corrupted or unreadable state — return clean defaults
             return cls()
 
         # Build from dict; unknown keys are silently ignored so older state
         # files remain compatible with newer code that adds fields.
         return cls._from_dict(data)
 
-    def save(self) -> None:
-        """Atomically persist the current state to the session file."""
-        path = _state_file_path()
-        tmp_path = path.with_suffix(".tmp")
+    @classmethod
+    @contextmanager
+    def transaction(cls):
+        """Load once, mutate many fields, commit once on exit.
+
+        Nested calls join the outer transaction. The commit also runs when the
+        block raises — hooks are fail-open and previously persisted each
+        update() immediately, so partial progress is kept.
+        """
+        active = getattr(_TXN, "state", None)
+        if active is not None:
+            yield active
+            return
+        state = cls.load()
+        _TXN.state = state
+        try:
+            yield state
+        finally:
+            _TXN.state = None
+            if not state._deleted:
+                state._commit()
 
-        data = asdict(self)
+    def _in_transaction(self) -> bool:
+        return getattr(_TXN, "state", None) is self
 
+    def save(self) -> None:
+        """Persist changed fields (deferred to commit inside a transaction)."""
+        if self._in_transaction():
+            return
+        self._commit()
+
+    def _commit(self) -> None:
+        """Merge this instance's changes into the state file under the lock.
+
+        Changed fields are the explicit update() keys plus any field whose
+        value differs from what was loaded; counter deltas are re-applied to
+        the on-disk value. Afterwards the instance reflects the merged file,
+        including fields other writers changed in the meantime. List and dict
+        fields are replaced whole, not merged element-wise (see module
+        docstring).
+        """
+        current = asdict(self)
+        delta_fields = {name for name, _ in self._deltas}
+        dirty = set(self._dirty) | {
+            k for k, v in current.items()
+            if k not in delta_fields and self._snapshot.get(k) != v
+        }
+        if not dirty and not self._deltas:
+            return
+
+        path = _state_file_path()
         try:
-            tmp_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
-            os.replace(tmp_path, path)
+            with _state_lock(path):
+                merged = _read_state_dict(path)
+                if merged is None:
+                    # No file yet: start from what this instance last saw so
+                    # counter deltas are applied exactly once.
+                    merged = dict(self._snapshot)
+                for k in dirty:
+                    merged[k] = current[k]
+                for (name, key), delta in self._deltas.items():
+                    if key is None:
+                        merged[name] = int(merged.get(name) or 0) + delta
+                    else:
+                        bucket = dict(merged.get(name) or {})
+                        bucket[key] = int(bucket.get(key) or 0) + delta
+                        merged[name] = bucket
+                tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+                tmp_path.write_text(
+                    json.dumps(merged, separators=(",", ":")), encoding="utf-8"
+                )
+                os.replace(tmp_path, path)
         except OSError as exc:
             print(
                 f"[wicked-garden] Failed to save session state: {exc}",
                 file=sys.stderr,
             )
+            return
+
+        for k, v in merged.items():
+            if k in self.__dataclass_fields__:
+                object.__setattr__(self, k, v)
+        self._snapshot = asdict(self)
+        self._dirty.clear()
+        self._deltas.clear()
 
     def update(self, **kwargs: Any) -> None:
         """Update one or more fields and immediately save to disk.
 
         Only recognised field names are applied; unknown keys are silently
         dropped so callers cannot accidentally corrupt the state schema.
+        An explicit value overrides any pending increment() of that field.
 
         Args:
             **kwargs: Field name -> new value pairs.
@@ -447,6 +610,9 @@ class SessionState:
         for key, value in kwargs.items():
             if key in valid_fields:
                 object.__setattr__(self, key, value)
+                self._dirty.add(key)
+                for pending in [d for d in self._deltas if d[0] == key]:
+                    del self._deltas[pending]
             else:
                 print(
                     f"[wicked-garden] SessionState.update: unknown field {key!r} ignored",
@@ -454,6 +620,31 @@ class SessionState:
                 )
         self.save()
 
+    def increment(self, name: str, delta: int = 1, key: "str | None" = None) -> int:
+        """Atomically add ``delta`` to an int field (or to ``field[key]`` of a
+        dict-of-ints field) and return the new value.
+
+        The delta — not the absolute value — is merged at save time, so two
+        hooks bumping the same counter concurrently both count.
+        """
+        if name not in self.__dataclass_fields__:
+            print(
+                f"[wicked-garden] SessionState.increment: unknown field {name!r} ignored",
+                file=sys.stderr,
+            )
+            return 0
+        if key is None:
+            object.__setattr__(self, name, int(getattr(self, name) or 0) + delta)
+        else:
+            bucket = dict(getattr(self, name) or {})
+            bucket[key] = int(bucket.get(key) or 0) + delta
+            object.__setattr__(self, name, bucket)
+        if name not in self._dirty:
+            self._deltas[(name, key)] = self._deltas.get((name, key), 0) + delta
+        self.save()
+        value = getattr(self, name)
+        return int(value if key is None else (value or {}).get(key, 0))
+
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -471,9 +662,7 @@ class SessionState:
 
     def increment_turn(self) -> int:
         """Increment turn_count, persist, and return the new value."""
-        self.turn_count += 1
-        self.save()
-        return self.turn_count
+        return self.increment("turn_count")
 
     # ------------------------------------------------------------------
     # Session file cleanup (called by stop.py)
@@ -482,13 +671,59 @@ class SessionState:
     def delete(self) -> None:
         """Remove the session state file at session end.
 
-        Silently succeeds if the file does not exist.
+        Silently succeeds if the file does not exist. Inside a transaction the
+        pending commit is dropped so the file is not recreated.
+
+        The file is removed under the state lock so it cannot race a
+        concurrent merge. The ``.lock`` file itself is left in place: another
+        process may hold or be waiting on it, and unlinking it would let the
+        next writer lock a fresh inode alongside them.
         """
+        self._deleted = True
         path = _state_file_path()
         try:
-            path.unlink(missing_ok=True)
+            with _state_lock(path):
+                path.unlink(missing_ok=True)
         except OSError as exc:
             print(
                 f"[wicked-garden] Failed to delete session state file: {exc}",
                 file=sys.stderr,
             )
+
+
+def purge_stale_locks(max_age_s: float = 3600.0) -> int:
+    """Remove ``.lock`` files left behind by sessions whose state file is gone.
+
+    A lock is removed only when its state file no longer exists, it was
+    created more than ``max_age_s`` ago, it is not the current session's, and
+    a non-blocking exclusive lock on it succeeds — so a lock another process
+    holds or waits on is never unlinked. POSIX only; returns the number
+    removed and never raises.
+    """
+    if fcntl is None:
+        return 0
+    current = _state_file_path().with_suffix(".lock")
+    cutoff = time.time() - max_age_s
+    removed = 0
+    try:
+        candidates = list(current.parent.glob("wicked-garden-session-*.lock"))
+    except OSError:
+        return 0
+    for lock_path in candidates:
+        try:
+            if (
+                lock_path == current
+                or lock_path.with_suffix(".json").exists()
+                or lock_path.stat().st_mtime > cutoff
+            ):
+                continue
+            with open(lock_path, "a+b") as fh:
+                try:
+                    fcntl.flock(fh.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    continue  # in use
+                lock_path.unlink()
+                removed += 1
+        except OSError:
+            continue
+    return removed
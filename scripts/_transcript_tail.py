@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+"""
+_transcript_tail.py — Incremental reads of the session transcript JSONL.
+
+The Stop hook fires every turn and the transcript only grows, yet both
+transcript readers used to re-read it from the top (stop.py's claim
+sentinel) or re-scan a fixed tail window (the session fact extractor).
+This module keeps a small per-transcript index in
+$TMPDIR/wicked-transcript-tail-{hash}.json so each Stop reads only the
+bytes appended since the previous one:
+
+    {"assistant": {"offset": N, "fp": "...", "text": "..."},
+     "cursors":   {"facts": {"offset": N, "fp": "..."}}}
+
+- ``assistant`` caches the text of the last assistant message up to
+  ``offset``. First use seeks backwards from EOF in blocks until an
+  assistant message turns up, instead of parsing the whole file.
+- ``cursors`` are named byte cursors for line consumers. First use starts
+  from the last ``tail_lines`` lines (the old fixed window).
+
+Every offset carries a fingerprint of the bytes just before it. A file that
+was truncated, rewritten or replaced fails the check and is re-read as if
+seen for the first time. A trailing line without a newline is consumed only
+when it already parses as JSON (a half-written record never does).
+
+Usage:
+    from _transcript_tail import final_assistant_text, iter_new_lines
+
+    text = final_assistant_text(transcript_path)
+    for raw in iter_new_lines(transcript_path, "facts", tail_lines=400):
+        ...
+
+Fail-open: I/O or parse errors degrade to a fresh read, never raise.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+_BLOCK = 64 * 1024
+_FP_BYTES = 64
+
+
+# ---------------------------------------------------------------------------
+# Index persistence
+# ---------------------------------------------------------------------------
+
+
+def _index_path(transcript_path: str) -> Path:
+    key = hashlib.sha256(os.path.abspath(transcript_path).encode("utf-8")).hexdigest()[:16]
+    tmpdir = os.environ.get("TMPDIR") or tempfile.gettempdir()
+    return Path(tmpdir) / f"wicked-transcript-tail-{key}.json"
+
+
+def _load_index(transcript_path: str) -> dict:
+    try:
+        data = json.loads(_index_path(transcript_path).read_text(encoding="utf-8"))
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_index(transcript_path: str, index: dict) -> None:
+    path = _index_path(transcript_path)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        tmp.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def _fingerprint(fh, offset: int) -> str:
+    start = max(0, offset - _FP_BYTES)
+    fh.seek(start)
+    return hashlib.sha1(fh.read(offset - start)).hexdigest()[:16]
+
+
+def _resume_offset(fh, size: int, entry) -> Optional[int]:
+    """Return the stored offset if it still describes this file, else None."""
+    if not isinstance(entry, dict):
+        return None
+    offset = entry.get("offset")
+    if not isinstance(offset, int) or offset < 0 or offset > size:
+        return None
+    if entry.get("fp") != _fingerprint(fh, offset):
+        return None
+    return offset
+
+
+# ---------------------------------------------------------------------------
+# Line splitting
+# ---------------------------------------------------------------------------
+
+
+def _is_complete(fragment: bytes) -> bool:
+    """True when a newline-less trailing fragment is a whole JSON record."""
+    try:
+        json.loads(fragment)
+        return True
+    except ValueError:
+        return False
+
+
+def _split_forward(data: bytes, base: int) -> Tuple[List[Tuple[bytes, int]], int]:
+    """Split ``data`` read at ``base`` into (line, end_offset) pairs.
+
+    Returns the lines and the offset just past the last consumed one.
+    """
+    lines: List[Tuple[bytes, int]] = []
+    pos = 0
+    while True:
+        nl = data.find(b"\n", pos)
+        if nl < 0:
+            break
+        lines.append((data[pos:nl], base + nl + 1))
+        pos = nl + 1
+    rest = data[pos:]
+    if rest.strip() and _is_complete(rest):
+        lines.append((rest, base + len(data)))
+        pos = len(data)
+    return lines, base + pos
+
+
+def _read_tail(fh, size: int, max_lines: int) -> Tuple[List[Tuple[bytes, int]], int]:
+    """Read backwards from EOF until ``max_lines`` lines are available."""
+    start = size
+    data = b""
+    while start > 0 and data.count(b"\n") <= max_lines:
+        step = min(_BLOCK, start)
+        start -= step
+        fh.seek(start)
+        data = fh.read(step) + data
+    if start > 0:
+        # Drop the partial first line — it belongs to an earlier window.
+        cut = data.find(b"\n") + 1
+        data, start = data[cut:], start + cut
+    lines, end = _split_forward(data, start)
+    return lines[-max_lines:], end
+
+
+# ---------------------------------------------------------------------------
+# Last assistant message
+# ---------------------------------------------------------------------------
+
+
+def _extract_text(content) -> Optional[str]:
+    if isinstance(content, str):
+        return content or None
+    if isinstance(content, list):
+        parts = [b["text"] for b in content
+                 if isinstance(b, dict) and b.get("type") == "text" and b.get("text")]
+        return "\n".join(parts) if parts else None
+    return None
+
+
+def _assistant_text(raw: bytes) -> Optional[str]:
+    """Text of one raw transcript line if it is an assistant message."""
+    line = raw.decode("utf-8", errors="ignore").strip()
+    if not line:
+        return None
+    try:
+        rec = json.loads(line)
+    except ValueError:
+        return None
+    if not isinstance(rec, dict):
+        return None
+    msg = rec.get("message") if isinstance(rec.get("message"), dict) else None
+    role = (msg or {}).get("role") or rec.get("role") or rec.get("type")
+    if role != "assistant":
+        return None
+    return _extract_text((msg or {}).get("content", rec.get("content")))
+
+
+def _consumed_end(fh, size: int) -> int:
+    """Offset just past the last whole line (see _split_forward)."""
+    pos = size
+    tail = b""
+    while pos > 0:
+        step = min(_BLOCK, pos)
+        pos -= step
+        fh.seek(pos)
+        tail = fh.read(step) + tail
+        nl = tail.rfind(b"\n")
+        if nl >= 0:
+            fragment, last_nl = tail[nl + 1:], pos + nl + 1
+            break
+    else:
+        fragment, last_nl = tail, 0
+    if not fragment.strip() or _is_complete(fragment):
+        return size
+    return last_nl
+
+
+def _scan_back_for_assistant(fh, size: int) -> Tuple[Optional[str], int]:
+    """Seek backwards from EOF to the last assistant message with text."""
+    end = _consumed_end(fh, size)
+    pos = end
+    carry = b""
+    while pos > 0:
+        step = min(_BLOCK, pos)
+        pos -= step
+        fh.seek(pos)
+        parts = (fh.read(step) + carry).split(b"\n")
+        # parts[0] may be a partial line unless this block starts the file.
+        carry = parts[0] if pos > 0 else b""
+        for raw in reversed(parts[1:] if pos > 0 else parts):
+            text = _assistant_text(raw)
+            if text:
+                return text, end
+    return None, end
+
+
+def final_assistant_text(transcript_path: str) -> Optional[str]:
+    """Return the text of the LAST assistant message in the transcript, or None.
+
+    Reads only the bytes appended since the previous call for this path.
+    """
+    try:
+        with open(transcript_path, "rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            index = _load_index(transcript_path)
+            entry = index.get("assistant")
+            offset = _resume_offset(fh, size, entry)
+            if offset is None:
+                text, end = _scan_back_for_assistant(fh, size)
+            else:
+                text = entry.get("text")
+                fh.seek(offset)
+                lines, end = _split_forward(fh.read(size - offset), offset)
+                for raw, _off in lines:
+                    found = _assistant_text(raw)
+                    if found:
+                        text = found
+            index["assistant"] = {"offset": end, "fp": _fingerprint(fh, end), "text": text}
+        _save_index(transcript_path, index)
+        return text
+    except OSError:
+        return None
+
+
+# ---------------------------------------------------------------------------
+# Named line cursors
+# ---------------------------------------------------------------------------
+
+
+def iter_new_lines(transcript_path: str, consumer: str, tail_lines: int = 400) -> Iterator[bytes]:
+    """Yield raw transcript lines appended since ``consumer`` last read.
+
+    First use (or an invalidated cursor) yields from the last ``tail_lines``
+    lines; blank lines are skipped. The cursor moves past a line once the caller asks for
+    the next one — or at exhaustion — so a caller that stops early re-sees
+    the line it was holding on the next call.
+    """
+    try:
+        with open(transcript_path, "rb") as fh:
+            size = os.fstat(fh.fileno()).st_size
+            index = _load_index(transcript_path)
+            cursors = index.get("cursors") if isinstance(index.get("cursors"), dict) else {}
+            offset = _resume_offset(fh, size, cursors.get(consumer))
+            if offset is None:
+                lines, end = _read_tail(fh, size, tail_lines)
+            else:
+                fh.seek(offset)
+                lines, end = _split_forward(fh.read(size - offset), offset)
+            fps = {off: _fingerprint(fh, off) for _line, off in lines}
+            fps[end] = _fingerprint(fh, end)
+    except OSError:
+        return
+
+    consumed = None if offset is None else offset
+    try:
+        for raw, off in lines:
+            if raw.strip():
+                yield raw
+            consumed = off
+        consumed = end
+    finally:
+        # A first-use read abandoned before its first line leaves no cursor.
+        if consumed is not None and (consumed != offset):
+            index = _load_index(transcript_path)
+            cursors = index.get("cursors") if isinstance(index.get("cursors"), dict) else {}
+            cursors[consumer] = {"offset": consumed, "fp": fps[consumed]}
+            index["cursors"] = cursors
+            _save_index(transcript_path, index)
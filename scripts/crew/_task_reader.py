@@ -31,6 +31,12 @@ Cold-start behavior:
   back to file read silently, so is blip-free at the cost of one extra
   file-scan per restart cycle.
 
+Projection coverage:
+  The daemon backfills the task files into its projection on start and
+  answers ``/tasks`` with 404 (not ``[]``) for a session or chain it holds no
+  task for, so an empty daemon result is a real answer and an unprojected one
+  takes the same direct-read fallback as any other HTTP error.
+
 R3: all constants named.
 R5: explicit timeout on every HTTP call; bounded iterdir scan preserved.
 """
@@ -191,7 +197,7 @@ def get_task_metadata(session_id: str, task_id: str) -> dict | None:
 
     # Daemon path.
     try:
-        row = _daemon_get(f"/tasks/{task_id}")
+        row = _daemon_get(f"/tasks/{task_id}?session={session_id}")
         if row and isinstance(row, dict):
             meta = row.get("metadata")
             return meta if isinstance(meta, dict) else None
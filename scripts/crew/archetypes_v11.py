@@ -52,7 +52,7 @@ import json
 import re
 import sys
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 
 _THIS_DIR = Path(__file__).resolve().parent
@@ -74,7 +74,92 @@ def load_catalog(path: Optional[Path] = None) -> Dict[str, Any]:
     return json.loads(catalog_path.read_text(encoding="utf-8"))
 
 
-def _phrase_score(prompt_lower: str, phrases: List[str]) -> Tuple[float, List[str]]:
+# Parsed default catalog, keyed by the file's (mtime_ns, size). Shared
+# and treated as read-only — detect_archetypes / steering_directives
+# only ever read it; load_catalog() keeps returning a fresh dict.
+_catalog_cache: Dict[str, Any] = {"key": None, "catalog": None}
+
+
+def _default_catalog() -> Dict[str, Any]:
+    """Return the default catalog, re-parsing only when the file changes."""
+    st = _CATALOG_PATH.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    if _catalog_cache["key"] != key:
+        _catalog_cache["catalog"] = load_catalog()
+        _catalog_cache["key"] = key
+    return _catalog_cache["catalog"]
+
+
+# ---------------------------------------------------------------------------
+# Phrase matching
+# ---------------------------------------------------------------------------
+
+_WORD_RE = re.compile(r"\w+")
+_PLAIN_WORD_RE = re.compile(r"\w+\Z")
+
+
+class _PhraseMatcher:
+    """Every catalog phrase compiled once; one tokenizing pass per prompt.
+
+    Keeps ``_phrase_score``'s matching rules exactly:
+      * single-word phrases made of word characters — ``\\bword\\b`` is
+        true iff the word is a whole ``\\w+`` run of the prompt, so they
+        reduce to a set lookup against the prompt's tokens;
+      * multi-word phrases — plain substring containment;
+      * anything else (``trade-off``) — a precompiled ``\\b...\\b`` regex.
+    """
+
+    __slots__ = ("words", "substrings", "patterns")
+
+    def __init__(self, phrases: Iterable[str]) -> None:
+        self.words: Set[str] = set()
+        self.substrings: List[str] = []
+        self.patterns: List[Tuple[str, "re.Pattern[str]"]] = []
+        for phrase in dict.fromkeys(phrases):
+            if " " in phrase:
+                self.substrings.append(phrase)
+            elif _PLAIN_WORD_RE.match(phrase):
+                self.words.add(phrase)
+            else:
+                self.patterns.append(
+                    (phrase, re.compile(rf"\b{re.escape(phrase)}\b", re.IGNORECASE))
+                )
+
+    def hits(self, prompt_lower: str) -> Set[str]:
+        """Return the set of phrases present in ``prompt_lower``."""
+        found = self.words.intersection(_WORD_RE.findall(prompt_lower))
+        found.update(p for p in self.substrings if p in prompt_lower)
+        found.update(p for p, pattern in self.patterns if pattern.search(prompt_lower))
+        return found
+
+
+# Compiled matchers keyed by the catalog's full phrase tuple, so a catalog
+# override (tests, callers passing catalog=) gets its own matcher and an
+# edited catalog file never reuses a stale one.
+_matcher_cache: Dict[Tuple[str, ...], _PhraseMatcher] = {}
+_MATCHER_CACHE_MAX = 8
+
+
+def _matcher_for(archetypes: Dict[str, Any]) -> _PhraseMatcher:
+    """Return the compiled phrase matcher for an ``archetypes`` mapping."""
+    phrases = tuple(
+        phrase
+        for archetype in archetypes.values()
+        for phrase in ((archetype.get("signals") or {}).get("phrases") or [])
+    )
+    matcher = _matcher_cache.get(phrases)
+    if matcher is None:
+        if len(_matcher_cache) >= _MATCHER_CACHE_MAX:
+            _matcher_cache.clear()
+        matcher = _matcher_cache[phrases] = _PhraseMatcher(phrases)
+    return matcher
+
+
+def _phrase_score(
+    prompt_lower: str,
+    phrases: List[str],
+    matched: Optional[Set[str]] = None,
+) -> Tuple[float, List[str]]:
     """Score how strongly the prompt matches a phrase list.
 
     First match scores 0.55 (above MEDIUM_CONFIDENCE so a single strong
@@ -86,18 +171,14 @@ def _phrase_score(prompt_lower: str, phrases: List[str]) -> Tuple[float, List[st
     'implement' / 'outage' / 'migrate' — they are intentionally
     high-signal. One should be enough to fire 'suggest' strength; two
     should escalate to 'recommend'.
+
+    ``matched`` is the phrase set already found in the prompt by a
+    catalog-wide ``_PhraseMatcher``; when omitted, ``phrases`` are
+    matched directly. Hits keep the order of ``phrases`` either way.
     """
-    hits: List[str] = []
-    for phrase in phrases:
-        # Word-boundary match for short phrases; substring for multi-word
-        # (multi-word phrases are inherently boundary-safe).
-        if " " in phrase:
-            if phrase in prompt_lower:
-                hits.append(phrase)
-        else:
-            pattern = re.compile(rf"\b{re.escape(phrase)}\b", re.IGNORECASE)
-            if pattern.search(prompt_lower):
-                hits.append(phrase)
+    if matched is None:
+        matched = _PhraseMatcher(phrases).hits(prompt_lower)
+    hits = [phrase for phrase in phrases if phrase in matched]
     if not hits:
         return 0.0, []
     score = 0.55 + 0.2 * (len(hits) - 1)
@@ -137,19 +218,21 @@ def _detect_one_archetype(
     archetype: Dict[str, Any],
     prompt_lower: str,
     signals: Dict[str, Any],
+    matched: Optional[Set[str]] = None,
 ) -> Tuple[float, List[str]]:
     """Score a single archetype against the prompt + signals.
 
     Returns (combined_score, evidence). Combined score is the max of
     phrase score and signal score plus 0.1 if both are non-zero
-    (concordance bonus), capped at 1.0.
+    (concordance bonus), capped at 1.0. ``matched`` is forwarded to
+    ``_phrase_score``.
     """
     arch_signals = archetype.get("signals") or {}
     if arch_signals.get("always_on"):
         return 1.0, ["always_on"]
 
     phrase_list = list(arch_signals.get("phrases") or [])
-    p_score, p_hits = _phrase_score(prompt_lower, phrase_list)
+    p_score, p_hits = _phrase_score(prompt_lower, phrase_list, matched)
     s_score, s_hits = _signal_score(arch_signals, signals)
 
     if p_score == 0 and s_score == 0:
@@ -189,17 +272,19 @@ def detect_archetypes(
     item returned, the caller should ask a clarifying question rather
     than dispatch.
     """
-    catalog = catalog or load_catalog()
+    catalog = catalog or _default_catalog()
     archetypes = catalog.get("archetypes", {})
     prompt_lower = (prompt or "").lower()
     signals = signals or {}
+    # One matching pass over the prompt covers every archetype.
+    matched = _matcher_for(archetypes).hits(prompt_lower)
 
     matches: List[Tuple[str, float, List[str]]] = []
     for name, archetype in archetypes.items():
         if name == "triage":
             continue  # always-on; appended last
         score, evidence = _detect_one_archetype(
-            name, archetype, prompt_lower, signals,
+            name, archetype, prompt_lower, signals, matched,
         )
         if score >= threshold:
             matches.append((name, round(score, 3), evidence))
@@ -246,7 +331,7 @@ def steering_directives(
     triage at the bottom of the match list adds an informational
     directive only if it is the *sole* match (no clear shape detected).
     """
-    catalog = catalog or load_catalog()
+    catalog = catalog or _default_catalog()
     archetypes = catalog.get("archetypes", {})
     signals = signals or {}
     sole_match = len(matches) == 1 and matches[0][0] == "triage"
@@ -219,6 +219,7 @@ def _iter_task_records(session_id: str) -> Iterable[dict]:
 _TRANSCRIPT_TAIL_LINES = 400   # per-turn Stop scans the recent window; earlier
                                # turns were scanned by earlier Stops.
 _TRANSCRIPT_MAX_TEXT = 8000    # cap a single message's text (defensive)
+_TRANSCRIPT_CURSOR = "facts"   # _transcript_tail cursor name for Stop reads
 
 
 def _message_text(entry: dict) -> str:
@@ -240,17 +241,36 @@ def _message_text(entry: dict) -> str:
     return ""
 
 
-def _iter_transcript_texts(transcript_path: str) -> Iterable[str]:
-    """Yield user/assistant text blocks from the transcript JSONL tail."""
+def _iter_transcript_lines(transcript_path: str, incremental: bool) -> Iterable[str]:
+    """Raw transcript lines: the fixed tail window, or (``incremental``) only
+    the lines appended since the previous incremental read — a persisted byte
+    cursor in scripts/_transcript_tail.py. Fails open to the tail window."""
+    if incremental:
+        try:
+            _scripts = str(Path(__file__).resolve().parents[1])
+            if _scripts not in sys.path:
+                sys.path.insert(0, _scripts)
+            from _transcript_tail import iter_new_lines
+        except Exception:
+            incremental = False
+    if incremental:
+        for raw in iter_new_lines(transcript_path, _TRANSCRIPT_CURSOR,
+                                  tail_lines=_TRANSCRIPT_TAIL_LINES):
+            yield raw.decode("utf-8", errors="replace")
+        return
     try:
-        path = Path(transcript_path)
-        if not path.is_file():
-            return
-        with path.open(encoding="utf-8", errors="replace") as fh:
+        with open(transcript_path, encoding="utf-8", errors="replace") as fh:
             tail = deque(fh, maxlen=_TRANSCRIPT_TAIL_LINES)
     except OSError:
         return
-    for line in tail:
+    yield from tail
+
+
+def _iter_transcript_texts(transcript_path: str, incremental: bool = False) -> Iterable[str]:
+    """Yield user/assistant text blocks from the transcript JSONL tail."""
+    if not Path(transcript_path).is_file():
+        return
+    for line in _iter_transcript_lines(transcript_path, incremental):
         line = line.strip()
         if not line:
             continue
@@ -263,18 +283,24 @@ def _iter_transcript_texts(transcript_path: str) -> Iterable[str]:
             yield text
 
 
-def extract_transcript_facts(transcript_path: str, limit: int = 10) -> list:
+def extract_transcript_facts(
+    transcript_path: str,
+    limit: int = 10,
+    incremental: bool = False,
+) -> list:
     """Extract facts from the session transcript's recent turns.
 
     Same patterns and dedup as the task source; `source` is marked
-    "transcript" so consumers can tell the two apart. Fails open.
+    "transcript" so consumers can tell the two apart. With `incremental`
+    (the per-turn Stop hook) only lines appended since the previous
+    incremental call are scanned. Fails open.
     """
     if not transcript_path or limit <= 0:
         return []
     facts: list = []
     seen: set = set()
     try:
-        for text in _iter_transcript_texts(transcript_path):
+        for text in _iter_transcript_texts(transcript_path, incremental):
             for fact in _extract_from_text(text, task_id="transcript"):
                 fact.source = "transcript"
                 key = fact.content.lower()
@@ -381,6 +407,7 @@ def extract_session_facts(
     session_id: str,
     limit: int = 10,
     transcript_path: Optional[str] = None,
+    incremental: bool = False,
 ) -> list:
     """Extract session-level facts from native task records + the transcript.
 
@@ -389,6 +416,8 @@ def extract_session_facts(
     is what actually feeds the pipeline in practice, since native task files
     exist for almost no session (the auto-memorize starvation, task #76).
 
+    `incremental` is forwarded to extract_transcript_facts.
+
     Returns a list of SessionFact objects (up to `limit`), deduplicated by
     lowercased content. Fails open — returns [] on any error.
 
@@ -423,7 +452,7 @@ def extract_session_facts(
         return facts
 
     if transcript_path and len(facts) < limit:
-        for fact in extract_transcript_facts(transcript_path, limit - len(facts)):
+        for fact in extract_transcript_facts(transcript_path, limit - len(facts), incremental):
             key = fact.content.lower()
             if key in seen:
                 continue
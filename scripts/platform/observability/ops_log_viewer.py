@@ -6,12 +6,15 @@ Reads $TMPDIR/wicked-ops-{session_id}.jsonl and formats output.
 
 Usage:
     python3 ops_log_viewer.py [--tail N] [--level LEVEL] [--json] [--session ID]
+    python3 ops_log_viewer.py --latency [--json] [--session ID]
 
 Flags:
     --tail N       Show only the last N entries (after filtering)
     --level LEVEL  Show only entries at LEVEL or more verbose (normal|verbose|debug)
     --json         Output raw JSONL lines instead of human-readable format
     --session ID   Read from $TMPDIR/wicked-ops-{ID}.jsonl instead of current session
+    --latency      Report per-hook / per-handler latency percentiles from
+                   $TMPDIR/wicked-latency-{session_id}.jsonl (scripts/_latency.py)
 """
 
 import argparse
@@ -22,6 +25,8 @@ import re
 import sys
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
 # Level hierarchy: lower rank = coarser (less verbose), higher rank = finer (more verbose)
 _LEVELS = {"normal": 0, "verbose": 1, "debug": 2}
 
@@ -35,27 +40,27 @@ def _get_session_id() -> str:
     return safe or ""
 
 
-def _find_log_file(session_id: str | None) -> Path | None:
-    """Resolve the ops log file path.
+def _find_log_file(session_id: str | None, prefix: str = "wicked-ops") -> Path | None:
+    """Resolve the ops log file path (or the latency file with prefix="wicked-latency").
 
     Resolution order:
     1. --session flag (explicit session ID)
     2. CLAUDE_SESSION_ID env var
-    3. Glob $TMPDIR/wicked-ops-*.jsonl — most recently modified if multiple
+    3. Glob $TMPDIR/{prefix}-*.jsonl — most recently modified if multiple
     """
     tmpdir = os.environ.get("TMPDIR") or __import__("tempfile").gettempdir()
 
     if session_id:
-        return Path(tmpdir) / f"wicked-ops-{session_id}.jsonl"
+        return Path(tmpdir) / f"{prefix}-{session_id}.jsonl"
 
     env_sid = _get_session_id()
     if env_sid:
-        candidate = Path(tmpdir) / f"wicked-ops-{env_sid}.jsonl"
+        candidate = Path(tmpdir) / f"{prefix}-{env_sid}.jsonl"
         if candidate.exists():
             return candidate
 
-    # Glob for any ops log in TMPDIR
-    pattern = str(Path(tmpdir) / "wicked-ops-*.jsonl")
+    # Glob for any log of this kind in TMPDIR
+    pattern = str(Path(tmpdir) / f"{prefix}-*.jsonl")
     matches = glob.glob(pattern)
     if not matches:
         return None
@@ -135,6 +140,55 @@ def _no_file_message(session_id: str | None) -> str:
     return "\n".join(lines)
 
 
+# HOT-path SLO from prompt_submit.py — rows whose p95 exceeds it are flagged.
+_SLO_P95_MS = 100.0
+_SLOWEST_N = 5
+
+
+def _latency_report(path: Path, as_json: bool) -> int:
+    """Print p50/p95/p99 per (hook, handler) and the slowest handlers."""
+    from _latency import TOTAL, load
+
+    hists = load(path)
+    if not hists:
+        print(f"No latency samples in {path}.")
+        return 0
+
+    rows = []
+    for (hook, handler), h in sorted(hists.items()):
+        rows.append({
+            "hook": hook,
+            "handler": handler,
+            "n": h.n,
+            "p50_ms": h.percentile(0.50),
+            "p95_ms": h.percentile(0.95),
+            "p99_ms": h.percentile(0.99),
+            "max_ms": round(h.max_ms, 1),
+            "mean_ms": round(h.sum_ms / h.n, 1) if h.n else 0.0,
+        })
+
+    if as_json:
+        for row in rows:
+            print(json.dumps(row))
+        return 0
+
+    print(f"{'hook':<18}  {'handler':<32}  {'n':>6}  {'p50':>7}  {'p95':>7}  {'p99':>7}  {'max':>8}")
+    for row in rows:
+        flag = "  !" if row["p95_ms"] > _SLO_P95_MS else ""
+        print(f"{row['hook']:<18}  {row['handler'][:32]:<32}  {row['n']:>6}  "
+              f"{row['p50_ms']:>7.1f}  {row['p95_ms']:>7.1f}  {row['p99_ms']:>7.1f}  "
+              f"{row['max_ms']:>8.1f}{flag}")
+
+    handlers = [r for r in rows if r["handler"] != TOTAL]
+    if handlers:
+        print()
+        print(f"Slowest handlers (by p95; ! = p95 over {_SLO_P95_MS:.0f}ms):")
+        for row in sorted(handlers, key=lambda r: (r["p95_ms"], r["max_ms"]), reverse=True)[:_SLOWEST_N]:
+            print(f"  {row['hook']}:{row['handler']}  p95={row['p95_ms']:.0f}ms  "
+                  f"max={row['max_ms']:.1f}ms  n={row['n']}")
+    return 0
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(
         description="View wicked-garden operational logs for a session."
@@ -147,8 +201,17 @@ def main() -> int:
                         help="Output raw JSONL lines")
     parser.add_argument("--session", type=str, default=None, metavar="ID",
                         help="Read from $TMPDIR/wicked-ops-{ID}.jsonl")
+    parser.add_argument("--latency", action="store_true",
+                        help="Report hook latency percentiles instead of log entries")
     args = parser.parse_args()
 
+    if args.latency:
+        latency_path = _find_log_file(args.session, prefix="wicked-latency")
+        if latency_path is None or not latency_path.exists():
+            print("No latency file found for this session.")
+            return 0
+        return _latency_report(latency_path, args.json)
+
     log_path = _find_log_file(args.session)
 
     if log_path is None or not log_path.exists():
@@ -64,10 +64,10 @@ def _query_events(prompt: str) -> list:
 
         results = []
 
-        # Strategy 1: FTS search with prompt keywords
+        # Strategy 1: FTS search with prompt keywords, best matches first
         keywords = _extract_keywords(prompt)
         if keywords:
-            fts_results = EventStore.query(fts=keywords, since="30d", limit=10)
+            fts_results = EventStore.query(fts=keywords, since="30d", limit=10, rank=True)
             results.extend(fts_results)
 
         # Strategy 2: Recent high-value events (last 7 days)
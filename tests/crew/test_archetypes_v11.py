@@ -317,5 +317,67 @@ class TestArchetypeProveHints(unittest.TestCase):
         self.assertEqual(ps._with_prove_hints(base, ["explore"]), base)
 
 
+class TestCompiledMatcher(unittest.TestCase):
+    """The catalog-wide matcher must agree with per-phrase matching."""
+
+    @staticmethod
+    def _reference_hits(prompt_lower, phrases):
+        import re
+        hits = []
+        for phrase in phrases:
+            if " " in phrase:
+                if phrase in prompt_lower:
+                    hits.append(phrase)
+            elif re.search(rf"\b{re.escape(phrase)}\b", prompt_lower, re.IGNORECASE):
+                hits.append(phrase)
+        return hits
+
+    def test_matches_reference_on_catalog_phrases(self):
+        archetypes = av.load_catalog()["archetypes"]
+        matcher = av._matcher_for(archetypes)
+        prompts = [
+            "should we use postgres or a queue? what should we pick",
+            "post-mortem for the outage, trade-off analysis",
+            "deploys are broken in prod",  # 'deploys' must not hit 'deploy'
+            "x or y",
+            "boxes or yaks",  # multi-word substring semantics preserved
+            "",
+        ]
+        for prompt in prompts:
+            hits = matcher.hits(prompt)
+            for archetype in archetypes.values():
+                phrases = (archetype.get("signals") or {}).get("phrases") or []
+                self.assertEqual(
+                    self._reference_hits(prompt, phrases),
+                    [p for p in phrases if p in hits],
+                    prompt,
+                )
+
+    def test_phrase_score_without_matcher_is_unchanged(self):
+        self.assertEqual(av._phrase_score("fix the bug", ["fix", "bug"]),
+                         (0.75, ["fix", "bug"]))
+        self.assertEqual(av._phrase_score("prefix", ["fix"]), (0.0, []))
+
+    def test_override_catalog_gets_its_own_matcher(self):
+        catalog = {"archetypes": {
+            "build": {"signals": {"phrases": ["zorbify"]}},
+            "triage": {"signals": {"always_on": True}},
+        }}
+        matches = av.detect_archetypes("please zorbify it", catalog=catalog)
+        self.assertEqual(matches[0][0], "build")
+        self.assertEqual(matches[0][2], ["zorbify"])
+
+    def test_default_catalog_parsed_once_per_mtime(self):
+        from unittest.mock import patch
+        av._catalog_cache.update(key=None, catalog=None)
+        with patch.object(av, "load_catalog", wraps=av.load_catalog) as spy:
+            av.detect_archetypes("implement a search box")
+            av.detect_archetypes("roll out the release")
+            self.assertEqual(spy.call_count, 1)
+            av._catalog_cache["key"] = (0, 0)  # simulate an edited file
+            av.detect_archetypes("implement a search box")
+            self.assertEqual(spy.call_count, 2)
+
+
 if __name__ == "__main__":
     unittest.main()
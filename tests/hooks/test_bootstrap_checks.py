@@ -0,0 +1,119 @@
+"""Tests for bootstrap.py's parallel checks and cross-session probe cache.
+
+The independent SessionStart checks run on a bounded daemon-thread pool with
+per-check deadlines; a missed deadline or a raising check yields the fail-open
+default. Plugin readiness probes are cached by binary path + mtime + plugin
+version, and auth failures are never cached.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_HOOKS = str(_REPO_ROOT / "hooks" / "scripts")
+if _HOOKS not in sys.path:
+    sys.path.insert(0, _HOOKS)
+
+import bootstrap  # noqa: E402
+
+
+class ParallelChecks(unittest.TestCase):
+    def test_checks_run_concurrently(self):
+        def slow():
+            time.sleep(0.3)
+            return "note"
+
+        with patch.object(bootstrap, "_check_vault_dependency", slow), \
+                patch.object(bootstrap, "_check_bus_dependency", slow):
+            t0 = time.monotonic()
+            checks = bootstrap._ParallelChecks(
+                ("_check_vault_dependency", "_check_bus_dependency"), workers=2)
+            self.assertEqual(checks.result("_check_vault_dependency"), "note")
+            self.assertEqual(checks.result("_check_bus_dependency"), "note")
+            self.assertLess(time.monotonic() - t0, 0.55)
+
+    def test_missed_deadline_returns_default(self):
+        with patch.object(bootstrap, "_probe_plugin_readiness",
+                          lambda: time.sleep(2) or [{"name": "x"}]), \
+                patch.dict(bootstrap._CHECK_DEADLINES_S, {"_probe_plugin_readiness": 0.05}):
+            checks = bootstrap._ParallelChecks(("_probe_plugin_readiness",))
+            t0 = time.monotonic()
+            self.assertEqual(checks.result("_probe_plugin_readiness", []), [])
+            self.assertLess(time.monotonic() - t0, 0.5)
+
+    def test_raising_check_returns_default(self):
+        def boom():
+            raise RuntimeError("boom")
+
+        with patch.object(bootstrap, "_check_pack_floors", boom):
+            checks = bootstrap._ParallelChecks(("_check_pack_floors",))
+            self.assertIsNone(checks.result("_check_pack_floors"))
+
+
+class ProbeCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.home = Path(self._tmp.name)
+        self.counter = self.home / "calls"
+        self.binary = self.home / "fake-hook"
+        self.binary.write_text(
+            "#!/bin/sh\n"
+            f"echo x >> '{self.counter}'\n"
+            "if [ -n \"$FAKE_AUTH_FAIL\" ]; then echo 'missing API token' >&2; exit 1; fi\n"
+            "exit 0\n"
+        )
+        self.binary.chmod(0o755)
+        self.plugin = self.home / ".claude" / "plugins" / "cache" / "org" / "fake"
+        (self.plugin / "hooks").mkdir(parents=True)
+        (self.plugin / ".claude-plugin").mkdir()
+        (self.plugin / "hooks" / "hooks.json").write_text(json.dumps({"hooks": {
+            "PostToolUse": [{"hooks": [{"type": "command", "command": f"{self.binary} run"}]}],
+        }}))
+        self._set_version("1.0.0")
+        env = {"HOME": str(self.home)}
+        self._env = patch.dict(os.environ, env)
+        self._env.start()
+        os.environ.pop("CLAUDE_CONFIG_DIR", None)
+
+    def tearDown(self):
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def _set_version(self, version):
+        (self.plugin / ".claude-plugin" / "plugin.json").write_text(
+            json.dumps({"name": "fake", "version": version}))
+
+    def _calls(self):
+        return len(self.counter.read_text().splitlines()) if self.counter.exists() else 0
+
+    def test_ready_probe_is_reused_across_sessions(self):
+        self.assertEqual(bootstrap._probe_plugin_readiness(), [])
+        self.assertEqual(bootstrap._probe_plugin_readiness(), [])
+        self.assertEqual(self._calls(), 1)
+        self.assertTrue(bootstrap._probe_cache_path().exists())
+
+    def test_plugin_version_change_reprobes(self):
+        bootstrap._probe_plugin_readiness()
+        self._set_version("1.1.0")
+        bootstrap._probe_plugin_readiness()
+        self.assertEqual(self._calls(), 2)
+
+    def test_auth_failure_is_not_cached(self):
+        with patch.dict(os.environ, {"FAKE_AUTH_FAIL": "1"}):
+            first = bootstrap._probe_plugin_readiness()
+            second = bootstrap._probe_plugin_readiness()
+        self.assertEqual([u["name"] for u in first], ["fake"])
+        self.assertEqual(first, second)
+        self.assertEqual(self._calls(), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
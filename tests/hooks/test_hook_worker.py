@@ -0,0 +1,202 @@
+"""Unit tests for hooks/scripts/hook_worker.py (resident hook worker).
+
+The worker is served from a background thread against a throwaway scripts
+directory so no real hook (or its side effects) runs. Covers:
+  1. stdout / stderr / stdin round-trip through the socket
+  2. exit-code propagation (sys.exit(2) is how prompt_submit hard-blocks)
+  3. module caching — the hook module is imported once per worker
+  4. fail-open client — no socket / busy worker returns None (local path)
+  5. non-resident scripts are refused
+  6. sys.path entries a hook adds at import survive later events
+"""
+
+from __future__ import annotations
+
+import os
+import socket
+import sys
+import tempfile
+import textwrap
+import threading
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_HOOKS_SCRIPTS = _REPO_ROOT / "hooks" / "scripts"
+if str(_HOOKS_SCRIPTS) not in sys.path:
+    sys.path.insert(0, str(_HOOKS_SCRIPTS))
+
+import hook_worker  # noqa: E402
+
+_FAKE_HOOK = textwrap.dedent('''
+    import json, os, sys, time
+    IMPORTS = globals().get("IMPORTS", 0) + 1
+
+    def main():
+        raw = sys.stdin.read()
+        payload = json.loads(raw) if raw.strip() else {}
+        if payload.get("sleep"):
+            time.sleep(payload["sleep"])
+        if payload.get("exit"):
+            print("blocked", file=sys.stderr)
+            sys.exit(payload["exit"])
+        print(json.dumps({
+            "echo": payload,
+            "argv": sys.argv[1:],
+            "env": os.environ.get("WG_TEST_MARKER", ""),
+            "imports": IMPORTS,
+        }))
+''')
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets required")
+class HookWorkerRoundTrip(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        tmp = Path(self._tmp.name)
+        (tmp / "pre_tool.py").write_text(_FAKE_HOOK, encoding="utf-8")
+        self.sock = str(tmp / "w.sock")
+        self.worker = hook_worker._Worker(self.sock, scripts_dir=tmp)
+        self.worker.queue_s = 0.05
+        self.thread = threading.Thread(target=self.worker.serve, daemon=True)
+        self.thread.start()
+        deadline = time.monotonic() + 2
+        while not os.path.exists(self.sock) and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def tearDown(self):
+        self.worker.shutdown()
+        self.thread.join(timeout=3)
+        sys.modules.pop("pre_tool", None)
+        self._tmp.cleanup()
+
+    def _request(self, stdin: bytes, argv=()):
+        with patch.object(hook_worker, "spawn") as spawn:
+            reply = hook_worker.request("pre_tool", list(argv), stdin, sock_path=self.sock)
+        spawn.assert_not_called()
+        return reply
+
+    def test_round_trips_stdin_argv_and_env(self):
+        with patch.dict(os.environ, {"WG_TEST_MARKER": "m1"}):
+            reply = self._request(b'{"tool_name": "Bash"}', argv=["x"])
+        self.assertEqual(reply["code"], 0)
+        self.assertIn('"tool_name": "Bash"', reply["stdout"])
+        self.assertIn('"argv": ["x"]', reply["stdout"])
+        self.assertIn('"env": "m1"', reply["stdout"])
+
+    def test_env_is_restored_after_run(self):
+        with patch.dict(os.environ, {"WG_TEST_MARKER": "leak"}):
+            self._request(b"{}")
+        reply = self._request(b"{}")
+        self.assertIn('"env": ""', reply["stdout"])
+
+    def test_exit_code_and_stderr_propagate(self):
+        reply = self._request(b'{"exit": 2}')
+        self.assertEqual(reply["code"], 2)
+        self.assertIn("blocked", reply["stderr"])
+
+    def test_module_imported_once(self):
+        self._request(b"{}")
+        reply = self._request(b"{}")
+        self.assertIn('"imports": 1', reply["stdout"])
+
+    def test_import_time_sys_path_survives_later_events(self):
+        tmp = Path(self._tmp.name)
+        (tmp / "lib").mkdir()
+        (tmp / "lib" / "_wg_worker_helper.py").write_text("VALUE = 42\n", encoding="utf-8")
+        (tmp / "post_tool.py").write_text(textwrap.dedent('''
+            import sys
+            from pathlib import Path
+            sys.path.insert(0, str(Path(__file__).parent / "lib"))
+
+            def main():
+                sys.modules.pop("_wg_worker_helper", None)
+                from _wg_worker_helper import VALUE
+                print("ok", VALUE)
+        '''), encoding="utf-8")
+        try:
+            with patch.object(hook_worker, "spawn"):
+                for _ in range(2):
+                    reply = hook_worker.request("post_tool", [], b"{}", sock_path=self.sock)
+                    self.assertEqual((reply["code"], reply["stdout"].strip()), (0, "ok 42"), reply["stderr"])
+        finally:
+            sys.modules.pop("post_tool", None)
+            sys.modules.pop("_wg_worker_helper", None)
+            lib = str(tmp / "lib")
+            sys.path[:] = [p for p in sys.path if p != lib]
+
+    def test_emitting_run_spawns_outbox_flusher(self):
+        import _bus
+
+        (Path(self._tmp.name) / "post_tool.py").write_text(textwrap.dedent('''
+            import _bus
+
+            def main():
+                _bus._outbox_append("wicked.garden.task.created",
+                                    {"domain": "wicked-garden", "subdomain": "task"}, "{}", None)
+        '''), encoding="utf-8")
+        outbox = os.path.join(self._tmp.name, "outbox.db")
+        try:
+            with patch.object(_bus, "_OUTBOX_FILE", outbox), \
+                    patch.object(_bus, "_outbox_spawn_flusher") as spawn_flusher, \
+                    patch.object(hook_worker, "spawn"):
+                reply = hook_worker.request("post_tool", [], b"{}", sock_path=self.sock)
+                self.assertEqual(reply["code"], 0, reply["stderr"])
+                spawn_flusher.assert_called_once_with()
+                self.assertFalse(_bus._outbox_pending)
+                # Nothing new queued: the next run does not spawn again.
+                hook_worker.request("pre_tool", [], b"{}", sock_path=self.sock)
+                spawn_flusher.assert_called_once_with()
+        finally:
+            sys.modules.pop("post_tool", None)
+            with _bus._outbox_lock:
+                if _bus._outbox_conn is not None:
+                    _bus._outbox_conn.close()
+                _bus._outbox_conn = _bus._outbox_conn_key = None
+
+    def test_busy_worker_returns_none(self):
+        slow = threading.Thread(target=self._request, args=(b'{"sleep": 0.5}',))
+        slow.start()
+        time.sleep(0.1)
+        try:
+            self.assertIsNone(self._request(b"{}"))
+        finally:
+            slow.join()
+
+    def test_non_resident_script_refused(self):
+        with patch.object(hook_worker, "spawn"):
+            reply = hook_worker.request("bootstrap", [], b"{}", sock_path=self.sock)
+        self.assertIsNone(reply)
+
+    def test_stop_worker(self):
+        self.assertTrue(hook_worker.stop_worker(self.sock))
+        self.thread.join(timeout=3)
+        self.assertFalse(self.thread.is_alive())
+
+
+@unittest.skipUnless(hasattr(socket, "AF_UNIX"), "Unix sockets required")
+class HookWorkerClientFallback(unittest.TestCase):
+    def test_missing_socket_spawns_and_falls_back(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            sock = os.path.join(tmp, "absent.sock")
+            with patch.object(hook_worker, "spawn") as spawn:
+                self.assertIsNone(hook_worker.request("pre_tool", [], b"{}", sock_path=sock))
+            spawn.assert_called_once_with(sock)
+
+    def test_disabled_by_default(self):
+        with patch.dict(os.environ, {}, clear=False):
+            os.environ.pop("WG_HOOK_WORKER", None)
+            self.assertFalse(hook_worker.enabled())
+
+    def test_socket_path_keyed_by_session_and_cwd(self):
+        with patch.dict(os.environ, {"CLAUDE_SESSION_ID": "a", "CLAUDE_CWD": "/x"}):
+            a = hook_worker.socket_path()
+        with patch.dict(os.environ, {"CLAUDE_SESSION_ID": "a", "CLAUDE_CWD": "/y"}):
+            b = hook_worker.socket_path()
+        self.assertNotEqual(a, b)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,87 @@
+"""Tests for hooks/scripts/invoke.py — the cross-platform hook dispatcher.
+
+invoke.py runs the target hook in its own interpreter via runpy (one start-up
+per event). ``WG_HOOK_ISOLATE=1`` restores the child-interpreter path. Both
+paths must be indistinguishable to the hook: same argv shape, same stdin
+bytes, same exit code.
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+import textwrap
+import unittest
+from pathlib import Path
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_INVOKE = _REPO_ROOT / "hooks" / "scripts" / "invoke.py"
+
+_PROBE = textwrap.dedent('''
+    import json, os, sys
+    raw = sys.stdin.read()
+    payload = json.loads(raw) if raw.strip() else {}
+    print(json.dumps({
+        "name": __name__,
+        "argv0": os.path.basename(sys.argv[0]),
+        "args": sys.argv[1:],
+        "payload": payload,
+        "path0": sys.path[0],
+    }))
+    if payload.get("exit") is not None:
+        sys.exit(payload["exit"])
+''')
+
+
+class InvokeDispatch(unittest.TestCase):
+    def setUp(self):
+        # invoke.py resolves targets next to itself, so run a copy of it
+        # from a scratch directory alongside the probe script.
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        (self.dir / "invoke.py").write_text(_INVOKE.read_text(encoding="utf-8"), encoding="utf-8")
+        (self.dir / "probe.py").write_text(_PROBE, encoding="utf-8")
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _run(self, stdin: str, *args: str, isolate: bool = False):
+        env = {k: v for k, v in os.environ.items()
+               if k not in ("WG_HOOK_ISOLATE", "WG_HOOK_WORKER")}
+        if isolate:
+            env["WG_HOOK_ISOLATE"] = "1"
+        return subprocess.run(
+            [sys.executable, str(self.dir / "invoke.py"), "probe", *args],
+            input=stdin, capture_output=True, text=True, env=env, timeout=30,
+        )
+
+    def test_in_process_matches_isolated(self):
+        for isolate in (False, True):
+            with self.subTest(isolate=isolate):
+                proc = self._run('{"tool_name": "Read"}', "--flag", isolate=isolate)
+                self.assertEqual(proc.returncode, 0, proc.stderr)
+                self.assertIn('"name": "__main__"', proc.stdout)
+                self.assertIn('"argv0": "probe.py"', proc.stdout)
+                self.assertIn('"args": ["--flag"]', proc.stdout)
+                self.assertIn('"tool_name": "Read"', proc.stdout)
+                self.assertIn(f'"path0": "{self.dir}"', proc.stdout)
+
+    def test_exit_code_propagates(self):
+        for isolate in (False, True):
+            with self.subTest(isolate=isolate):
+                proc = self._run('{"exit": 2}', isolate=isolate)
+                self.assertEqual(proc.returncode, 2)
+
+    def test_missing_script_fails_open(self):
+        proc = subprocess.run(
+            [sys.executable, str(self.dir / "invoke.py"), "nope"],
+            input="", capture_output=True, text=True, timeout=30,
+        )
+        self.assertEqual(proc.returncode, 0)
+        self.assertIn('{"ok": true}', proc.stdout)
+
+
+if __name__ == "__main__":
+    unittest.main()
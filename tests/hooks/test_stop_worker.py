@@ -0,0 +1,157 @@
+"""Tests for hooks/scripts/stop_worker.py — the detached Stop worker.
+
+stop.py queues its heavy jobs (auto-memorize drain, event purge, heavy
+cadence) durably and returns; the worker drains the queue under a per-session
+lock, runs each job kind once per batch, and leaves messages for
+prompt_submit.py to collect on the next turn.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+_REPO_ROOT = Path(__file__).resolve().parents[2]
+_HOOKS = str(_REPO_ROOT / "hooks" / "scripts")
+if _HOOKS not in sys.path:
+    sys.path.append(_HOOKS)
+
+import stop  # noqa: E402
+import stop_worker  # noqa: E402
+
+
+class _TmpCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._env = patch.dict(os.environ, {
+            "TMPDIR": self._tmp.name,
+            "CLAUDE_SESSION_ID": "stop-worker-test",
+        })
+        self._env.start()
+        os.environ.pop("WG_STOP_INLINE", None)
+
+    def tearDown(self):
+        self._env.stop()
+        self._tmp.cleanup()
+
+
+class Enqueue(_TmpCase):
+    def test_enqueue_appends_jobs_and_spawns(self):
+        with patch.object(stop_worker, "spawn") as spawn:
+            self.assertTrue(stop_worker.enqueue([{"job": "purge_events"}]))
+            self.assertTrue(stop_worker.enqueue([{"job": "auto_memorize_drain"}]))
+        self.assertEqual(spawn.call_count, 2)
+        lines = stop_worker.queue_path().read_text().splitlines()
+        self.assertEqual([json.loads(l)["job"] for l in lines],
+                         ["purge_events", "auto_memorize_drain"])
+
+    def test_inline_escape_hatch_queues_nothing(self):
+        with patch.dict(os.environ, {"WG_STOP_INLINE": "1"}), \
+                patch.object(stop_worker, "spawn") as spawn:
+            self.assertFalse(stop_worker.enqueue([{"job": "purge_events"}]))
+        spawn.assert_not_called()
+        self.assertFalse(stop_worker.queue_path().exists())
+
+    def test_stop_runs_jobs_inline_when_not_queued(self):
+        calls = []
+        with patch.dict(os.environ, {"WG_STOP_INLINE": "1"}), \
+                patch.object(stop, "_run_stop_job",
+                             lambda job: calls.append(job["job"]) or [f"ran {job['job']}"]):
+            messages = stop._dispatch_stop_jobs(
+                [{"job": "auto_memorize_drain"}, {"job": "purge_events"}])
+        self.assertEqual(calls, ["auto_memorize_drain", "purge_events"])
+        self.assertEqual(messages, ["ran auto_memorize_drain", "ran purge_events"])
+
+
+class Drain(_TmpCase):
+    def _queue(self, *jobs):
+        with patch.object(stop_worker, "spawn"):
+            stop_worker.enqueue(list(jobs))
+
+    def test_drain_runs_each_kind_once_in_order(self):
+        self._queue({"job": "heavy_cadence", "session_id": "a"},
+                    {"job": "auto_memorize_drain"},
+                    {"job": "heavy_cadence", "session_id": "b"},
+                    {"job": "bogus"})
+        calls = []
+        with patch.object(stop, "_run_stop_job",
+                          lambda job: calls.append(job) or [f"{job['job']} done"]):
+            self.assertEqual(stop_worker.drain(), 0)
+        self.assertEqual([c["job"] for c in calls], ["auto_memorize_drain", "heavy_cadence"])
+        self.assertEqual(calls[1]["session_id"], "b")
+        self.assertFalse(stop_worker.queue_path().exists())
+        self.assertEqual(stop_worker.take_results(),
+                         ["auto_memorize_drain done", "heavy_cadence done"])
+        self.assertEqual(stop_worker.take_results(), [])
+
+    def test_orphaned_work_file_is_reclaimed(self):
+        q = stop_worker.queue_path()
+        orphan = q.with_name(f"{q.name}.99999.work")
+        orphan.write_text(json.dumps({"job": "purge_events"}) + "\n")
+        calls = []
+        with patch.object(stop, "_run_stop_job", lambda job: calls.append(job["job"]) or []):
+            stop_worker.drain()
+        self.assertEqual(calls, ["purge_events"])
+        self.assertFalse(orphan.exists())
+
+    def test_second_worker_exits_while_lock_is_held(self):
+        import fcntl
+        self._queue({"job": "purge_events"})
+        lock = open(str(stop_worker.queue_path()) + ".lock", "a")
+        try:
+            fcntl.flock(lock.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            with patch.object(stop, "_run_stop_job") as run:
+                self.assertEqual(stop_worker.drain(), 0)
+            run.assert_not_called()
+            self.assertTrue(stop_worker.queue_path().exists())
+        finally:
+            lock.close()
+
+    def test_failing_job_does_not_block_the_batch(self):
+        self._queue({"job": "auto_memorize_drain"}, {"job": "purge_events"})
+
+        def run(job):
+            if job["job"] == "auto_memorize_drain":
+                raise RuntimeError("boom")
+            return ["purged"]
+
+        with patch.object(stop, "_run_stop_job", run):
+            stop_worker.drain()
+        self.assertEqual(stop_worker.take_results(), ["purged"])
+
+
+class HeavyCadenceJob(_TmpCase):
+    def test_queued_duplicate_does_not_rerun_the_teardown(self):
+        import _heavy_cadence
+        with patch.object(_heavy_cadence, "already_ran_this_session", return_value=True), \
+                patch.object(_heavy_cadence, "run_heavy_cadence") as run:
+            self.assertEqual(stop._run_stop_job(
+                {"job": "heavy_cadence", "trigger": "stop_fallback", "session_id": "s"}), [])
+        run.assert_not_called()
+
+
+class ResultsDelivery(_TmpCase):
+    def test_continuation_prompt_delivers_results(self):
+        import io
+        import prompt_submit
+
+        stop_worker._append_lines(stop_worker.results_path(), [{"messages": ["memorized 3 facts"]}])
+        out = io.StringIO()
+        with patch.object(prompt_submit, "_check_setup_gate"), \
+                patch.object(prompt_submit, "_check_context_gate"), \
+                patch.object(prompt_submit, "_check_onboarding_gate", return_value=None), \
+                patch.object(sys, "stdin", io.StringIO(json.dumps({"prompt": "continue"}))), \
+                patch.object(sys, "stdout", out):
+            prompt_submit.main()
+        reply = json.loads(out.getvalue())
+        self.assertIn("memorized 3 facts", reply["hookSpecificOutput"]["additionalContext"])
+        self.assertEqual(stop_worker.take_results(), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -132,6 +132,21 @@ def test_extract_session_facts_merges_transcript(tmp_path, monkeypatch):
     assert facts and facts[0].source == "transcript"
 
 
+def test_incremental_transcript_scans_only_appended_lines(tmp_path, monkeypatch):
+    monkeypatch.setenv("TMPDIR", str(tmp_path))
+    t = tmp_path / "inc.jsonl"
+    _write_transcript(t, ["We decided to use the estate memory store for all session facts."])
+    assert sfe.extract_transcript_facts(str(t), 10, incremental=True)
+    assert sfe.extract_transcript_facts(str(t), 10, incremental=True) == []
+    with t.open("a", encoding="utf-8") as fh:
+        fh.write("\n" + json.dumps({"type": "assistant", "message": {"content": [
+            {"type": "text", "text": "Turns out the cursor skips already-scanned turns."}]}}))
+    facts = sfe.extract_transcript_facts(str(t), 10, incremental=True)
+    assert [f.type for f in facts] == ["discovery"]
+    # The non-incremental path still re-scans the whole tail window.
+    assert len(sfe.extract_transcript_facts(str(t), 10)) >= 2
+
+
 def test_transcript_missing_file_fails_open(tmp_path):
     assert sfe.extract_transcript_facts(str(tmp_path / "nope.jsonl"), 10) == []
 
@@ -0,0 +1,131 @@
+"""Tests for the _bus.py cross-process wicked-bus binary resolution cache."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import _bus
+
+
+def _status(returncode: int = 0, **data) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(
+        args=[], returncode=returncode, stdout=json.dumps(data), stderr="",
+    )
+
+
+class BinaryCache(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.cache = os.path.join(self._tmp.name, "bus-binary.json")
+        self._patches = [
+            patch.object(_bus, "_BINARY_CACHE_FILE", self.cache),
+            patch.object(_bus, "_bus_binary", None),
+            patch.dict(os.environ, {"CLAUDE_SESSION_ID": "sess-1"}),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def tearDown(self):
+        for p in reversed(self._patches):
+            p.stop()
+        self._tmp.cleanup()
+
+    def _fresh_process(self):
+        _bus._bus_binary = None
+
+    def test_path_hit_needs_no_probe_and_is_shared_across_processes(self):
+        with patch.object(_bus.shutil, "which",
+                          side_effect=lambda n: "/opt/bin/wicked-bus" if n == "wicked-bus" else None), \
+                patch.object(_bus.subprocess, "run") as run:
+            self.assertEqual(_bus._resolve_binary(), "/opt/bin/wicked-bus")
+            self._fresh_process()
+            self.assertEqual(_bus._resolve_binary(), "/opt/bin/wicked-bus")
+            status = _bus.cached_binary_status()
+        run.assert_not_called()
+        self.assertEqual(status["binary"], "/opt/bin/wicked-bus")
+        self.assertIsNone(status["db_path"])
+
+    def test_status_db_path_is_recorded_on_the_path_entry(self):
+        with patch.object(_bus.shutil, "which",
+                          side_effect=lambda n: "/opt/bin/wicked-bus" if n == "wicked-bus" else None), \
+                patch.object(_bus, "_check_available", return_value=True), \
+                patch.object(_bus.subprocess, "run",
+                             return_value=_status(version="2.1.0", db_path=self.cache)) as run:
+            _bus._resolve_binary()
+            self.assertEqual(_bus._resolve_bus_db_path(), self.cache)
+            status = _bus.cached_binary_status()
+            self.assertEqual(_bus._resolve_bus_db_path(), self.cache)
+        self.assertEqual(run.call_count, 1)
+        self.assertEqual((status["version"], status["healthy"]), ("2.1.0", True))
+
+    def test_negative_verdict_holds_for_the_session(self):
+        with patch.object(_bus.shutil, "which", return_value=None), \
+                patch.object(_bus.subprocess, "run", return_value=_status(1)) as run:
+            self.assertIsNone(_bus._resolve_binary())
+            self._fresh_process()
+            self.assertIsNone(_bus._resolve_binary())
+            self.assertEqual(run.call_count, 1)
+            with patch.dict(os.environ, {"CLAUDE_SESSION_ID": "sess-2"}):
+                # Another session, still inside the negative TTL.
+                self._fresh_process()
+                self.assertIsNone(_bus._resolve_binary())
+            self.assertEqual(run.call_count, 1)
+
+    def test_negative_verdict_expires_outside_the_session(self):
+        with patch.object(_bus.shutil, "which", return_value=None), \
+                patch.object(_bus.subprocess, "run", return_value=_status(1)) as run:
+            _bus._resolve_binary()
+            with open(self.cache) as f:
+                entry = json.load(f)
+            entry["ts"] = time.time() - _bus._BINARY_NEGATIVE_TTL_S - 1
+            with open(self.cache, "w") as f:
+                json.dump(entry, f)
+            with patch.dict(os.environ, {"CLAUDE_SESSION_ID": "sess-2"}):
+                self._fresh_process()
+                _bus._resolve_binary()
+        self.assertEqual(run.call_count, 2)
+
+    def test_probe_timeout_is_cached_briefly(self):
+        timeout = subprocess.TimeoutExpired(cmd="npx", timeout=1)
+        with patch.object(_bus.shutil, "which", return_value=None), \
+                patch.object(_bus.subprocess, "run", side_effect=timeout) as run:
+            self.assertIsNone(_bus._resolve_binary())
+            self._fresh_process()
+            _bus._resolve_binary()
+            self.assertEqual(run.call_count, 1)
+            with open(self.cache) as f:
+                entry = json.load(f)
+            self.assertTrue(entry["error"])
+            entry["ts"] = time.time() - _bus._BINARY_ERROR_TTL_S - 1
+            with open(self.cache, "w") as f:
+                json.dump(entry, f)
+            # Same session, yet the transient failure is re-probed.
+            self._fresh_process()
+            _bus._resolve_binary()
+        self.assertEqual(run.call_count, 2)
+
+    def test_path_change_reprobes(self):
+        with patch.object(_bus.shutil, "which", return_value=None), \
+                patch.object(_bus.subprocess, "run", return_value=_status(1)) as run:
+            _bus._resolve_binary()
+            with patch.dict(os.environ, {"PATH": "/somewhere/else"}):
+                self._fresh_process()
+                self.assertIsNone(_bus.cached_binary_status())
+                _bus._resolve_binary()
+        self.assertEqual(run.call_count, 2)
+
+    def test_npx_fallback_requires_healthy_status(self):
+        with patch.object(_bus.shutil, "which",
+                          side_effect=lambda n: "/usr/bin/npx" if n == "npx" else None), \
+                patch.object(_bus.subprocess, "run", return_value=_status(0)):
+            self.assertEqual(_bus._resolve_binary(), "npx")
+
+
+if __name__ == "__main__":
+    unittest.main()
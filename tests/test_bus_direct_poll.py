@@ -0,0 +1,157 @@
+"""Tests for the _bus.py direct-SQLite poll/ack path.
+
+poll_pending() and ack_events() read and advance the subscriber cursor in the
+wicked-bus database when its layout matches, and fall back to the CLI when it
+does not. Cursor IDs are cached per consumer name.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import _bus
+
+
+def _make_bus_db(path: str, with_metadata: bool = True) -> None:
+    conn = sqlite3.connect(path)
+    meta_col = ", metadata TEXT" if with_metadata else ""
+    conn.execute(
+        "CREATE TABLE events (event_id INTEGER PRIMARY KEY, event_type TEXT, "
+        f"domain TEXT, subdomain TEXT, payload TEXT{meta_col}, emitted_at INTEGER)"
+    )
+    conn.execute(
+        "CREATE TABLE cursors (cursor_id TEXT PRIMARY KEY, subscription_id TEXT, "
+        "last_event_id INTEGER, deregistered_at INTEGER)"
+    )
+    conn.execute("INSERT INTO cursors VALUES ('cur-1', 'sub-1', 1, NULL)")
+    for i, etype in enumerate(
+        ["wicked.garden.gate.decided", "wicked.garden.gate.decided",
+         "wicked.garden.persona.contributed", "wicked.garden.gate.blocked"],
+        start=1,
+    ):
+        cols = "event_id, event_type, domain, subdomain, payload, emitted_at"
+        vals = [i, etype, "wicked-garden", "crew.gate", json.dumps({"n": i}), 1000 + i]
+        if with_metadata:
+            cols += ", metadata"
+            vals.append(json.dumps({"chain_id": f"c{i}"}))
+        conn.execute(f"INSERT INTO events ({cols}) VALUES ({', '.join('?' * len(vals))})", vals)
+    conn.commit()
+    conn.close()
+
+
+class _DirectCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self._tmp.name, "bus.db")
+        self.cursor_file = os.path.join(self._tmp.name, "_bus_cursor.json")
+        with open(self.cursor_file, "w") as f:
+            json.dump({"cursor_id": "cur-1", "updated_at": 0}, f)
+        self._patches = [
+            patch.dict(os.environ, {"WICKED_BUS_DATA_DIR": self._tmp.name}),
+            patch.object(_bus, "_CURSOR_FILE", self.cursor_file),
+            patch.object(_bus, "_cursor_ids", {}),
+            patch.object(_bus, "_direct_schema_cache", {}),
+            patch.object(_bus, "_check_available", return_value=True),
+        ]
+        for p in self._patches:
+            p.start()
+        os.environ.pop("WG_BUS_DIRECT_DB", None)
+
+    def tearDown(self):
+        for p in reversed(self._patches):
+            p.stop()
+        self._tmp.cleanup()
+
+    def _cursor_position(self) -> int:
+        conn = sqlite3.connect(self.db)
+        try:
+            return conn.execute(
+                "SELECT last_event_id FROM cursors WHERE cursor_id = 'cur-1'"
+            ).fetchone()[0]
+        finally:
+            conn.close()
+
+
+class DirectPoll(_DirectCase):
+    def test_poll_reads_past_cursor_with_prefix_and_no_subprocess(self):
+        _make_bus_db(self.db)
+        with patch.object(_bus.subprocess, "run") as run:
+            events = _bus.poll_pending(event_type_prefix="wicked.garden.gate.")
+        run.assert_not_called()
+        self.assertEqual([e["event_id"] for e in events], [2, 4])
+        self.assertEqual(events[0]["payload"], {"n": 2})
+        self.assertEqual(events[0]["data"], {"n": 2})
+        self.assertEqual(events[0]["metadata"], {"chain_id": "c2"})
+
+    def test_prefix_wildcards_are_literal(self):
+        _make_bus_db(self.db)
+        with patch.object(_bus.subprocess, "run"):
+            self.assertEqual(_bus.poll_pending(event_type_prefix="wicked_garden"), [])
+
+    def test_ack_advances_cursor_but_never_rewinds(self):
+        _make_bus_db(self.db)
+        with patch.object(_bus.subprocess, "run") as run:
+            self.assertTrue(_bus.ack_events(3))
+            self.assertTrue(_bus.ack_events(2))
+        run.assert_not_called()
+        self.assertEqual(self._cursor_position(), 3)
+        with patch.object(_bus.subprocess, "run"):
+            events = _bus.poll_pending()
+        self.assertEqual([e["event_id"] for e in events], [4])
+
+    def test_schema_mismatch_falls_back_to_cli(self):
+        _make_bus_db(self.db, with_metadata=False)
+        with patch.object(_bus.subprocess, "run") as run:
+            run.return_value.returncode = 1
+            self.assertEqual(_bus.poll_pending(), [])
+            self.assertFalse(_bus.ack_events(3))
+        self.assertIn("list", run.call_args_list[0].args[0])
+        self.assertIn("ack", run.call_args_list[-1].args[0])
+        self.assertEqual(self._cursor_position(), 1)
+
+    def test_opt_out_env_forces_cli(self):
+        _make_bus_db(self.db)
+        with patch.dict(os.environ, {"WG_BUS_DIRECT_DB": "0"}), \
+                patch.object(_bus.subprocess, "run") as run:
+            run.return_value.returncode = 1
+            _bus.poll_pending()
+        self.assertTrue(run.called)
+
+    def test_unknown_cursor_falls_back_to_cli(self):
+        _make_bus_db(self.db)
+        _bus._save_cursor("cur-gone")
+        with patch.object(_bus.subprocess, "run") as run:
+            run.return_value.returncode = 1
+            self.assertFalse(_bus.ack_events(3))
+        self.assertTrue(run.called)
+        self.assertEqual(self._cursor_position(), 1)
+
+
+class ConsumerCursors(_DirectCase):
+    def test_legacy_cursor_file_maps_to_default_consumer(self):
+        self.assertEqual(_bus._load_cursor(), "cur-1")
+        self.assertIsNone(_bus._load_cursor("wicked-garden.jam"))
+
+    def test_registration_is_cached_per_consumer(self):
+        with patch.object(_bus.subprocess, "run") as run:
+            run.return_value.returncode = 0
+            run.return_value.stdout = json.dumps({"cursor_id": "cur-jam"})
+            self.assertEqual(_bus._ensure_registered("wicked-garden.jam"), "cur-jam")
+            self.assertEqual(_bus._ensure_registered("wicked-garden.jam"), "cur-jam")
+        run.assert_called_once()
+        self.assertIn("wicked-garden.jam", run.call_args.args[0])
+        _bus._cursor_ids.clear()
+        with open(self.cursor_file) as f:
+            stored = json.load(f)["consumers"]
+        self.assertEqual(stored["wicked-garden"]["cursor_id"], "cur-1")
+        self.assertEqual(stored["wicked-garden.jam"]["cursor_id"], "cur-jam")
+        self.assertEqual(_bus._load_cursor("wicked-garden.jam"), "cur-jam")
+
+
+if __name__ == "__main__":
+    unittest.main()
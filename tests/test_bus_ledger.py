@@ -0,0 +1,79 @@
+"""Tests for the _bus.py SQLite idempotency ledger."""
+
+from __future__ import annotations
+
+import json
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+import _bus
+
+
+class Ledger(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.db = os.path.join(self._tmp.name, "_bus_processed.db")
+        self.legacy = os.path.join(self._tmp.name, "_bus_processed.json")
+        self._patches = [
+            patch.object(_bus, "_LEDGER_DB", self.db),
+            patch.object(_bus, "_LEDGER_FILE", self.legacy),
+            patch.object(_bus, "_ledger_conn", None),
+            patch.object(_bus, "_ledger_conn_key", None),
+        ]
+        for p in self._patches:
+            p.start()
+
+    def tearDown(self):
+        if _bus._ledger_conn is not None:
+            _bus._ledger_conn.close()
+        for p in reversed(self._patches):
+            p.stop()
+        self._tmp.cleanup()
+
+    def test_mark_then_check(self):
+        self.assertFalse(_bus.is_processed("wicked.garden.gate.decided", "p.build"))
+        _bus.mark_processed("wicked.garden.gate.decided", "p.build")
+        self.assertTrue(_bus.is_processed("wicked.garden.gate.decided", "p.build"))
+        self.assertFalse(_bus.is_processed("wicked.garden.gate.decided", "p.test"))
+
+    def test_marks_are_per_consumer(self):
+        _bus.mark_processed("wicked.garden.gate.decided", "p.build", consumer="jam")
+        self.assertTrue(_bus.is_processed("wicked.garden.gate.decided", "p.build", consumer="jam"))
+        self.assertFalse(_bus.is_processed("wicked.garden.gate.decided", "p.build"))
+
+    def test_mark_many_is_one_batch(self):
+        pairs = [("wicked.garden.gate.decided", f"p.{i}") for i in range(50)]
+        _bus.mark_processed_many(pairs)
+        self.assertTrue(all(_bus.is_processed(et, cid) for et, cid in pairs))
+
+    def test_legacy_json_is_imported_and_expired_rows_pruned(self):
+        now = time.time()
+        with open(self.legacy, "w") as f:
+            json.dump({
+                "wicked.garden.gate.decided:fresh": now - 60,
+                "wicked.garden.gate.decided:stale": now - 8 * 86400,
+            }, f)
+        self.assertTrue(_bus.is_processed("wicked.garden.gate.decided", "fresh"))
+        self.assertFalse(_bus.is_processed("wicked.garden.gate.decided", "stale"))
+        self.assertFalse(os.path.exists(self.legacy))
+        self.assertTrue(os.path.exists(self.legacy + ".migrated"))
+        conn = sqlite3.connect(self.db)
+        try:
+            keys = [r[0] for r in conn.execute("SELECT event_key FROM processed")]
+        finally:
+            conn.close()
+        self.assertEqual(keys, ["wicked.garden.gate.decided:fresh"])
+
+    def test_unwritable_ledger_fails_open(self):
+        with patch.object(_bus, "_LEDGER_DB", os.path.join(self.legacy, "x", "db")):
+            open(self.legacy, "w").close()
+            _bus.mark_processed("wicked.garden.gate.decided", "p.build")
+            self.assertFalse(_bus.is_processed("wicked.garden.gate.decided", "p.build"))
+
+
+if __name__ == "__main__":
+    unittest.main()
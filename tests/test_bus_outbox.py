@@ -0,0 +1,140 @@
+"""Tests for the _bus.py local outbox.
+
+emit_event() appends to a SQLite WAL spool instead of spawning a thread per
+event; flush_outbox() drains it into wicked-bus with idempotency keys and
+keeps queued/flushed/failed counters for bus_emit_stats().
+"""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import tempfile
+import unittest
+from unittest.mock import patch
+
+import _bus
+
+
+def _completed(returncode: int) -> subprocess.CompletedProcess:
+    return subprocess.CompletedProcess(args=[], returncode=returncode, stdout=b"", stderr=b"")
+
+
+class _OutboxCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self._patches = [
+            patch.object(_bus, "_OUTBOX_FILE", os.path.join(self._tmp.name, "outbox.db")),
+            patch.object(_bus, "_check_available", return_value=True),
+            patch.object(_bus, "_bus_binary", "/usr/bin/wicked-bus"),
+            patch.dict(os.environ, {}, clear=False),
+        ]
+        for p in self._patches:
+            p.start()
+        os.environ.pop("WG_BUS_OUTBOX_DIRECT", None)
+
+    def tearDown(self):
+        for p in reversed(self._patches):
+            p.stop()
+        _bus._outbox_pending = False  # never spawn a real flusher at exit
+        self._tmp.cleanup()
+
+
+class EmitQueues(_OutboxCase):
+    def test_emit_appends_without_spawning(self):
+        with patch.object(_bus.subprocess, "run") as run, \
+                patch.object(_bus.threading, "Thread") as thread:
+            _bus.emit_event("wicked.garden.project.created",
+                            {"project_id": "p1"}, chain_id="p1.root")
+        run.assert_not_called()
+        thread.assert_not_called()
+        stats = _bus.bus_emit_stats()
+        self.assertEqual(stats["attempted"], 1)
+        self.assertEqual(stats["succeeded"], 1)
+        self.assertEqual(stats["queued"], 1)
+        self.assertEqual((stats["flushed"], stats["failed"]), (0, 0))
+        self.assertTrue(_bus._outbox_pending)
+
+    def test_direct_escape_hatch_skips_outbox(self):
+        with patch.dict(os.environ, {"WG_BUS_OUTBOX_DIRECT": "1"}), \
+                patch.object(_bus.threading, "Thread") as thread:
+            _bus.emit_event("wicked.garden.project.created", {"project_id": "p1"})
+        thread.assert_called_once()
+        self.assertEqual(_bus.bus_emit_stats()["queued"], 0)
+
+    def test_stats_are_zero_without_outbox(self):
+        stats = _bus.bus_emit_stats()
+        self.assertEqual((stats["queued"], stats["flushed"], stats["failed"]), (0, 0, 0))
+
+
+class Flush(_OutboxCase):
+    def _queue(self, n: int) -> None:
+        for i in range(n):
+            _bus.emit_event("wicked.garden.project.created", {"project_id": f"p{i}"})
+
+    def test_flush_delivers_in_order_with_idempotency_keys(self):
+        self._queue(3)
+        with patch.object(_bus.subprocess, "run", return_value=_completed(0)) as run:
+            result = _bus.flush_outbox()
+        self.assertEqual(result["flushed"], 3)
+        cmds = [c.args[0] for c in run.call_args_list]
+        payloads = [cmd[cmd.index("--payload") + 1] for cmd in cmds]
+        self.assertEqual(payloads, ['{"project_id": "p0"}', '{"project_id": "p1"}',
+                                    '{"project_id": "p2"}'])
+        keys = {cmd[cmd.index("--idempotency-key") + 1] for cmd in cmds}
+        self.assertEqual(len(keys), 3)
+        stats = _bus.bus_emit_stats()
+        self.assertEqual((stats["queued"], stats["flushed"]), (0, 3))
+
+    def test_rejected_rows_retry_then_drop(self):
+        self._queue(1)
+        with patch.object(_bus.subprocess, "run", return_value=_completed(1)):
+            for _ in range(_bus._OUTBOX_MAX_ATTEMPTS - 1):
+                self.assertTrue(_bus.flush_outbox()["stalled"])
+            self.assertEqual(_bus.bus_emit_stats()["queued"], 1)
+            result = _bus.flush_outbox()
+        self.assertEqual(result["failed"], 1)
+        stats = _bus.bus_emit_stats()
+        self.assertEqual((stats["queued"], stats["failed"]), (0, 1))
+
+    def test_transport_error_keeps_rows_queued(self):
+        self._queue(2)
+        with patch.object(_bus.subprocess, "run",
+                          side_effect=subprocess.TimeoutExpired("wicked-bus", 5)):
+            result = _bus.flush_outbox()
+        self.assertTrue(result["stalled"])
+        self.assertEqual(_bus.bus_emit_stats()["queued"], 2)
+
+    def test_max_rows_bounds_one_call(self):
+        self._queue(3)
+        with patch.object(_bus.subprocess, "run", return_value=_completed(0)):
+            self.assertEqual(_bus.flush_outbox(max_rows=2)["flushed"], 2)
+        self.assertEqual(_bus.bus_emit_stats()["queued"], 1)
+
+    def test_second_flusher_backs_off_while_locked(self):
+        self._queue(1)
+        lock = _bus._outbox_try_lock()
+        try:
+            if lock is True:
+                self.skipTest("no flock on this platform")
+            with patch.object(_bus.subprocess, "run") as run:
+                result = _bus.flush_outbox()
+            run.assert_not_called()
+            self.assertTrue(result["locked"])
+        finally:
+            _bus._outbox_release(lock)
+
+
+class AtExit(_OutboxCase):
+    def test_exit_spawns_flusher_only_after_append(self):
+        with patch.object(_bus, "_outbox_spawn_flusher") as spawn:
+            _bus._outbox_at_exit()
+            spawn.assert_not_called()
+            _bus.emit_event("wicked.garden.project.created", {"project_id": "p1"})
+            _bus._outbox_at_exit()
+            _bus._outbox_at_exit()
+        spawn.assert_called_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@ Covers:
   - payload['data'] not a dict → None
   - malformed JSON in payload_json → None
   - sqlite.Error on query → None / [] (fail-open)
+  - chain_id prefix is an index range seek, not a table scan
 
 All tests are deterministic, stdlib-only, no disk I/O beyond in-memory DB.
 """
@@ -24,7 +25,10 @@ from unittest.mock import patch
 _REPO_ROOT = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(_REPO_ROOT / "scripts"))
 
-from _event_log_reader import read_latest_event_data, read_event_appends  # noqa: E402
+from _event_log_reader import (  # noqa: E402
+    read_event_appends,
+    read_latest_event_data,
+)
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -377,5 +381,51 @@ class TestLikeEscaping(unittest.TestCase):
         self.assertEqual(result["verdict"], "APPROVE")
 
 
+class TestPrefixRange(unittest.TestCase):
+    """chain_id prefix matching is a BINARY range, served by the index."""
+
+    def test_prefix_boundaries(self):
+        conn = _make_conn()
+        for i, chain in enumerate([
+            "proj-x.design",            # exact prefix
+            "proj-x.design.gate",       # extension
+            "proj-x.desigm.gate",       # sorts just below
+            "proj-x.desigo",            # sorts just above
+            "proj%x.design.gate",       # LIKE wildcard in another project
+        ], start=1):
+            _insert(conn, event_id=i, event_type="wicked.garden.dispatch.log_entry_appended",
+                    chain_id=chain, payload={"raw_payload": chain})
+        result = read_event_appends(
+            conn, project_id="proj-x", phase="design",
+            event_type="wicked.garden.dispatch.log_entry_appended"
+        )
+        self.assertEqual(result, ["proj-x.design", "proj-x.design.gate"])
+
+    def test_percent_in_project_id_is_literal(self):
+        conn = _make_conn()
+        _insert(conn, event_id=1, event_type="wicked.garden.gate.decided",
+                chain_id="proj-abc.design.gate",
+                payload={"data": {"verdict": "REJECT"}})
+        result = read_latest_event_data(
+            conn, project_id="proj-%", phase="design", event_type="wicked.garden.gate.decided"
+        )
+        self.assertIsNone(result)
+
+    def test_lookup_uses_index_not_scan(self):
+        conn = _make_conn()
+        # The range predicate must be servable once the DB owner adds an index.
+        conn.execute("CREATE INDEX idx_event_log_type_chain ON event_log(event_type, chain_id)")
+        statements = []
+        conn.set_trace_callback(statements.append)
+        read_latest_event_data(
+            conn, project_id="proj-x", phase="design", event_type="wicked.garden.gate.decided"
+        )
+        conn.set_trace_callback(None)
+        select = next(sql for sql in statements if "event_log" in sql)
+        plan = " ".join(row[3] for row in conn.execute("EXPLAIN QUERY PLAN " + select))
+        self.assertIn("idx_event_log_type_chain", plan)
+        self.assertNotIn("SCAN event_log", plan)
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,96 @@
+"""Tests for EventStore archive segments.
+
+archive_before() rotates whole months out of the hot events.db into
+monthly (optionally gzipped) segment files; query(include_archive=True)
+searches them; drop_archive_before() retires them by unlinking files.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import _event_store
+from _event_store import EventStore
+
+
+class _ArchiveCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self._patch = patch.object(_event_store, "_db_path", return_value=self.root / "events.db")
+        self._patch.start()
+        EventStore.close()
+        EventStore._schema_ready = False
+        EventStore.ensure_schema()
+
+    def tearDown(self):
+        EventStore.close()
+        EventStore._schema_ready = False
+        self._patch.stop()
+        self._tmp.cleanup()
+
+    def _add(self, ts: str, text: str) -> str:
+        event_id = EventStore.append(domain="crew", action="note", payload={"text": text})
+        conn = EventStore._get_conn()
+        conn.execute("UPDATE events SET ts = ? WHERE event_id = ?", (ts, event_id))
+        conn.commit()
+        return event_id
+
+    def _segment_names(self):
+        return sorted(p.name for p in (self.root / "archive").glob("events-*"))
+
+
+class ArchiveRotation(_ArchiveCase):
+    def setUp(self):
+        super().setUp()
+        self._add("2025-01-10T00:00:00+00:00", "january auth")
+        self._add("2025-01-20T00:00:00+00:00", "january deploy")
+        self._add("2025-02-03T00:00:00+00:00", "february auth")
+        self.recent = EventStore.append(domain="crew", action="note", payload={"text": "today auth"})
+
+    def test_old_months_move_to_compressed_segments(self):
+        self.assertEqual(EventStore.archive_before(days=90), 3)
+        self.assertEqual(EventStore.count(), 1)
+        self.assertEqual(self._segment_names(), ["events-2025-01.db.gz", "events-2025-02.db.gz"])
+        # The hot FTS index no longer references archived rows.
+        self.assertEqual([r["event_id"] for r in EventStore.query(fts="auth")], [self.recent])
+
+    def test_archive_is_queryable_on_request(self):
+        EventStore.archive_before(days=90)
+        rows = EventStore.query(fts="auth", include_archive=True)
+        self.assertEqual([r["payload"] for r in rows][1:], ['{"text": "february auth"}', '{"text": "january auth"}'])
+        ranked = EventStore.query(fts="deploy", rank=True, include_archive=True)
+        self.assertEqual(len(ranked), 1)
+        # Paging walks from the hot segment into the archive.
+        page = EventStore.query(limit=2, include_archive=True)
+        page2 = EventStore.query(limit=2, include_archive=True,
+                                 before_ts=page[-1]["ts"], before_id=page[-1]["event_id"])
+        self.assertEqual(len(page) + len(page2), 4)
+        self.assertEqual(page2[-1]["ts"], "2025-01-10T00:00:00+00:00")
+
+    def test_rerun_appends_to_existing_segment(self):
+        EventStore.archive_before(days=90)
+        self._add("2025-01-25T00:00:00+00:00", "late january")
+        self.assertEqual(EventStore.archive_before(days=90), 1)
+        self.assertEqual(self._segment_names(), ["events-2025-01.db.gz", "events-2025-02.db.gz"])
+        rows = EventStore.query(fts="january", include_archive=True)
+        self.assertEqual(len(rows), 3)
+
+    def test_drop_unlinks_old_segments(self):
+        EventStore.archive_before(days=90)
+        self.assertEqual(EventStore.drop_archive_before(days=0), 2)
+        self.assertEqual(self._segment_names(), [])
+        self.assertEqual(len(EventStore.query(include_archive=True)), 1)
+
+
+class MonthHelpers(unittest.TestCase):
+    def test_next_month_wraps_year(self):
+        self.assertEqual(_event_store._next_month("2025-12"), "2026-01")
+        self.assertEqual(_event_store._next_month("2025-03"), "2025-04")
+
+
+if __name__ == "__main__":
+    unittest.main()
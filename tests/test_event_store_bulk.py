@@ -0,0 +1,106 @@
+"""Tests for EventStore bulk and buffered appends.
+
+append_many() writes a burst in one transaction; buffered mode queues
+append() calls and flushes them on size, age, read or exit. Both keep the
+FTS index in step with the events table.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import _event_store
+from _event_store import EventStore
+
+
+class _StoreCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        db = Path(self._tmp.name) / "events.db"
+        self._patch = patch.object(_event_store, "_db_path", return_value=db)
+        self._patch.start()
+        EventStore.close()
+        EventStore._schema_ready = False
+        EventStore._buffer_max = 0
+        EventStore.ensure_schema()
+        self.commits = 0
+        EventStore._get_conn().set_trace_callback(self._trace)
+
+    def tearDown(self):
+        EventStore._buffer = []
+        EventStore._buffer_max = 0
+        EventStore.close()
+        EventStore._schema_ready = False
+        self._patch.stop()
+        self._tmp.cleanup()
+
+    def _trace(self, sql):
+        if sql.strip().upper() == "COMMIT":
+            self.commits += 1
+
+
+class AppendMany(_StoreCase):
+    def test_burst_is_one_commit_and_searchable(self):
+        ids = EventStore.append_many(
+            {"domain": "crew", "action": "tasks.completed", "record_id": f"t{i}",
+             "payload": {"note": "migration step"}}
+            for i in range(25)
+        )
+        self.assertEqual(len(ids), 25)
+        self.assertTrue(all(ids))
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(EventStore.count(), 25)
+        self.assertEqual(len(EventStore.query(fts="migration", limit=100)), 25)
+
+    def test_malformed_item_is_skipped(self):
+        ids = EventStore.append_many([
+            {"domain": "mem", "action": "stored"},
+            {"action": "no-domain"},
+        ])
+        self.assertIsNotNone(ids[0])
+        self.assertIsNone(ids[1])
+        self.assertEqual(EventStore.count(), 1)
+
+
+class Buffered(_StoreCase):
+    def test_flushes_at_size(self):
+        EventStore.enable_buffering(max_events=3, max_age_s=60)
+        for i in range(2):
+            EventStore.append(domain="jam", action="round", record_id=str(i))
+        self.assertEqual(self.commits, 0)
+        EventStore.append(domain="jam", action="round", record_id="2")
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(EventStore._buffer, [])
+
+    def test_read_sees_queued_events(self):
+        EventStore.enable_buffering(max_events=100, max_age_s=60)
+        event_id = EventStore.append(domain="mem", action="stored")
+        rows = EventStore.query(domain="mem")
+        self.assertEqual([r["event_id"] for r in rows], [event_id])
+
+    def test_failed_flush_keeps_rows_queued(self):
+        EventStore.enable_buffering(max_events=100, max_age_s=60)
+        first = EventStore.append(domain="mem", action="stored", record_id="a")
+        with patch.object(EventStore, "_get_conn", side_effect=OSError("disk full")):
+            self.assertEqual(EventStore.flush(), 0)
+        second = EventStore.append(domain="mem", action="stored", record_id="b")
+        self.assertEqual([r[0] for r in EventStore._buffer], [first, second])
+        self.assertEqual(EventStore.flush(), 2)
+        self.assertEqual(EventStore.count(), 2)
+
+    def test_batch_commits_once_and_restores_mode(self):
+        with EventStore.batch():
+            for i in range(10):
+                EventStore.append(domain="crew", action="tasks.completed", record_id=str(i))
+            self.assertEqual(self.commits, 0)
+        self.assertEqual(self.commits, 1)
+        self.assertEqual(EventStore._buffer_max, 0)
+        EventStore.append(domain="crew", action="phases.transitioned")
+        self.assertEqual(self.commits, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
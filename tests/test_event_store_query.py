@@ -0,0 +1,87 @@
+"""Tests for EventStore.query keyset paging and ranked search.
+
+Chronological scans page with a (ts, event_id) cursor and never repeat or
+skip a row, even when timestamps tie; rank=True returns FTS matches best
+first via bm25.
+"""
+
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import _event_store
+from _event_store import EventStore
+
+
+class _QueryCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        db = Path(self._tmp.name) / "events.db"
+        self._patch = patch.object(_event_store, "_db_path", return_value=db)
+        self._patch.start()
+        EventStore.close()
+        EventStore._schema_ready = False
+        EventStore.ensure_schema()
+
+    def tearDown(self):
+        EventStore.close()
+        EventStore._schema_ready = False
+        self._patch.stop()
+        self._tmp.cleanup()
+
+
+class KeysetPaging(_QueryCase):
+    def test_pages_cover_every_row_once_across_equal_timestamps(self):
+        EventStore.append_many(
+            {"domain": "crew", "action": "tasks.completed", "record_id": str(i)}
+            for i in range(23)
+        )
+        # Force ties: the cursor must fall back to event_id.
+        conn = EventStore._get_conn()
+        conn.execute("UPDATE events SET ts = '2026-01-01T00:00:00+00:00' WHERE CAST(record_id AS INT) < 12")
+        conn.commit()
+
+        seen, cursor = [], {}
+        while True:
+            page = EventStore.query(domain="crew", limit=5, **cursor)
+            if not page:
+                break
+            seen.extend(r["record_id"] for r in page)
+            cursor = {"before_ts": page[-1]["ts"], "before_id": page[-1]["event_id"]}
+        self.assertEqual(sorted(seen, key=int), [str(i) for i in range(23)])
+        self.assertEqual(len(seen), len(set(seen)))
+
+    def test_scan_uses_keyset_index(self):
+        conn = EventStore._get_conn()
+        plan = " ".join(r[3] for r in conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM events e WHERE (e.ts, e.event_id) < (?, ?) "
+            "ORDER BY e.ts DESC, e.event_id DESC LIMIT 5", ("z", "z"),
+        ))
+        self.assertIn("idx_events_ts_id", plan)
+        self.assertNotIn("TEMP B-TREE", plan)
+
+
+class RankedSearch(_QueryCase):
+    def test_best_match_first(self):
+        EventStore.append(domain="mem", action="stored", payload={"text": "auth"})
+        EventStore.append(domain="mem", action="stored", payload={"text": "auth migration auth migration"})
+        EventStore.append(domain="mem", action="stored", payload={"text": "unrelated"})
+        rows = EventStore.query(fts="migration", rank=True)
+        self.assertEqual(len(rows), 1)
+        rows = EventStore.query(fts="auth", rank=True)
+        self.assertEqual(len(rows), 2)
+        self.assertIn("migration", rows[0]["payload"])
+        self.assertLessEqual(rows[0]["score"], rows[1]["score"])
+
+    def test_filters_apply_to_ranked_results(self):
+        EventStore.append(domain="mem", action="stored", payload={"text": "deploy"})
+        EventStore.append(domain="crew", action="gate", payload={"text": "deploy"})
+        rows = EventStore.query(fts="deploy", rank=True, domain="crew")
+        self.assertEqual([r["domain"] for r in rows], ["crew"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Unit tests for scripts/_latency.py
+
+Covers:
+- Bucket placement and percentile resolution (capped at observed max)
+- flush() appends one line per (hook, handler) and clears pending samples
+- load() merges lines from several processes and skips corrupt lines
+- timed() records even when the block raises
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_SCRIPTS = _REPO_ROOT / "scripts"
+sys.path.insert(0, str(_SCRIPTS))
+
+import _latency  # noqa: E402
+
+
+class HistogramTests(unittest.TestCase):
+    def test_percentiles_use_bucket_upper_bound(self):
+        h = _latency.Histogram()
+        for ms in [3] * 90 + [40] * 9 + [700]:
+            h.add(ms)
+        self.assertEqual(h.percentile(0.50), 5.0)
+        self.assertEqual(h.percentile(0.95), 50.0)
+        self.assertEqual(h.percentile(0.99), 50.0)
+        self.assertEqual(h.percentile(1.0), 700.0)
+
+    def test_percentile_capped_at_max(self):
+        h = _latency.Histogram()
+        h.add(12.5)
+        self.assertEqual(h.percentile(0.99), 12.5)
+
+    def test_overflow_bucket(self):
+        h = _latency.Histogram()
+        h.add(60_000)
+        self.assertEqual(h.counts[-1], 1)
+        self.assertEqual(h.percentile(0.5), 60_000)
+
+    def test_empty(self):
+        self.assertEqual(_latency.Histogram().percentile(0.95), 0.0)
+
+
+class FlushLoadTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(os.environ, {
+            "TMPDIR": self.tmpdir.name,
+            "CLAUDE_SESSION_ID": "lat-test",
+        })
+        self.env.start()
+        _latency._pending.clear()
+
+    def tearDown(self):
+        _latency._pending.clear()
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def test_flush_then_load_round_trip(self):
+        _latency.record("post_tool", 4.0, handler="Read")
+        _latency.record("post_tool", 30.0, handler="Read")
+        _latency.record("post_tool", 35.0)
+        _latency.flush()
+        self.assertEqual(_latency._pending, {})
+
+        path = _latency.latency_file()
+        self.assertEqual(len(path.read_text().splitlines()), 2)
+
+        # A second process appends more samples for the same key.
+        _latency.record("post_tool", 8.0, handler="Read")
+        _latency.flush()
+        with path.open("a") as fh:
+            fh.write("{truncated\n")
+
+        merged = _latency.load(path)
+        read = merged[("post_tool", "Read")]
+        self.assertEqual(read.n, 3)
+        self.assertEqual(read.max_ms, 30.0)
+        self.assertEqual(merged[("post_tool", _latency.TOTAL)].n, 1)
+
+    def test_flush_without_samples_writes_nothing(self):
+        _latency.flush()
+        self.assertFalse(_latency.latency_file().exists())
+
+    def test_timed_records_on_exception(self):
+        with self.assertRaises(RuntimeError):
+            with _latency.timed("prompt_submit", "setup_gate"):
+                raise RuntimeError("boom")
+        self.assertEqual(_latency._pending[("prompt_submit", "setup_gate")].n, 1)
+
+    def test_line_format_is_compact_json(self):
+        _latency.record("pre_tool", 1.5, handler="Bash")
+        _latency.flush()
+        row = json.loads(_latency.latency_file().read_text())
+        self.assertEqual(row["hook"], "pre_tool")
+        self.assertEqual(len(row["counts"]), len(_latency.BOUNDS_MS) + 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
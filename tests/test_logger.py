@@ -9,6 +9,7 @@ Covers:
 - AC-11: WICKED_LOG_LEVEL env var precedence
 - Security: path traversal in session ID
 - Edge cases: non-serializable detail, never-raises contract
+- Fast path: cached level resolution, buffered writes, size-threshold flush
 """
 
 import importlib
@@ -72,6 +73,7 @@ class TestLoggerSchemaAndExistence(unittest.TestCase):
         defaults = dict(domain="bootstrap", level="normal", event="onboarding.status", ok=True)
         defaults.update(kwargs)
         self.logger.log(**defaults)
+        self.logger.flush()
         lp = self._log_path()
         self.assertTrue(lp.exists(), "Log file was not created")
         return lp.read_text(encoding="utf-8").strip().splitlines()
@@ -138,6 +140,7 @@ class TestLoggerSchemaAndExistence(unittest.TestCase):
         with patch.dict(os.environ, {"WICKED_LOG_LEVEL": "normal"}):
             self.logger.log("bootstrap", "normal", "ev.first", ok=True)
             self.logger.log("bootstrap", "normal", "ev.second", ok=True)
+            self.logger.flush()
         lp = self._log_path()
         lines = lp.read_text(encoding="utf-8").strip().splitlines()
         self.assertEqual(len(lines), 2)
@@ -187,6 +190,7 @@ class TestLevelFiltering(unittest.TestCase):
     def _call(self, event_level):
         logger = _fresh_logger()
         logger.log("test", event_level, "test.event", ok=True)
+        logger.flush()
 
     # S02-A: normal filters verbose
     def test_normal_blocks_verbose(self):
@@ -224,6 +228,7 @@ class TestLevelFiltering(unittest.TestCase):
             logger.log("test", "normal", "ev.normal", ok=True)
             logger.log("test", "verbose", "ev.verbose", ok=True)
             logger.log("test", "debug", "ev.debug", ok=True)
+            logger.flush()
         self.assertEqual(self._line_count(), 3)
 
     # S02-F: debug allows normal (explicit)
@@ -276,6 +281,7 @@ class TestTmpDirFallback(unittest.TestCase):
         with patch.dict(os.environ, env_clean, clear=True):
             logger = _fresh_logger()
             logger.log("bootstrap", "normal", "onboarding.status", ok=True)
+            logger.flush()
         # Use tempfile.gettempdir() which matches _logger.py behavior (not hardcoded /tmp)
         expected = Path(tempfile.gettempdir()) / "wicked-ops-test-session-tmpfallback.jsonl"
         self._tmp_files_to_clean.append(str(expected))
@@ -292,6 +298,7 @@ class TestTmpDirFallback(unittest.TestCase):
         with patch.dict(os.environ, env, clear=False):
             logger = _fresh_logger()
             logger.log("bootstrap", "normal", "onboarding.status", ok=True)
+            logger.flush()
         expected = Path(self.tmpdir.name) / "wicked-ops-test-session-customtmp.jsonl"
         self.assertTrue(expected.exists(), f"Expected log file at {expected}")
         # Ensure NOT written to /tmp
@@ -311,6 +318,7 @@ class TestTmpDirFallback(unittest.TestCase):
             logger = _fresh_logger()
             try:
                 logger.log("bootstrap", "normal", "onboarding.status", ok=True)
+                logger.flush()
             except Exception as exc:
                 self.fail(f"log() raised an exception with bad TMPDIR: {exc}")
 
@@ -364,6 +372,7 @@ class TestLevelPrecedence(unittest.TestCase):
         with patch.dict(os.environ, {"WICKED_LOG_LEVEL": "debug"}):
             logger = _fresh_logger()
             logger.log("test", "debug", "test.debug", ok=True)
+            logger.flush()
         self.assertEqual(self._line_count(), 1, "debug event should be written when env=debug overrides session=normal")
 
     # S11-B: session state used when no env var
@@ -374,6 +383,7 @@ class TestLevelPrecedence(unittest.TestCase):
         with patch.dict(os.environ, env, clear=True):
             logger = _fresh_logger()
             logger.log("test", "verbose", "test.verbose", ok=True)
+            logger.flush()
         self.assertEqual(self._line_count(), 1, "verbose event should be written when session=verbose")
 
     # S11-C: default normal when both absent — verbose not written
@@ -384,6 +394,7 @@ class TestLevelPrecedence(unittest.TestCase):
         with patch.dict(os.environ, env, clear=True):
             logger = _fresh_logger()
             logger.log("test", "verbose", "test.verbose", ok=True)
+            logger.flush()
         self.assertEqual(self._line_count(), 0, "verbose event should be filtered when default=normal")
 
     # S11-D: missing session file still works with default
@@ -395,6 +406,7 @@ class TestLevelPrecedence(unittest.TestCase):
             logger = _fresh_logger()
             try:
                 logger.log("test", "normal", "test.normal", ok=True)
+                logger.flush()
             except Exception as exc:
                 self.fail(f"log() raised with missing session file: {exc}")
         # normal event should still be written at default normal level
@@ -408,6 +420,7 @@ class TestLevelPrecedence(unittest.TestCase):
         with patch.dict(os.environ, env, clear=True):
             logger = _fresh_logger()
             logger.log("test", "verbose", "test.verbose", ok=True)
+            logger.flush()
         self.assertEqual(self._line_count(), 0, "verbose should be blocked when malformed session defaults to normal")
 
 
@@ -440,6 +453,7 @@ class TestSessionIdSanitization(unittest.TestCase):
         with patch.dict(os.environ, {"CLAUDE_SESSION_ID": "../../etc/passwd"}):
             logger = _fresh_logger()
             logger.log("bootstrap", "normal", "test.event", ok=True)
+            logger.flush()
 
         # No file should appear outside tmpdir
         traversal_target = Path("/etc/passwd")
@@ -493,6 +507,7 @@ class TestEdgeCases(unittest.TestCase):
                 "bootstrap", "normal", "test.event", ok=True,
                 detail={"obj": object()}
             )
+            self.logger.flush()
         except Exception as exc:
             self.fail(f"log() raised with non-serializable detail: {exc}")
 
@@ -502,6 +517,7 @@ class TestEdgeCases(unittest.TestCase):
             "bootstrap", "normal", "test.event", ok=True,
             detail={"obj": object()}
         )
+        self.logger.flush()
         lp = Path(self.tmpdir.name) / "wicked-ops-test-session-edge.jsonl"
         self.assertTrue(lp.exists())
         entry = json.loads(lp.read_text(encoding="utf-8").strip())
@@ -513,28 +529,120 @@ class TestEdgeCases(unittest.TestCase):
     def test_log_never_raises_none_domain(self):
         try:
             self.logger.log(None, "normal", "test.event", ok=True)
+            self.logger.flush()
         except Exception as exc:
             self.fail(f"log() raised with None domain: {exc}")
 
     def test_log_never_raises_empty_event(self):
         try:
             self.logger.log("bootstrap", "normal", "", ok=True)
+            self.logger.flush()
         except Exception as exc:
             self.fail(f"log() raised with empty event: {exc}")
 
     def test_log_never_raises_bad_ms(self):
         try:
             self.logger.log("bootstrap", "normal", "test.event", ok=True, ms="not-a-number")
+            self.logger.flush()
         except Exception as exc:
             self.fail(f"log() raised with non-numeric ms: {exc}")
 
     def test_log_never_raises_ok_none(self):
         try:
             self.logger.log("bootstrap", "normal", "test.event", ok=None)
+            self.logger.flush()
         except Exception as exc:
             self.fail(f"log() raised with ok=None: {exc}")
 
 
+# ---------------------------------------------------------------------------
+# Fast path: cached level + buffered writes
+# ---------------------------------------------------------------------------
+
+
+class TestFastPath(unittest.TestCase):
+    """Level resolved once per session-file mtime; entries buffered until flush."""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        env = {k: v for k, v in os.environ.items() if k != "WICKED_LOG_LEVEL"}
+        env.update({"TMPDIR": self.tmpdir.name, "CLAUDE_SESSION_ID": "test-session-fast"})
+        self.env_patch = patch.dict(os.environ, env, clear=True)
+        self.env_patch.start()
+        self.logger = _fresh_logger()
+
+    def tearDown(self):
+        self.logger.flush()
+        self.env_patch.stop()
+        self.tmpdir.cleanup()
+
+    def _log_path(self):
+        return Path(self.tmpdir.name) / "wicked-ops-test-session-fast.jsonl"
+
+    def _state_path(self):
+        return Path(self.tmpdir.name) / "wicked-garden-session-test-session-fast.json"
+
+    def test_entries_buffered_until_flush(self):
+        self.logger.log("test", "normal", "ev.one")
+        self.assertFalse(self._log_path().exists())
+        self.logger.flush()
+        self.assertEqual(len(self._log_path().read_text().splitlines()), 1)
+
+    def test_entry_threshold_triggers_flush(self):
+        for i in range(self.logger._FLUSH_ENTRIES):
+            self.logger.log("test", "normal", f"ev.{i}")
+        lines = self._log_path().read_text().splitlines()
+        self.assertEqual(len(lines), self.logger._FLUSH_ENTRIES)
+
+    def test_session_file_parsed_once_per_mtime(self):
+        self._state_path().write_text(json.dumps({"log_level": "verbose"}))
+        real_open = open
+        opened = []
+
+        def spy_open(path, *a, **kw):
+            opened.append(str(path))
+            return real_open(path, *a, **kw)
+
+        with patch("builtins.open", side_effect=spy_open):
+            for _ in range(5):
+                self.assertEqual(self.logger._resolve_level(), "verbose")
+        self.assertEqual(sum(p.endswith(".json") for p in opened), 1)
+
+    def test_level_cache_invalidated_on_mtime_change(self):
+        state = self._state_path()
+        state.write_text(json.dumps({"log_level": "normal"}))
+        self.assertEqual(self.logger._resolve_level(), "normal")
+        state.write_text(json.dumps({"log_level": "debug"}))
+        st = state.stat()
+        os.utime(state, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+        self.assertEqual(self.logger._resolve_level(), "debug")
+
+    def test_concurrent_logging_loses_no_entries(self):
+        import threading
+
+        def worker(n):
+            for i in range(200):
+                self.logger.log("test", "normal", f"ev.{n}.{i}")
+
+        threads = [threading.Thread(target=worker, args=(n,)) for n in range(8)]
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)  # force thread switches inside flush()
+        try:
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+        finally:
+            sys.setswitchinterval(interval)
+        self.logger.flush()
+        self.assertEqual(len(self._log_path().read_text().splitlines()), 8 * 200)
+
+    def test_filtered_event_skips_serialization(self):
+        with patch.object(self.logger.json, "dumps") as dumps:
+            self.logger.log("test", "debug", "ev.filtered", detail={"k": "v"})
+        dumps.assert_not_called()
+
+
 # ---------------------------------------------------------------------------
 # Entry point
 # ---------------------------------------------------------------------------
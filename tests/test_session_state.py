@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Unit tests for scripts/_session.py persistence.
+
+Covers:
+- Field-level merge: two loaded instances updating different fields both persist
+- increment(): deltas merge under concurrent writers (multiprocess)
+- transaction(): load() joins the transaction, one commit on exit
+- delete() inside a transaction does not resurrect the file
+- The state file stays plain JSON (statusline.py compatibility)
+"""
+
+import json
+import multiprocessing
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+_REPO_ROOT = Path(__file__).resolve().parents[1]
+_SCRIPTS = _REPO_ROOT / "scripts"
+sys.path.insert(0, str(_SCRIPTS))
+
+import _session  # noqa: E402
+from _session import SessionState  # noqa: E402
+
+
+def _bump(tmpdir: str, n: int) -> None:
+    os.environ["TMPDIR"] = tmpdir
+    os.environ["CLAUDE_SESSION_ID"] = "sess-concurrency"
+    for _ in range(n):
+        SessionState.load().increment("bash_count")
+
+
+class SessionStateMergeTests(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.env = patch.dict(os.environ, {
+            "TMPDIR": self.tmpdir.name,
+            "CLAUDE_SESSION_ID": "sess-merge",
+        })
+        self.env.start()
+        self.path = _session._state_file_path()
+
+    def tearDown(self):
+        self.env.stop()
+        self.tmpdir.cleanup()
+
+    def test_concurrent_instances_do_not_lose_fields(self):
+        a = SessionState.load()
+        b = SessionState.load()
+        a.update(qe_nudged=True)
+        b.update(jam_hint_shown=True)
+        final = SessionState.load()
+        self.assertTrue(final.qe_nudged)
+        self.assertTrue(final.jam_hint_shown)
+
+    def test_direct_attribute_mutation_then_save(self):
+        state = SessionState.load()
+        state.turn_count = 7
+        state.save()
+        self.assertEqual(SessionState.load().turn_count, 7)
+
+    def test_in_place_list_mutation_is_detected(self):
+        SessionState.load().update(stale_files=["a.py"])
+        state = SessionState.load()
+        state.stale_files.append("b.py")
+        state.save()
+        self.assertEqual(SessionState.load().stale_files, ["a.py", "b.py"])
+
+    def test_increment_merges_with_stale_instance(self):
+        a = SessionState.load()
+        b = SessionState.load()
+        a.increment("bash_count")
+        self.assertEqual(b.increment("bash_count"), 2)
+        self.assertEqual(SessionState.load().bash_count, 2)
+
+    def test_increment_dict_key(self):
+        state = SessionState.load()
+        state.increment("post_tool_handler_ms", 5, key="Read")
+        state.increment("post_tool_handler_ms", 3, key="Read")
+        self.assertEqual(SessionState.load().post_tool_handler_ms, {"Read": 8})
+
+    def test_explicit_update_overrides_pending_increment(self):
+        with SessionState.transaction() as state:
+            state.increment("turn_tool_count")
+            state.update(turn_tool_count=0)
+        self.assertEqual(SessionState.load().turn_tool_count, 0)
+
+    def test_transaction_commits_once(self):
+        writes = []
+        real_replace = os.replace
+
+        def counting_replace(src, dst):
+            writes.append(dst)
+            return real_replace(src, dst)
+
+        with patch.object(_session.os, "replace", side_effect=counting_replace):
+            with SessionState.transaction() as state:
+                self.assertIs(SessionState.load(), state)
+                state.update(qe_nudged=True)
+                state.increment("bash_count")
+                SessionState.load().update(jam_hint_shown=True)
+                self.assertFalse(self.path.exists())
+        self.assertEqual(len(writes), 1)
+        final = SessionState.load()
+        self.assertTrue(final.qe_nudged and final.jam_hint_shown)
+        self.assertEqual(final.bash_count, 1)
+
+    def test_delete_inside_transaction_is_final(self):
+        SessionState.load().update(qe_nudged=True)
+        with SessionState.transaction() as state:
+            state.update(jam_hint_shown=True)
+            state.delete()
+        self.assertFalse(self.path.exists())
+
+    def test_delete_keeps_lock_file(self):
+        SessionState.load().update(turn_count=1)
+        lock = self.path.with_suffix(".lock")
+        self.assertTrue(lock.exists())
+        SessionState.load().delete()
+        self.assertFalse(self.path.exists())
+        self.assertTrue(lock.exists())
+
+    @unittest.skipIf(_session.fcntl is None, "POSIX locking required")
+    def test_purge_removes_only_stale_orphaned_locks(self):
+        import fcntl
+        tmp = Path(self.tmpdir.name)
+        old = 0
+        SessionState.load().update(turn_count=1)          # current session
+        orphan = tmp / "wicked-garden-session-ended.lock"
+        fresh = tmp / "wicked-garden-session-starting.lock"
+        live = tmp / "wicked-garden-session-live.lock"
+        held = tmp / "wicked-garden-session-held.lock"
+        for lock in (orphan, fresh, live, held):
+            lock.touch()
+        (tmp / "wicked-garden-session-live.json").write_text("{}")
+        for lock in (orphan, live, held, self.path.with_suffix(".lock")):
+            os.utime(lock, (old, old))
+
+        with open(held, "a+b") as fh:
+            fcntl.flock(fh.fileno(), fcntl.LOCK_EX)
+            self.assertEqual(_session.purge_stale_locks(max_age_s=3600), 1)
+        self.assertFalse(orphan.exists())
+        for lock in (fresh, live, held, self.path.with_suffix(".lock")):
+            self.assertTrue(lock.exists(), lock.name)
+
+    def test_state_file_is_plain_json(self):
+        SessionState.load().update(turn_count=3)
+        data = json.loads(self.path.read_text(encoding="utf-8"))
+        self.assertEqual(data["turn_count"], 3)
+
+
+class SessionStateConcurrencyTests(unittest.TestCase):
+    def test_parallel_increments_are_not_lost(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            ctx = multiprocessing.get_context("spawn")
+            procs = [ctx.Process(target=_bump, args=(tmp, 20)) for _ in range(4)]
+            for p in procs:
+                p.start()
+            for p in procs:
+                p.join(60)
+            with patch.dict(os.environ, {"TMPDIR": tmp, "CLAUDE_SESSION_ID": "sess-concurrency"}):
+                self.assertEqual(SessionState.load().bash_count, 80)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,130 @@
+"""Tests for scripts/_transcript_tail.py — incremental transcript reads.
+
+The per-transcript index must make each read see only appended bytes while
+returning exactly what a full re-read would: the last assistant message, and
+for named cursors every appended line once.
+"""
+
+import json
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+
+import _transcript_tail as tt
+
+
+def _line(role, text, nested=True):
+    if nested:
+        rec = {"type": role, "message": {"role": role,
+                                         "content": [{"type": "text", "text": text}]}}
+    else:
+        rec = {"role": role, "content": text}
+    return json.dumps(rec) + "\n"
+
+
+def _full_scan(path):
+    """Reference: the pre-index implementation (parse every line)."""
+    last = None
+    for raw in Path(path).read_bytes().splitlines():
+        text = tt._assistant_text(raw)
+        if text:
+            last = text
+    return last
+
+
+class _TmpCase(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self._tmp.name)
+        self._env = patch.dict(os.environ, {"TMPDIR": str(self.dir)})
+        self._env.start()
+        self.path = self.dir / "transcript.jsonl"
+
+    def tearDown(self):
+        self._env.stop()
+        self._tmp.cleanup()
+
+    def append(self, *lines):
+        with self.path.open("a", encoding="utf-8") as fh:
+            fh.write("".join(lines))
+
+
+class FinalAssistantText(_TmpCase):
+    def test_tracks_appends_like_a_full_scan(self):
+        self.append(_line("user", "hi"), _line("assistant", "first"))
+        self.assertEqual(tt.final_assistant_text(str(self.path)), "first")
+        self.append(_line("user", "more"))
+        self.assertEqual(tt.final_assistant_text(str(self.path)), "first")
+        self.append(_line("assistant", "second", nested=False), _line("user", "x"))
+        self.assertEqual(tt.final_assistant_text(str(self.path)), "second")
+        self.assertEqual(tt.final_assistant_text(str(self.path)), _full_scan(self.path))
+
+    def test_only_new_bytes_are_parsed(self):
+        self.append(_line("assistant", "done"))
+        tt.final_assistant_text(str(self.path))
+        self.append(_line("user", "next"))
+        with patch.object(tt, "_assistant_text", wraps=tt._assistant_text) as spy:
+            self.assertEqual(tt.final_assistant_text(str(self.path)), "done")
+        self.assertEqual(spy.call_count, 1)
+
+    def test_backward_scan_spans_blocks(self):
+        filler = "".join(_line("user", "x" * 500) for _ in range(400))
+        self.append(_line("assistant", "early"), filler)
+        self.assertGreater(self.path.stat().st_size, 3 * tt._BLOCK)
+        self.assertEqual(tt.final_assistant_text(str(self.path)), "early")
+
+    def test_partial_trailing_line_is_not_consumed(self):
+        self.append(_line("assistant", "one"))
+        full = _line("assistant", "two")
+        self.append(full[:20])
+        self.assertEqual(tt.final_assistant_text(str(self.path)), "one")
+        self.append(full[20:])
+        self.assertEqual(tt.final_assistant_text(str(self.path)), "two")
+
+    def test_rewritten_file_invalidates_the_index(self):
+        self.append(_line("assistant", "old answer"), _line("user", "u"))
+        tt.final_assistant_text(str(self.path))
+        self.path.write_text(_line("user", "u") + _line("assistant", "new answer!!") + _line("user", "v"))
+        self.assertEqual(tt.final_assistant_text(str(self.path)), "new answer!!")
+
+    def test_missing_file_returns_none(self):
+        self.assertIsNone(tt.final_assistant_text(str(self.dir / "nope.jsonl")))
+
+
+class IterNewLines(_TmpCase):
+    def lines(self, tail=400):
+        return [json.loads(raw)["message"]["content"][0]["text"]
+                for raw in tt.iter_new_lines(str(self.path), "facts", tail_lines=tail)]
+
+    def test_first_use_yields_the_tail_then_only_appends(self):
+        self.append(*(_line("user", f"m{i}") for i in range(5)))
+        self.assertEqual(self.lines(tail=3), ["m2", "m3", "m4"])
+        self.assertEqual(self.lines(), [])
+        self.append(_line("assistant", "m5"), "\n", _line("user", "m6"))
+        self.assertEqual(self.lines(), ["m5", "m6"])
+
+    def test_early_stop_re_yields_the_held_line(self):
+        self.append(*(_line("user", f"m{i}") for i in range(4)))
+        gen = tt.iter_new_lines(str(self.path), "facts")
+        next(gen)
+        next(gen)
+        gen.close()
+        self.assertEqual(self.lines(), ["m1", "m2", "m3"])
+
+    def test_cursors_are_independent(self):
+        self.append(_line("user", "a"))
+        self.assertEqual(self.lines(), ["a"])
+        other = list(tt.iter_new_lines(str(self.path), "other"))
+        self.assertEqual(len(other), 1)
+
+    def test_truncation_restarts_from_the_tail(self):
+        self.append(*(_line("user", f"m{i}") for i in range(3)))
+        self.lines()
+        self.path.write_text(_line("user", "fresh"))
+        self.assertEqual(self.lines(), ["fresh"])
+
+
+if __name__ == "__main__":
+    unittest.main()